@@ -42,6 +42,7 @@ This file is not running/executing/using BLAT.
 import sys
 import os
 import optparse
+import compression
 
 
 # bowtie outputs one alignment per line. Each line is a collection of 8 fields separated by tabs; from left to right, the fields are:
@@ -71,7 +72,7 @@ import optparse
 #########################
 def line_from(a_map_filename):
     # it gives chunks from a_map_filename
-    fin=open(a_map_filename,'r')
+    fin=compression.zopen(a_map_filename) # it might be compressed
     while True:
         lines=fin.readlines(10**8)
         if not lines:
@@ -170,6 +170,7 @@ import sys
 import optparse
 import gc
 import itertools
+import compression
 
 
 # PSL columns
@@ -195,6 +196,10 @@ psl_blockSizes = 18
 psl_qStarts = 19
 psl_tStarts = 20
 
+# two local alignments of a read are joined if the gap between them (on read)
+# is shorter than wiggle_gap or if they overlap (on read) less than wiggle_overlap
+wiggle_gap = 9
+wiggle_overlap = 17
 
 #########################
 def lines(filename,buffer_size = 10**8):
@@ -203,7 +208,7 @@ def lines(filename,buffer_size = 10**8):
     if filename == '-':
         fin = sys.stdin
     else:
-        fin = open(filename,'r')
+        fin = compression.zopen(filename) # it might be compressed
     while True:
         lines = fin.readlines(buffer_size)
         if not lines:
@@ -323,7 +328,96 @@ def chunks(psl_file, min_count = 2, ids_out = None, ref_out = None, clip_size =
         yield chunk
 
 #########################
-def merge_local_alignment_sam(psl_in, psl_ou, ids_ou = None, ref_ou = None, min_clip = 10, remove_extra = False):
+class tree:
+    # segment tree which gives the first position (after a given one) whose
+    # value is larger (or smaller) than a threshold
+    def __init__(self, values, larger = True):
+        self.n = len(values)
+        self.size = 1
+        while self.size < self.n:
+            self.size = 2 * self.size
+        self.larger = larger
+        self.empty = -sys.maxint if larger else sys.maxint
+        self.f = max if larger else min
+        self.data = [self.empty] * (2 * self.size)
+        self.data[self.size:self.size+self.n] = values
+        for i in xrange(self.size-1,0,-1):
+            self.data[i] = self.f(self.data[2*i],self.data[2*i+1])
+
+    def value(self, i):
+        return self.data[i + self.size]
+
+    def update(self, i, value):
+        i = i + self.size
+        self.data[i] = value
+        i = i / 2
+        while i:
+            self.data[i] = self.f(self.data[2*i],self.data[2*i+1])
+            i = i / 2
+
+    def first(self, lo, threshold):
+        # the first position >= lo whose value is larger (or smaller) than threshold
+        if self.larger:
+            good = lambda v: v > threshold
+        else:
+            good = lambda v: v < threshold
+        return self._first(1, 0, self.size, lo, good)
+
+    def _first(self, node, left, right, lo, good):
+        if right <= lo or not good(self.data[node]):
+            return self.n
+        if right - left == 1:
+            return left
+        middle = (left + right) / 2
+        r = self._first(2*node, left, middle, lo, good)
+        if r == self.n:
+            r = self._first(2*node+1, middle, right, lo, good)
+        return r
+
+#########################
+def pairs(bucket, all_pairs = False, few = 32):
+    # it gives the pairs of local alignments of a read (in the same order as
+    # itertools.combinations) which might be trimmed/extended or joined, i.e.
+    # it skips the pairs which overlap on read at least wiggle_overlap
+    #
+    # the pairs are not independent (the alignments are trimmed/extended in
+    # place while they are checked) and therefore the starts and ends (on read)
+    # of the alignments are kept in two segment trees which are updated after
+    # each pair; for an alignment A, the alignment B might be used only if
+    # start(B) > end(A) - wiggle_overlap (when B starts after A) or
+    # end(B) < start(A) + wiggle_overlap (when B starts before A); for reads
+    # with a few local alignments all the pairs are checked
+    n = len(bucket)
+    if all_pairs or n < few:
+        for box in itertools.combinations(bucket,2):
+            yield box
+        return
+    starts = tree([int(line[psl_qStart]) for line in bucket], larger = True)
+    ends = tree([int(line[psl_qEnd]) for line in bucket], larger = False)
+    for i in xrange(n-1):
+        a = bucket[i]
+        j = i + 1
+        while j < n:
+            after = int(a[psl_qEnd]) - wiggle_overlap
+            before = int(a[psl_qStart]) + wiggle_overlap
+            if not (starts.value(j) > after or ends.value(j) < before):
+                j = min(starts.first(j, after), ends.first(j, before))
+                if j >= n:
+                    break
+            b = bucket[j]
+            yield (a,b)
+            # the alignments might have been trimmed/extended
+            for (k,line) in ((i,a),(j,b)):
+                x = int(line[psl_qStart])
+                if x != starts.value(k):
+                    starts.update(k, x)
+                x = int(line[psl_qEnd])
+                if x != ends.value(k):
+                    ends.update(k, x)
+            j = j + 1
+
+#########################
+def merge_local_alignment_sam(psl_in, psl_ou, ids_ou = None, ref_ou = None, min_clip = 10, remove_extra = False, all_pairs = False):
     #
     psl = []
     fou = None
@@ -333,18 +427,10 @@ def merge_local_alignment_sam(psl_in, psl_ou, ids_ou = None, ref_ou = None, min_
         fou = open(psl_ou,'w')
 
     limit_psl = 10**5
-    
-    xi = 0
 
     for bucket in chunks(psl_in, min_count = 2, ids_out = ids_ou, ref_out = ref_ou, clip_size = min_clip):
-    
-        xi = 0
 
-        for box in itertools.combinations(bucket,2):
-            xi = xi + 1
-            
-            if xi > 100000: # too many combinations
-                break
+        for box in pairs(bucket, all_pairs):
 
             if box[0][psl_strand] == box[1][psl_strand]:
 
@@ -370,8 +456,6 @@ def merge_local_alignment_sam(psl_in, psl_ou, ids_ou = None, ref_ou = None, min_
                 if t1_start > t2_start:
                     continue
 
-                wiggle_gap = 9
-                wiggle_overlap = 17
                 if r1_end + wiggle_gap > r2_start and r1_end < r2_start:
                     dif = r2_start - r1_end
 
@@ -569,6 +653,12 @@ Here the assumption is that the PSL is sorted by columns 10, 14, 12, and 13."""
                       default = False,
                       help = """It removes from the string of reads ids everything what is after '__' and also '__'. Default is '%default'.""")
 
+    parser.add_option("--all-pairs",
+                      action = "store_true",
+                      dest = "all_pairs",
+                      default = False,
+                      help = optparse.SUPPRESS_HELP) # all the pairs of local alignments of a read are checked (used for benchmarking)
+
 
 
     (options,args) = parser.parse_args()
@@ -586,5 +676,6 @@ Here the assumption is that the PSL is sorted by columns 10, 14, 12, and 13."""
                               options.output_ids_filename,
                               options.output_ref_filename,
                               options.min_clip,
-                              remove_extra = options.remove_extra)
+                              remove_extra = options.remove_extra,
+                              all_pairs = options.all_pairs)
 #
@@ -1,7 +1,12 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """
-It runs BLAT in parallel by dividing the input file into equal parts.
+It runs BLAT in parallel by dividing the input file into many small parts
+(i.e. chunks) which are given to the BLAT processes as soon as they finish
+their previous chunks (such that no CPU waits idle for a few slow parts). The
+outputs of the chunks are joined in the order of the input file as soon as
+they are ready, and therefore the output is the same as when the input file
+is divided into one part per CPU.
 
 Date: September 9, 2010.
 
@@ -51,6 +56,7 @@ import os
 import multiprocessing
 import subprocess
 import time
+import errno
 import tempfile
 import Bio.SeqIO
 import math
@@ -77,6 +83,35 @@ def quote(txt):
         r = '"%s"' % (txt,)
     return r
 
+def wait_any():
+    # it waits for any child process to finish and it returns its pid and exit code
+    while True:
+        try:
+            (pid, status) = os.wait()
+            break
+        except OSError, e:
+            if e.errno != errno.EINTR:
+                raise
+    code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+    return (pid, code)
+
+def join_file(fod, some_file):
+    # it appends a file to the (already opened) output file
+    flag = False
+    if not os.path.exists(some_file):
+        return flag
+    fid = open(some_file,'r')
+    while True:
+        lines = fid.readlines(10**8)
+        if not lines:
+            break
+        if not lines[-1].endswith('\n'):
+            lines[-1] = lines[-1]+'\n'
+        fod.writelines(lines)
+        flag = True
+    fid.close()
+    return flag
+
 #
 #
 #
@@ -92,6 +127,7 @@ if __name__ == '__main__':
         print >>sys.stderr,"The blat directory where the blat executable is placed, '--blat_dir', e.g. '--blat_dir=/some/blat/dir/'."
         print >>sys.stderr,"The option '--cpus' specifies the number of  CPUs to be used, e.g. '--cpus=10'. If it is not specified then all the CPUs found will be used."
         print >>sys.stderr,"The option '--filter-fusion' forces that all the lines in the PSL output are filtered according to finding gene fusions. If it is not specified then no filtering is done."
+        print >>sys.stderr,"The option '--chunks' specifies the number of parts (i.e. chunks) into which the input file is divided, e.g. '--chunks=100'. If it is not specified then 8 chunks per CPU are used."
 
 
     blat_dir = [el for el in cmd if el.startswith('--blat_dir=')]
@@ -119,6 +155,14 @@ if __name__ == '__main__':
     else:
         cmd_cpus = None
 
+    chunks = [el for el in cmd if el.startswith('--chunks=')]
+    if chunks:
+        chunks = int(chunks[0][9:])
+    else:
+        chunks = 0
+    if chunks < 1:
+        chunks = 8 * cpus
+
     filtered = [el for el in cmd if el.startswith('--filter-fusion')]
     if filtered:
         filtered = True
@@ -128,6 +172,7 @@ if __name__ == '__main__':
     cmd = [el for el in cmd if ((not el.startswith('--tmp_dir=')) and
                                 (not el.startswith('--cpus=')) and
                                 (not el.startswith('--blat_dir=')) and
+                                (not el.startswith('--chunks=')) and
                                 (not el.startswith('--filter-fusion')))]
 
     if not tmp_dir:
@@ -163,17 +208,17 @@ if __name__ == '__main__':
     input_handle.close()
     print >>sys.stderr," -",count,"records found in the input file!"
     if count > 0:
-        print >>sys.stderr,"Splitting the input file into",cpus,"pieces..."
-        list_input_temp_files = [give_me_temp_filename(tmp_dir) for i in range(cpus)]
-        list_output_temp_files = [give_me_temp_filename(tmp_dir) for i in range(cpus)]
-        pipes = [give_me_temp_filename(tmp_dir) for i in range(cpus)]
+        if count <= 5*cpus:
+            chunks = 1
+        chunks = min(chunks, count)
+        print >>sys.stderr,"Splitting the input file into",chunks,"chunks..."
+        list_input_temp_files = [give_me_temp_filename(tmp_dir) for i in xrange(chunks)]
+        list_output_temp_files = [give_me_temp_filename(tmp_dir) for i in xrange(chunks)]
+        pipes = [give_me_temp_filename(tmp_dir) for i in xrange(chunks)]
 
         input_handle = open(input_filename, "rU")
         input_seq_iterator = Bio.SeqIO.parse(input_handle, "fasta")
-        empty_flag = []
-        size_block = math.ceil(float(count) / float(cpus))
-        if count <= 5*cpus:
-            size_block = count
+        size_block = math.ceil(float(count) / float(chunks))
         i = -1
         j = -1
         seq = []
@@ -182,82 +227,76 @@ if __name__ == '__main__':
             seq.append(record)
             if ( (i+1) % size_block == 0) or (i + 1 == count):
                 j = j + 1
-                print >>sys.stderr," - writing part",j+1
                 output_handle = open(list_input_temp_files[j], "w")
-                cc = Bio.SeqIO.write(seq, output_handle, "fasta")
+                Bio.SeqIO.write(seq, output_handle, "fasta")
                 output_handle.close()
-                print >>sys.stderr,"       wrote",cc,"sequences"
-                if seq:
-                    empty_flag.append(False)
-                else:
-                    empty_flag.append(True)
                 seq = []
         input_handle.close()
-        if len(empty_flag) != cpus:
-            empty_flag = empty_flag + [True] * (cpus - len(empty_flag))
+        chunks = j + 1
+        print >>sys.stderr," -",chunks,"chunks of at most",int(size_block),"sequences written"
 
 
-        proc = []
+        # the chunks are given (in the order of the input file) to the BLAT
+        # processes as soon as they become free and the outputs of the chunks
+        # are joined (in the same order) as soon as they are ready
         print >>sys.stderr,"Launching BLAT in parallel..."
-        for i in xrange(j+1):
-            if empty_flag[i]:
-                continue
-            parameters = [_BT_+'blat'] + cmd + [quote(database_filename), quote(list_input_temp_files[i]), quote(list_output_temp_files[i])]
-            if filtered:
-                parameters = [os.path.abspath(os.path.dirname(__file__))+'/blat-filter-fusion.sh',
-                              _BT_ if _BT_ else '-',
-                              quote(database_filename),
-                              quote(list_input_temp_files[i]),
-                              quote(pipes[i]),
-                              quote(list_output_temp_files[i])] + cmd
-
-
-            print >>sys.stderr,'-->JOB:'+str(i+1)+'-----------------------------------------------------------------'
-            print >>sys.stderr,' '.join(parameters)
-
-            # original
-            #p = subprocess.Popen(parameters)
-            # fix https://github.com/ndaniel/fusioncatcher/issues/62
-            p = subprocess.Popen(parameters,close_fds=True)
-
-            proc.append(p)
-            time.sleep(1) # seconds
-        print >>sys.stderr,'-------------------------------------------------------------------------'
-        print >>sys.stderr,"Waiting for BLAT to finish running..."
-
-        # original
-        #for p in proc:
-        #    p.communicate()
-        # fix https://github.com/ndaniel/fusioncatcher/issues/62
-        while proc:
-            proc.pop().communicate()
-            
-        print >>sys.stderr,"BLAT finished running."
-        print >>sys.stderr,'-------------------------------------------------------------------------'
-        print >>sys.stderr,"Joining BLAT's output files..."
         fod = open(output_filename,'w')
         flag = False
-        for i in xrange(j+1):
-            if empty_flag[i] or (not os.path.exists(list_output_temp_files[i])):
-                continue
-            fid = open(list_output_temp_files[i],'r')
-            while True:
-                lines = fid.readlines(10**8)
-                if not lines:
-                    break
-                if not lines[-1].endswith('\n'):
-                    lines[-1] = lines[-1]+'\n'
-                fod.writelines(lines)
-                flag = True
-            fid.close()
+        running = dict() # pid -> (chunk, process, start time)
+        finished = [False] * chunks
+        busy = 0.0
+        next_chunk = 0
+        next_join = 0
+        start = time.time()
+        while next_join < chunks:
+            while next_chunk < chunks and len(running) < cpus:
+                i = next_chunk
+                parameters = [_BT_+'blat'] + cmd + [quote(database_filename), quote(list_input_temp_files[i]), quote(list_output_temp_files[i])]
+                if filtered:
+                    parameters = [os.path.abspath(os.path.dirname(__file__))+'/blat-filter-fusion.sh',
+                                  _BT_ if _BT_ else '-',
+                                  quote(database_filename),
+                                  quote(list_input_temp_files[i]),
+                                  quote(pipes[i]),
+                                  quote(list_output_temp_files[i])] + cmd
+
+                print >>sys.stderr,'-->JOB:'+str(i+1)+'-----------------------------------------------------------------'
+                print >>sys.stderr,' '.join(parameters)
+
+                # fix https://github.com/ndaniel/fusioncatcher/issues/62
+                p = subprocess.Popen(parameters,close_fds=True)
+                running[p.pid] = (i, p, time.time())
+                next_chunk = next_chunk + 1
+
+            if running:
+                (pid, code) = wait_any()
+                if pid not in running:
+                    continue
+                (i, p, t) = running.pop(pid)
+                p.returncode = code # it has been waited for already
+                busy = busy + time.time() - t
+                finished[i] = True
+                if code != 0:
+                    print >>sys.stderr,"WARNING: BLAT exited with code %d for chunk %d!" % (code, i+1)
+
+            while next_join < chunks and finished[next_join]:
+                if join_file(fod, list_output_temp_files[next_join]):
+                    flag = True
+                delete_file(list_input_temp_files[next_join])
+                delete_file(list_output_temp_files[next_join])
+                delete_file(pipes[next_join])
+                next_join = next_join + 1
+        wall = time.time() - start
         if not flag:
             fod.write('')
         fod.close()
 
-        for i in range(cpus):
-            delete_file(list_input_temp_files[i])
-            delete_file(list_output_temp_files[i])
-            delete_file(pipes[i])
+        print >>sys.stderr,'-------------------------------------------------------------------------'
+        print >>sys.stderr,"BLAT finished running."
+        print >>sys.stderr,"Wall-clock time: %.1f seconds" % (wall,)
+        print >>sys.stderr,"Busy CPU time: %.1f seconds" % (busy,)
+        print >>sys.stderr,"Idle CPU time: %.1f seconds (%d CPU(s))" % (max(0.0, cpus * wall - busy), cpus)
+        print >>sys.stderr,'-------------------------------------------------------------------------'
     print >>sys.stderr,"Done."
 
 
@@ -0,0 +1,355 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It builds an index (e.g. using bowtie-build, bowtie2-build or STAR) through a
+local cache of indexes (see '--index-cache' of 'fusioncatcher.py'), i.e. if an
+index has been built already for the same reference sequences (by content) and
+the same build parameters (and version of the program) then it is reused
+instead of being built again.
+
+The cache is a directory where each index is kept in a sub-directory named by
+its key (i.e. SHA1 of the content of the reference sequences, the command line
+without the paths and the number of threads, and the version of the program).
+A new index is copied first into a temporary sub-directory which is renamed
+afterwards (i.e. atomically) and the cache is locked (i.e. 'flock' on the file
+'.lock') while indexes are reused, added or removed, such that several runs of
+FusionCatcher on one computer can use the same cache concurrently. A run which
+needs an index which is being built by another run waits for it and reuses it. The least
+recently used indexes are removed when the cache becomes larger than the given
+size.
+
+Example:
+
+cache-index.py --cache /some/cache --reference genes.fa --index genes_index/ -- bowtie-build -f genes.fa genes_index/
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+
+"""
+import os
+import sys
+import time
+import errno
+import fcntl
+import shutil
+import hashlib
+import optparse
+import subprocess
+
+# the options of the programs which do not change the index (and their number of values)
+IGNORE = {'--threads': 1,
+          '--runThreadN': 1,
+          '--quiet': 0,
+          '-q': 0,
+          # STAR writes its log files there (i.e. outside of the index)
+          '--outFileNamePrefix': 1}
+
+# the age (in seconds) after which the temporary sub-directories left behind
+# (e.g. by a run which has been killed) are removed
+STALE = 24 * 3600
+
+# the file used for locking the cache
+LOCK = '.lock'
+
+#
+class lock:
+    """
+    It locks the cache (exclusive or shared) until it is released. If a key
+    is given then only the building of the index with that key is locked.
+    """
+    def __init__(self, cache, exclusive = True, key = None):
+        self.file_handle = None
+        self.file_handle = open(os.path.join(cache,LOCK + ('.' + key if key else '')),'a')
+        fcntl.flock(self.file_handle.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+    def release(self):
+        if self.file_handle:
+            fcntl.flock(self.file_handle.fileno(), fcntl.LOCK_UN)
+            self.file_handle.close()
+            self.file_handle = None
+
+    def __del__(self):
+        self.release()
+
+#
+def version(program):
+    """
+    It returns the version of a program (as printed by '--version').
+    """
+    v = ''
+    try:
+        p = subprocess.Popen([program,'--version'], stdout = subprocess.PIPE, stderr = subprocess.STDOUT)
+        v = p.communicate()[0]
+    except OSError:
+        pass
+    return v
+
+#
+def key(command, references, index):
+    """
+    It returns the key of an index, i.e. SHA1 of the content of the reference
+    sequences, the command line (where the paths of the references and index
+    are replaced by placeholders and the options from IGNORE are removed) and
+    the version of the program.
+    """
+    h = hashlib.sha1()
+    paths = [(r.rstrip(os.sep),'<REFERENCE%d>' % (i+1,)) for (i,r) in enumerate(references)]
+    paths.append((index.rstrip(os.sep),'<INDEX>'))
+    # the longer paths first (e.g. 'genes.fa_dir/' contains 'genes.fa')
+    paths.sort(key = lambda e: -len(e[0]))
+    cmd = []
+    skip = 0
+    for i,c in enumerate(command):
+        if skip:
+            skip = skip - 1
+            continue
+        if i > 0 and c in IGNORE:
+            skip = IGNORE[c]
+            continue
+        for (p,r) in paths:
+            c = c.replace(p,r)
+        cmd.append(c)
+    cmd[0] = os.path.basename(cmd[0])
+    h.update('\0'.join(cmd))
+    h.update('\0')
+    h.update(version(command[0]))
+    for r in references:
+        h.update('\0')
+        fin = open(r,'rb')
+        while True:
+            data = fin.read(2**20)
+            if not data:
+                break
+            h.update(data)
+        fin.close()
+    return h.hexdigest()
+
+#
+def size(path):
+    """
+    It returns the size (in bytes) of a directory.
+    """
+    n = 0
+    for (d,dirs,files) in os.walk(path):
+        for f in files:
+            n = n + os.path.getsize(os.path.join(d,f))
+    return n
+
+#
+def transfer(source, destination):
+    """
+    It puts the files of the source directory in the destination directory,
+    i.e. as hard links (the indexes are never modified) or copies (e.g. when
+    they are on different file systems).
+    """
+    for (d,dirs,files) in os.walk(source):
+        t = os.path.join(destination,os.path.relpath(d,source))
+        if not os.path.isdir(t):
+            os.makedirs(t)
+        for f in files:
+            s = os.path.join(d,f)
+            o = os.path.join(t,f)
+            if os.path.exists(o) or os.path.islink(o):
+                os.remove(o)
+            try:
+                os.link(s,o)
+            except OSError:
+                shutil.copy2(s,o)
+
+#
+def evict(cache, maximum, keep = None):
+    """
+    It removes the least recently used indexes until the cache is not larger
+    than the given size (in bytes). The cache should be locked (exclusive).
+    """
+    entries = []
+    now = time.time()
+    for e in os.listdir(cache):
+        p = os.path.join(cache,e)
+        if e.startswith(LOCK + '.') and now - os.path.getmtime(p) > STALE:
+            # the lock of the building of an index
+            os.remove(p)
+            continue
+        if e.startswith('.') or not os.path.isdir(p):
+            continue
+        if e.startswith('tmp.'):
+            if now - os.path.getmtime(p) > STALE:
+                shutil.rmtree(p,ignore_errors = True)
+            continue
+        entries.append((os.path.getmtime(p),e,size(p)))
+    entries.sort()
+    total = sum([e[2] for e in entries])
+    for (t,e,s) in entries:
+        if total <= maximum:
+            break
+        if e == keep:
+            continue
+        print >>sys.stderr,"Removing from cache the index '%s' (%d bytes)..." % (e,s)
+        shutil.rmtree(os.path.join(cache,e),ignore_errors = True)
+        total = total - s
+
+
+#
+def build(command):
+    """
+    It builds the index by executing the command and it returns its exit code.
+    """
+    r = subprocess.call(command)
+    if r != 0:
+        print >>sys.stderr,"ERROR: The building of the index failed (exit code %d)!" % (r,)
+    return r
+
+#
+def cached_build(command, references, index, cache, maximum):
+    """
+    It builds the index through the cache (see above) and it returns the exit
+    code of the command. If the cache cannot be used (e.g. it is on a read-only
+    file system or it cannot be locked, such as on some NFS) then the index is
+    built without the cache.
+    """
+    k = None
+    build_lck = None
+    try:
+        if not os.path.isdir(cache):
+            try:
+                os.makedirs(cache)
+            except OSError, e:
+                if e.errno != errno.EEXIST:
+                    raise
+        k = key(command, references, index)
+        entry = os.path.join(cache,k)
+
+        # only one run builds a given index at a time and the others wait for it
+        build_lck = lock(cache, exclusive = True, key = k)
+
+        # reuse the index
+        lck = lock(cache, exclusive = False)
+        if os.path.isdir(entry):
+            print >>sys.stderr,"Reusing the index '%s' from cache..." % (k,)
+            transfer(entry, index)
+            os.utime(entry, None)
+            lck.release()
+            build_lck.release()
+            return 0
+        lck.release()
+    except (IOError, OSError), e:
+        print >>sys.stderr,"WARNING: The cache of indexes cannot be used (and the index is built without it): %s" % (e,)
+        if build_lck:
+            build_lck.release()
+        return build(command)
+
+    # build the index
+    print >>sys.stderr,"Building the index '%s'..." % (k,)
+    r = build(command)
+    if r != 0:
+        build_lck.release()
+        return r
+
+    # add the index to the cache
+    temp = os.path.join(cache,'tmp.%s.%s.%d' % (k,os.uname()[1],os.getpid()))
+    try:
+        if os.path.exists(temp):
+            shutil.rmtree(temp)
+        shutil.copytree(index, temp)
+        lck = lock(cache, exclusive = True)
+        os.rename(temp, entry)
+        print >>sys.stderr,"Added the index '%s' to cache." % (k,)
+        evict(cache, maximum, keep = k)
+        lck.release()
+    except (IOError, OSError), e:
+        # the index has been built and therefore the cache is optional
+        print >>sys.stderr,"WARNING: The index could not be added to cache: %s" % (e,)
+        shutil.rmtree(temp, ignore_errors = True)
+    build_lck.release()
+    return 0
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options] -- command"
+    description = """It builds an index (e.g. using bowtie-build, bowtie2-build or STAR) through a local cache of indexes, i.e. an index built already for the same reference sequences and build parameters is reused instead of being built again."""
+    version_text = "%prog 0.10 beta"
+
+    parser = optparse.OptionParser(usage = usage,
+                                   description = description,
+                                   version = version_text)
+
+    parser.add_option("--cache","-c",
+                      action = "store",
+                      type = "string",
+                      dest = "cache_directory",
+                      help = """The directory of the cache of indexes (it is created if it does not exist).""")
+
+    parser.add_option("--size","-s",
+                      action = "store",
+                      type = "float",
+                      dest = "size",
+                      default = 50,
+                      help = """The maximum size (in GB) of the cache. The least recently used indexes are removed when the cache becomes larger. Default is %default.""")
+
+    parser.add_option("--reference","-r",
+                      action = "append",
+                      type = "string",
+                      dest = "references",
+                      default = [],
+                      help = """The file with the reference sequences which are indexed. It can be given several times.""")
+
+    parser.add_option("--index","-i",
+                      action = "store",
+                      type = "string",
+                      dest = "index_directory",
+                      help = """The directory where the index is built by the command.""")
+
+    (options, args) = parser.parse_args()
+
+    # validate options
+    if not (options.cache_directory and
+            options.references and
+            options.index_directory and
+            args
+            ):
+        parser.print_help()
+        parser.error("No cache, references, index and command specified!")
+
+    r = cached_build(args,
+                     options.references,
+                     options.index_directory,
+                     options.cache_directory,
+                     int(options.size * (2**30)))
+    if r != 0:
+        sys.exit(r)
+    print >>sys.stderr,"Done."
+    #
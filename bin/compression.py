@@ -0,0 +1,314 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It opens compressed files (i.e. gzip, BGZF, bzip2, xz, zstd, lz4 and lzop) for
+reading as streams. The files are decompressed by an external program (running
+in parallel with the reader) which is multithreaded where the format allows it,
+i.e. bgzip for BGZF files, pigz for gzip files, pbzip2 for bzip2 files and pxz
+for xz files (or gzip, bzip2 and xz if the multithreaded ones are not found).
+If no external program is found then the files are decompressed using the
+Python modules (only for gzip and bzip2).
+
+The format of a file is recognized from its first bytes (i.e. magic number)
+and therefore the intermediate files which are compressed on the fly (see
+'--compress-intermediates' of 'fusioncatcher.py') keep their usual names and
+they are read transparently.
+
+Example:
+
+import compression
+fid = compression.zopen('reads_1.fq.gz')
+for line in fid:
+    ...
+fid.close()
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+"""
+import os
+import sys
+import gzip
+import bz2
+import signal
+import subprocess
+
+# the extensions of the compressed files which are supported
+EXTENSIONS = ('.gz', '.bz2', '.xz', '.zst', '.lz4', '.lzo')
+
+# the magic numbers of the compressed files which are supported
+MAGIC = (('gz', '\x1f\x8b'),
+         ('bz2', 'BZh'),
+         ('xz', '\xfd7zXZ\x00'),
+         ('zst', '\x28\xb5\x2f\xfd'),
+         ('lz4', '\x04\x22\x4d\x18'),
+         ('lzo', '\x89LZO\x00'))
+
+# the fast compressors (in the order of preference) used for the intermediate files
+COMPRESSORS = ('zstd', 'lz4', 'lzop', 'pigz', 'gzip')
+
+#
+def which(program):
+    """
+    It returns the full path of a program found in PATH (or None).
+    """
+    for p in os.environ.get('PATH','').split(os.pathsep):
+        f = os.path.join(p,program)
+        if os.path.isfile(f) and os.access(f,os.X_OK):
+            return f
+    return None
+
+#
+def is_compressed(file_name):
+    """
+    It returns True if the file is compressed (based on its extension).
+    """
+    return file_name.lower().endswith(EXTENSIONS)
+
+#
+def uncompressed(file_name):
+    """
+    It returns the name of the file without the extension of compression.
+    """
+    for e in EXTENSIONS:
+        if file_name.lower().endswith(e):
+            return file_name[:-len(e)]
+    return file_name
+
+#
+def kind(file_name):
+    """
+    It returns the compression format of a file (i.e. 'gz', 'bz2', 'xz',
+    'zst', 'lz4', 'lzo') or None if the file is not compressed. The format is
+    found from the magic number for regular files and from the extension
+    otherwise (e.g. named pipes, which cannot be peeked).
+    """
+    if file_name == '-':
+        return None
+    if os.path.isfile(file_name):
+        try:
+            h = open(file_name,'rb').read(6)
+        except IOError:
+            h = ''
+        for (k,m) in MAGIC:
+            if h.startswith(m):
+                return k
+        return None
+    f = file_name.lower()
+    for e in EXTENSIONS:
+        if f.endswith(e):
+            return e[1:]
+    return None
+
+#
+def is_bgzf(file_name):
+    """
+    It returns True if the file is compressed using BGZF (i.e. blocked gzip,
+    as produced by bgzip), which can be decompressed in parallel.
+    """
+    try:
+        h = open(file_name,'rb').read(18)
+    except IOError:
+        return False
+    # gzip magic, deflate, FEXTRA flag and the 'BC' extra subfield
+    return len(h) == 18 and h[:4] == '\x1f\x8b\x08\x04' and h[12:14] == 'BC'
+
+#
+def decompressor(file_name, processes = 0):
+    """
+    It returns the command line (as list) which decompresses the file to
+    stdout (or None if no suitable program is found).
+    """
+    if processes < 1:
+        processes = 1
+        try:
+            import multiprocessing
+            processes = multiprocessing.cpu_count()
+        except (ImportError, NotImplementedError):
+            pass
+    k = kind(file_name)
+    candidates = []
+    if k == 'gz':
+        if processes > 1 and is_bgzf(file_name):
+            candidates.append(['bgzip','-d','-c','-@',str(processes)])
+        candidates.append(['pigz','-d','-c','-p',str(processes)])
+        candidates.append(['gzip','-d','-c'])
+    elif k == 'bz2':
+        candidates.append(['pbzip2','-d','-c','-p%d' % (processes,)])
+        candidates.append(['bzip2','-d','-c'])
+    elif k == 'xz':
+        candidates.append(['pxz','-d','-c','-T',str(processes)])
+        candidates.append(['xz','-d','-c'])
+    elif k == 'zst':
+        candidates.append(['zstd','-d','-c','-q'])
+    elif k == 'lz4':
+        candidates.append(['lz4','-d','-c','-q'])
+    elif k == 'lzo':
+        candidates.append(['lzop','-d','-c'])
+    for c in candidates:
+        p = which(c[0])
+        if p:
+            return [p] + c[1:]
+    return None
+
+#
+def compressor(program, processes = 0):
+    """
+    It returns the command line (as list) which compresses fast (i.e. lowest
+    level of compression) stdin to stdout using the given program (i.e. zstd,
+    lz4, lzop, pigz or gzip) or None if the program is not found.
+    """
+    if processes < 1:
+        processes = 1
+        try:
+            import multiprocessing
+            processes = multiprocessing.cpu_count()
+        except (ImportError, NotImplementedError):
+            pass
+    p = which(program)
+    if not p:
+        return None
+    name = os.path.basename(program)
+    if name == 'zstd':
+        return [p,'-1','-q','-c','-T%d' % (processes,)]
+    elif name == 'lz4':
+        return [p,'-1','-q','-c']
+    elif name == 'lzop':
+        return [p,'-1','-c']
+    elif name == 'pigz':
+        return [p,'-1','-c','-p',str(processes)]
+    elif name == 'gzip':
+        return [p,'-1','-c']
+    return None
+
+#
+def find_compressor(preference = 'auto', processes = 0):
+    """
+    It returns the command line (as list) of the fastest compressor found
+    (or of the preferred one, if it is found) or None if none is found.
+    """
+    if preference and preference not in ('auto','no'):
+        if preference == 'gzip':
+            # pigz produces gzip files also
+            candidates = ('pigz','gzip')
+        else:
+            candidates = (preference,)
+    elif preference == 'auto':
+        candidates = COMPRESSORS
+    else:
+        candidates = ()
+    for c in candidates:
+        r = compressor(c, processes)
+        if r:
+            return r
+    return None
+
+#
+class pipe:
+    """
+    It reads the output of a decompression program as a file (read only).
+    """
+    def __init__(self, cmd, file_name):
+        self.file_name = file_name
+        self.cmd = cmd
+        f = open(file_name,'rb')
+        self.process = subprocess.Popen(cmd,
+                                        stdin = f,
+                                        stdout = subprocess.PIPE,
+                                        bufsize = 16*1024*1024,
+                                        close_fds = True,
+                                        preexec_fn = lambda: signal.signal(signal.SIGPIPE, signal.SIG_DFL))
+        f.close()
+        self.file_handle = self.process.stdout
+        self.done = False
+
+    def readline(self, *args):
+        line = self.file_handle.readline(*args)
+        if not line:
+            self.done = True
+        return line
+
+    def readlines(self, *args):
+        lines = self.file_handle.readlines(*args)
+        if not lines:
+            self.done = True
+        return lines
+
+    def read(self, *args):
+        data = self.file_handle.read(*args)
+        if not data:
+            self.done = True
+        return data
+
+    def __iter__(self):
+        for line in self.file_handle:
+            yield line
+        self.done = True
+
+    def close(self):
+        if self.file_handle:
+            self.file_handle.close()
+            self.file_handle = None
+            r = self.process.wait()
+            # the reader may stop earlier (and the decompression is killed
+            # by SIGPIPE), which is fine
+            if r != 0 and not (r == -signal.SIGPIPE and not self.done):
+                raise IOError("Decompression of '%s' failed (exit code %d): %s" % (self.file_name, r, ' '.join(self.cmd)))
+
+    def __del__(self):
+        if self.file_handle:
+            self.file_handle.close()
+            self.process.wait()
+
+#
+def zopen(file_name, processes = 0):
+    """
+    It opens a file (which might be compressed) for reading. It returns a
+    file-like object.
+    """
+    if file_name == '-':
+        return sys.stdin
+    k = kind(file_name)
+    if not k:
+        return open(file_name,'r')
+    cmd = decompressor(file_name, processes)
+    if cmd:
+        return pipe(cmd, file_name)
+    if k == 'gz':
+        return gzip.open(file_name,'r')
+    elif k == 'bz2':
+        return bz2.BZ2File(file_name,'r')
+    print >>sys.stderr,"ERROR: Cannot find any program for decompressing '%s'!" % (file_name,)
+    sys.exit(1)
+    #
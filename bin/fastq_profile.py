@@ -0,0 +1,430 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It profiles a FASTQ file in one single pass, i.e. it counts the reads, it
+computes the histogram of the lengths of the reads, it auto-detects the
+encoding of the quality scores (i.e. Sanger, Solexa or Illumina), it converts
+the read names from the Illumina CASAVA version 1.8 format to the older
+Solexa version 1.5 format (i.e. the read names end with /1 or /2 and the reads
+marked as filtered are removed) and it converts the quality scores to Sanger
+format. The statistics are written in a JSON file.
+
+It replaces running 'wc -l', 'solexa18to15.py', 'phred.py' and
+'lengths_reads.py' one after another on the same input file. In case that no
+changes are needed (which is the most common case) the output file is just a
+link to the input file. The quality scores are converted using a translation
+table (i.e. the lengths of the lines do not change) and only the reads which
+have been read before the encoding was detected are converted again (this
+happens only for the old Solexa/Illumina formats).
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+
+"""
+import os
+import sys
+import gc
+import math
+import json
+import shutil
+import optparse
+import collections
+import compression
+
+# the number of reads used for auto-detecting the encoding of the quality
+# scores (same as in 'phred.py')
+FIRST = 10000000
+
+#
+def sanger_table(encoding):
+    """
+    It returns the translation table which converts the quality scores from
+    the given encoding ('solexa' or 'illumina') to Sanger (the new line
+    characters are not changed).
+    """
+    t = [chr(i) for i in xrange(256)]
+    if encoding == 'illumina':
+        for i in xrange(64,127):
+            t[i] = chr(i - 31)
+    elif encoding == 'solexa':
+        for i in xrange(59,127):
+            q = 10 * math.log10(10 ** ((i - 64) / 10.0) + 1)
+            t[i] = chr(min(int(round(q)),93) + 33)
+    return ''.join(t)
+
+#
+def read_names_version(line):
+    """
+    It returns the version of the format of the read names ('1.5' or '1.8' or
+    None if the format is not supported).
+    """
+    t = line.rstrip("\r\n").rstrip()
+    if ((t.endswith('/1') or t.endswith('/2')) and
+        t.find(' ') == -1 and
+        t.find('\t') == -1):
+        return '1.5'
+    t = t.split(" ")
+    if len(t) >= 2:
+        t0 = t[0].split(":")
+        t1 = t[1].split(":")
+        if len(t0) == 7 and len(t1) == 4 and (t1[0] == '1' or t1[0] == '2'):
+            return '1.8'
+    return None
+
+#
+def convert_in_place(filename, table, size_buffer = 10**8):
+    """
+    It converts in place the quality scores of a FASTQ file (the lengths of
+    the lines do not change).
+    """
+    f = open(filename,'r+b')
+    i = 0
+    while True:
+        position = f.tell()
+        lines = f.readlines(size_buffer)
+        if not lines:
+            break
+        n = len(lines)
+        for j in xrange((3 - i) % 4, n, 4):
+            lines[j] = lines[j].translate(table)
+        i = i + n
+        f.seek(position)
+        f.writelines(lines)
+        f.seek(f.tell())
+    f.close()
+
+#
+def convert_copy(input_filename, fou, count, table, size_buffer = 10**8):
+    """
+    It copies the first 'count' lines of a FASTQ file to the output file and
+    it converts their quality scores.
+    """
+    fin = compression.zopen(input_filename)
+    i = 0
+    while i < count:
+        lines = fin.readlines(size_buffer)
+        if not lines:
+            break
+        if i + len(lines) > count:
+            lines = lines[:count - i]
+        n = len(lines)
+        for j in xrange((3 - i) % 4, n, 4):
+            lines[j] = lines[j].translate(table)
+        i = i + n
+        fou.writelines(lines)
+    fin.close()
+
+#
+def link_file(input_filename, output_filename, link = 'soft'):
+    """
+    It links the output file to the input file (same as in 'phred.py').
+    """
+    if os.path.isfile(output_filename) or os.path.islink(output_filename):
+        os.remove(output_filename)
+    if link == 'soft':
+        if os.path.islink(input_filename):
+            os.symlink(os.readlink(input_filename),output_filename)
+        else:
+            os.symlink(input_filename,output_filename)
+    elif link == 'hard':
+        linkto = input_filename
+        if os.path.islink(input_filename):
+            linkto = os.readlink(input_filename)
+        try:
+            os.link(linkto,output_filename)
+        except OSError as er:
+            print >>sys.stderr,"WARNING: Cannot do hard links ('%s' and '%s')!" % (linkto,output_filename)
+            shutil.copyfile(linkto,output_filename)
+    elif link == 'copy':
+        shutil.copyfile(input_filename, output_filename)
+    else:
+        print >>sys.stderr, "ERROR: unknown operation of linking!", link
+        sys.exit(1)
+
+#
+def profile(input_filename,
+            output_filename,
+            stats_filename = None,
+            counts_filename = None,
+            lengths_filename = None,
+            fail = False,
+            skip_filter = False,
+            link = 'soft',
+            first = FIRST,
+            size_buffer = 10**8):
+    """
+    It profiles (and converts, if needed) a FASTQ file in one single pass
+    and it returns the statistics as a dictionary.
+    """
+    fin = compression.zopen(input_filename)
+
+    t = fin.readline()
+    if not t:
+        print >>sys.stderr,"ERROR: The input file '%s' is empty!" % (input_filename,)
+        sys.exit(1)
+    if not t.startswith("@"):
+        print >>sys.stderr,"ERROR: The input file '%s' is not in FASTQ file format!" % (input_filename,)
+        print >>sys.stderr,"The read names in the input file look like '%s'." % (t.rstrip('\r\n'),)
+        sys.exit(1)
+
+    names = read_names_version(t)
+    if fail and (not names):
+        print >>sys.stderr,"ERROR: The input FASTQ file is not in a supported FASTQ format, which are:"
+        print >>sys.stderr," - version 1.5 (i.e. read names end with /1 or /2 and contain no blank characters)"
+        print >>sys.stderr," - version 1.8 (e.g. read name looks like '@GQWE8:57:C00T6ABXX:2:1101:1233:2230 1:N:0:CTTGTA')"
+        print >>sys.stderr,"The read names in the input file look like this '%s' but it should look like this '@GQWE8:57:C00T6ABXX:2:1101:1233:2230 1:N:0:CTTGTA' (i.e. there should be 6 of ':' in read name, one blank space between read name and description, description should be in this format '1:N:0:CTTGTA')" % (t.rstrip('\r\n'),)
+        sys.exit(1)
+    rename = names == '1.8'
+    if rename:
+        print >>sys.stderr,"The input file is in FASTQ format compatible with Illumina pipeline CASAVA version 1.8!"
+        print >>sys.stderr,"The short read names will be changed (i.e. adding /1 and /2)!"
+        if not skip_filter:
+            print >>sys.stderr,"Filtering out the reads marked by Illumina SOLEXA as Y."
+
+    # the output is written while reading only if the reads are changed
+    # (or if the input cannot be read again or it is compressed), otherwise
+    # it is written only once it is known that the quality scores should be
+    # converted
+    direct = rename or input_filename == '-' or compression.kind(input_filename)
+    fou = open(output_filename,'wb') if direct else None
+
+    encoding = None
+    table = None
+    minimum = chr(126)
+    count = 0 # lines in input
+    reads = 0 # reads in output
+    lengths = collections.Counter()
+    leftover = [t]
+    while True:
+        gc.disable()
+        lines = fin.readlines(size_buffer)
+        gc.enable()
+        if not lines:
+            if leftover:
+                print >>sys.stderr,"WARNING: The last read from the input file '%s' is incomplete and it is skipped!" % (input_filename,)
+                count = count + len(leftover)
+            break
+        if leftover:
+            lines = leftover + lines
+        n = len(lines) - len(lines) % 4
+        if n != len(lines):
+            leftover = lines[n:]
+            del lines[n:]
+        else:
+            leftover = []
+        if not lines:
+            continue
+        consumed = count
+        count = count + n
+
+        if rename:
+            data = []
+            for j in xrange(0, n, 4):
+                r = lines[j].partition(" ")
+                if skip_filter:
+                    if r[2].startswith("1:"):
+                        data.extend((r[0] + "/1\n", lines[j+1], "+\n", lines[j+3]))
+                    elif r[2].startswith("2:"):
+                        data.extend((r[0] + "/2\n", lines[j+1], "+\n", lines[j+3]))
+                    else:
+                        data.extend((lines[j], lines[j+1], "+\n", lines[j+3]))
+                elif r[2].startswith("1:N:"):
+                    data.extend((r[0] + "/1\n", lines[j+1], "+\n", lines[j+3]))
+                elif r[2].startswith("2:N:"):
+                    data.extend((r[0] + "/2\n", lines[j+1], "+\n", lines[j+3]))
+            lines = data
+            n = len(lines)
+
+        reads = reads + n / 4
+        lengths.update(map(len,lines[1::4]))
+
+        if encoding is None and n:
+            q = ''.join(lines[3::4]).translate(None,'\r\n')
+            if q:
+                minimum = min(minimum,min(q))
+            if minimum < ';':
+                encoding = 'sanger'
+            elif reads >= first:
+                encoding = 'solexa' if minimum < '@' else 'illumina'
+            if encoding:
+                print >>sys.stderr,"Auto-detect found "+encoding.upper()+" FASTQ format!"
+            if encoding and encoding != 'sanger':
+                table = sanger_table(encoding)
+                if direct:
+                    fou.flush()
+                    convert_in_place(output_filename, table, size_buffer)
+                else:
+                    fou = open(output_filename,'wb')
+                    convert_copy(input_filename, fou, consumed, table, size_buffer)
+
+        if table:
+            for j in xrange(3, n, 4):
+                lines[j] = lines[j].translate(table)
+        if fou:
+            fou.writelines(lines)
+
+    if fin != sys.stdin:
+        fin.close()
+
+    if encoding is None:
+        # less reads than needed for auto-detection
+        encoding = 'sanger'
+        if reads and minimum >= ';':
+            encoding = 'solexa' if minimum < '@' else 'illumina'
+        print >>sys.stderr,"Auto-detect found "+encoding.upper()+" FASTQ format!"
+        if encoding != 'sanger':
+            table = sanger_table(encoding)
+            if direct:
+                fou.flush()
+                convert_in_place(output_filename, table, size_buffer)
+            else:
+                fou = open(output_filename,'wb')
+                convert_copy(input_filename, fou, count, table, size_buffer)
+
+    if fou:
+        fou.close()
+    else:
+        print >>sys.stderr,"No changes are done!"
+        link_file(input_filename, output_filename, link)
+
+    lengths = dict([(k - 1, v) for (k, v) in lengths.iteritems()])
+    stats = {'input': input_filename,
+             'output': output_filename,
+             'reads_input': count / 4,
+             'reads_output': reads,
+             'reads_filtered': count / 4 - reads,
+             'read_names': names if names else 'unknown',
+             'read_names_changed': rename,
+             'quality_encoding': encoding,
+             'quality_converted': table is not None,
+             'minimum_length': min(lengths) if lengths else 0,
+             'maximum_length': max(lengths) if lengths else 0,
+             'lengths': dict([(str(k), v) for (k, v) in lengths.iteritems()])}
+
+    if stats_filename:
+        fo = open(stats_filename,'w')
+        json.dump(stats, fo, indent = 1, sort_keys = True)
+        fo.write('\n')
+        fo.close()
+    if counts_filename:
+        file(counts_filename,'w').write("%d\n" % (count / 4,))
+    if lengths_filename:
+        file(lengths_filename,'w').writelines([str(k)+'\n' for k in sorted(lengths,reverse=True)])
+    return stats
+
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options]"
+    description = """It profiles a FASTQ file in one single pass, i.e. it counts the reads, it computes the histogram of the lengths of the reads, it auto-detects the encoding of the quality scores, it converts the read names to the Solexa version 1.5 format (i.e. ending with /1 or /2) and the quality scores to Sanger format. The statistics are written in a JSON file."""
+    version = "%prog 0.10 beta"
+
+    parser = optparse.OptionParser(usage = usage,
+                                   description = description,
+                                   version = version)
+
+    parser.add_option("--input","-i",
+                      action = "store",
+                      type = "string",
+                      dest = "input_filename",
+                      help = """The input FASTQ file (also given thru stdin or as compressed file, i.e. gzip, bzip2 or xz).""")
+
+    parser.add_option("--output","-o",
+                      action = "store",
+                      type = "string",
+                      dest = "output_filename",
+                      help = """The output FASTQ file where the read names end with /1 or /2 and the quality scores are in Sanger format.""")
+
+    parser.add_option("--stats","-s",
+                      action = "store",
+                      type = "string",
+                      dest = "stats_filename",
+                      help = """The output JSON file containing the statistics of the input file (i.e. counts of reads, histogram of lengths of reads, encoding of the quality scores, format of the read names).""")
+
+    parser.add_option("--counts","-c",
+                      action = "store",
+                      type = "string",
+                      dest = "counts_filename",
+                      help = """The output text file containing the count of reads found in the input file.""")
+
+    parser.add_option("--lengths","-l",
+                      action = "store",
+                      type = "string",
+                      dest = "lengths_filename",
+                      help = """The output text file containing the unique lengths of the reads (sorted in descending order, same as 'lengths_reads.py').""")
+
+    parser.add_option("--skip_filter",
+                      action = "store_true",
+                      dest = "skip_filter",
+                      default = False,
+                      help = """If it is set then the reads which have been marked by Illumina as filtered are not filtered out. Default is %default.""")
+
+    parser.add_option("--fail",
+                      action = "store_true",
+                      dest = "fail",
+                      default = False,
+                      help = """In case that the short reads names do not end with /1 or /2 or are not in format '@GQWE8:57:C00T6ABXX:2:1101:1233:2230 1:N:0:CTTGTA' then the script will exit with an exit error code. Default is %default.""")
+
+    choices = ('soft','hard','copy')
+    parser.add_option("--link",
+                      action = "store",
+                      choices = choices,
+                      dest = "link",
+                      default = 'soft',
+                      help = """It creates a link from the output file to the input file of type ("""+','.join(choices)+""") in case that no operation is done on the input file. Default is '%default'.""")
+
+    (options, args) = parser.parse_args()
+
+    # validate options
+    if not (options.input_filename and
+            options.output_filename
+            ):
+        parser.print_help()
+        parser.error("No inputs and outputs specified!")
+
+    print >>sys.stderr,"Starting..."
+    stats = profile(input_filename = options.input_filename,
+                    output_filename = options.output_filename,
+                    stats_filename = options.stats_filename,
+                    counts_filename = options.counts_filename,
+                    lengths_filename = options.lengths_filename,
+                    fail = options.fail,
+                    skip_filter = options.skip_filter,
+                    link = options.link)
+    print >>sys.stderr,"%d reads read and %d reads written." % (stats['reads_input'],stats['reads_output'])
+    print >>sys.stderr,"Done."
+    #
@@ -57,17 +57,13 @@ import sys
 import os
 import optparse
 import gc
-import gzip
+import compression
 
 #########################
 def line_from(a_map_filename):
     # it gives chunks from a_map_filename which is assumed to be ordered by the
     # name of reads (i.e. column 1 = read name)
-    fin = None
-    if a_map_filename.lower().endswith('.gz'):
-        fin = gzip.open(a_map_filename,'r')
-    else:
-        fin = open(a_map_filename,'r')
+    fin = compression.zopen(a_map_filename) # it might be compressed
     buffer_size = 10**8
     while True:
         gc.disable()
@@ -132,6 +132,7 @@ import optparse
 import tempfile
 import Bio.SeqIO
 import itertools
+import intervals
 
 #########################
 def coord_gene2genome(a_gene,positions,a_database):
@@ -265,32 +266,27 @@ a candidate list of fusion genes (where short reads have been aligned using BLAT
     # start_position
     # strand
     # chromosome_name
-    col=dict()
-    col['gene']=0
-    col['end']=1
-    col['start']=2
-    col['strand']=3
-    col['chr']=4
-    gene = [line.rstrip('\r\n').split('\t') for line in file(options.input_genes_positions_filename,'r').readlines()]
+    # the genes are indexed (see 'intervals.py')
+    db = intervals.load(options.input_genes_positions_filename,'genes')
     gene_dict = dict()
-    for line in gene:
-        g = line[col['gene']]
-        s = line[col['start']]
-        e = line[col['end']]
-        c = line[col['chr']]
-        t = line[col['strand']]
-        if not gene_dict.has_key(g):
-            gene_dict[g]={'chr':'','strand':'','start':0,'end':0,'hugo':''}
-        else:
-            if gene_dict[g]['chr'] == c and gene_dict[g]['start'] == int(s) and gene_dict[g]['end'] == int(e) and gene_dict[g]['strand'] == int(t):
+    for g in db.genes:
+        x = db.gene(g)
+        # each line of a gene is compared to its previous line
+        for (previous,y) in zip(x[:-1],x[1:]):
+            if (y[intervals.CHROM] == previous[intervals.CHROM] and
+                y[intervals.START] == previous[intervals.START] and
+                y[intervals.END] == previous[intervals.END] and
+                int(y[intervals.STRAND]) == int(previous[intervals.STRAND])):
                 print >>sys.stderr,"WARNING: gene id %s is not unique!" % (g,)
             else:
                 print >>sys.stderr,"ERROR: gene id %s is not unique!" % (g,)
                 sys.exit(1)
-        gene_dict[g]['chr'] = c
-        gene_dict[g]['start'] = int(s)
-        gene_dict[g]['end'] = int(e)
-        gene_dict[g]['strand'] = int(t)
+        x = x[-1]
+        gene_dict[g]={'chr':x[intervals.CHROM],
+                      'strand':int(x[intervals.STRAND]),
+                      'start':x[intervals.START],
+                      'end':x[intervals.END],
+                      'hugo':''}
         if gene_dict[g]['start'] > gene_dict[g]['end']:
             print "Error: bad gene coordinates!"
             print g,gene_dict[g]['start'],gene_dict[g]['end'],gene_dict[g]['strand']
@@ -83,6 +83,8 @@ import optparse
 import gc
 import multiprocessing
 import itertools
+import array
+import Queue
 
 #########################
 def line_from3(a_map_filename):
@@ -242,11 +244,48 @@ def is_overlapping(e1,e2,tolerance = 50):
     return r
 
 
+#########################
+# a pair of genes (given as integer ids) is coded as one integer
+SHIFT = 2**32
+MASK = SHIFT - 1
+
+# the type of the arrays of unsigned integers of (at least) 32 bits, i.e. the
+# halves of the pairs of genes and the counts ('L' has only 32 bits on 32-bit
+# builds and on Windows and there is no 'Q' in Python 2)
+UINT32 = 'I' if array.array('I').itemsize >= 4 else 'L'
+
+#########################
+def encode(reads, ids, names):
+    # it replaces the gene ids (strings) with dense integer ids (in the order
+    # in which they are found); the order of the genes of a read is kept
+    for (ar,ge,ex) in reads:
+        x = []
+        for g in ge:
+            i = ids.get(g)
+            if i is None:
+                i = len(names)
+                ids[g] = i
+                names.append(g)
+            x.append(i)
+        yield (ar,x,ex)
+
+#########################
+def batches(reads, size = 10000):
+    # it gives the reads in batches
+    batch = []
+    for r in reads:
+        batch.append(r)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
 #########################
 #def compute_homology(ar,ge,ex):
 def homology(stuff):
     # ar = read id
-    # ge = list of gene ids
+    # ge = list of gene ids (integers, see encode)
     # ex = list of exons coordinates
 
     ar = stuff[0]
@@ -261,15 +300,80 @@ def homology(stuff):
     if n > 100:
         n = 100
     for a in xrange(0,n-1):
+        k = ge[a] * SHIFT
         for b in xrange(a+1,n):
-            k = '%s\t%s' % (ge[a],ge[b])
-#            if g[a] > g[b]:
-#                k = '%s\t%s' % (g[b],g[a])
-            hom.append(k)
+            hom.append(k + ge[b])
             if ex and (not is_overlapping(ex[a],ex[b])):
                 flag = True
     return (hom, ar if flag else None )
 
+#########################
+def homology_batch(batch, counts):
+    # it counts (in COUNTS) the pairs of genes of a batch of reads; it gives
+    # the reads for which the genes are not overlapping and the read with the
+    # most pairs of genes from this batch
+    offenders = []
+    max_pairs = 0
+    max_pairs_id = ''
+    gc.disable()
+    for stuff in batch:
+        (h,f) = homology(stuff)
+        z = len(h)
+        if z > max_pairs:
+            max_pairs = z
+            max_pairs_id = f
+        for k in h:
+            counts[k] = counts.get(k,0) + 1
+        if f:
+            offenders.append(f)
+    gc.enable()
+    return (offenders, max_pairs, max_pairs_id)
+
+#########################
+def pack(counts):
+    # the counts of the pairs of genes (sparse) as compact arrays, i.e. the
+    # first genes, the second genes and the counts
+    return (array.array(UINT32,[k // SHIFT for k in counts.iterkeys()]).tostring(),
+            array.array(UINT32,[k & MASK for k in counts.iterkeys()]).tostring(),
+            array.array(UINT32,counts.itervalues()).tostring())
+
+#########################
+def merge(counts, packed):
+    # it adds to COUNTS the packed counts of the pairs of genes
+    first = array.array(UINT32)
+    first.fromstring(packed[0])
+    second = array.array(UINT32)
+    second.fromstring(packed[1])
+    values = array.array(UINT32)
+    values.fromstring(packed[2])
+    keys = itertools.imap(lambda a,b: a * SHIFT + b, first, second)
+    gc.disable()
+    if counts:
+        for (k,v) in itertools.izip(keys,values):
+            counts[k] = counts.get(k,0) + v
+    else:
+        counts.update(itertools.izip(keys,values))
+    gc.enable()
+
+#########################
+def counter(tasks, results, limit = 5*10**6):
+    # it runs in a separate process and it counts the pairs of genes of all
+    # the batches of reads which it gets; the counts are sent back only at the
+    # end (or when there are too many pairs) such that only a few sparse
+    # counts are merged by the main process (instead of one for each batch)
+    counts = dict()
+    while True:
+        batch = tasks.get()
+        if batch is None:
+            break
+        (offenders, z, f) = homology_batch(batch, counts)
+        packed = None
+        if len(counts) > limit:
+            packed = pack(counts)
+            counts = dict()
+        results.put((packed, offenders, z, f, False))
+    results.put((pack(counts), [], 0, '', True))
+
 #
 # def shred(stuff):
 #    return compute_homology(stuff[0],stuff[1],stuff[2])
@@ -438,7 +542,6 @@ if __name__ == '__main__':
 
 
     #print "Finding the homolog genes..."
-    pool = multiprocessing.Pool(processes=cpus)
     homolog = dict()
     offenders = list()
     fo = None
@@ -469,26 +572,59 @@ if __name__ == '__main__':
     max_genes_per_read = 0
     max_genes_per_read_id = ''
 
-    if fo:
-        for w in pool.imap_unordered(
-            homology,
-            my_iter,
-            chunksize = 100):
-
-            h = w[0] # list of pairs of genes which are homologous to each other
-            f = w[1] # read id if it the genes are NOT overlapping
+    # the genes are counted as integers (see encode); the batches of reads
+    # are counted by several processes and their counts are merged here
+    ids = dict()
+    names = list()
+    reads = batches(encode(my_iter, ids, names))
+    workers = []
+    tasks = None
+    results = None
+    if cpus > 1:
+        tasks = multiprocessing.Queue(2 * cpus)
+        results = multiprocessing.Queue()
+        workers = [multiprocessing.Process(target = counter, args = (tasks, results)) for i in xrange(cpus)]
+        for w in workers:
+            w.daemon = True
+            w.start()
+
+    done = 0
+    while True:
+        got = []
+        if workers:
+            batch = next(reads, None)
+            if batch is not None:
+                tasks.put(batch)
+                # the results which are ready
+                while True:
+                    try:
+                        got.append(results.get_nowait())
+                    except Queue.Empty:
+                        break
+            else:
+                for w in workers:
+                    tasks.put(None)
+                while done < len(workers):
+                    r = results.get()
+                    if r[4]:
+                        done = done + 1
+                    got.append(r)
+        else:
+            batch = next(reads, None)
+            if batch is not None:
+                r = homology_batch(batch, homolog)
+                got.append((None, r[0], r[1], r[2], False))
+
+        for (packed, offending, z, f, last) in got:
+            if packed:
+                merge(homolog, packed)
 
-            z = len(h)
             if z > max_genes_per_read:
                 max_genes_per_read = z
                 max_genes_per_read_id = f
 
-            for k in h:
-                gc.disable()
-                homolog[k] = homolog.get(k,0) + 1
-                gc.enable()
-            if f:
-                offenders.append(f)
+            if fo:
+                offenders.extend(offending)
                 if len(offenders) > 100000:
                     d = list()
                     for e in offenders:
@@ -505,6 +641,13 @@ if __name__ == '__main__':
                     fo.writelines([line+'\n' for line in d])
                     offenders = []
 
+        if batch is None:
+            break
+
+    for w in workers:
+        w.join()
+
+    if fo:
         if offenders:
             d = list()
             for e in offenders:
@@ -519,61 +662,21 @@ if __name__ == '__main__':
                     d.append(e)
                     gc.enable()
             fo.writelines([line+'\n' for line in d])
-        if fo:
-            fo.close()
-
-    else:
+        fo.close()
 
-        for w in pool.imap_unordered(
-            homology,
-            my_iter,
-            chunksize = 100):
-
-
-#        for w in itertools.imap(
-#            shred,
-#            my_iter):
-
-
-
-            h = w[0]
-            #f = w[1]
-
-            z = len(h)
-            if z > max_genes_per_read:
-                max_genes_per_read = z
-                max_genes_per_read_id = w[1]
-
-            for k in h:
-                gc.disable()
-                homolog[k] = homolog.get(k,0) + 1
-                gc.enable()
-
-
-#        g = genes
-#        n = len(genes)
-#        flag = False
-#        for a in xrange(0,n-1):
-#            for b in xrange(a+1,n):
-#                k = '%s\t%s' % (g[a],g[b])
-#                if g[a] > g[b]:
-#                    k = '%s\t%s' % (g[b],g[a])
-#                gc.disable()
-#                homolog[k] = homolog.get(k,0) + 1
-#                gc.enable()
-#                if database and (not is_overlapping(g[a],g[b])):
-#                    flag = True
-#        if flag:
-#            gc.disable()
-#            offenders.add(a_read)
-#            gc.enable()
-
-    pool.close()
-    pool.join()
     #print "Writing...",options.output_filename
     #homolog = sorted([k+'\t'+str(v)+'\n' for (k,v) in homolog.items() if v >= options.reads])
-    homolog = [k+'\t'+str(v)+'\n' for (k,v) in homolog.items() if v >= options.reads]
-    file(options.output_filename,'w').writelines(homolog)
+    fou = file(options.output_filename,'w')
+    piece = []
+    for (k,v) in homolog.iteritems():
+        if v >= options.reads:
+            # the names of the genes are needed only here
+            piece.append('%s\t%s\t%d\n' % (names[k / SHIFT],names[k % SHIFT],v))
+            if len(piece) > 100000:
+                fou.writelines(piece)
+                piece = []
+    fou.writelines(piece)
+    fou.close()
 
     print >> sys.stderr, "Read '%s' found mapping on %d genes!" % (max_genes_per_read_id,max_genes_per_read)
 
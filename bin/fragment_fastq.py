@@ -206,6 +206,7 @@ def fragment_fastq(
         skip = 0,
         trim_n = False,
         verbose = False,
+        input_file_merged = None
             ):
     #
     #
@@ -223,13 +224,56 @@ def fragment_fastq(
     
 
     
-    fq1 = open(output_file_1,"w")
+    fq1 = sys.stdout if output_file_1 == '-' else open(output_file_1,"w")
     fq2 = None
     if output_file_2 and output_file_2 != '-':
         fq2 = open(output_file_2,"w")
     
     t1 = []
     t2 = []
+
+    (t1,t2) = fragment_reads(input_file_1, input_file_2, fq1, fq2, t1, t2,
+                             window, step, threshold, anchors, wiggle_end, skip, trim_n, limit)
+
+    # the merged reads (single-end) are fragmented after the paired-end reads
+    # and streamed into the same output (instead of fragmenting them into
+    # separate files which are concatenated afterwards)
+    if input_file_merged:
+        (t1,t2) = fragment_reads(input_file_merged, "-", fq1, fq2, t1, t2,
+                                 window, step, threshold, anchors, wiggle_end, skip, trim_n, limit)
+
+    if t1:
+        fq1.writelines(t1)
+    if output_file_1 != '-':
+        fq1.close()
+
+    if fq2:
+        if t2:
+            fq2.writelines(t2)
+        fq2.close()
+
+
+#
+#
+#
+def fragment_reads(
+        input_file_1,
+        input_file_2,
+        fq1,
+        fq2,
+        t1,
+        t2,
+        window,
+        step,
+        threshold,
+        anchors,
+        wiggle_end,
+        skip,
+        trim_n,
+        limit
+            ):
+    # it fragments the reads of the input files and it appends them to the
+    # buffers T1 and T2 (which are written to FQ1 and FQ2 when they are full)
     zn = 0
     z = []
     
@@ -239,7 +283,7 @@ def fragment_fastq(
     get_reads = None
     single = False
     if input_file_2 and input_file_2 == "-":
-        get_reads = reads_from_single_fastq_file(input_file_1,anchor_size=window_size-step)
+        get_reads = reads_from_single_fastq_file(input_file_1,anchor_size=window-step)
         single = True
     else:
         get_reads = reads_from_paired_fastq_file(input_file_1,input_file_2)
@@ -361,14 +405,7 @@ def fragment_fastq(
             fq2.writelines(t2)
             t2 = []
 
-    if t1:
-        fq1.writelines(t1)
-    fq1.close()
-
-    if fq2:
-        if t2:
-            fq2.writelines(t2)
-        fq2.close()
+    return (t1,t2)
 
 
 ######################################################################
@@ -424,11 +461,17 @@ Copyright (c) 2009-2017 Daniel Nicorici
                       default = "-",
                       help = """The input FASTQ file containing the reads from 3' fragment end (i.e. 5'-3' orientation for read 1 and 3'-5' for read 2 which needs to be reversed-complemented). If this is not used then the input FASTQ file is assume to contain single-end reads.""")
 
+    parser.add_option("-m","--input_merged",
+                      action = "store",
+                      type = "string",
+                      dest = "input_merged_filename",
+                      help = """An input FASTQ file containing single-end reads (e.g. the pairs of reads which have been merged) which are fragmented after the reads given in '--input_1' and '--input_2' and which are written to the same output (interleaved). This is the same as fragmenting it separately and concatenating the outputs but without writing them on the disk twice. It works only if '--output_2' is not used.""")
+
     parser.add_option("-f","--output_1",
                       action = "store",
                       type = "string",
                       dest = "output_1_filename",
-                      help = """The output FASTQ file where the reads are trimmed.""")
+                      help = """The output FASTQ file where the reads are trimmed. If it is '-' then the reads are written to the standard output.""")
 
     parser.add_option("-r","--output_2",
                       action = "store",
@@ -515,6 +558,9 @@ Copyright (c) 2009-2017 Daniel Nicorici
         parser.print_help()
         parser.error("One of the arguments has not been specified.")
 
+    if options.input_merged_filename and options.output_2_filename != '-':
+        parser.error("The option '--input_merged' cannot be used together with '--output_2'!")
+
     #
     fragment_fastq(
         options.input_1_filename,
@@ -529,7 +575,8 @@ Copyright (c) 2009-2017 Daniel Nicorici
         options.wiggle_end,
         options.skip_short,
         options.trim_n,
-        options.verbose
+        options.verbose,
+        options.input_merged_filename
         )
 
 
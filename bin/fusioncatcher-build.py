@@ -50,6 +50,7 @@ import socket
 import locale
 import workflow
 import configuration
+import memory_model
 
 bowtie_error = ("Please, check if 'Bowtie' (from <http://bowtie-bio.sourceforge.net/index.shtml>) "+
                "is installed correctly and it is in the corresponding PATH "+
@@ -105,6 +106,18 @@ def empty(a_file):
             f = False
     return f
 
+#
+#
+def memory_hint(step, reference, default):
+    # the memory (in GB) reserved for building an index when it is executed
+    # concurrently with other steps (see 'memory' in 'workflow.py'), as
+    # predicted by 'memory_model.py' from the size of the reference (the
+    # default is used if the reference does not exist yet)
+    if os.path.isfile(reference):
+        model = memory_model.load(os.path.join(pipeline_path,"..","etc","memory_model.txt"))
+        return memory_model.peak(step, os.path.getsize(reference), model = model)
+    return default
+
 #
 # command line parsing
 #
@@ -298,6 +311,48 @@ if __name__ == '__main__':
                              "This is intended to be used for debugging. "+
                              "Default is '%default'.")
 
+    parser.add_option("--incremental",
+                      action = "store_true",
+                      dest = "incremental",
+                      default = False,
+                      help = "If it is set then a step is skipped when its "+
+                             "outputs have already been built from exactly the "+
+                             "same inputs (i.e. same content) in a previous run "+
+                             "in the same output directory. The fingerprints of "+
+                             "the inputs used for building each database file "+
+                             "are saved in 'manifest.txt' in the output directory "+
+                             "(only when this option is set, i.e. the first build "+
+                             "with this option builds everything). This is useful "+
+                             "for updating an existing database where only some "+
+                             "sources have changed. "+
+                             "Default is '%default'.")
+
+    parser.add_option("--telemetry",
+                      action = "store_true",
+                      dest = "telemetry",
+                      default = False,
+                      help = "If it is set then the resources used by each executed "+
+                             "step (i.e. wall time, CPU time, peak memory, bytes "+
+                             "read/written, sizes of inputs/outputs, used space of "+
+                             "the file system of the output directory) are saved in "+
+                             "'telemetry.jsonl' and the timeline of the steps is "+
+                             "saved in 'telemetry.trace.json' (Chrome trace "+
+                             "format, which can be viewed with Perfetto) in the "+
+                             "output directory. "+
+                             "Default is '%default'.")
+
+    parser.add_option("--in-process",
+                      action = "store_true",
+                      dest = "inprocess",
+                      default = False,
+                      help = "If it is set then the steps which run only one of the "+
+                             "Python scripts of FusionCatcher (i.e. no pipes) are "+
+                             "executed in-process, i.e. in a child forked from "+
+                             "the main process which has the common Python modules "+
+                             "already imported, instead of starting each time the "+
+                             "shell and a new Python interpreter. "+
+                             "Default is '%default'.")
+
     parser.add_option("--keep","-k",
                       action = "store_true",
                       dest = "keep_temporary_files",
@@ -411,7 +466,20 @@ if __name__ == '__main__':
             log_filename       = log_file,
             checksums_filename = options.checksums_filename,
             hash_library       = options.hash,
-            start_step         = options.start_step)
+            threads            = options.processes,
+            start_step         = options.start_step,
+            manifest_filename  = outdir('manifest.txt'),
+            incremental        = options.incremental,
+            telemetry_filename = outdir('telemetry.jsonl') if options.telemetry else None,
+            trace_filename     = outdir('telemetry.trace.json') if options.telemetry else None,
+            inprocess          = options.inprocess,
+            preload            = ['optparse','gzip','gc','shutil','socket','string',
+                                  'itertools','math','bisect','tempfile','datetime',
+                                  'multiprocessing','Bio','Bio.Seq','Bio.SeqIO',
+                                  'Bio.SeqRecord','Bio.Alphabet','symbols',
+                                  'concatenate','labels'],
+            keep               = options.keep_temporary_files,
+            disk_path          = outdir() if options.telemetry else None)
 
 
     ##############################################################################
@@ -701,6 +769,9 @@ if __name__ == '__main__':
     job.run()
 
 
+    # the lists of overlapping genes (UCSC, RefSeq, Gencode) are independent of each other
+    job.parallel_start()
+
     job.add(_FC_+'generate_overlapping_genes.py',kind='program')
     job.add('--input_genes',outdir('ucsc_genes.txt'),kind='input')
     job.add('--output',out_dir,kind='output',checksum='no')
@@ -822,6 +893,8 @@ if __name__ == '__main__':
         job.add('>',outdir('ig_loci.txt'),kind='output')
         job.run()
 
+    job.parallel_stop()
+
 #    if options.organism == 'homo_sapiens':
 #        job.add('grep',kind='program')
 #        job.add('-i',kind='parameter')
@@ -1014,6 +1087,10 @@ if __name__ == '__main__':
 #        job.link(outdir('genome3.fa'),outdir('genome.fa'),temp_path='yes')
 
 
+    # the lists of labels are independent of each other (they need only the
+    # symbols of the genes, e.g. 'synonyms.txt')
+    job.parallel_start()
+
     job.add(_FC_+'generate_rrna_unit.py',kind='program')
     job.add('--organism',options.organism,kind='parameter')
     job.add('--output',out_dir,kind='output',checksum='no')
@@ -1038,6 +1115,8 @@ if __name__ == '__main__':
     job.add('',outdir('non-tumor_cells.txt'),kind='output',command_line='no')
     job.run()
 
+    job.parallel_stop()
+
     job.add(_FC_+'get_noncancer.py',kind='program')
     job.add('--organism',options.organism,kind='parameter')
     job.add('--output',out_dir,kind='output',checksum='no')
@@ -1056,6 +1135,8 @@ if __name__ == '__main__':
     job.add('',outdir('oncogenes_more.txt'),kind='output',command_line='no')
     job.run()
 
+    job.parallel_start()
+
     job.add(_FC_+'generate_tumor-genes.py',kind='program')
     job.add('--organism',options.organism,kind='parameter')
     job.add('--output',out_dir,kind='output',checksum='no')
@@ -1099,6 +1180,17 @@ if __name__ == '__main__':
     job.add(_FC_+'generate_tcga.py',kind='program')
     job.add('--organism',options.organism,kind='parameter')
     job.add('--output',out_dir,kind='output',checksum='no')
+    # the overlapping genes are read from the output directory (see
+    # 'labels.OVERLAPPINGS') and 'pairs_pseudogenes.txt' is generated above
+    # concurrently
+    job.add('',outdir('ensembl_fully_overlapping_genes.txt'),kind='input',command_line='no')
+    job.add('',outdir('ensembl_same_strand_overlapping_genes.txt'),kind='input',command_line='no')
+    job.add('',outdir('refseq_fully_overlapping_genes.txt'),kind='input',command_line='no')
+    job.add('',outdir('refseq_same_strand_overlapping_genes.txt'),kind='input',command_line='no')
+    job.add('',outdir('ucsc_fully_overlapping_genes.txt'),kind='input',command_line='no')
+    job.add('',outdir('ucsc_same_strand_overlapping_genes.txt'),kind='input',command_line='no')
+    job.add('',outdir('pairs_pseudogenes.txt'),kind='input',command_line='no')
+    job.add('',outdir('paralogs.txt'),kind='input',command_line='no')
     job.add('',outdir('tcga.txt'),kind='output',command_line='no')
     job.run()
 
@@ -1144,6 +1236,8 @@ if __name__ == '__main__':
     job.add('',outdir('gliomas.txt'),kind='output',command_line='no')
     job.run()
 
+    job.parallel_stop()
+
     job.add(_FC_+'get_celllines.py',kind='program')
     job.add('--organism',options.organism,kind='parameter')
     job.add('--output',out_dir,kind='output',checksum='no')
@@ -1162,6 +1256,9 @@ if __name__ == '__main__':
     job.add('',outdir('pancreases.txt'),kind='output',command_line='no')
     job.run()
 
+    # the lists of genes are independent of each other
+    job.parallel_start()
+
     job.add('grep',kind='program')
     job.add('--ignore-case','\tHLA-',kind='parameter')
     job.add('',outdir('genes_symbols.txt'),kind='input')
@@ -1586,6 +1683,8 @@ if __name__ == '__main__':
     job.add('',outdir('transcripts.fa'),kind='output',command_line='no')
     job.run()
 
+    job.parallel_stop()
+
 #    job.add('extract_transcripts.py',kind='program')
 #    job.add('--input_genes',outdir('hla_12.txt'),kind='input')
 #    job.add('--input_transcriptome',outdir('transcripts.fa'),kind='input')
@@ -1717,6 +1816,11 @@ if __name__ == '__main__':
     job.add('',outdir('gtex.txt'),kind='output',command_line='no')
     job.run()
 
+    # the indexes are independent of each other (building the indexes of the
+    # genome needs lots of memory and therefore each index reserves the peak
+    # memory predicted for it)
+    job.parallel_start()
+
     job.add(_FC_+'concatenate.py',kind='program')
     job.add('',outdir('trna.fa'),kind='input')
     job.add('',outdir('rrna.fa'),kind='input')
@@ -1748,7 +1852,6 @@ if __name__ == '__main__':
     job.add('',outdir('final-list_candidate-fusion-genes.caption.md.txt'),kind='output',command_line='no')
     job.run()
 
-
     job.add(_BE_+'bowtie-build',kind='program')
     job.add('-f',kind='parameter')
 #    job.add('--ntoa',kind='parameter')
@@ -1812,7 +1915,7 @@ if __name__ == '__main__':
     job.add('--ftabchars','7',kind='parameter')
     job.add('',outdir('transcripts.fa'),kind='input')
     job.add('',outdir('transcripts_index/'),kind='output')
-    job.run(error_message = bowtie_error)
+    job.run(error_message = bowtie_error, memory = memory_hint('bowtie-build',outdir('transcripts.fa'),4))
 
     job.add(_BE_+'bowtie-build',kind='program')
     job.add('-f',kind='parameter')
@@ -1821,7 +1924,7 @@ if __name__ == '__main__':
     job.add('--ftabchars','7',kind='parameter')
     job.add('',outdir('genome.fa'),kind='input')
     job.add('',outdir('genome_index/'),kind='output')
-    job.run(error_message = bowtie_error)
+    job.run(error_message = bowtie_error, memory = memory_hint('bowtie-build',outdir('genome.fa'),16))
 
     job.add(_B2_+'bowtie2-build',kind='program')
     job.add('-f',kind='parameter')
@@ -1831,7 +1934,7 @@ if __name__ == '__main__':
     job.add('',outdir('genome.fa'),kind='input')
     job.add('',outdir('genome_index2/index'),kind='output',command_line='no')
     job.add('',outdir('genome_index2/index'),kind='output',checksum='no')
-    job.run(error_message = bowtie2_error)
+    job.run(error_message = bowtie2_error, memory = memory_hint('bowtie2-build',outdir('genome.fa'),16))
 
 
     job.add(_BE_+'bowtie-build',kind='program')
@@ -1841,7 +1944,7 @@ if __name__ == '__main__':
     job.add('--ftabchars','7',kind='parameter')
     job.add('',outdir('viruses-noblanks.fa'),kind='input')
     job.add('',outdir('viruses_index/'),kind='output')
-    job.run(error_message = bowtie_error)
+    job.run(error_message = bowtie_error, memory = memory_hint('bowtie-build',outdir('viruses-noblanks.fa'),4))
 
     if not options.skip_blat:
         job.add(_FT_+'faToTwoBit',kind='program')
@@ -1857,6 +1960,37 @@ if __name__ == '__main__':
             "Please, also read its commercial "+
             "license <http://www.kentinformatics.com/> if this applies in your case!"))
 
+    # the interval index of the exons and genes (see 'intervals.py') and the
+    # compiled chain of the liftover (see 'liftover.py'); these steps are the
+    # last ones such that the numbers of the previous steps do not change (see
+    # '--start')
+    job.add(_FC_+'intervals.py',kind='program')
+    job.add('--input',outdir('organism.gtf'),kind='input')
+    job.add('--format','gtf',kind='parameter')
+    job.add('--output',outdir('organism.gtf.idx'),kind='output')
+    job.run()
+
+    job.add(_FC_+'intervals.py',kind='program')
+    job.add('--input',outdir('exons.txt'),kind='input')
+    job.add('--format','exons',kind='parameter')
+    job.add('--output',outdir('exons.txt.idx'),kind='output')
+    job.run()
+
+    job.add(_FC_+'intervals.py',kind='program')
+    job.add('--input',outdir('genes.txt'),kind='input')
+    job.add('--format','genes',kind='parameter')
+    job.add('--output',outdir('genes.txt.idx'),kind='output')
+    job.run()
+
+    if options.organism == 'homo_sapiens':
+        job.add(_FC_+'liftover.py',kind='program')
+        job.add('--compile-only',kind='parameter')
+        job.add('--chain',outdir('hg38ToHg19.over.chain.gz'),kind='input')
+        job.add('--compiled',outdir('hg38ToHg19.over.chain.gz.compiled'),kind='output')
+        job.run()
+
+    job.parallel_stop()
+
     job.clean(outdir('genome.fa'))
     job.clean(outdir('rtrna_mt.fa'))
     job.clean(outdir('rtrna.fa'))
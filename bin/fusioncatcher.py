@@ -48,10 +48,14 @@ import optparse
 import multiprocessing
 import subprocess
 import shutil
+import pipes
 import socket
 import locale
 import math
 import configuration
+import compression
+import memory_model
+import resident
 
 
 
@@ -113,6 +117,37 @@ def is_optparse_provided(parser, dest):
 #        return True
 #    return False
 
+#
+# replace the values of some command line options (given as dest => value)
+# in a command line, e.g. for restarting the pipeline
+def replace_optparse_options(parser, argv, values):
+    r = []
+    i = 0
+    while i < len(argv):
+        a = argv[i]
+        i = i + 1
+        if a == '--':
+            r.extend(argv[i-1:])
+            break
+        name = a.split('=',1)[0]
+        opt = None
+        if name.startswith('--'):
+            try:
+                opt = parser.get_option(parser._match_long_opt(name))
+            except optparse.BadOptionError:
+                opt = None
+        elif name.startswith('-') and len(name) == 2:
+            opt = parser.get_option(name)
+        if opt is None or opt.dest not in values:
+            r.append(a)
+            continue
+        if opt.takes_value() and a == name:
+            i = i + 1 # skip also the value
+    for opt in parser._get_all_options():
+        if opt.dest in values and opt._long_opts:
+            r.extend([opt._long_opts[0],str(values[opt.dest])])
+    return r
+
 
 #
 #
@@ -143,7 +178,7 @@ def delete_file(some_file):
 #
 #
 def memory(unit='default'):
-    meminfo = {'MemTotal':0,'free':0,'used':0,'unit':'kB','total':0}
+    meminfo = {'MemTotal':0,'free':0,'available':0,'used':0,'unit':'kB','total':0}
     
 
     if os.path.isfile('/proc/meminfo'):
@@ -154,6 +189,9 @@ def memory(unit='default'):
 
         meminfo['free'] = meminfo['MemFree'] + meminfo['Buffers'] + meminfo['Cached']
         meminfo['used'] = meminfo['MemTotal'] - meminfo['free']
+        # the memory which can be used by new processes without swapping
+        # (i.e. 'MemAvailable' of Linux 3.14 and newer)
+        meminfo['available'] = meminfo.get('MemAvailable',meminfo['free'])
         meminfo['unit'] = t
         meminfo['total'] = meminfo['MemTotal']
         if unit.upper() == 'GB' and t.upper() == 'KB':
@@ -196,6 +234,177 @@ def info(ajob, fromfile, tofile , top = "\n\n\n", bottom = "\n\n\n" , temp_path
     if fromfile:
         ajob.clean(fromfile,temp_path = temp_path)
 
+#
+def zcat(ajob, a_file, pigz = False, pxz = False, processes = 1, pigz_path = '', temp_path = 'no'):
+    # it adds to the job the program which decompresses a file to stdout
+    f = a_file.lower()
+    if f.endswith('.gz'):
+        if pigz:
+            ajob.add(pigz_path+'pigz',kind='program')
+            ajob.add('-p',processes,kind='parameter',checksum='no')
+        else:
+            ajob.add('gzip',kind='program')
+        ajob.add('-d',kind='parameter')
+        ajob.add('-c',kind='parameter')
+    elif f.endswith('.xz'):
+        if pxz:
+            ajob.add('pxz',kind='program')
+            ajob.add('-T',processes,kind='parameter',checksum='no')
+        else:
+            ajob.add('xz',kind='program')
+        ajob.add('-dc',kind='parameter')
+    elif f.endswith('.bz2'):
+        ajob.add('bzip2',kind='program')
+        ajob.add('-d',kind='parameter')
+        ajob.add('-c',kind='parameter')
+    else:
+        ajob.add('cat',kind='program')
+    ajob.add('',a_file,kind='input',temp_path=temp_path)
+
+#
+def zout(ajob, a_file, zip_program = None):
+    # it adds to the job the writing of stdout to a file which is compressed on
+    # the fly (the file keeps its name and it is recognized by its magic number)
+    if zip_program:
+        ajob.add('|',kind='parameter')
+        ajob.add(zip_program[0],kind='parameter')
+        for p in zip_program[1:]:
+            ajob.add(p,kind='parameter',checksum='no')
+    ajob.add('>',a_file,kind='output')
+
+#
+def count_of(a_file):
+    # it reads the number from the first line of a file (0 if it is missing)
+    n = 0
+    if not empty(a_file):
+        n = int(file(a_file,'r').readline().strip())
+    return n
+
+#
+def sharddir(stage, shard, *more_paths):
+    # the output directory of a shard of reads for the given stage (see '--shards')
+    return outdir('shards','%s_%s' % (stage, shard),*more_paths)
+
+#
+def shards_split(ajob, stage, a_file, shards, lines = 4, mates = False, temp_path = 'no'):
+    # it adds to the job the splitting of a FASTQ file into shards of reads,
+    # which are written in the output directories of the shards
+    ajob.add(_FC_+'split-shards.py',kind='program')
+    ajob.add('--input',outdir(a_file),kind='input',temp_path=temp_path)
+    ajob.add('--output',sharddir(stage,'%d',a_file),kind='parameter')
+    ajob.add('--shards',shards,kind='parameter')
+    ajob.add('--lines',lines,kind='parameter')
+    if mates:
+        ajob.add('--mates',kind='parameter')
+    for k in xrange(1,shards+1):
+        ajob.add('',sharddir(stage,k,a_file),kind='output',command_line='no')
+    ajob.run()
+
+#
+def shards_run(ajob, stage, shards, inputs = [], outputs = [], launcher = '', processes = 1):
+    # it runs concurrently the given stage for each shard of reads, i.e.
+    # 'fusioncatcher.py' is executed again (with the same command line
+    # arguments) in the output directory of each shard, where it executes
+    # only the steps of the given stage
+    ajob.parallel_start()
+    for k in xrange(1,shards+1):
+        if launcher:
+            cmd = launcher.replace('%d',str(k)).split(' ',1)
+            ajob.add(cmd[0],kind='program')
+            if len(cmd) > 1:
+                ajob.add('',cmd[1],kind='parameter')
+            ajob.add('',sys.executable,kind='parameter')
+        else:
+            ajob.add(sys.executable,kind='program')
+        ajob.add('',expand(sys.argv[0]),kind='parameter')
+        ajob.add('',' '.join([pipes.quote(el) for el in sys.argv[1:]]),kind='parameter')
+        ajob.add('--output',sharddir(stage,k),kind='parameter')
+        ajob.add('--shard',k,kind='parameter')
+        ajob.add('--shard-stage',stage,kind='parameter')
+        ajob.add('--start','0',kind='parameter')
+        ajob.add('--threads',processes,kind='parameter',checksum='no')
+        ajob.add('--no-update-check',kind='parameter')
+        for f in inputs:
+            ajob.add('',sharddir(stage,k,f),kind='input',command_line='no')
+        for f in outputs:
+            ajob.add('',sharddir(stage,k,f),kind='output',command_line='no')
+        ajob.add('>','/dev/null',kind='parameter')
+        ajob.add('2>',sharddir(stage,k,'fusioncatcher.stderr.txt'),kind='output',checksum='no')
+        ajob.run(processes = 0 if launcher else processes,
+                 error_message = "The processing of shard %d (stage '%s') failed! Please, see '%s' for details!" % (k, stage, sharddir(stage,k,'fusioncatcher.log')))
+    ajob.parallel_stop()
+
+#
+def shards_merge(ajob, stage, a_file, shards, method = 'cat', lines = 1, key = '', unique = False, temp_path = 'no'):
+    # it adds to the job the merging (exact) of a file produced by each shard
+    # of reads into one file in the output directory
+    ajob.add(_FC_+'merge-shards.py',kind='program')
+    ajob.add('--input',sharddir(stage,'%d',a_file),kind='parameter')
+    ajob.add('--shards',shards,kind='parameter')
+    ajob.add('--method',method,kind='parameter')
+    if method == 'merge':
+        ajob.add('--lines',lines,kind='parameter')
+        if key:
+            ajob.add('--key',key,kind='parameter')
+        if unique:
+            ajob.add('--unique',kind='parameter')
+    for k in xrange(1,shards+1):
+        ajob.add('',sharddir(stage,k,a_file),kind='input',temp_path=temp_path,command_line='no')
+    ajob.add('--output',outdir(a_file),kind='output')
+    ajob.run()
+
+#
+def index_builder(ajob, program, references, index):
+    # it adds to the job the program which builds the index of the given
+    # reference sequences, through the cache of indexes if it is used (see
+    # '--index-cache'), i.e. an index which has been built already (e.g. by
+    # another run) for the same sequences and parameters is reused
+    global index_cache
+    global index_cache_size
+    if index_cache:
+        ajob.add(_FC_+'cache-index.py',kind='program')
+        ajob.add('--cache',index_cache,kind='parameter',checksum='no')
+        ajob.add('--size',index_cache_size,kind='parameter',checksum='no')
+        for r in references:
+            ajob.add('--reference',r,kind='parameter')
+        ajob.add('--index',index,kind='parameter')
+        ajob.add('--',kind='parameter')
+        ajob.add(program,kind='parameter')
+    else:
+        ajob.add(program,kind='program')
+
+#
+def parts_budget(parts, processes, steps):
+    # it gives the number of threads and the memory (in GB) used for each
+    # part of the reference sequences which have been split (see
+    # 'split-fasta.py') such that as many parts as the available memory and
+    # CPUs allow are indexed and aligned concurrently (see 'parallel_start');
+    # the memory is the predicted peak memory of the given aligner steps for
+    # the largest part (see 'memory_model.py')
+    global memory_coefficients
+    size = max([memory_model.nucleotides(p) for p in parts if os.path.isfile(p)] + [0])
+    (n, threads, gb) = memory_model.concurrency(steps,
+                                                size,
+                                                len(parts),
+                                                processes,
+                                                memory('GB')['available'],
+                                                model = memory_coefficients)
+    return (threads, gb)
+
+#
+def split_threshold(steps, limit, provided, reads = 0):
+    # it gives the size threshold (in nucleotides) used for splitting the
+    # reference sequences of the given aligner steps (see 'split-fasta.py'),
+    # i.e. the given limit lowered such that the predicted peak memory of
+    # each step is below the cap (see '--limit-memory' and 'memory_model.py')
+    # for the given size of the input reads (nucleotides); the limit is used
+    # as it is if it has been given in the command line (or if no cap is given)
+    global memory_coefficients
+    global memory_cap
+    if is_optparse_provided(parser,provided) or not memory_cap:
+        return limit
+    return min(limit, memory_model.limit(steps, memory_cap, reads = reads, threads = options.processes, model = memory_coefficients))
+
 #
 # command line parsing
 #
@@ -334,6 +543,31 @@ if __name__ == "__main__":
                              "and directories will be written. Default is directory "+
                              "'%default' in the output directory specified with '--output'. ")
 
+    parser.add_option("--index-cache",
+                      action = "store",
+                      type = "string",
+                      dest = "index_cache",
+                      default = "",
+                      help = "The directory of a local cache of the indexes (i.e. Bowtie, "+
+                             "Bowtie2 and STAR indexes) of the candidate fusion genes, which "+
+                             "are built for each sample. An index which has been built already "+
+                             "(e.g. by a previous run or by another run which is running on "+
+                             "the same computer) for the same sequences and the same parameters "+
+                             "is reused instead of being built again, e.g. for samples which "+
+                             "have the same candidate fusion genes. If it is empty then no cache "+
+                             "is used. "+
+                             "Default is '%default'.")
+
+    parser.add_option("--index-cache-size",
+                      action = "store",
+                      type = "float",
+                      dest = "index_cache_size",
+                      default = 50,
+                      help = "The maximum size (in GB) of the cache of indexes (see "+
+                             "'--index-cache'). The least recently used indexes are removed "+
+                             "from the cache when it becomes larger. "+
+                             "Default is '%default'.")
+
     parser.add_option("--threads","-p",
                       action = "store",
                       type = "int",
@@ -866,6 +1100,21 @@ if __name__ == "__main__":
 #                             "of BLAT/STAR/BOWTIE2 alignment is somewhat lowered. "+
 #                             "Default is '%default'.")
 
+    parser.add_option("--prefilter-kmer",
+                      action = "store",
+                      type = "int",
+                      dest = "prefilter_kmer",
+                      default = 0,
+                      help = "If it is set to a value larger than zero then the short reads "+
+                             "which will be aligned using BLAT/STAR/BOWTIE2 on the candidate "+
+                             "fusion genes are prefiltered (in addition to the usual Bowtie "+
+                             "prefiltering) by removing the reads which do not share any k-mer "+
+                             "(where k is the value given here, e.g. 20) with the sequences "+
+                             "of the candidate fusion genes. A read is always kept if it has "+
+                             "an exact match of at least k+4 nucleotides with the candidate "+
+                             "fusion genes. Zero disables it. "+
+                             "Default is '%default'.")
+
     parser.add_option("--skip-interleave",
                       action = "store_true",
                       dest = "skip_interleave_processing",
@@ -1096,6 +1345,51 @@ if __name__ == "__main__":
 #                             "the aligner can handle them without an error. "+
 #                             "Default is '%default'.")
 
+    parser.add_option("--limit-memory",
+                      action = "store",
+                      type = "float",
+                      dest = "limit_memory",
+                      default = 0,
+                      help = "The maximum amount of memory (in GB) which the aligners are allowed "+
+                             "to use. The reference sequences of an aligner (i.e. BOWTIE, BOWTIE2, "+
+                             "STAR or BLAT) are split in more parts if the predicted peak memory "+
+                             "of the aligner (see '--memory-model') is over this limit. If it is "+
+                             "0 then only the limits of the aligners are used (e.g. '--limit-star'), "+
+                             "i.e. the splitting (and therefore the numbering of the steps, see "+
+                             "'--start') does not depend on the computer. "+
+                             "Default is '%default'.")
+
+    parser.add_option("--resident-indexes",
+                      action = "store",
+                      type = "choice",
+                      choices = ['no','session','batch'],
+                      dest = "resident_indexes",
+                      default = 'no',
+                      help = "If it is 'session' then the indexes of BOWTIE from the database "+
+                             "are kept resident in memory while FusionCatcher is running, "+
+                             "i.e. they are loaded once (in the page cache, which is shared by "+
+                             "all the BOWTIE processes, see '--mm' of BOWTIE) instead of at "+
+                             "every step. If it is 'batch' then they are kept resident also "+
+                             "for one hour after FusionCatcher finishes, such that the next "+
+                             "runs (e.g. a batch of samples) find them already loaded. This is "+
+                             "done on a best-effort basis, i.e. the indexes are mapped in memory "+
+                             "and their pages are touched periodically (they are not locked in "+
+                             "memory, e.g. using 'mlock') and therefore the operating system may "+
+                             "still evict some of them. The indexes are released when the "+
+                             "available memory is low (see 'resident.py'). "+
+                             "Default is '%default'.")
+
+    parser.add_option("--memory-model",
+                      action = "store",
+                      type = "string",
+                      dest = "memory_model",
+                      default = os.path.abspath(os.path.join(pipeline_path,"..","etc","memory_model.txt")),
+                      help = "The file with the coefficients of the model which predicts the "+
+                             "peak memory of the aligners (as written by the benchmark 'memory_model' "+
+                             "of 'test/benchmark/benchmark.py'). If it does not exist then the "+
+                             "built-in coefficients are used (see 'memory_model.py'). "+
+                             "Default is '%default'.")
+
     parser.add_option("--limit-star",
                       action = "store",
                       type = "int",
@@ -1331,6 +1625,88 @@ if __name__ == "__main__":
                              "Default is '%default' if less than 32GB RAM is "+
                              "installed on computer else is set to 26GB.")
 
+    choices = ('no','auto','zstd','lz4','lzop','gzip')
+    parser.add_option("--compress-intermediates",
+                      action = "store",
+                      type = "choice",
+                      choices = choices,
+                      dest = "compress_intermediates",
+                      default = "no",
+                      help = "It compresses on the fly (using a fast multithreaded compressor) "+
+                             "the large intermediate files (i.e. gene-gene SAM files, "+
+                             "MAP files of the transcriptome and the temporary files of "+
+                             "command SORT), which are decompressed transparently by "+
+                             "the scripts reading them. This is useful when the "+
+                             "throughput is limited by the I/O (e.g. network filesystems) "+
+                             "rather than CPU. The choices are ['"+"','".join(choices)+"']. "+
+                             "If it is set to 'auto' then the fastest compressor "+
+                             "found is used (i.e. zstd, lz4, lzop, pigz, gzip in this order). "+
+                             "Default is '%default'.")
+
+    parser.add_option("--shards",
+                      action = "store",
+                      type = "int",
+                      dest = "shards",
+                      default = 1,
+                      help = "The input reads are split into this number of shards "+
+                             "and the read-level stages (i.e. removal of duplicates, "+
+                             "trimming, filtering and mapping on genome and transcriptome) "+
+                             "are executed independently for each shard, as separate "+
+                             "processes which might run on different computers sharing "+
+                             "the output directory (see '--shard-launcher'). The results "+
+                             "of all shards are merged exactly before the candidate-level "+
+                             "stages and therefore they are the same as when all reads "+
+                             "are processed at once. "+
+                             "Default is '%default'.")
+
+    parser.add_option("--shard-launcher",
+                      action = "store",
+                      type = "string",
+                      dest = "shard_launcher",
+                      default = "",
+                      help = "The command used for launching the processing of one shard "+
+                             "(see '--shards') on another computer, where '%d' is replaced "+
+                             "by the number of the shard, e.g. 'srun -N1 -n1' for SLURM. "+
+                             "The command should run in the current working directory. "+
+                             "If it is empty then the shards are processed locally "+
+                             "as concurrent processes, where each shard uses its part "+
+                             "of the threads given by '--threads'. "+
+                             "Default is '%default'.")
+
+    parser.add_option("--screen",
+                      action = "store",
+                      type = "int",
+                      dest = "screen",
+                      default = 0,
+                      help = "If it is larger than 0 then the candidate fusion genes are "+
+                             "searched first on a subsample of the reads (which has "+
+                             "approximately this number of reads, e.g. 10000000) and "+
+                             "afterwards only the pairs of reads which map on the genes "+
+                             "of these candidate fusion genes (and on their paralogs and "+
+                             "adjacent genes) are kept from all reads and analyzed further. "+
+                             "This is faster for very deep libraries. If the candidate "+
+                             "fusion genes found in the end are not among the candidate "+
+                             "fusion genes found in the subsample then the analysis is re-started "+
+                             "automatically using all reads. If it is 0 then all "+
+                             "reads are analyzed. "+
+                             "Default is '%default'.")
+
+    parser.add_option("--shard",
+                      action = "store",
+                      type = "int",
+                      dest = "shard",
+                      default = 0,
+                      help = optparse.SUPPRESS_HELP) # the number of the shard processed by this run (see '--shards')
+
+    choices = ('dedup','reads','screen')
+    parser.add_option("--shard-stage",
+                      action = "store",
+                      type = "choice",
+                      choices = choices,
+                      dest = "shard_stage",
+                      default = "reads",
+                      help = optparse.SUPPRESS_HELP) # the stage executed for the shard (see '--shards')
+
     parser.add_option("--start",
                       action = "store",
                       type = "int",
@@ -1360,6 +1736,32 @@ if __name__ == "__main__":
 #                             "'workflow.py'. "+
 #                             "Default is '%default'.")
 
+    parser.add_option("--telemetry",
+                      action = "store_true",
+                      dest = "telemetry",
+                      default = False,
+                      help = "If it is set then the resources used by each executed "+
+                             "step (i.e. wall time, CPU time, peak memory, bytes "+
+                             "read/written, sizes of inputs/outputs, used space of "+
+                             "the file system of the output directory) are saved in "+
+                             "'telemetry.jsonl' and the timeline of the steps is "+
+                             "saved in 'telemetry.trace.json' (Chrome trace "+
+                             "format, which can be viewed with Perfetto) in the "+
+                             "output directory. "+
+                             "Default is '%default'.")
+
+    parser.add_option("--in-process",
+                      action = "store_true",
+                      dest = "inprocess",
+                      default = False,
+                      help = "If it is set then the steps which run only one of the "+
+                             "Python scripts of FusionCatcher (i.e. no pipes) are "+
+                             "executed in-process, i.e. in a child forked from "+
+                             "the main process which has the common Python modules "+
+                             "already imported, instead of starting each time the "+
+                             "shell and a new Python interpreter. "+
+                             "Default is '%default'.")
+
     parser.add_option("--keep",
                       action = "store_true",
                       dest = "keep_temporary_files",
@@ -1719,7 +2121,24 @@ if __name__ == "__main__":
     
     if options.processes and options.processes > multiprocessing.cpu_count():
             options.processes = multiprocessing.cpu_count()
-            
+
+    # the read-level stages are executed for each shard of reads (see '--shards')
+    if options.shards < 1:
+        parser.error("ERROR: The number of shards should be at least 1!")
+    sharded = options.shards > 1 and not options.shard
+    shard_processes = options.processes
+    if not options.shard_launcher:
+        # the shards are processed locally and concurrently
+        shard_processes = max(1,options.processes/options.shards)
+
+    # the candidate fusion genes are searched first on a subsample of reads (see '--screen')
+    if options.screen < 0:
+        parser.error("ERROR: The number of reads of the subsample should be at least 0!")
+    screening = options.screen > 0 and not options.shard
+    if options.shard and options.shard_stage == 'screen':
+        # only the candidate fusion genes are needed from the subsample
+        options.reads_preliminary_fusions = False
+
     # getting absolute paths for the tools and scripts from configuration.cfg
     _B2_ = confs.get("BOWTIE2").rstrip("/")+"/" if options.force_paths else ''
     _BA_ = confs.get("BWA").rstrip("/")+"/" if options.force_paths else ''
@@ -1747,6 +2166,12 @@ if __name__ == "__main__":
     #
     data_dir = adir(expand(options.data_directory))
     out_dir = adir(expand(options.output_directory))
+    index_cache = adir(expand(options.index_cache)) if options.index_cache else ''
+    index_cache_size = options.index_cache_size
+    memory_coefficients = memory_model.load(expand(options.memory_model))
+    # the splitting depends on the memory of the computer only if it is asked
+    # (otherwise a restart on another computer would number the steps differently)
+    memory_cap = options.limit_memory if options.limit_memory > 0 else 0
     tmp_dir = adir(expand(options.tmp_directory))
     log_file = expand(outdir('fusioncatcher.log'))
     info_file = expand(outdir('info.txt'))
@@ -1995,7 +2420,32 @@ if __name__ == "__main__":
             log_filename       = log_file,
             checksums_filename = options.checksums_filename,
             hash_library       = options.hash,
-            start_step         = options.start_step)
+            start_step         = options.start_step,
+            threads            = options.processes,
+            telemetry_filename = outdir('telemetry.jsonl') if options.telemetry else None,
+            trace_filename     = outdir('telemetry.trace.json') if options.telemetry else None,
+            inprocess          = options.inprocess,
+            preload            = ['optparse','gzip','gc','shutil','socket','string',
+                                  'itertools','math','bisect','tempfile','datetime',
+                                  'multiprocessing','Bio','Bio.Seq','Bio.SeqIO',
+                                  'Bio.SeqRecord','Bio.Alphabet','compression'],
+            keep               = options.keep_temporary_files,
+            disk_path          = outdir() if options.telemetry else None)
+
+    if options.shard:
+        # only the steps of the given stage are executed for this shard of reads
+        job.skip(True)
+
+    if options.resident_indexes != 'no':
+        # the indexes of BOWTIE from the database are kept resident in memory
+        # for this run (and the next ones, for 'batch'), see 'resident.py'
+        resident.start([datadir('transcripts_index/'),
+                        datadir('genome_index/'),
+                        datadir('rtrna_index/'),
+                        datadir('rtrna_hla_mt_index/'),
+                        datadir('viruses_index/')],
+                       session = os.getpid(),
+                       idle = 3600 if options.resident_indexes == 'batch' else 0)
 
     ##############################################################################
     # SAVE EXTRA INFORMATION
@@ -2019,7 +2469,7 @@ if __name__ == "__main__":
     job.run()
 
     # create the temporary directory
-    if job.run():
+    if job.run() or options.shard:
         if not os.path.isdir(tmp_dir) and not islink(tmp_dir):
             os.makedirs(tmp_dir)
 
@@ -2045,26 +2495,24 @@ if __name__ == "__main__":
             sort_buffer = options.sort_buffer_size #"80%"
     delete_file(outdir('sort_help.txt'))
     # check options suppported by SORT command
-    sort_lzop_compress = False
-    r = os.system("sort --help | grep 'compress-program' > "+outdir('sort_help.txt')+ " ; lzop --help 2>/dev/null | grep -i 'compress' > " +outdir('lzop_help.txt'))
-    if (not r) and ((not empty(outdir('sort_help.txt'))) and len(file(outdir('sort_help.txt'),'r').readlines()) == 1 and
-        (not empty(outdir('lzop_help.txt'))) and len(file(outdir('lzop_help.txt'),'r').readlines()) >= 1):
-        sort_lzop_compress = True
-    delete_file(outdir('sort_help.txt'))
-    delete_file(outdir('lzop_help.txt'))
-    # check options suppported by SORT command
-    sort_gzip_compress = False
-    r = os.system("sort --help | grep 'compress-program' > "+outdir('sort_help.txt')+ " ; gzip --help 2>/dev/null | grep -i 'compress' > " +outdir('gzip_help.txt'))
-    if (not r) and ((not empty(outdir('sort_help.txt'))) and len(file(outdir('sort_help.txt'),'r').readlines()) == 1 and
-        (not empty(outdir('gzip_help.txt'))) and len(file(outdir('gzip_help.txt'),'r').readlines()) >= 1):
-        sort_gzip_compress = True
+    sort_compress_program = False
+    r = os.system("sort --help | grep 'compress-program' > "+outdir('sort_help.txt'))
+    if (not r) and (not empty(outdir('sort_help.txt'))) and len(file(outdir('sort_help.txt'),'r').readlines()) == 1:
+        sort_compress_program = True
     delete_file(outdir('sort_help.txt'))
-    delete_file(outdir('gzip_help.txt'))
 
+    # compressor used for the large intermediate files (written through a pipe)
+    # and for the temporary files of SORT
+    zip_program = None
+    if options.compress_intermediates != 'no':
+        zip_program = compression.find_compressor(options.compress_intermediates, options.processes)
+        if not zip_program:
+            print >>sys.stderr,"WARNING: No compressor found for '--compress-intermediates %s'! The intermediate files will not be compressed!" % (options.compress_intermediates,)
 
-    # disable any compression done by SORT ===> FASTER
-    sort_lzop_compress = False
-    sort_gzip_compress = False
+    # no compression done by SORT ===> FASTER (unless the intermediate files are compressed)
+    sort_compress = None
+    if zip_program and sort_compress_program:
+        sort_compress = zip_program[0]
 
     # check if PIGZ is installed
     pigz = False
@@ -2667,7 +3115,7 @@ if __name__ == "__main__":
 #    job.add('>>',info_file,kind='output')
 #    job.run()
 
-    if len(list_input_files) < 1:
+    if len(list_input_files) < 1 and not options.shard:
         job.close()
         print >>sys.stderr,"\n\n\nERROR: No input valid files have been found (given input is: '%s' )!\n" % (options.input_filename,)
         sys.exit(1)
@@ -2780,33 +3228,13 @@ if __name__ == "__main__":
     new_list_input_files = []
     for i,input_file in enumerate(list_input_files):
         output_file = None
-        if input_file.lower().endswith('.gz') and (not input_file.lower().endswith('.tar.gz')):
-            output_file = outdir('init-'+str(i)+'_'+os.path.basename(input_file)[:-3])
-            # decompress
-            if pigz:
-                job.add(_PZ_+'pigz',kind='program')
-                job.add('-p',options.processes,kind='parameter',checksum='no')
-            else:
-                job.add('gzip',kind='program')
-            job.add('-d',kind='parameter')
-            job.add('-f',kind='parameter')
-            job.add('-c',kind='parameter')
-            job.add('',input_file,kind='input')
-            job.add('>',output_file,kind='output')
-            job.run()
-        elif input_file.lower().endswith('.xz'):
-            output_file = outdir('init-'+str(i)+'_'+os.path.basename(input_file)[:-3])
-            # decompress
-            # decompress
-            if pxz:
-                job.add('pxz',kind='program')
-                job.add('-T',options.processes,kind='parameter',checksum='no')
-            else:
-                job.add('xz',kind='program')
-            job.add('-dc',kind='parameter')
-            job.add('',input_file,kind='input')
-            job.add('>',output_file,kind='output')
-            job.run()
+        if ((input_file.lower().endswith('.gz') and (not input_file.lower().endswith('.tar.gz'))) or
+            (input_file.lower().endswith('.bz2') and (not input_file.lower().endswith('.tar.bz2'))) or
+            input_file.lower().endswith('.xz')):
+            output_file = outdir('init-'+str(i)+'_'+os.path.basename(input_file))
+            # no decompression to disk (the reads are streamed directly from the
+            # compressed file by the first step which reads them)
+            job.link(input_file, output_file, temp_path=temp_flag)
         elif input_file.lower().endswith('.zip'):
             output_file = outdir('init-'+str(i)+'_'+os.path.basename(input_file)[:-4])
             # decompress
@@ -2816,16 +3244,6 @@ if __name__ == "__main__":
             job.add('',input_file,kind='input')
             job.add('>',output_file,kind='output')
             job.run()
-        elif input_file.lower().endswith('.bz2') and (not input_file.lower().endswith('.tar.bz2')):
-            output_file = outdir('init-'+str(i)+'_'+os.path.basename(input_file)[:-4])
-            # decompress
-            job.add('bzip2',kind='program')
-            job.add('-d',kind='parameter')
-            job.add('-f',kind='parameter')
-            job.add('-c',kind='parameter')
-            job.add('',input_file,kind='input')
-            job.add('>',output_file,kind='output')
-            job.run()
         elif ( input_file.lower().endswith('.fq') or
                input_file.lower().endswith('.fastq')):
             output_file = outdir('init-'+str(i)+'_'+os.path.basename(input_file))
@@ -2860,8 +3278,8 @@ if __name__ == "__main__":
         # single-end reads
         new_list_input_files = []
         for i,input_file in enumerate(list_input_files):
-            output_file_1 = outdir('single-1-'+str(i)+'_'+os.path.basename(input_file))
-            output_file_2 = outdir('single-2-'+str(i)+'_'+os.path.basename(input_file))
+            output_file_1 = outdir('single-1-'+str(i)+'_'+compression.uncompressed(os.path.basename(input_file)))
+            output_file_2 = outdir('single-2-'+str(i)+'_'+compression.uncompressed(os.path.basename(input_file)))
 
             # compute the read lengths for the input file
             job.add(_FC_+'lengths_reads.py',kind='program')
@@ -2902,6 +3320,16 @@ if __name__ == "__main__":
                 job.run()
                 
                 fragments_flag = True
+            elif input_file.lower().endswith(('.bz2','.xz')):
+                # SEQTK reads directly only GZIP files
+                zcat(job, input_file, pigz = pigz, pxz = pxz, processes = options.processes, pigz_path = _PZ_, temp_path = temp_flag)
+                job.add('|',kind='parameter')
+                job.add(_SK_+'seqtk',kind='parameter')
+                job.add('trimfq',kind='parameter')
+                job.add('-q','0.25',kind='parameter')
+                job.add('-',kind='parameter')
+                job.add('>',output_file_1,kind='output')
+                job.run()
             else:
                 job.add(_SK_+'seqtk',kind='program')
                 job.add('trimfq',kind='parameter')
@@ -2939,55 +3367,34 @@ if __name__ == "__main__":
         for (f,r) in pairs:
             i = i + 1
             # automatically remove adapters
-            output_1_file = outdir(os.path.basename(f).replace('init-','init-noadapt-'))
-            output_2_file = outdir(os.path.basename(r).replace('init-','init-noadapt-'))
-
-            job.add('printf',kind='program')
-            job.add('"\n\nFirst 8 lines of input FASTQ file: %s\n-------------------------\n"' % (r,),kind='parameter')
-            job.add('>>',info_file,kind='output')
-            job.run()
-
-            job.add('head',kind='program')
-            job.add('-8',r,kind='input')
-            job.add('>>',info_file,kind='output')
-            job.run()
-
+            output_1_file = outdir(compression.uncompressed(os.path.basename(f)).replace('init-','init-noadapt-'))
+            output_2_file = outdir(compression.uncompressed(os.path.basename(r)).replace('init-','init-noadapt-'))
 
-            job.add('printf',kind='program')
-            job.add('"\n\nFirst 8 lines of input FASTQ file: %s\n-------------------------\n"' % (f,),kind='parameter')
-            job.add('>>',info_file,kind='output')
-            job.run()
-
-            job.add('head',kind='program')
-            job.add('-8',f,kind='input')
-            job.add('>>',info_file,kind='output')
-            job.run()
-
-
-            job.add('printf',kind='program')
-            job.add('"\n\nLast 8 lines of input FASTQ file: %s\n-------------------------\n"' % (r,),kind='parameter')
-            job.add('>>',info_file,kind='output')
-            job.run()
-
-            job.add('tail',kind='program')
-            job.add('-8',r,kind='input')
-            job.add('>>',info_file,kind='output')
-            job.run()
-
-
-            job.add('printf',kind='program')
-            job.add('"\n\nLast 8 lines of input FASTQ file: %s\n-------------------------\n"' % (f,),kind='parameter')
-            job.add('>>',info_file,kind='output')
-            job.run()
+            for (where,what,a_file) in (('First','head',r),('First','head',f),('Last','tail',r),('Last','tail',f)):
+                job.add('printf',kind='program')
+                job.add('"\n\n%s 8 lines of input FASTQ file: %s\n-------------------------\n"' % (where,a_file),kind='parameter')
+                job.add('>>',info_file,kind='output')
+                job.run()
 
-            job.add('tail',kind='program')
-            job.add('-8',f,kind='input')
-            job.add('>>',info_file,kind='output')
-            job.run()
+                if compression.is_compressed(a_file):
+                    zcat(job, a_file, pigz = pigz, pxz = pxz, processes = options.processes, pigz_path = _PZ_)
+                    job.add('|',kind='parameter')
+                    job.add(what,kind='parameter')
+                    job.add('-8',kind='parameter')
+                else:
+                    job.add(what,kind='program')
+                    job.add('-8',a_file,kind='input')
+                job.add('>>',info_file,kind='output')
+                job.run()
 
             if options.single_end:
-                job.link(f,output_1_file,temp_path=temp_flag)
-                job.link(r,output_2_file,temp_path=temp_flag)
+                for (a_file,b_file) in ((f,output_1_file),(r,output_2_file)):
+                    if compression.is_compressed(a_file):
+                        zcat(job, a_file, pigz = pigz, pxz = pxz, processes = options.processes, pigz_path = _PZ_, temp_path = temp_flag)
+                        job.add('>',b_file,kind='output')
+                        job.run()
+                    else:
+                        job.link(a_file,b_file,temp_path=temp_flag)
             else:
                 job.add(_FC_+'overlap.py',kind='program')
                 job.add('--input_1',f,kind='input')
@@ -3060,8 +3467,8 @@ if __name__ == "__main__":
 
                     ff = f[:]
                     rr = r[:]
-                    f = outdir(os.path.basename(f).replace('init-','init-f-'))
-                    r = outdir(os.path.basename(r).replace('init-','init-r-'))
+                    f = outdir(compression.uncompressed(os.path.basename(f)).replace('init-','init-f-'))
+                    r = outdir(compression.uncompressed(os.path.basename(r)).replace('init-','init-r-'))
 
                     # add A to the reads which are shorter in order to make all reads have the same length
                     job.add(_FC_+'padding-fastq.py',kind='program')
@@ -3130,8 +3537,13 @@ if __name__ == "__main__":
                          temp_path = temp_flag)
 
                 else:
-                    job.link(f,output_1_file,temp_path=temp_flag)
-                    job.link(r,output_2_file,temp_path=temp_flag)
+                    for (a_file,b_file) in ((f,output_1_file),(r,output_2_file)):
+                        if compression.is_compressed(a_file):
+                            zcat(job, a_file, pigz = pigz, pxz = pxz, processes = options.processes, pigz_path = _PZ_, temp_path = temp_flag)
+                            job.add('>',b_file,kind='output')
+                            job.run()
+                        else:
+                            job.link(a_file,b_file,temp_path=temp_flag)
 
             in1 = output_1_file
             in2 = output_2_file
@@ -3264,35 +3676,26 @@ if __name__ == "__main__":
         job.add('>>',info_file,kind='output')
         job.run()
 
-        job.add('LC_ALL=C',kind='program')
-        job.add('cat',kind='parameter')
-        job.add('',input_file,kind='input')
-        job.add('|',kind='parameter')
-        job.add("echo $((`wc -l`/4))",kind='parameter')
-        job.add('>>',info_file,kind='output')
-        job.run()
-
-        # convert the read names to Illumina Solexa version 1.5 format (i.e. end in /1 or /2)
-        output_file = outdir(os.path.basename(input_file).replace('init-','init-head-'))
-        job.add(_FC_+'solexa18to15.py',kind='program')
+        # count the reads, convert the read names to Illumina Solexa version 1.5
+        # format (i.e. end in /1 or /2) and the quality scores to Sanger format
+        # (all in one pass)
+        output_file = outdir(compression.uncompressed(os.path.basename(input_file)).replace('init-','init-phred-'))
+        counts_file = outdir('log_counts_'+os.path.basename(input_file)+'.txt')
+        job.add(_FC_+'fastq_profile.py',kind='program')
         job.add('--fail',kind='parameter')
+        job.add('--link','hard',kind='parameter')
         job.add('--input',input_file,kind='input',temp_path=temp_flag)
         job.add('--output',output_file,kind='output')
-        job.add('--link','hard',kind='parameter')
+        job.add('--counts',counts_file,kind='output')
+        job.add('--stats',outdir('log_profile_'+os.path.basename(input_file)+'.json'),kind='output')
         job.run()
 
-        # convert the quality scores to Illumina Solexa version 1.5 format
-        infile = output_file
-        output_file = outdir(os.path.basename(infile).replace('init-','init-phred-'))
-        job.add(_FC_+'phred.py',kind='program')
-        job.add('--link','hard',kind='parameter')
-        job.add('--input',infile,kind='input',temp_path=temp_flag)
-        job.add('--output',output_file,kind='output')
-        job.add('--input_type','auto-detect',kind='parameter')
-        #job.add('--output_type','illumina-1.5',kind='parameter')
-        job.add('--output_type','sanger',kind='parameter')
-        job.add('--tmp_dir',tmp_dir,kind='parameter',checksum='no')
-        job.run()
+        info(job,
+             fromfile = counts_file,
+             tofile = info_file,
+             top = [],
+             bottom = [],
+             temp_path = temp_flag)
 
         new_list_input_files.append(output_file)
 
@@ -3319,6 +3722,20 @@ if __name__ == "__main__":
         job.link(new_list_input_files[0], output_file, temp_path=temp_flag)
 
     if not options.skip_deduplication:
+        if sharded:
+            # remove the duplicates for each shard of reads and merge them
+            # exactly (i.e. only the first pair is kept from all shards)
+            shards_split(job, 'dedup', 'orig.fq', options.shards, lines = 8, temp_path = temp_flag)
+            shards_run(job, 'dedup', options.shards,
+                       inputs = ['orig.fq'],
+                       outputs = ['origi.fq'],
+                       launcher = options.shard_launcher,
+                       processes = shard_processes)
+            shards_merge(job, 'dedup', 'origi.fq', options.shards, method = 'merge', lines = 8, key = '2,6', unique = True, temp_path = temp_flag)
+            job.skip(True)
+        elif options.shard and options.shard_stage == 'dedup':
+            job.skip(False)
+
         job.add('LC_ALL=C',kind='program')
         job.add('cat',kind='parameter')
         job.add('',outdir('orig.fq'),kind='input',temp_path=temp_flag)
@@ -3341,10 +3758,8 @@ if __name__ == "__main__":
             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
         if sort_parallel:
             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-        if sort_lzop_compress:
-            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-        elif sort_gzip_compress:
-            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+        if sort_compress:
+            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
         job.add('-T',tmp_dir,kind='parameter',checksum='no')
         job.add('|',kind='parameter')
         job.add('LC_ALL=C',kind='parameter')
@@ -3353,6 +3768,12 @@ if __name__ == "__main__":
         job.add('"\\n"',kind='parameter')
         job.add('>',outdir('origi.fq'),kind='output')
         job.run()
+
+        if sharded:
+            job.skip(False)
+        elif options.shard and options.shard_stage == 'dedup':
+            job.close()
+            sys.exit(0)
     else:
         job.link(outdir('orig.fq'), outdir('origi.fq'), temp_path=temp_flag)
 
@@ -3399,6 +3820,8 @@ if __name__ == "__main__":
             job.add('--max',outdir('oxx_multiple.fq'),kind='output',temp_path=temp_flag) # if this is missing then these reads are going to '--un'
             if os.path.isfile(datadir('transcripts_index','.1.ebwtl')):
                 job.add('--large-index',kind='parameter')
+            if options.resident_indexes != 'no':
+                job.add('--mm',kind='parameter',checksum='no')
             job.add('',datadir('transcripts_index/'),kind='input')
             job.add('-1',outdir('ox1.fq'),kind='input',temp_path=temp_flag)
             job.add('-2',outdir('ox2.fq'),kind='input',temp_path=temp_flag)
@@ -3426,6 +3849,8 @@ if __name__ == "__main__":
             job.add('--max',outdir('ox_multiple.fq'),kind='output',temp_path=temp_flag) # if this is missing then these reads are going to '--un'
             if os.path.isfile(datadir('transcripts_index','.1.ebwtl')):
                 job.add('--large-index',kind='parameter')
+            if options.resident_indexes != 'no':
+                job.add('--mm',kind='parameter',checksum='no')
             job.add('',datadir('transcripts_index/'),kind='input')
             job.add('-1',outdir('ox1.fq'),kind='input',temp_path=temp_flag)
             job.add('-2',outdir('ox2.fq'),kind='input',temp_path=temp_flag)
@@ -3592,20 +4017,12 @@ if __name__ == "__main__":
         job.add(_FC_+'fragment_fastq.py',kind='program')
         job.add('-1',outdir('or1.fq'),kind='input',temp_path=temp_flag)
         job.add('-2',outdir('or2.fq'),kind='input',temp_path=temp_flag)
-        job.add('-f',outdir('originala-t1.fq'),kind='output')
-#        job.add('-m',outdir('merged.txt'),kind='input',temp_path=temp_flag)
-        job.add('--window-size',options.trim_psl_3end_keep,kind='parameter')
-        job.add('--step-size',options.trim_psl_3end_keep-2*length_anchor_minimum+1,kind='parameter')
-        job.add('--threshold-read',options.trim_psl_3end_keep + 10,kind='parameter')
-        job.add('--anchors',options.bridges,kind='parameter')
-        job.add('--skip-short',options.trim_3end_keep,kind='parameter')
-        job.add('--trim-n',kind='parameter')
-        job.run()
-
-        job.add(_FC_+'fragment_fastq.py',kind='program')
-        job.add('-1',outdir('merged.fq'),kind='input',temp_path=temp_flag)
-        job.add('-2','-',kind='parameter')
-        job.add('-f',outdir('originala-t2.fq'),kind='output')
+        # the fragments of the merged reads are streamed into the same output
+        # (i.e. no 'originala-t1.fq' and 'originala-t2.fq' which are concatenated);
+        # the output itself is written on the disk because it is read several
+        # times further (e.g. lengths of reads, 'original.fq', SEQTK SUBSEQ)
+        job.add('-m',outdir('merged.fq'),kind='input',temp_path=temp_flag)
+        job.add('-f',outdir('originala.fq'),kind='output')
         job.add('--window-size',options.trim_psl_3end_keep,kind='parameter')
         job.add('--step-size',options.trim_psl_3end_keep-2*length_anchor_minimum+1,kind='parameter')
         job.add('--threshold-read',options.trim_psl_3end_keep + 10,kind='parameter')
@@ -3614,12 +4031,6 @@ if __name__ == "__main__":
         job.add('--trim-n',kind='parameter')
         job.run()
 
-        job.add('cat',kind='program')
-        job.add('',outdir('originala-t1.fq'),kind='input',temp_path=temp_flag)
-        job.add('',outdir('originala-t2.fq'),kind='input',temp_path=temp_flag)
-        job.add('>',outdir('originala.fq'),kind='output')
-        job.run()
-
         fragments_flag = True
 
 #        job.add('cat',kind='program')
@@ -3779,10 +4190,182 @@ if __name__ == "__main__":
 #    job.add('>>',info_file,kind='output')
 #    job.run()
 
+    # compress the original reads (they are used later), before the read-level
+    # stages because they are not split into shards (see '--shards')
+    if pigz:
+        job.add(_PZ_+'pigz',kind='program')
+        job.add('-p',options.processes,kind='parameter',checksum='no')
+    else:
+        job.add('gzip',kind='program')
+    job.add('--fast',kind='parameter')
+    job.add('-c',outdir('originala.fq'),kind='input',temp_path=temp_flag)
+    job.add('>',outdir('originala.fq.gz'),kind='output')
+    job.run()
+
     ##############################################################################
     # FILTERING - ambiguous + Bs + too short
     ##############################################################################
 
+    targeted = False
+    if screening:
+        # the candidate fusion genes are searched first on a subsample of the
+        # reads, i.e. the read-level and candidate-level stages are executed
+        # for the subsample as for a shard of reads (see '--shards')
+        job.add(_FC_+'subsample-reads.py',kind='program')
+        job.add('--input',outdir('reads.fq'),kind='input')
+        job.add('--reads',options.screen,kind='parameter')
+        job.add('--mates',kind='parameter')
+        job.add('--output',sharddir('screen',1,'reads.fq'),kind='output')
+        job.run()
+        for f in ('log_lengths_original_reads.txt','log_lengths_reads.txt','log_minimum_length_short_read.txt'):
+            job.link(outdir(f), sharddir('screen',1,f), kind = 'copy')
+        shards_run(job, 'screen', 1,
+                   inputs = ['reads.fq'],
+                   outputs = ['preliminary-list_candidate-fusion-genes.txt'],
+                   launcher = options.shard_launcher,
+                   processes = options.processes)
+        # the genes of the candidate fusion genes found in the subsample
+        # together with their paralogs and adjacent genes
+        job.add(_FC_+'screen-genes.py',kind='program')
+        job.add('--input',sharddir('screen',1,'preliminary-list_candidate-fusion-genes.txt'),kind='input')
+        job.add('--pairs',datadir('paralogs.txt'),kind='input')
+        job.add('--pairs',datadir('adjacent_genes.txt'),kind='input')
+        job.add('--output',outdir('screen_genes.txt'),kind='output')
+        job.run()
+
+        targeted = job.iff(not empty(outdir('screen_genes.txt')),id = "#screen_genes.txt#")
+        if targeted:
+            # count of all reads (it is used for the automatic scaling)
+            job.add('LC_ALL=C',kind='program')
+            job.add('cat',kind='parameter')
+            job.add('',outdir('reads.fq'),kind='input')
+            job.add('|',kind='parameter')
+            job.add("echo $((`wc -l`/4))",kind='parameter')
+            job.add('>',outdir('log_screen_all_reads.txt'),kind='output')
+            job.run()
+
+            # only the pairs of reads where at least one read maps on these
+            # genes are kept from all reads
+            job.add(_SK_+'seqtk',kind='program')
+            job.add('subseq',kind='parameter')
+            job.add('',datadir('genes.fa'),kind='input')
+            job.add('',outdir('screen_genes.txt'),kind='input')
+            job.add('>',outdir('screen_genes.fa'),kind='output')
+            job.run()
+
+            index_builder(job, _BE_+'bowtie-build', [outdir('screen_genes.fa')], outdir('screen_genes_index/'))
+            if bowtie121:
+                job.add('--threads',options.processes,kind='parameter')
+            job.add('-f',kind='parameter')
+            job.add('--quiet',kind='parameter')
+            job.add('',outdir('screen_genes.fa'),kind='input',temp_path=temp_flag)
+            job.add('',outdir('screen_genes_index/'),kind='output')
+            job.run()
+
+            job.add(_BE_+'bowtie',kind='program')
+            job.add('-t',kind='parameter')
+            job.add('-k','1',kind='parameter')
+            job.add('-v',options.mismatches,kind='parameter')
+            job.add('-p',options.processes,kind='parameter',checksum='no')
+            if os.path.isfile(outdir('screen_genes_index','.1.ebwtl')):
+                job.add('--large-index',kind='parameter')
+            job.add('--chunkmbs',options.chunkmbs,kind='parameter',checksum='no')
+            job.add('--suppress','2,3,4,5,6,7,8',kind='parameter')
+            job.add('',outdir('screen_genes_index/'),kind='input',temp_path=temp_flag)
+            job.add('',outdir('reads.fq'),kind='input')
+            job.add('2>',outdir('log_bowtie_reads_screen-genes.stdout.txt'),kind='output',checksum='no')
+            job.add('|',kind='parameter')
+            # both mates of a pair
+            job.add('awk',kind='parameter')
+            job.add("""'{n=substr($1,1,length($1)-1); print n"1"; print n"2"}'""",kind='parameter')
+            job.add('|',kind='parameter')
+            job.add('LC_ALL=C',kind='parameter')
+            job.add('sort',kind='parameter')
+            job.add('-u',kind='parameter')
+            if sort_buffer:
+                job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
+            if sort_parallel:
+                job.add('--parallel',options.processes,kind='parameter',checksum='no')
+            if sort_compress:
+                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
+            job.add('-T',tmp_dir,kind='parameter',checksum='no')
+            job.add('>',outdir('screen_reads_ids.txt'),kind='output')
+            job.run()
+
+            job.add(_SK_+'seqtk',kind='program')
+            job.add('subseq',kind='parameter')
+            job.add('',outdir('reads.fq'),kind='input')
+            job.add('',outdir('screen_reads_ids.txt'),kind='input',temp_path=temp_flag)
+            job.add('>',outdir('reads_screen.fq'),kind='output')
+            job.run()
+
+            job.link(outdir('reads_screen.fq'), outdir('reads.fq'), kind = 'move')
+
+            info(job,
+                 fromfile = outdir('log_bowtie_reads_screen-genes.stdout.txt'),
+                 tofile = info_file,
+                 top = ["Mapping all reads on the genes of the candidate fusion genes found in a subsample of reads (see '--screen'):",
+                        "-----------------------------------------------------------------------------------------------------------"],
+                 bottom = "\n\n\n",
+                 temp_path = temp_flag)
+        else:
+            t = ["="*80,
+                 "WARNING: No candidate fusion genes have been found in the subsample of reads",
+                 "         (see '--screen') and therefore all reads are analyzed!",
+                 "="*80
+                ]
+            job.write(t, stderr=True)
+            if job.run():
+                file(info_file,'a').writelines([el.rstrip('\r\n')+'\n' for el in [""]+t+[""]])
+
+    if sharded:
+        # the read-level stages (i.e. until the mapping of the reads on the
+        # transcriptome) are executed for each shard of reads
+        shards_split(job, 'reads', 'reads.fq', options.shards, mates = True, temp_path = temp_flag)
+        for f in ('log_lengths_original_reads.txt','log_lengths_reads.txt','log_minimum_length_short_read.txt'):
+            for k in xrange(1,options.shards+1):
+                job.link(outdir(f), sharddir('reads',k,f), kind = 'copy')
+        shards_run(job, 'reads', options.shards,
+                   inputs = ['reads.fq'],
+                   outputs = ['reads_filtered_transcriptome_sorted-read.map',
+                              'reads_filtered_mapped-transcriptome.fq'],
+                   launcher = options.shard_launcher,
+                   processes = shard_processes)
+        # the MAP files are sorted by read names (and entire lines as the last
+        # resort because no stable sort is used) and therefore merging them
+        # gives the same file as sorting all reads at once
+        shards_merge(job, 'reads', 'reads_filtered_transcriptome_sorted-read.map', options.shards, method = 'merge', temp_path = temp_flag)
+        for f in ('reads_filtered_mapped-transcriptome.fq',
+                  'reads-filtered_multiple-mappings-genome.fq',
+                  'reads_filtered_not-mapped-genome_not-mapped-transcriptome.fq'):
+            shards_merge(job, 'reads', f, options.shards, method = 'cat', temp_path = temp_flag)
+        for f in ('log_removed_single_reads1.txt',
+                  'count_reads_left_after_filtering.txt'):
+            shards_merge(job, 'reads', f, options.shards, method = 'sum', temp_path = temp_flag)
+        for f in ('log_bowtie_reads-filtered-out.stdout.txt',
+                  'log_bowtie_reads_mapped-genome.stdout.txt',
+                  'log_bowtie_reads_not-mapped-genome_but_mapped-transcriptome.stdout.txt',
+                  'log_bowtie_reads_unique-mapped-genome_mapped-transcriptome.stdout.txt'):
+            shards_merge(job, 'reads', f, options.shards, method = 'bowtie', temp_path = temp_flag)
+
+        job.add('printf',kind='program')
+        job.add('"\n\n\nRead-level stages (executed for each shard of %d shards):\n=========================================================\n\n"' % (options.shards,),kind='parameter')
+        job.add('>>',info_file,kind='output')
+        job.run()
+        for k in xrange(1,options.shards+1):
+            job.add('printf',kind='program')
+            job.add('"\nShard %d:\n--------\n"' % (k,),kind='parameter')
+            job.add('>>',info_file,kind='output')
+            job.run()
+            job.add('cat',kind='program')
+            job.add('',sharddir('reads',k,'info.txt'),kind='input')
+            job.add('>>',info_file,kind='output')
+            job.run()
+        job.skip(True)
+    elif options.shard and options.shard_stage in ('reads','screen'):
+        job.skip(False)
+
+
 
     if options.skip_b_filtering:
         #job.link(outdir('reads.fq'), outdir('reads_no-shorts.fq'), temp_path=temp_flag)
@@ -3855,16 +4438,6 @@ if __name__ == "__main__":
     #job.add('--output',outdir('reads_b2n2a.fq'),kind='output')
     #job.run()
 
-    if pigz:
-        job.add(_PZ_+'pigz',kind='program')
-        job.add('-p',options.processes,kind='parameter',checksum='no')
-    else:
-        job.add('gzip',kind='program')
-    job.add('--fast',kind='parameter')
-    job.add('-c',outdir('originala.fq'),kind='input',temp_path=temp_flag)
-    job.add('>',outdir('originala.fq.gz'),kind='output')
-    job.run()
-
 
 
 
@@ -3945,7 +4518,12 @@ if __name__ == "__main__":
         bottom = "\n\n\n")
 
 
-    if job.iff(empty(outdir('reads_acgt.fq')),id = "#reads_acgt.fq#"):
+    if job.iff((empty(outdir('reads_acgt.fq')) and not sharded) or
+               (sharded and not count_of(outdir('log_removed_single_reads1.txt'))),id = "#reads_acgt.fq#"):
+        if options.shard:
+            # no reads are left in this shard (the other shards may have some)
+            job.close()
+            sys.exit(0)
         t = ["ERROR: Too many reads have been removed during the pre-filtering steps!",
              "Please, check that the input files are from a RNA-seq dataset with pair-reads ",
              "or that the input files are given correctly!"
@@ -3973,6 +4551,9 @@ if __name__ == "__main__":
     no_reads = 0
     if os.path.isfile(outdir('log_removed_single_reads1.txt')):
         no_reads = int(file(outdir('log_removed_single_reads1.txt'),'r').readline().strip())
+    if targeted:
+        # the automatic scaling uses the count of all reads and not only of the kept ones (see '--screen')
+        no_reads = count_of(outdir('log_screen_all_reads.txt'))
 
 ####
 ####
@@ -4115,10 +4696,14 @@ if __name__ == "__main__":
     if options.skip_mitochondrion_filtering:
         if os.path.isfile(datadir('rtrna_index','.1.ebwtl')):
             job.add('--large-index',kind='parameter')
+        if options.resident_indexes != 'no':
+            job.add('--mm',kind='parameter',checksum='no')
         job.add('',datadir('rtrna_index/'),kind='input')
     else:
         if os.path.isfile(datadir('rtrna_hla_mt_index','.1.ebwtl')):
             job.add('--large-index',kind='parameter')
+        if options.resident_indexes != 'no':
+            job.add('--mm',kind='parameter',checksum='no')
         job.add('',datadir('rtrna_hla_mt_index/'),kind='input')
     job.add('',outdir('reads_acgt.fq'),kind='input',temp_path=temp_flag)
     job.add('',outdir('reads-filtered.map'),kind='output',temp_path=temp_flag)
@@ -4174,10 +4759,8 @@ if __name__ == "__main__":
             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
         if sort_parallel:
             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-        if sort_lzop_compress:
-            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-        elif sort_gzip_compress:
-            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+        if sort_compress:
+            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
         job.add('-T',tmp_dir,kind='parameter',checksum='no')
         job.add('|',kind='parameter')
         job.add('LC_ALL=C',kind='parameter')
@@ -4188,7 +4771,7 @@ if __name__ == "__main__":
         job.add(_SK_+'seqtk',kind='parameter')
         job.add('dropse',kind='parameter')
         #job.add('-',kind='parameter')
-        job.add('>',outdir('reads-filtered.fq'),kind='output')
+        job.add('>',outdir('reads-filtered.fq'),kind='output',consumers=4) # 2 counts, the mapping on genome and the extraction
         job.run()
 
         job.add('LC_ALL=C',kind='program')
@@ -4294,7 +4877,12 @@ if __name__ == "__main__":
 #    job.add('>>',info_file,kind='output')
 #    job.run()
 
-    if job.iff(empty(outdir('reads-filtered.fq')),id = "#reads-filtered.fq#"):
+    if job.iff((empty(outdir('reads-filtered.fq')) and not sharded) or
+               (sharded and not count_of(outdir('count_reads_left_after_filtering.txt'))),id = "#reads-filtered.fq#"):
+        if options.shard:
+            # no reads are left in this shard (the other shards may have some)
+            job.close()
+            sys.exit(0)
         t = ["ERROR: Too many reads have been removed during the pre-filtering steps!",
              "Please, check that the input files are from a RNA-seq dataset with pair-reads "
              "or that the input files are given correctly!"
@@ -4330,10 +4918,12 @@ if __name__ == "__main__":
         job.add('--strata',kind='parameter')
 #        job.add('--tryhard',kind='parameter') # ??? really necessary? stjude
         job.add('--chunkmbs',options.chunkmbs,kind='parameter',checksum='no')
-        job.add('--un',outdir('reads_filtered_not-mapped-genome.fq'),kind='output')
+        job.add('--un',outdir('reads_filtered_not-mapped-genome.fq'),kind='output',consumers=2) # the mapping on transcriptome and the extraction
         job.add('--max',outdir('reads-filtered_multiple-mappings-genome.fq'),kind='output') # if this is missing then these reads are going to '--un'
         if os.path.isfile(datadir('genome_index','.1.ebwtl')):
             job.add('--large-index',kind='parameter')
+        if options.resident_indexes != 'no':
+            job.add('--mm',kind='parameter',checksum='no')
         job.add('',datadir('genome_index/'),kind='input')
         job.add('',outdir('reads-filtered.fq'),kind='input')
         job.add('',outdir('reads_filtered_genome.map'),kind='output') # <== best mappings on genome #######
@@ -4382,10 +4972,8 @@ if __name__ == "__main__":
             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
         if sort_parallel:
             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-        if sort_lzop_compress:
-            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-        elif sort_gzip_compress:
-            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+        if sort_compress:
+            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
         job.add('-T',tmp_dir,kind='parameter',checksum='no')
     #    job.add('|',kind='parameter')
     #    job.add('LC_ALL=C',kind='parameter')
@@ -4400,7 +4988,7 @@ if __name__ == "__main__":
             job.add(_FC_+'extract_short_reads.py',kind='program')
             job.add('--input',outdir('reads-filtered.fq'),kind='input')
             job.add('--list',outdir('list-names-reads-filtered_genome.txt'),kind='input')
-            job.add('--output',outdir('reads_filtered_unique-mapped-genome.fq'),kind='output')
+            job.add('--output',outdir('reads_filtered_unique-mapped-genome.fq'),kind='output',consumers=2)
             job.add('--buffer-size',options.extract_buffer_size,kind='parameter',checksum='no')
             job.run(error_message = ("If this fails (again?) due to a memory error (e.g. not enough free memory) then lowering the "+
                                      "buffer size for specifically this script might help. This can be done by using the FusionCatcher's "+
@@ -4411,7 +4999,7 @@ if __name__ == "__main__":
             job.add('subseq',kind='parameter')
             job.add('',outdir('reads-filtered.fq'),kind='input')
             job.add('',outdir('list-names-reads-filtered_genome.txt'),kind='input')
-            job.add('>',outdir('reads_filtered_unique-mapped-genome.fq'),kind='output')
+            job.add('>',outdir('reads_filtered_unique-mapped-genome.fq'),kind='output',consumers=2)
             job.run(error_message=("ERROR: Most likely this fails because there is not enough free RAM memory for running SEQTK SUBSEQ tool <https://github.com/lh3/seqtk> on this computer. "+
                 "Please, try to (i) run it on a server/computer with larger amount of memory, or (ii) using command line option '--no-seqtk-subseq' !"))
         elif options.split_seqtk_subseq > 1:
@@ -4422,7 +5010,7 @@ if __name__ == "__main__":
             job.add('',options.split_seqtk_subseq,kind='parameter')
             job.add('',outdir('reads-filtered.fq'),kind='input')
             job.add('',outdir('list-names-reads-filtered_genome.txt'),kind='input')
-            job.add('',outdir('reads_filtered_unique-mapped-genome.fq'),kind='output')
+            job.add('',outdir('reads_filtered_unique-mapped-genome.fq'),kind='output',consumers=2)
             job.run(error_message=("ERROR: Most likely this fails because there is not enough free RAM memory for running SEQTK SUBSEQ tool <https://github.com/lh3/seqtk> on this computer. "+
                 "Please, try to (i) run it on a server/computer with larger amount of memory, or (ii) using command line option '--no-seqtk-subseq' !"))
 
@@ -4474,6 +5062,8 @@ if __name__ == "__main__":
             job.add('--max',outdir('reads_filtered_genome-transcriptome_multiple.fq'),kind='output',temp_path=temp_flag) # if this is missing then these reads are going to '--un'
             if os.path.isfile(datadir('transcripts_index','.1.ebwtl')):
                 job.add('--large-index',kind='parameter')
+            if options.resident_indexes != 'no':
+                job.add('--mm',kind='parameter',checksum='no')
             job.add('',datadir('transcripts_index/'),kind='input')
             job.add('',outdir('reads_filtered_not-mapped-genome.fq'),kind='input')
             job.add('',outdir('reads_filtered_not-mapped-genome_transcriptome.map'),kind='output')
@@ -4518,10 +5108,8 @@ if __name__ == "__main__":
             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
         if sort_parallel:
             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-        if sort_lzop_compress:
-            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-        elif sort_gzip_compress:
-            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+        if sort_compress:
+            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
     #    job.add('-T',tmp_dir,kind='parameter',checksum='no')
     #    job.add('|',kind='parameter')
     #    job.add('LC_ALL=C',kind='parameter')
@@ -4575,6 +5163,10 @@ if __name__ == "__main__":
     # MAPPING short reads (which map uniquely on genome) against the transcriptome
     ##############################################################################
 
+    # it is decided before the mapping if its output is filtered such that the
+    # output can be streamed to the filtering (see STREAM in workflow.py)
+    filtering = job.iff((not options.skip_genome_transcriptome_filtering) and (not empty(outdir('reads_filtered_genome.map'))),id="#genome_transcriptome_filtering#")
+
     # map using the transcript index (not mapped, unique alignment, multiple alignments)
     job.add(_BE_+'bowtie',kind='program')
     job.add('-t',kind='parameter')
@@ -4592,21 +5184,16 @@ if __name__ == "__main__":
     job.add('--suppress','5,6,7',kind='parameter')
     if os.path.isfile(datadir('transcripts_index','.1.ebwtl')):
         job.add('--large-index',kind='parameter')
+    if options.resident_indexes != 'no':
+        job.add('--mm',kind='parameter',checksum='no')
     job.add('',datadir('transcripts_index/'),kind='input')
     job.add('',outdir('reads_filtered_unique-mapped-genome.fq'),kind='input')
-    job.add('',outdir('reads_filtered_unique-mapped-genome_transcriptome_temp.map'),kind='output')
+    job.add('',outdir('reads_filtered_unique-mapped-genome_transcriptome_temp.map'),kind='output',stream='yes')
     job.add('2>',outdir('log_bowtie_reads_unique-mapped-genome_mapped-transcriptome.stdout.txt'),kind='parameter',checksum='no')
     #job.add('2>&1',kind='parameter',checksum='no')
     job.run()
 
-    info(job,
-         fromfile = outdir('log_bowtie_reads_unique-mapped-genome_mapped-transcriptome.stdout.txt'),
-         tofile = info_file,
-         top = ["Mapping on transcriptome the filtered reads which map uniquely on genome:",
-                "------------------------------------------------------------------------"],
-         bottom = "\n\n\n")
-
-    if job.iff((not options.skip_genome_transcriptome_filtering) and (not empty(outdir('reads_filtered_genome.map'))),id="#genome_transcriptome_filtering#"):
+    if filtering:
         # filter the mapped reads on transcriptome wich mapped also on genome using mismatches
         job.add(_FC_+'remove_reads_genome_transcriptome.py',kind='program')
         job.add('--input_map_1',outdir('reads_filtered_genome.map'),kind='input',temp_path=temp_flag)
@@ -4619,6 +5206,13 @@ if __name__ == "__main__":
         job.link(outdir('reads_filtered_unique-mapped-genome_transcriptome_temp.map'),outdir('reads_filtered_unique-mapped-genome_transcriptome.map'),temp_path=temp_flag)
         job.clean(outdir('reads_filtered_genome.map'),temp_path=temp_flag)
 
+    info(job,
+         fromfile = outdir('log_bowtie_reads_unique-mapped-genome_mapped-transcriptome.stdout.txt'),
+         tofile = info_file,
+         top = ["Mapping on transcriptome the filtered reads which map uniquely on genome:",
+                "------------------------------------------------------------------------"],
+         bottom = "\n\n\n")
+
     # extract the names of the short reads which mapped on the transcriptome
     job.add('LC_ALL=C',kind='program')
     job.add('cut',kind='parameter')
@@ -4635,10 +5229,8 @@ if __name__ == "__main__":
         job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
     if sort_parallel:
         job.add('--parallel',options.processes,kind='parameter',checksum='no')
-    if sort_lzop_compress:
-        job.add('--compress-program','lzop',kind='parameter',checksum='no')
-    elif sort_gzip_compress:
-        job.add('--compress-program','gzip',kind='parameter',checksum='no')
+    if sort_compress:
+        job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
     job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #    job.add('|',kind='parameter')
 #    job.add('LC_ALL=C',kind='parameter')
@@ -4743,10 +5335,8 @@ if __name__ == "__main__":
         job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
     if sort_parallel:
         job.add('--parallel',options.processes,kind='parameter',checksum='no')
-    if sort_lzop_compress:
-        job.add('--compress-program','lzop',kind='parameter',checksum='no')
-    elif sort_gzip_compress:
-        job.add('--compress-program','gzip',kind='parameter',checksum='no')
+    if sort_compress:
+        job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
     job.add('-T',tmp_dir,kind='parameter',checksum='no')
     #job.add('-s',kind='parameter') # stable sort
     job.add('-t',"'\t'",kind='parameter')
@@ -4755,6 +5345,12 @@ if __name__ == "__main__":
     job.add('>',outdir('reads_filtered_transcriptome_sorted-read.map'),kind='output')
     job.run()
 
+    if sharded:
+        job.skip(False)
+    elif options.shard and options.shard_stage == 'reads':
+        job.close()
+        sys.exit(0)
+
     if ( (options.homolog > 0 or (options.ambiguous_filtering)) and
          job.iff(not empty(outdir('reads_filtered_mapped-transcriptome.fq')),id = "#reads_filtered_mapped-transcriptome.fq#")
          ):
@@ -4783,6 +5379,8 @@ if __name__ == "__main__":
         job.add('--chunkmbs',options.chunkmbs,kind='parameter',checksum='no')
         if os.path.isfile(datadir('transcripts_index','.1.ebwtl')):
             job.add('--large-index',kind='parameter')
+        if options.resident_indexes != 'no':
+            job.add('--mm',kind='parameter',checksum='no')
         job.add('',datadir('transcripts_index/'),kind='input')
         job.add('',outdir('reads_filtered_mapped-transcriptome.fq'),kind='input',temp_path = temp_flag)
         #job.add('',outdir('reads_filtered_all-possible-mappings-transcriptome.map'),kind='output') # <== best mappings on transcriptome ####### XXX
@@ -4820,10 +5418,8 @@ if __name__ == "__main__":
             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
         if sort_parallel:
             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-        if sort_lzop_compress:
-            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-        elif sort_gzip_compress:
-            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+        if sort_compress:
+            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
         job.add('-T',tmp_dir,kind='parameter',checksum='no')
         #job.add('-s',kind='parameter') # stable sort
         job.add('-t',"'\t'",kind='parameter')
@@ -4867,10 +5463,8 @@ if __name__ == "__main__":
             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
         if sort_parallel:
             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-        if sort_lzop_compress:
-            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-        elif sort_gzip_compress:
-            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+        if sort_compress:
+            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
         job.add('-T',tmp_dir,kind='parameter',checksum='no')
         job.add('',outdir('list_offending_reads_.txt'),kind='input',temp_path=temp_flag)
 #        job.add('|',kind='parameter')
@@ -4928,6 +5522,8 @@ if __name__ == "__main__":
             job.add('--chunkmbs',options.chunkmbs,kind='parameter',checksum='no')
             if os.path.isfile(datadir('transcripts_index','.1.ebwtl')):
                 job.add('--large-index',kind='parameter')
+            if options.resident_indexes != 'no':
+                job.add('--mm',kind='parameter',checksum='no')
             job.add('',datadir('transcripts_index/'),kind='input')
             job.add('',outdir('reads-filtered_multiple-mappings-genome.fq'),kind='input',temp_path=temp_flag)
             #job.add('',outdir('reads_filtered_all-possible-mappings-transcriptome_multiple.map'),kind='output') # <== best mappings on transcriptome #######
@@ -4960,10 +5556,8 @@ if __name__ == "__main__":
                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
             if sort_parallel:
                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-            if sort_lzop_compress:
-                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-            elif sort_gzip_compress:
-                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+            if sort_compress:
+                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
             job.add('-T',tmp_dir,kind='parameter',checksum='no')
             job.add('-t',"'\t'",kind='parameter')
             job.add('-k','1,1',kind='parameter')
@@ -5122,10 +5716,8 @@ if __name__ == "__main__":
             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
         if sort_parallel:
             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-        if sort_lzop_compress:
-            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-        elif sort_gzip_compress:
-            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+        if sort_compress:
+            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
         job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #        job.add('|',kind='parameter')
 #        job.add('LC_ALL=C',kind='parameter')
@@ -5807,6 +6399,39 @@ if __name__ == "__main__":
     job.add('--output',outdir('preliminary-list_candidate-fusion-genes.txt'),kind='output')
     job.run()
 
+    if options.shard and options.shard_stage == 'screen':
+        # the candidate fusion genes of the subsample are ready (see '--screen')
+        job.close()
+        sys.exit(0)
+
+    if targeted:
+        # the candidate fusion genes found using the kept reads should be
+        # among the candidate fusion genes found in the subsample of reads
+        # (whatever their analysis status), otherwise some of their reads
+        # might have been dropped (see '--screen')
+        job.add(_FC_+'screen-genes.py',kind='program')
+        job.add('--input',outdir('preliminary-list_candidate-fusion-genes.txt'),kind='input')
+        job.add('--known',outdir('screen_genes.txt'),kind='input')
+        job.add('--output',outdir('screen_genes_missed.txt'),kind='output')
+        job.run()
+        job.add(_FC_+'screen-genes.py',kind='program')
+        job.add('--input',outdir('preliminary-list_candidate-fusion-genes.txt'),kind='input')
+        job.add('--known-pairs',sharddir('screen',1,'preliminary-list_candidate-fusion-genes.txt'),kind='input')
+        job.add('--output',outdir('screen_pairs_missed.txt'),kind='output')
+        job.run()
+        if job.iff((not empty(outdir('screen_genes_missed.txt'))) or (not empty(outdir('screen_pairs_missed.txt'))),id = "#screen_genes_missed.txt#"):
+            t = ["="*80,
+                 "WARNING: The candidate fusion genes have genes (or pairs of genes) which",
+                 "         have not been found in the subsample of reads (see '--screen')",
+                 "         and therefore the analysis is re-started using all reads!",
+                 "="*80
+                ]
+            job.write(t, stderr=True)
+            file(info_file,'a').writelines([el.rstrip('\r\n')+'\n' for el in [""]+t+[""]])
+            job.close()
+            argv = replace_optparse_options(parser, sys.argv[1:], {'screen':0, 'start_step':1})
+            os.execv(sys.executable, [sys.executable, expand(sys.argv[0])] + argv)
+
     candidates = True
     if job.iff(empty(outdir('candidate_fusion-genes_exon-exon.txt'))  ,
                 id = "#no-candidate-fusion-genes-found-1#"):
@@ -5894,6 +6519,8 @@ if __name__ == "__main__":
             job.add('--max',outdir('reads_filtered_not-mapped_multiple.fq'),kind='output',temp_path=temp_flag) # if this is missing then these reads are going to '--un'
             if os.path.isfile(datadir('transcripts_index','.1.ebwtl')):
                 job.add('--large-index',kind='parameter')
+            if options.resident_indexes != 'no':
+                job.add('--mm',kind='parameter',checksum='no')
             job.add('',datadir('transcripts_index/'),kind='input')
             job.add('',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome.fq'),kind='input',temp_path=temp_flag)
             #job.add('',outdir('reads-unmapped-filtered-trans.map'),kind='output')
@@ -5907,10 +6534,8 @@ if __name__ == "__main__":
                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
             if sort_parallel:
                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-            if sort_lzop_compress:
-                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-            elif sort_gzip_compress:
-                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+            if sort_compress:
+                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
             job.add('-T',tmp_dir,kind='parameter',checksum='no')
             #job.add('-s',kind='parameter') # stable sort
             job.add('-t',"'\t'",kind='parameter')
@@ -5935,10 +6560,8 @@ if __name__ == "__main__":
                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                 if sort_parallel:
                     job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                if sort_lzop_compress:
-                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                elif sort_gzip_compress:
-                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                if sort_compress:
+                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
                 #job.add('-s',kind='parameter') # stable sort
                 job.add('-t',"'\t'",kind='parameter')
@@ -5969,6 +6592,8 @@ if __name__ == "__main__":
                 job.add('--max',outdir('reads_filtered_not-mapped_multiple_end.fq'),kind='output',temp_path=temp_flag) # if this is missing then these reads are going to '--un'
                 if os.path.isfile(datadir('genome_index','.1.ebwtl')):
                     job.add('--large-index',kind='parameter')
+                if options.resident_indexes != 'no':
+                    job.add('--mm',kind='parameter',checksum='no')
                 job.add('',datadir('genome_index/'),kind='input')
                 job.add('',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_more.fq'),kind='input',temp_path=temp_flag)
                 job.add('',outdir('reads-unmapped-filtered-geno.map'),kind='output',temp_path=temp_flag)
@@ -6091,6 +6716,8 @@ if __name__ == "__main__":
 #                    job.add('--trim5',options.trim_wiggle,kind='parameter') # trim the 5
                 if os.path.isfile(datadir('viruses_index','.1.ebwtl')):
                     job.add('--large-index',kind='parameter')
+                if options.resident_indexes != 'no':
+                    job.add('--mm',kind='parameter',checksum='no')
                 job.add('',datadir('viruses_index/'),kind='input')
                 job.add('',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_end-f4-sam.fq'),kind='input',temp_path=temp_flag)
                 #job.add('',outdir('reads-mapped-on-viruses.sam'),kind='output')
@@ -6151,6 +6778,8 @@ if __name__ == "__main__":
             job.add('--max',outdir('reads-filtered_temp_multiple-viruses.fq'),kind='output',temp_path=temp_flag) # if this is missing then these reads are going to '--un'
             if os.path.isfile(datadir('viruses_index','.1.ebwtl')):
                 job.add('--large-index',kind='parameter')
+            if options.resident_indexes != 'no':
+                job.add('--mm',kind='parameter',checksum='no')
             job.add('',datadir('viruses_index/'),kind='input')
             job.add('',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_end-f4.fq'),kind='input',temp_path=temp_flag)
             #job.add('',outdir('reads-filtered-viruses.map'),kind='output') # XXX
@@ -6164,10 +6793,8 @@ if __name__ == "__main__":
                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
             if sort_parallel:
                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-            if sort_lzop_compress:
-                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-            elif sort_gzip_compress:
-                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+            if sort_compress:
+                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
             job.add('-T',tmp_dir,kind='parameter',checksum='no')
             #job.add('',outdir('reads-filtered-viruses.map'),kind='input',temp_path=temp_flag) # XXX
             job.add('|',kind='parameter')
@@ -6253,6 +6880,8 @@ if __name__ == "__main__":
         job.add('--max',outdir('reads_filtered_not-mapped_multiple_end2.fq'),kind='output',temp_path=temp_flag) # if this is missing then these reads are going to '--un'
         if os.path.isfile(datadir('genome_index','.1.ebwtl')):
             job.add('--large-index',kind='parameter')
+        if options.resident_indexes != 'no':
+            job.add('--mm',kind='parameter',checksum='no')
         job.add('',datadir('genome_index/'),kind='input')
         job.add('',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_end-f5.fq'),kind='input',temp_path=temp_flag)
         job.add('',outdir('reads-unmapped-filtered-geno_last.map'),kind='output',temp_path=temp_flag)
@@ -6396,10 +7025,8 @@ if __name__ == "__main__":
             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
         if sort_parallel:
             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-        if sort_lzop_compress:
-            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-        elif sort_gzip_compress:
-            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+        if sort_compress:
+            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
         job.add('-T',tmp_dir,kind='parameter',checksum='no')
         job.add('>',outdir('original_important.txt'),kind='output')
         job.run()
@@ -6457,7 +7084,7 @@ if __name__ == "__main__":
         job.add('-t',"'\t'",kind='parameter')
         job.add('',outdir('original_important.txt'),kind='input',temp_path=temp_flag)
         job.add('',outdir('reads_filtered_transcriptome_sorted-read_end.map'),kind='input',temp_path=temp_flag)
-        job.add('>',outdir('reads_filtered_transcriptome_sorted-read_end_important.map'),kind='output')
+        zout(job,outdir('reads_filtered_transcriptome_sorted-read_end_important.map'),zip_program)
         job.run()
 
 
@@ -6480,10 +7107,8 @@ if __name__ == "__main__":
             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
         if sort_parallel:
             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-        if sort_lzop_compress:
-            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-        elif sort_gzip_compress:
-            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+        if sort_compress:
+            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
         job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #        job.add('|',kind='parameter')
 #        job.add('LC_ALL=C',kind='parameter')
@@ -6507,10 +7132,8 @@ if __name__ == "__main__":
             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
         if sort_parallel:
             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-        if sort_lzop_compress:
-            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-        elif sort_gzip_compress:
-            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+        if sort_compress:
+            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
         job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #        job.add('|',kind='parameter')
 #        job.add('LC_ALL=C',kind='parameter')
@@ -6533,10 +7156,8 @@ if __name__ == "__main__":
             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
         if sort_parallel:
             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-        if sort_lzop_compress:
-            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-        elif sort_gzip_compress:
-            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+        if sort_compress:
+            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
         job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #        job.add('|',kind='parameter')
 #        job.add('LC_ALL=C',kind='parameter')
@@ -6606,7 +7227,7 @@ if __name__ == "__main__":
         job.add('-t',"'\t'",kind='parameter')
         job.add('',outdir('original_important.txt'),kind='input',temp_path=temp_flag)
         job.add('',outdir('reads_filtered_transcriptome_sorted-read_end.map'),kind='input',temp_path=temp_flag)
-        job.add('>',outdir('reads_filtered_transcriptome_sorted-read_end_important.map'),kind='output')
+        zout(job,outdir('reads_filtered_transcriptome_sorted-read_end_important.map'),zip_program)
         job.run()
 
 
@@ -6718,33 +7339,37 @@ if __name__ == "__main__":
 #            double_bowtie = True
 
         parts = []
-        if nucleotides_ee > options.limit_bowtie:
+        threshold_bowtie = split_threshold(['bowtie-build','bowtie'],options.limit_bowtie,'limit_bowtie')
+        if nucleotides_ee > threshold_bowtie:
 
             job.add(_FC_+'split-fasta.py',kind='program')
             job.add('--size',outdir('exon-exon_junction_cut__nuc.txt'),kind='input')
             job.add('--seqs',outdir('exon-exon_junction_cut__seq.txt'),kind='input')
-            job.add('--threshold',options.limit_bowtie,kind='parameter')
+            job.add('--threshold',threshold_bowtie,kind='parameter')
             job.add('-i',outdir('exon-exon_junction_cut.fa'),kind='input')
             job.add('-o',outdir('exon-exon_junction_cut_split.fa'),kind='output')
             job.run()
 
             parts = [el.strip() for el in file(outdir('exon-exon_junction_cut_split.fa'),'r').readlines()]
+            # the parts are indexed and aligned concurrently
+            (threads,gb) = parts_budget(parts,options.processes,['bowtie-build','bowtie'])
+            job.parallel_start()
             for i,part in enumerate(parts):
                 # map the reads which do not align anywhere on the exon-exon junctions from fusion-genes
                 # build index
-                job.add(_BE_+'bowtie-build',kind='program')
+                index_builder(job, _BE_+'bowtie-build', [part], part+'_dir/')
                 if bowtie121:
-                    job.add('--threads',options.processes,kind='parameter')
+                    job.add('--threads',threads,kind='parameter')
                 job.add('-f',kind='parameter')
                 job.add('--quiet',kind='parameter')
                 if bowtie121:
-                    job.add('--threads',options.processes,kind='parameter')
+                    job.add('--threads',threads,kind='parameter')
 #                job.add('--ntoa',kind='parameter')
                 job.add('--offrate','1',kind='parameter')
                 job.add('--ftabchars','5',kind='parameter')
                 job.add('',part,kind='input')
                 job.add('',part+'_dir/',kind='output')
-                job.run()
+                job.run(processes=threads,memory=gb)
                 # map using the exon-exon fusion genes index (all possible mappings)
                 job.add(_BE_+'bowtie',kind='program')
                 job.add('-t',kind='parameter')
@@ -6752,7 +7377,7 @@ if __name__ == "__main__":
                 #job.add('-a',kind='parameter')
                 job.add('-k','1000',kind='parameter')
                 job.add('-v',options.mismatches,kind='parameter')
-                job.add('-p',options.processes,kind='parameter',checksum='no')
+                job.add('-p',threads,kind='parameter',checksum='no')
                 if os.path.isfile(os.path.join(part+'_dir','.1.ebwtl')):
                     job.add('--large-index',kind='parameter')
                 job.add('--chunkmbs',options.chunkmbs,kind='parameter',checksum='no')
@@ -6774,19 +7399,19 @@ if __name__ == "__main__":
                 if sort_buffer:
                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                 if sort_parallel:
-                    job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                if sort_lzop_compress:
-                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                elif sort_gzip_compress:
-                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                    job.add('--parallel',threads,kind='parameter',checksum='no')
+                if sort_compress:
+                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
                 #job.add('-s',kind='parameter') # stable sort
                 job.add('-t',"'\t'",kind='parameter')
                 job.add('-k','3,3',kind='parameter')
                 #job.add('',outdir('reads_mapped-exon-exon-fusion-genes.map'),kind='input',temp_path = temp_flag) # XXX
                 job.add('>',outdir('reads_mapped-exon-exon-fusion-genes_sorted-ref.map.'+str(i)),kind='output',dest_list='exonexon')
-                job.run()
+                job.run(processes=threads,memory=gb)
+            job.parallel_stop()
 
+            for i,part in enumerate(parts):
                 job.clean(outdir('log_bowtie_reads_mapped-exon-exon-fusion-genes_map.stdout.txt.'+str(i)),temp_path=temp_flag)
                 
                 if job.iff(empty(outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_ex-ex_final.fq.'+str(i))),id="###reads_fnmgnmteef.fq."+str(i)+"###"):
@@ -6813,7 +7438,7 @@ if __name__ == "__main__":
         else:
             # map the reads which do not align anywhere on the exon-exon junctions from fusion-genes
             # build index
-            job.add(_BE_+'bowtie-build',kind='program')
+            index_builder(job, _BE_+'bowtie-build', [outdir('exon-exon_junction_cut.fa')], outdir('exon-exon_fusion-genes/'))
             if bowtie121:
                 job.add('--threads',options.processes,kind='parameter')
             job.add('-f',kind='parameter')
@@ -6856,10 +7481,8 @@ if __name__ == "__main__":
                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
             if sort_parallel:
                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-            if sort_lzop_compress:
-                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-            elif sort_gzip_compress:
-                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+            if sort_compress:
+                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
             job.add('-T',tmp_dir,kind='parameter',checksum='no')
             #job.add('-s',kind='parameter') # stable sort
             job.add('-t',"'\t'",kind='parameter')
@@ -6907,10 +7530,8 @@ if __name__ == "__main__":
                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
             if sort_parallel:
                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-            if sort_lzop_compress:
-                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-            elif sort_gzip_compress:
-                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+            if sort_compress:
+                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
             job.add('-T',tmp_dir,kind='parameter',checksum='no')
             job.add('>',outdir('reads_transcriptome22.txt'),kind='output')
             job.run()
@@ -7025,13 +7646,14 @@ if __name__ == "__main__":
 
         job.clean(outdir('reads_filtered_psl_temp22.fq'),temp_path=temp_flag)
 
-        if nucleotides_ee > options.limit_bowtie:
+        threshold_bowtie = split_threshold(['bowtie-build','bowtie'],options.limit_bowtie,'limit_bowtie')
+        if nucleotides_ee > threshold_bowtie:
 
             if not candidates:
                 job.add(_FC_+'split-fasta.py',kind='program')
                 job.add('--size',outdir('exon-exon_junction_cut__nuc.txt'),kind='input')
                 job.add('--seqs',outdir('exon-exon_junction_cut__seq.txt'),kind='input')
-                job.add('--threshold',options.limit_bowtie,kind='parameter')
+                job.add('--threshold',threshold_bowtie,kind='parameter')
                 job.add('-i',outdir('exon-exon_junction_cut.fa'),kind='input')
                 job.add('-o',outdir('exon-exon_junction_cut_split.fa'),kind='output')
                 job.run()
@@ -7039,12 +7661,15 @@ if __name__ == "__main__":
                 parts = [el.strip() for el in file(outdir('exon-exon_junction_cut_split.fa'),'r').readlines()]
                 
                 
+            # the parts are indexed and aligned concurrently
+            (threads,gb) = parts_budget(parts,options.processes,['bowtie-build','bowtie'])
+            job.parallel_start()
             for i,part in enumerate(parts):
 
                 if not candidates:
-                    job.add(_BE_+'bowtie-build',kind='program')
+                    index_builder(job, _BE_+'bowtie-build', [part], part+'_dir/')
                     if bowtie121:
-                        job.add('--threads',options.processes,kind='parameter')
+                        job.add('--threads',threads,kind='parameter')
                     job.add('-f',kind='parameter')
                     job.add('--quiet',kind='parameter')
     #                job.add('--ntoa',kind='parameter')
@@ -7052,20 +7677,20 @@ if __name__ == "__main__":
                     job.add('--ftabchars','5',kind='parameter')
                     job.add('',part,kind='input')
                     job.add('',part+'_dir/',kind='output')
-                    job.run()
+                    job.run(processes=threads,memory=gb)
 
                 job.add(_BE_+'bowtie',kind='program')
                 job.add('-t',kind='parameter')
                 job.add('-k','1000',kind='parameter')
                 job.add('-v',options.mismatches,kind='parameter')
-                job.add('-p',options.processes,kind='parameter',checksum='no')
+                job.add('-p',threads,kind='parameter',checksum='no')
                 if os.path.isfile(os.path.join(part+'_dir','.1.ebwtl')):
                     job.add('--large-index',kind='parameter')
                 job.add('--chunkmbs',options.chunkmbs,kind='parameter',checksum='no')
                 job.add('--un',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_ex-ex_final22.fq.'+str(i)),kind='output',dest_list='exonexon22_un') # here is the result
                 job.add('--tryhard',kind='parameter')
                 job.add('',part+'_dir/',kind='input',temp_path=temp_flag)
-                job.add('',outdir('reads_filtered_psl.fq'),kind='input',temp_path=temp_flag)
+                job.add('',outdir('reads_filtered_psl.fq'),kind='input')
                 job.add('2>',outdir('log_bowtie_reads_mapped-exon-exon-fusion-genes_map22.stdout.txt.'+str(i)),kind='output',checksum='no')
                 job.add('|',kind='parameter')
                 job.add('LC_ALL=C',kind='parameter')
@@ -7073,17 +7698,19 @@ if __name__ == "__main__":
                 if sort_buffer:
                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                 if sort_parallel:
-                    job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                if sort_lzop_compress:
-                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                elif sort_gzip_compress:
-                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                    job.add('--parallel',threads,kind='parameter',checksum='no')
+                if sort_compress:
+                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
                 job.add('-t',"'\t'",kind='parameter')
                 job.add('-k','3,3',kind='parameter')
                 job.add('>',outdir('reads_mapped-exon-exon-fusion-genes_sorted-ref22.map.'+str(i)),kind='output',dest_list='exonexon22')
-                job.run()
+                job.run(processes=threads,memory=gb)
+            job.parallel_stop()
+
+            job.clean(outdir('reads_filtered_psl.fq'),temp_path=temp_flag)
 
+            for i,part in enumerate(parts):
                 job.clean(outdir('log_bowtie_reads_mapped-exon-exon-fusion-genes_map22.stdout.txt.'+str(i)),temp_path=temp_flag)
 
                 if job.iff(empty(outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_ex-ex_final22.fq.'+str(i))),id="###reads_fnmgnmteef22.fq."+str(i)+"###"):
@@ -7108,7 +7735,7 @@ if __name__ == "__main__":
         else:
 
             if not candidates:
-                job.add(_BE_+'bowtie-build',kind='program')
+                index_builder(job, _BE_+'bowtie-build', [outdir('exon-exon_junction_cut.fa')], outdir('exon-exon_fusion-genes/'))
                 if bowtie121:
                     job.add('--threads',options.processes,kind='parameter')
                 job.add('-f',kind='parameter')
@@ -7140,10 +7767,8 @@ if __name__ == "__main__":
                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
             if sort_parallel:
                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-            if sort_lzop_compress:
-                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-            elif sort_gzip_compress:
-                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+            if sort_compress:
+                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
             job.add('-T',tmp_dir,kind='parameter',checksum='no')
             job.add('-t',"'\t'",kind='parameter')
             job.add('-k','3,3',kind='parameter')
@@ -7173,10 +7798,8 @@ if __name__ == "__main__":
                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
             if sort_parallel:
                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-            if sort_lzop_compress:
-                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-            elif sort_gzip_compress:
-                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+            if sort_compress:
+                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
             job.add('-T',tmp_dir,kind='parameter',checksum='no')
             job.add('-t',"'\t'",kind='parameter')
             job.add('-k','3,3',kind='parameter')
@@ -7220,10 +7843,8 @@ if __name__ == "__main__":
                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
             if sort_parallel:
                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-            if sort_lzop_compress:
-                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-            elif sort_gzip_compress:
-                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+            if sort_compress:
+                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
             job.add('>',outdir('reads_mapped-exon-exon-fusion-genes_sorted-ref_big.txt'),kind='output')
             job.run()
             
@@ -7377,10 +7998,8 @@ if __name__ == "__main__":
                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
             if sort_parallel:
                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-            if sort_lzop_compress:
-                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-            elif sort_gzip_compress:
-                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+            if sort_compress:
+                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
             job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #            job.add('|',kind='parameter')
 #            job.add('LC_ALL=C',kind='parameter')
@@ -7415,10 +8034,8 @@ if __name__ == "__main__":
                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                 if sort_parallel:
                     job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                if sort_lzop_compress:
-                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                elif sort_gzip_compress:
-                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                if sort_compress:
+                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #                job.add('|',kind='parameter')
 #                job.add('LC_ALL=C',kind='parameter')
@@ -7801,22 +8418,26 @@ if __name__ == "__main__":
                 job.add('>',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_psl_all_final.fq'),kind='output')
                 job.run()
 
-                if nucleotides_ggu > options.limit_bowtie:
+                threshold_bowtie = split_threshold(['bowtie-build','bowtie'],options.limit_bowtie,'limit_bowtie')
+                if nucleotides_ggu > threshold_bowtie:
 
                     job.add(_FC_+'split-fasta.py',kind='program')
                     job.add('--size',outdir('gene-gene_unique__nuc.txt'),kind='input')
                     job.add('--seqs',outdir('gene-gene_unique__seq.txt'),kind='input')
-                    job.add('--threshold',options.limit_bowtie,kind='parameter')
+                    job.add('--threshold',threshold_bowtie,kind='parameter')
                     job.add('-i',outdir('gene-gene_unique.fa'),kind='input')
                     job.add('-o',outdir('gene-gene_unique_split.fa'),kind='output')
                     job.run()
 
                     parts = [el.strip() for el in file(outdir('gene-gene_unique_split.fa'),'r').readlines()]
+                    # the parts are indexed and aligned concurrently
+                    (threads,gb) = parts_budget(parts,options.processes,['bowtie-build','bowtie'])
+                    job.parallel_start()
                     for i,part in enumerate(parts):
                         # build index
-                        job.add(_BE_+'bowtie-build',kind='program')
+                        index_builder(job, _BE_+'bowtie-build', [part], part+'_dir/')
                         if bowtie121:
-                            job.add('--threads',options.processes,kind='parameter')
+                            job.add('--threads',threads,kind='parameter')
                         job.add('-f',kind='parameter')
                         job.add('--quiet',kind='parameter')
 #                        job.add('--ntoa',kind='parameter')
@@ -7824,13 +8445,13 @@ if __name__ == "__main__":
                         job.add('--ftabchars','5',kind='parameter')
                         job.add('',part,kind='input',temp_path=temp_flag)
                         job.add('',part+'_dir/',kind='output')
-                        job.run()
+                        job.run(processes=threads,memory=gb)
 
                         job.add(_BE_+'bowtie',kind='program')
                         job.add('-t',kind='parameter')
                         #job.add('-q',kind='parameter')
                         job.add('-v',options.mismatches,kind='parameter') #options.mismatches
-                        job.add('-p',options.processes,kind='parameter',checksum='no')
+                        job.add('-p',threads,kind='parameter',checksum='no')
                         job.add('-k','1',kind='parameter')
                         if os.path.isfile(os.path.join(part+'_dir','.1.ebwtl')):
                             job.add('--large-index',kind='parameter')
@@ -7838,9 +8459,9 @@ if __name__ == "__main__":
                         job.add('--tryhard',kind='parameter')
                         job.add('--suppress','2,3,4,5,6,7,8',kind='parameter')
                         job.add('',part+'_dir/',kind='input',temp_path=temp_flag)
-                        job.add('',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_psl_all_final.fq'),kind='input',temp_path=temp_flag)
+                        job.add('',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_psl_all_final.fq'),kind='input')
                         #job.add('',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_psl_all.map'),kind='output')
-                        job.add('2>',outdir('log_bowtie_psl_all.txt'),kind='output',checksum='no')
+                        job.add('2>',outdir('log_bowtie_psl_all.txt.')+str(i),kind='output',checksum='no')
                         #job.add('2>&1',kind='parameter',checksum='no')
                         #job.run()
                         job.add('|',kind='parameter')
@@ -7853,20 +8474,21 @@ if __name__ == "__main__":
                         if sort_buffer:
                             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                         if sort_parallel:
-                            job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                        if sort_lzop_compress:
-                            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                        elif sort_gzip_compress:
-                            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            job.add('--parallel',threads,kind='parameter',checksum='no')
+                        if sort_compress:
+                            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                         job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #                        job.add('|',kind='parameter')
 #                        job.add('LC_ALL=C',kind='parameter')
 #                        job.add('uniq',kind='parameter')
                         #job.add('',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_psl_all.map'),kind='input',temp_path = temp_flag) # XXX
                         job.add('>',outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_psl_all_uniq.map.')+str(i),kind='output',dest_list='genegeneunique')
-                        job.run()
+                        job.run(processes=threads,memory=gb)
+                    job.parallel_stop()
 
-                        job.clean(outdir('log_bowtie_psl_all.txt'),temp_path=temp_flag)
+                    job.clean(outdir('reads_filtered_not-mapped-genome_not-mapped-transcriptome_psl_all_final.fq'),temp_path=temp_flag)
+                    for i,part in enumerate(parts):
+                        job.clean(outdir('log_bowtie_psl_all.txt.')+str(i),temp_path=temp_flag)
 
                     job.sink(job.genegeneunique, outdir('genegeneunique.txt'))
 
@@ -7881,7 +8503,7 @@ if __name__ == "__main__":
 
                 else:
                     # build index
-                    job.add(_BE_+'bowtie-build',kind='program')
+                    index_builder(job, _BE_+'bowtie-build', [outdir('gene-gene_unique.fa')], outdir('gene-gene_index/'))
                     if bowtie121:
                         job.add('--threads',options.processes,kind='parameter')
                     job.add('-f',kind='parameter')
@@ -7921,10 +8543,8 @@ if __name__ == "__main__":
                         job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                     if sort_parallel:
                         job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                    if sort_lzop_compress:
-                        job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                    elif sort_gzip_compress:
-                        job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                    if sort_compress:
+                        job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                     job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #                    job.add('|',kind='parameter')
 #                    job.add('LC_ALL=C',kind='parameter')
@@ -7994,6 +8614,25 @@ if __name__ == "__main__":
                          outdir('reads_gene-gene.fq'),
                          temp_path = temp_flag)
 
+            if options.prefilter_kmer > 0:
+                # remove the reads which do not share any k-mer with the candidate fusion genes
+                job.add(_FC_+'kmer-filter.py',kind='program')
+                job.add('--kmer',options.prefilter_kmer,kind='parameter')
+                job.add('--reference',outdir('gene-gene.fa'),kind='input')
+                job.add('--input',outdir('reads_gene-gene.fq'),kind='input',temp_path = temp_flag)
+                job.add('--output',outdir('reads_gene-gene_kmer.fq'),kind='output')
+                job.add('--log',outdir('log_reads_gene-gene_kmer.txt'),kind='output')
+                job.run()
+
+                job.link(outdir('reads_gene-gene_kmer.fq'), outdir('reads_gene-gene.fq'), kind = 'move')
+
+                info(job,
+                     fromfile = outdir('log_reads_gene-gene_kmer.txt'),
+                     tofile = info_file,
+                     top = "",
+                     bottom = "\n\n\n",
+                     temp_path = temp_flag)
+
             if not options.filter_str:
                 # remove STR reads
                 job.add(_FC_+'remove_str.py',kind='program')
@@ -8080,12 +8719,13 @@ if __name__ == "__main__":
                 job.add('>>',info_file,kind='output')
                 job.run()
 
-                if nucleotides_gg > options.limit_blat:
+                threshold_blat = split_threshold(['blat'],options.limit_blat,'limit_blat')
+                if nucleotides_gg > threshold_blat:
 
                     job.add(_FC_+'split-fasta.py',kind='program')
                     job.add('--size',outdir('gene-gene__nuc.txt'),kind='input')
                     job.add('--seqs',outdir('gene-gene__seq.txt'),kind='input')
-                    job.add('--threshold',options.limit_blat,kind='parameter')
+                    job.add('--threshold',threshold_blat,kind='parameter')
                     job.add('-i',outdir('gene-gene.fa'),kind='input')
                     job.add('-o',outdir('gene-gene_split_blat.fa'),kind='output')
                     job.add('-x',outdir('gene-gene_split_blat.len'),kind='output')
@@ -8286,12 +8926,14 @@ if __name__ == "__main__":
                 job.add('>>',info_file,kind='output')
                 job.run()
 
-                if nucleotides_gg > options.limit_star:
+                nucleotides_reads_gg = count_of(outdir('log_counts_reads_gene-gene_no-str.txt')) * count_of(outdir('log_lengths_reads_gene-gene_no-str.txt'))
+                threshold_star = split_threshold(['STAR-build','STAR'],options.limit_star,'limit_star',nucleotides_reads_gg)
+                if nucleotides_gg > threshold_star:
 
                     job.add(_FC_+'split-fasta.py',kind='program')
                     job.add('--size',outdir('gene-gene__nuc.txt'),kind='input')
                     job.add('--seqs',outdir('gene-gene__seq.txt'),kind='input')
-                    job.add('--threshold',options.limit_star,kind='parameter')
+                    job.add('--threshold',threshold_star,kind='parameter')
                     job.add('-i',outdir('gene-gene.fa'),kind='input')
                     job.add('-o',outdir('gene-gene_split_star.fa'),kind='output')
                     job.add('-x',outdir('gene-gene_split_star.len'),kind='output')
@@ -8329,7 +8971,7 @@ if __name__ == "__main__":
                         # build the STAR index
                         gd = "%s_star/" % (part,)
                         gdr = "%s_star-results/" % (part,)
-                        job.add(_SR_+'STAR',kind='program')
+                        index_builder(job, _SR_+'STAR', [part], gd)
                         job.add('--genomeChrBinNbits',genomechrbinnbits,kind='parameter')
                         job.add('--genomeSAindexNbases',genomesaindexnbases,kind='parameter')
                         job.add('--runMode','genomeGenerate',kind='parameter')
@@ -8404,10 +9046,8 @@ if __name__ == "__main__":
                             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                         if sort_parallel:
                             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                        if sort_lzop_compress:
-                            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                        elif sort_gzip_compress:
-                            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                        if sort_compress:
+                            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                         job.add('-T',tmp_dir,kind='parameter',checksum='no')
                         job.add('>',outdir('gene-gene-star.psl.')+str(i),kind='output')
                         job.run()
@@ -8439,10 +9079,8 @@ if __name__ == "__main__":
                                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                                 if sort_parallel:
                                     job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                                if sort_lzop_compress:
-                                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                                elif sort_gzip_compress:
-                                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                                if sort_compress:
+                                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
                                 job.add('',outdir('reads-ids_clip_psl_star.txt.')+str(i),kind='input',temp_path=temp_flag)
 #                                job.add('|',kind='parameter')
@@ -8465,10 +9103,8 @@ if __name__ == "__main__":
                                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                                 if sort_parallel:
                                     job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                                if sort_lzop_compress:
-                                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                                elif sort_gzip_compress:
-                                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                                if sort_compress:
+                                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #                                job.add('|',kind='parameter')
 #                                job.add('LC_ALL=C',kind='parameter')
@@ -8502,10 +9138,8 @@ if __name__ == "__main__":
                                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                                 if sort_parallel:
                                     job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                                if sort_lzop_compress:
-                                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                                elif sort_gzip_compress:
-                                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                                if sort_compress:
+                                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
                                 job.add('',outdir('reads-refs_clip_psl_star.txt.')+str(i),kind='input',temp_path=temp_flag)
 #                                job.add('|',kind='parameter')
@@ -8555,7 +9189,7 @@ if __name__ == "__main__":
                                 job.run()
 
                                 gdbu = "%s_bowtie_star_unique/" % (part,)
-                                job.add(_BE_+'bowtie-build',kind='program')
+                                index_builder(job, _BE_+'bowtie-build', [gdau], gdbu)
                                 if bowtie121:
                                     job.add('--threads',options.processes,kind='parameter')
                                 job.add('-f',kind='parameter')
@@ -8610,10 +9244,8 @@ if __name__ == "__main__":
                                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                                 if sort_parallel:
                                     job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                                if sort_lzop_compress:
-                                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                                elif sort_gzip_compress:
-                                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                                if sort_compress:
+                                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
                                 job.add('|',kind='parameter')
                                 if eporcrlf2igh == False:
@@ -8633,10 +9265,8 @@ if __name__ == "__main__":
                                         job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                                     if sort_parallel:
                                         job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                                    if sort_lzop_compress:
-                                        job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                                    elif sort_gzip_compress:
-                                        job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                                    if sort_compress:
+                                        job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                                     job.add('-T',tmp_dir,kind='parameter',checksum='no')
                                 job.add('>',outdir('reads_filtered_unique_cuts_star.txt.')+str(i),kind='output')
                                 job.run()
@@ -8742,7 +9372,7 @@ if __name__ == "__main__":
                                 job.run()
 
                                 gdb = "%s_bowtie_star/" % (part,)
-                                job.add(_BE_+'bowtie-build',kind='program')
+                                index_builder(job, _BE_+'bowtie-build', [gda], gdb)
                                 if bowtie121:
                                     job.add('--threads',options.processes,kind='parameter')
                                 job.add('-f',kind='parameter')
@@ -8797,7 +9427,8 @@ if __name__ == "__main__":
 
                                 job.add(_FC_+'merge-sam.py',kind='program')
                                 job.add('--input',outdir('split_gene-gene_star.sam.')+str(i),kind='input',temp_path=temp_flag)
-                                job.add('--output',outdir('split_gene-gene_star_patch.sam.')+str(i),kind='output')
+                                job.add('--output','-',kind='parameter')
+                                zout(job,outdir('split_gene-gene_star_patch.sam.')+str(i),zip_program)
                                 job.run()
 
                                 job.add(_FC_+'sam2psl.py',kind='program')
@@ -8816,12 +9447,10 @@ if __name__ == "__main__":
                                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                                 if sort_parallel:
                                     job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                                if sort_lzop_compress:
-                                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                                elif sort_gzip_compress:
-                                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                                if sort_compress:
+                                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
-                                job.add('>',outdir('split_gene-gene_star_patch.psl.')+str(i),kind='output')
+                                job.add('>',outdir('split_gene-gene_star_patch.psl.')+str(i),kind='output',stream='yes')
                                 job.run()
                         
                                 job.add(_FC_+'analyze_splits_sam.py',kind='program')
@@ -8859,10 +9488,8 @@ if __name__ == "__main__":
                                         job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                                     if sort_parallel:
                                         job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                                    if sort_lzop_compress:
-                                        job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                                    elif sort_gzip_compress:
-                                        job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                                    if sort_compress:
+                                        job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                                     job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #                                    job.add('|',kind='parameter')
 #                                    job.add('LC_ALL=C',kind='parameter')
@@ -8979,7 +9606,7 @@ if __name__ == "__main__":
                                         genomechrbinnbits2 = int(min(18, math.log(float(nucleotides2_gg)/float(sequences2_gg),2)))
 
                                         # build the STAR index
-                                        job.add(_SR_+'STAR',kind='program')
+                                        index_builder(job, _SR_+'STAR', [gda], outdir('gene-gene-bowtie_star2.'+str(i)+'/'))
                                         job.add('--genomeChrBinNbits',genomechrbinnbits2,kind='parameter')
                                         job.add('--genomeSAindexNbases',genomesaindexnbases2,kind='parameter')
                                         job.add('--runMode','genomeGenerate',kind='parameter')
@@ -9022,7 +9649,8 @@ if __name__ == "__main__":
 
                                     job.add(_FC_+'merge-sam.py',kind='program')
                                     job.add('--input',outdir('split_gene-gene_star_unmapped.sam.')+str(i),kind='input',temp_path=temp_flag)
-                                    job.add('--output',outdir('split_gene-gene_star_unmapped_patch.sam.')+str(i),kind='output')
+                                    job.add('--output','-',kind='parameter')
+                                    zout(job,outdir('split_gene-gene_star_unmapped_patch.sam.')+str(i),zip_program)
                                     #job.add('--mismatches-long',options.mismatches+1,kind='parameter')
                                     job.add('--mismatches-long',options.mismatches_gap,kind='parameter')
                                     job.add('--mismatches-short',options.mismatches,kind='parameter')
@@ -9051,12 +9679,10 @@ if __name__ == "__main__":
                                         job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                                     if sort_parallel:
                                         job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                                    if sort_lzop_compress:
-                                        job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                                    elif sort_gzip_compress:
-                                        job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                                    if sort_compress:
+                                        job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                                     job.add('-T',tmp_dir,kind='parameter',checksum='no')
-                                    job.add('>',outdir('split_gene-gene_star_unmapped_patch.psl.')+str(i),kind='output')
+                                    job.add('>',outdir('split_gene-gene_star_unmapped_patch.psl.')+str(i),kind='output',stream='yes')
                                     job.run()
 
                                     job.add(_FC_+'analyze_splits_sam.py',kind='program')
@@ -9109,7 +9735,7 @@ if __name__ == "__main__":
                     
                 else:
                     # build the STAR index
-                    job.add(_SR_+'STAR',kind='program')
+                    index_builder(job, _SR_+'STAR', [outdir('gene-gene.fa')], outdir('gene-gene-star/'))
                     job.add('--genomeChrBinNbits',genomechrbinnbits,kind='parameter')
                     job.add('--genomeSAindexNbases',genomesaindexnbases,kind='parameter')
                     job.add('--runMode','genomeGenerate',kind='parameter')
@@ -9212,10 +9838,8 @@ if __name__ == "__main__":
                         job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                     if sort_parallel:
                         job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                    if sort_lzop_compress:
-                        job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                    elif sort_gzip_compress:
-                        job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                    if sort_compress:
+                        job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                     job.add('-T',tmp_dir,kind='parameter',checksum='no')
                     job.add('>',outdir('gene-gene-star.psl'),kind='output')
                     job.run()
@@ -9271,10 +9895,8 @@ if __name__ == "__main__":
                                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                             if sort_parallel:
                                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                            if sort_lzop_compress:
-                                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                            elif sort_gzip_compress:
-                                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            if sort_compress:
+                                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                             job.add('-T',tmp_dir,kind='parameter',checksum='no')
                             job.add('',outdir('reads-ids_clip_psl_star.txt'),kind='input',temp_path=temp_flag)
 #                            job.add('|',kind='parameter')
@@ -9297,10 +9919,8 @@ if __name__ == "__main__":
                                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                             if sort_parallel:
                                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                            if sort_lzop_compress:
-                                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                            elif sort_gzip_compress:
-                                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            if sort_compress:
+                                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                             job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #                            job.add('|',kind='parameter')
 #                            job.add('LC_ALL=C',kind='parameter')
@@ -9335,10 +9955,8 @@ if __name__ == "__main__":
                                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                             if sort_parallel:
                                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                            if sort_lzop_compress:
-                                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                            elif sort_gzip_compress:
-                                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            if sort_compress:
+                                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                             job.add('-T',tmp_dir,kind='parameter',checksum='no')
                             job.add('',outdir('reads-refs_clip_psl_star.txt'),kind='input',temp_path=temp_flag)
 #                            job.add('|',kind='parameter')
@@ -9380,7 +9998,7 @@ if __name__ == "__main__":
                             job.add('>',outdir('gene-gene-bowtie_star_unique.fa'),kind='output')
                             job.run()
 
-                            job.add(_BE_+'bowtie-build',kind='program')
+                            index_builder(job, _BE_+'bowtie-build', [outdir('gene-gene-bowtie_star_unique.fa')], outdir('gene-gene-bowtie_star_unique/'))
                             if bowtie121:
                                 job.add('--threads',options.processes,kind='parameter')
                             job.add('-f',kind='parameter')
@@ -9434,10 +10052,8 @@ if __name__ == "__main__":
                                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                             if sort_parallel:
                                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                            if sort_lzop_compress:
-                                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                            elif sort_gzip_compress:
-                                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            if sort_compress:
+                                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                             job.add('-T',tmp_dir,kind='parameter',checksum='no')
                             job.add('|',kind='parameter')
                             if eporcrlf2igh == False:
@@ -9457,10 +10073,8 @@ if __name__ == "__main__":
                                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                                 if sort_parallel:
                                     job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                                if sort_lzop_compress:
-                                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                                elif sort_gzip_compress:
-                                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                                if sort_compress:
+                                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
                             job.add('>',outdir('reads_filtered_unique_cuts_star.txt'),kind='output')
                             job.run()
@@ -9563,7 +10177,7 @@ if __name__ == "__main__":
                             job.add('>',outdir('gene-gene-bowtie_star.fa'),kind='output')
                             job.run()
 
-                            job.add(_BE_+'bowtie-build',kind='program')
+                            index_builder(job, _BE_+'bowtie-build', [outdir('gene-gene-bowtie_star.fa')], outdir('gene-gene-bowtie_star/'))
                             if bowtie121:
                                 job.add('--threads',options.processes,kind='parameter')
                             job.add('-f',kind='parameter')
@@ -9619,7 +10233,8 @@ if __name__ == "__main__":
                             
                             job.add(_FC_+'merge-sam.py',kind='program')
                             job.add('--input',outdir('split_gene-gene_star.sam'),kind='input',temp_path=temp_flag)
-                            job.add('--output',outdir('split_gene-gene_star_patch.sam'),kind='output')
+                            job.add('--output','-',kind='parameter')
+                            zout(job,outdir('split_gene-gene_star_patch.sam'),zip_program)
                             job.run()
 
                             job.add(_FC_+'sam2psl.py',kind='program')
@@ -9638,12 +10253,10 @@ if __name__ == "__main__":
                                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                             if sort_parallel:
                                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                            if sort_lzop_compress:
-                                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                            elif sort_gzip_compress:
-                                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            if sort_compress:
+                                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                             job.add('-T',tmp_dir,kind='parameter',checksum='no')
-                            job.add('>',outdir('split_gene-gene_star_patch.psl'),kind='output')
+                            job.add('>',outdir('split_gene-gene_star_patch.psl'),kind='output',stream='yes')
                             job.run()
 
                             job.add(_FC_+'analyze_splits_sam.py',kind='program')
@@ -9680,10 +10293,8 @@ if __name__ == "__main__":
                                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                                 if sort_parallel:
                                     job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                                if sort_lzop_compress:
-                                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                                elif sort_gzip_compress:
-                                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                                if sort_compress:
+                                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #                                job.add('|',kind='parameter')
 #                                job.add('LC_ALL=C',kind='parameter')
@@ -9800,7 +10411,7 @@ if __name__ == "__main__":
                                     genomechrbinnbits2 = int(min(18, math.log(float(nucleotides2_gg)/float(sequences2_gg),2)))
 
                                     # build the STAR index
-                                    job.add(_SR_+'STAR',kind='program')
+                                    index_builder(job, _SR_+'STAR', [outdir('gene-gene-bowtie_star.fa')], outdir('gene-gene-bowtie_star2/'))
                                     job.add('--genomeChrBinNbits',genomechrbinnbits2,kind='parameter')
                                     job.add('--genomeSAindexNbases',genomesaindexnbases2,kind='parameter')
                                     job.add('--runMode','genomeGenerate',kind='parameter')
@@ -9850,7 +10461,8 @@ if __name__ == "__main__":
 
                                 job.add(_FC_+'merge-sam.py',kind='program')
                                 job.add('--input',outdir('split_gene-gene_star_unmapped.sam'),kind='input',temp_path=temp_flag)
-                                job.add('--output',outdir('split_gene-gene_star_unmapped_patch.sam'),kind='output')
+                                job.add('--output','-',kind='parameter')
+                                zout(job,outdir('split_gene-gene_star_unmapped_patch.sam'),zip_program)
                                 #job.add('--mismatches-long',options.mismatches+1,kind='parameter')
                                 job.add('--mismatches-long',options.mismatches_gap,kind='parameter')
                                 job.add('--mismatches-short',options.mismatches,kind='parameter')
@@ -9878,12 +10490,10 @@ if __name__ == "__main__":
                                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                                 if sort_parallel:
                                     job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                                if sort_lzop_compress:
-                                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                                elif sort_gzip_compress:
-                                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                                if sort_compress:
+                                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
-                                job.add('>',outdir('split_gene-gene_star_unmapped_patch.psl'),kind='output')
+                                job.add('>',outdir('split_gene-gene_star_unmapped_patch.psl'),kind='output',stream='yes')
                                 job.run()
 
                                 job.add(_FC_+'analyze_splits_sam.py',kind='program')
@@ -10079,12 +10689,13 @@ if __name__ == "__main__":
                 job.add('>>',info_file,kind='output')
                 job.run()
 
-                if nucleotides_gg > options.limit_bowtie2:
+                threshold_bowtie2 = split_threshold(['bowtie2-build','bowtie2'],options.limit_bowtie2,'limit_bowtie2')
+                if nucleotides_gg > threshold_bowtie2:
 
                     job.add(_FC_+'split-fasta.py',kind='program')
                     job.add('--size',outdir('gene-gene__nuc.txt'),kind='input')
                     job.add('--seqs',outdir('gene-gene__seq.txt'),kind='input')
-                    job.add('--threshold',options.limit_bowtie2,kind='parameter')
+                    job.add('--threshold',threshold_bowtie2,kind='parameter')
                     job.add('-i',outdir('gene-gene.fa'),kind='input')
                     job.add('-o',outdir('gene-gene_split_bowtie2.fa'),kind='output')
                     job.add('-x',outdir('gene-gene_split_bowtie2.len'),kind='output')
@@ -10092,12 +10703,15 @@ if __name__ == "__main__":
 
                     parts = [el.strip() for el in file(outdir('gene-gene_split_bowtie2.fa'),'r').readlines()]
                     maxlens = [el.strip() for el in file(outdir('gene-gene_split_bowtie2.len'),'r').readlines()]
+                    # the parts are indexed and aligned concurrently
+                    (threads,gb) = parts_budget(parts,options.processes,['bowtie2-build','bowtie2'])
+                    job.parallel_start()
                     for i,part in enumerate(parts):
 
                         gd = "%s_bowtie2/" % (part,)
                         gdi = "%s_bowtie2/index" % (part,)
                         # build the BOWTIE2 index
-                        job.add(_B2_+'bowtie2-build',kind='program')
+                        index_builder(job, _B2_+'bowtie2-build', [part], gd)
                         job.add('-f',kind='parameter')
                         job.add('--quiet',kind='parameter')
                         job.add('--offrate','1',kind='parameter')
@@ -10105,12 +10719,12 @@ if __name__ == "__main__":
                         job.add('',part,kind='input')
                         job.add('',gdi,kind='output',checksum='no')
                         job.add('',gd,kind='output',command_line='no')
-                        job.run()
+                        job.run(processes=threads,memory=gb)
 
 
                         # align the unmapped reads using BOWTIE2 on candidate fusion gene-gene
                         job.add(_B2_+'bowtie2',kind='program')
-                        job.add('-p',options.processes,kind='parameter',checksum='no')
+                        job.add('-p',threads,kind='parameter',checksum='no')
                         job.add('--phred33',kind='parameter')
                         job.add('--no-unal',kind='parameter')
                         job.add('--local',kind='parameter')
@@ -10124,9 +10738,7 @@ if __name__ == "__main__":
                         job.add('-U',outdir('reads_gene-gene_no-str.fq'),kind='input')
                         job.add('-S',outdir('gene-gene-bowtie2.sam.')+str(i),kind='output')
                         job.add('2>',outdir('log_bowtie2_reads-gene-gene.stdout.txt.')+str(i),kind='output',checksum='no')
-                        job.run()
-
-                        job.clean(outdir('log_bowtie2_reads-gene-gene.stdout.txt.')+str(i),temp_path=temp_flag)
+                        job.run(processes=threads,memory=gb)
 
                         job.add(_FC_+'sam2psl.py',kind='program')
                         job.add('--input',outdir('gene-gene-bowtie2.sam.')+str(i),kind='input',temp_path=temp_flag)
@@ -10142,14 +10754,12 @@ if __name__ == "__main__":
                         if sort_buffer:
                             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                         if sort_parallel:
-                            job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                        if sort_lzop_compress:
-                            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                        elif sort_gzip_compress:
-                            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            job.add('--parallel',threads,kind='parameter',checksum='no')
+                        if sort_compress:
+                            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                         job.add('-T',tmp_dir,kind='parameter',checksum='no')
                         job.add('>',outdir('gene-gene-bowtie2.psl.')+str(i),kind='output')
-                        job.run()
+                        job.run(processes=threads,memory=gb)
 
                         job.add(_FC_+'analyze_splits_sam.py',kind='program')
                         job.add('--input',outdir('gene-gene-bowtie2.psl.')+str(i),kind='input',temp_path=temp_flag)
@@ -10158,6 +10768,11 @@ if __name__ == "__main__":
                         job.add('--clipped-reads-refs',outdir('reads-refs_clip_psl_bowtie2.txt.')+str(i),kind='output')
                         job.add('--clip-min',length_anchor_bowtie2,kind='parameter')
                         job.run()
+                    job.parallel_stop()
+
+                    for i,part in enumerate(parts):
+
+                        job.clean(outdir('log_bowtie2_reads-gene-gene.stdout.txt.')+str(i),temp_path=temp_flag)
 
                         if job.iff(empty(outdir('reads-ids_clip_psl_bowtie2.txt.')+str(i)),id = "#reads-ids-clip-psl-bowtie2."+str(i)+"#"):
                             job.clean(outdir('reads-ids_clip_psl_bowtie2.txt.')+str(i),temp_path=temp_flag)
@@ -10171,10 +10786,8 @@ if __name__ == "__main__":
                                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                             if sort_parallel:
                                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                            if sort_lzop_compress:
-                                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                            elif sort_gzip_compress:
-                                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            if sort_compress:
+                                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                             job.add('-T',tmp_dir,kind='parameter',checksum='no')
                             job.add('',outdir('reads-ids_clip_psl_bowtie2.txt.')+str(i),kind='input',temp_path=temp_flag)
 #                            job.add('|',kind='parameter')
@@ -10197,10 +10810,8 @@ if __name__ == "__main__":
                                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                             if sort_parallel:
                                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                            if sort_lzop_compress:
-                                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                            elif sort_gzip_compress:
-                                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            if sort_compress:
+                                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                             job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #                            job.add('|',kind='parameter')
 #                            job.add('LC_ALL=C',kind='parameter')
@@ -10234,10 +10845,8 @@ if __name__ == "__main__":
                                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                             if sort_parallel:
                                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                            if sort_lzop_compress:
-                                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                            elif sort_gzip_compress:
-                                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            if sort_compress:
+                                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                             job.add('-T',tmp_dir,kind='parameter',checksum='no')
                             job.add('',outdir('reads-refs_clip_psl_bowtie2.txt.')+str(i),kind='input',temp_path=temp_flag)
 #                            job.add('|',kind='parameter')
@@ -10290,7 +10899,7 @@ if __name__ == "__main__":
                             job.run()
 
                             gdbu = "%s_bowtie_bowtie2_unique/" % (part,)
-                            job.add(_BE_+'bowtie-build',kind='program')
+                            index_builder(job, _BE_+'bowtie-build', [gdau], gdbu)
                             if bowtie121:
                                 job.add('--threads',options.processes,kind='parameter')
                             job.add('-f',kind='parameter')
@@ -10345,10 +10954,8 @@ if __name__ == "__main__":
                                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                             if sort_parallel:
                                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                            if sort_lzop_compress:
-                                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                            elif sort_gzip_compress:
-                                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            if sort_compress:
+                                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                             job.add('-T',tmp_dir,kind='parameter',checksum='no')
                             job.add('|',kind='parameter')
                             job.add('awk',kind='parameter')
@@ -10460,7 +11067,7 @@ if __name__ == "__main__":
 
 
                             gdb = "%s_bowtie_bowtie2/" % (part,)
-                            job.add(_BE_+'bowtie-build',kind='program')
+                            index_builder(job, _BE_+'bowtie-build', [gda], gdb)
                             if bowtie121:
                                 job.add('--threads',options.processes,kind='parameter')
                             job.add('-f',kind='parameter')
@@ -10511,7 +11118,8 @@ if __name__ == "__main__":
 
                             job.add(_FC_+'merge-sam.py',kind='program')
                             job.add('--input',outdir('split_gene-gene_bowtie2.sam.')+str(i),kind='input',temp_path=temp_flag)
-                            job.add('--output',outdir('split_gene-gene_bowtie2_patch.sam.')+str(i),kind='output')
+                            job.add('--output','-',kind='parameter')
+                            zout(job,outdir('split_gene-gene_bowtie2_patch.sam.')+str(i),zip_program)
                             job.run()
 
                             job.add(_FC_+'sam2psl.py',kind='program')
@@ -10530,12 +11138,10 @@ if __name__ == "__main__":
                                 job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                             if sort_parallel:
                                 job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                            if sort_lzop_compress:
-                                job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                            elif sort_gzip_compress:
-                                job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                            if sort_compress:
+                                job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                             job.add('-T',tmp_dir,kind='parameter',checksum='no')
-                            job.add('>',outdir('split_gene-gene_bowtie2_patch.psl.')+str(i),kind='output')
+                            job.add('>',outdir('split_gene-gene_bowtie2_patch.psl.')+str(i),kind='output',stream='yes')
                             job.run()
 
                             job.add(_FC_+'analyze_splits_sam.py',kind='program')
@@ -10573,7 +11179,7 @@ if __name__ == "__main__":
                     
                 else:
                     # build the BOWTIE2 index
-                    job.add(_B2_+'bowtie2-build',kind='program')
+                    index_builder(job, _B2_+'bowtie2-build', [outdir('gene-gene.fa')], outdir('gene-gene-bowtie2/'))
                     job.add('-f',kind='parameter')
                     job.add('--quiet',kind='parameter')
                     job.add('--offrate','1',kind='parameter')
@@ -10621,12 +11227,10 @@ if __name__ == "__main__":
                         job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                     if sort_parallel:
                         job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                    if sort_lzop_compress:
-                        job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                    elif sort_gzip_compress:
-                        job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                    if sort_compress:
+                        job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                     job.add('-T',tmp_dir,kind='parameter',checksum='no')
-                    job.add('>',outdir('gene-gene-bowtie2.psl'),kind='output')
+                    job.add('>',outdir('gene-gene-bowtie2.psl'),kind='output',stream='yes')
                     job.run()
 
                     job.add(_FC_+'analyze_splits_sam.py',kind='program')
@@ -10648,10 +11252,8 @@ if __name__ == "__main__":
                             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                         if sort_parallel:
                             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                        if sort_lzop_compress:
-                            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                        elif sort_gzip_compress:
-                            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                        if sort_compress:
+                            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                         job.add('-T',tmp_dir,kind='parameter',checksum='no')
                         job.add('',outdir('reads-ids_clip_psl_bowtie2.txt'),kind='input',temp_path=temp_flag)
 #                        job.add('|',kind='parameter')
@@ -10674,10 +11276,8 @@ if __name__ == "__main__":
                             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                         if sort_parallel:
                             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                        if sort_lzop_compress:
-                            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                        elif sort_gzip_compress:
-                            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                        if sort_compress:
+                            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                         job.add('-T',tmp_dir,kind='parameter',checksum='no')
 #                        job.add('|',kind='parameter')
 #                        job.add('LC_ALL=C',kind='parameter')
@@ -10711,10 +11311,8 @@ if __name__ == "__main__":
                             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                         if sort_parallel:
                             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                        if sort_lzop_compress:
-                            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                        elif sort_gzip_compress:
-                            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                        if sort_compress:
+                            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                         job.add('-T',tmp_dir,kind='parameter',checksum='no')
                         job.add('',outdir('reads-refs_clip_psl_bowtie2.txt'),kind='input',temp_path=temp_flag)
 #                        job.add('|',kind='parameter')
@@ -10759,7 +11357,7 @@ if __name__ == "__main__":
                         job.add('>',outdir('gene-gene-bowtie_bowtie2_unique.fa'),kind='output')
                         job.run()
 
-                        job.add(_BE_+'bowtie-build',kind='program')
+                        index_builder(job, _BE_+'bowtie-build', [outdir('gene-gene-bowtie_bowtie2_unique.fa')], outdir('gene-gene-bowtie_bowtie2_unique/'))
                         if bowtie121:
                             job.add('--threads',options.processes,kind='parameter')
                         job.add('-f',kind='parameter')
@@ -10813,10 +11411,8 @@ if __name__ == "__main__":
                             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                         if sort_parallel:
                             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                        if sort_lzop_compress:
-                            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                        elif sort_gzip_compress:
-                            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                        if sort_compress:
+                            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                         job.add('-T',tmp_dir,kind='parameter',checksum='no')
                         job.add('|',kind='parameter')
                         job.add('awk',kind='parameter')
@@ -10924,7 +11520,7 @@ if __name__ == "__main__":
                         job.add('>',outdir('gene-gene-bowtie_bowtie2.fa'),kind='output')
                         job.run()
 
-                        job.add(_BE_+'bowtie-build',kind='program')
+                        index_builder(job, _BE_+'bowtie-build', [outdir('gene-gene-bowtie_bowtie2.fa')], outdir('gene-gene-bowtie_bowtie2/'))
                         if bowtie121:
                             job.add('--threads',options.processes,kind='parameter')
                         job.add('-f',kind='parameter')
@@ -10973,7 +11569,8 @@ if __name__ == "__main__":
 
                         job.add(_FC_+'merge-sam.py',kind='program')
                         job.add('--input',outdir('split_gene-gene_bowtie2.sam'),kind='input',temp_path=temp_flag)
-                        job.add('--output',outdir('split_gene-gene_bowtie2_patch.sam'),kind='output')
+                        job.add('--output','-',kind='parameter')
+                        zout(job,outdir('split_gene-gene_bowtie2_patch.sam'),zip_program)
                         job.run()
 
                         job.add(_FC_+'sam2psl.py',kind='program')
@@ -10992,12 +11589,10 @@ if __name__ == "__main__":
                             job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                         if sort_parallel:
                             job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                        if sort_lzop_compress:
-                            job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                        elif sort_gzip_compress:
-                            job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                        if sort_compress:
+                            job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                         job.add('-T',tmp_dir,kind='parameter',checksum='no')
-                        job.add('>',outdir('split_gene-gene_bowtie2_patch.psl'),kind='output')
+                        job.add('>',outdir('split_gene-gene_bowtie2_patch.psl'),kind='output',stream='yes')
                         job.run()
 
                         job.add(_FC_+'analyze_splits_sam.py',kind='program')
@@ -11189,10 +11784,8 @@ if __name__ == "__main__":
                     job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                 if sort_parallel:
                     job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                if sort_lzop_compress:
-                    job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                elif sort_gzip_compress:
-                    job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                if sort_compress:
+                    job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                 job.add('-T',tmp_dir,kind='parameter',checksum='no')
                 job.add('|',kind='parameter')
                 job.add('LC_ALL=C',kind='parameter')
@@ -11403,7 +11996,7 @@ if __name__ == "__main__":
 
                         bd = outdir("focus_star.%d/" % (i,))
                         bdr = outdir("focus_star_results.%d/" % (i,))
-                        job.add(_SR_+'STAR',kind='program')
+                        index_builder(job, _SR_+'STAR', [outdir('genegene.fa.'+str(i))], bd)
                         job.add('--genomeChrBinNbits',f_genomechrbinnbits,kind='parameter')
                         job.add('--genomeSAindexNbases',f_genomesaindexnbases,kind='parameter')
                         job.add('--runMode','genomeGenerate',kind='parameter')
@@ -11469,7 +12062,7 @@ if __name__ == "__main__":
                         bd = outdir("focus_bowtie2.%d/" % (i,))
                         bdi = outdir("focus_bowtie2.%d/index" % (i,))
                         # build the BOWTIE2 index
-                        job.add(_B2_+'bowtie2-build',kind='program')
+                        index_builder(job, _B2_+'bowtie2-build', [outdir('genegene.fa.'+str(i))], bd)
                         job.add('-f',kind='parameter')
                         job.add('--quiet',kind='parameter')
                         job.add('--offrate','1',kind='parameter')
@@ -11523,10 +12116,8 @@ if __name__ == "__main__":
                         job.add('--buffer-size',sort_buffer,kind='parameter',checksum='no')
                     if sort_parallel:
                         job.add('--parallel',options.processes,kind='parameter',checksum='no')
-                    if sort_lzop_compress:
-                        job.add('--compress-program','lzop',kind='parameter',checksum='no')
-                    elif sort_gzip_compress:
-                        job.add('--compress-program','gzip',kind='parameter',checksum='no')
+                    if sort_compress:
+                        job.add('--compress-program',sort_compress,kind='parameter',checksum='no')
                     job.add('-T',tmp_dir,kind='parameter',checksum='no')
                     job.add('>',outdir('focus.psl.'+str(i)),kind='output',dest_list='genegenespotlight')
                     job.run()
@@ -11677,9 +12268,6 @@ if __name__ == "__main__":
             job.add('--input',outdir('final-list_candidate-fusion-genes.txt'),kind='input')
             job.add('--chain',datadir('hg38ToHg19.over.chain.gz'),kind='input')
             job.add('--output',outdir('final-list_candidate-fusion-genes.hg19.txt'),kind='output')
-            if _LR_:
-                job.add('--path-liftover',_LR_,kind='parameter',checksum='no')
-            job.add('--tmp_dir',tmp_dir,kind='parameter',checksum='no')
             job.run()
 
 
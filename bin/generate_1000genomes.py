@@ -1,8 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """
-It generates the list of candidate fusion genes. This list is hard coded
-in here and it is manually curated from:
+It generates the list of candidate fusion genes. This list is read from
+the dataset 'labels.txt.gz' (see 'labels.py') and it is manually curated from:
 
 
 Greger et al. Tandem RNA Chimeras Contribute to Transcriptome Diversity in 
@@ -48,7 +48,7 @@ This file is not running/executing/using BLAT.
 import sys
 import os
 import optparse
-import symbols
+import labels
 
 if __name__ == '__main__':
 
@@ -94,187 +94,13 @@ if __name__ == '__main__':
     #
 
     print "Generating the list of 1000 genomes fusion genes..."
-    fusions = dict()
-
-    # manual curation from papers
-
-    fusions['rattus_norvegicus'] = []
-
-    fusions['mus_musculus'] = []
-
-    fusions['canis_familiaris'] = []
-
-    fusions['homo_sapiens'] = [
-        ['ACTB','POTEE'],
-        ['ACTB','POTEM'],
-        ['AIG1','PARL'],
-        ['AP5S1','MAVS'],
-        ['ARHGAP19','SLIT1'],
-        ['ARL4A','MTHFD1L'],
-        ['BPTF','LRRC37A3'],
-        ['C11ORF48','INTS5'],
-        ['C1ORF189','TOX'],
-        ['C2ORF27A','NBEA'],
-        ['C6ORF72','PPIL4'],
-        ['C7ORF55','LUC7L2'],
-        ['CCL22','CX3CL1'],
-        ['CENPE','BDH2'],
-        ['CHURC1','FNTB'],
-        ['CLN6','CALML4'],
-        ['CNPY2','CS'],
-        ['COPE','CERS1'],
-        ['COPE','LASS1'],
-        ['CORO7','PAM16'],
-        ['COX5A','EDC3'],
-        ['CTBS','GNG5'],
-        ['CTSC','RAB38'],
-        ['DDX5','POLG2'],
-        ['EDARADD','ENO1'],
-        ['EEF1A1','XPOT'],
-        ['ELAVL1','TIMM44'],
-        ['ENTPD1','CC2D2B'],
-        ['FAM18B2','CDRT4'],
-        ['FARSB','TRIM61'],
-        ['FKBP1A','SDCBP2'],
-        ['GNG5','CTBS'],
-        ['GPI','PDCD2L'],
-        ['HACL1','COLQ'],
-        ['HAUS4','PRMT5'],
-        ['HILPDA','EFCAB3'],
-        ['HMSD','SERPINB8'],
-        ['HSPE1','MOBKL3'],
-        ['IFNAR2','IL10RB'],
-        ['IFRD1','C7ORF53'],
-        ['ISY1','RAB43'],
-        ['JAK3','INSL3'],
-        ['KIAA0101','CSNK1G1'],
-        ['KIAA0494','ATPAF1'],
-        ['LMAN2','MXD3'],
-        ['LRRC33','PIGX'],
-        ['LSP1','TNNT3'],
-        ['MAPKAPK5','ACAD10'],
-        ['MED8','ELOVL1'],
-        ['METTL10','FAM53B'],
-        ['METTL21B','TSFM'],
-        ['NAIP','OCLN'],
-        ['NDUFA13','YJEFN3'],
-        ['NDUFB8','SEC31B'],
-        ['NHP2L1','LLPH'],
-        ['NRXN1','EIF2AK2'],
-        ['NSUN4','FAAH'],
-        ['PEX26','TUBA8'],
-        ['PFKFB4','SHISA5'],
-        ['PKHD1L1','EBAG9'],
-        ['PLEKHO2','ANKDD1A'],
-        ['POLA2','CDC42EP2'],
-        ['POLR1A','REEP1'],
-        ['PPIP5K1','CATSPER2'],
-        ['PPRC1','NOLC1'],
-        ['PRH1','PRR4'],
-        ['PRIM1','NACA'],
-        ['PRKAA1','TTC33'],
-        ['PRKCB','YBX1'],
-        ['PRR11','C17ORF71'],
-        ['PRR13','PCBP2'],
-        ['PXMP2','PGAM5'],
-        ['RBM14','RBM4'],
-        ['RHOQ','LRR1'],
-        ['RNASET2','RPS6KA2'],
-        ['RRM2','C2ORF48'],
-        ['S1PR2','DNMT1'],
-        ['SAV1','GYPE'],
-        ['SDHAF2','C11ORF66'],
-        ['SDHD','TEX12'],
-        ['SLC35A3','HIAT1'],
-        ['SLC39A1','CRTC2'],
-        ['SLC43A3','PRG2'],
-        ['SMC4','BCL6'],
-        ['SMG1','ARL6IP1'],
-        ['SNTB2','VPS4A'],
-        ['SP100','HMGB1'],
-        ['SUMO2','HN1'],
-        ['SYNJ2BP','COX16'],
-        ['TAGLN2','CCDC19'],
-        ['TAP2','HLA-DOB'],
-        ['TFG','GPR128'],
-        ['TMBIM4','LLPH'],
-        ['TNFAIP8L2','SCNM1'],
-        ['TOMM5','FBXO10'],
-        ['TOPORS','DDX58'],
-        ['TPD52L2','DNAJC5'],
-        ['TRIP12','SLC16A14'],
-        ['TSC22D4','C7ORF61'],
-        ['TSTD1','F11R'],
-        ['TYK2','CDC37'],
-        ['UBA2','WTIP'],
-        ['UBE2J1','GABRR2'],
-        ['UBE2J2','FAM132A'],
-        ['UCHL3','LMO7'],
-        ['UQCRQ','LEAP2'],
-        ['VBP1','BRCC3'],
-        ['VKORC1','PRSS53'],
-        ['YARS2','NAP1L1'],
-        ['ZNF175','CTU1'],
-        ['ZNF343','SNRPB'],
-        ['ZNF562','RBAK']
-
-]
-
-
-
-    data = fusions.get(options.organism.lower(),[])
-    if data:
-
-        #file_symbols = os.path.join(options.output_directory,'genes_symbols.txt')
-        file_symbols = os.path.join(options.output_directory,'synonyms.txt')
-        loci = symbols.generate_loci(file_symbols)
-
-        genes = symbols.read_genes_symbols(file_symbols)
-
-        d = []
-        for (g1,g2) in data:
-            if g1.upper() != g2.upper():
-                ens1 = symbols.ensembl(g1.upper(),genes,loci)
-                ens2 = symbols.ensembl(g2.upper(),genes,loci)
-                if ens1 and ens2:
-                    for e1 in ens1:
-                        for e2 in ens2:
-                            if e1 != e2:
-                                d.append([e1,e2])
-
-        data = ['\t'.join(sorted(line)) + '\n' for line in d]
-        data = list(set(data))
-
-        print "%d known fusion genes found in manually currated database" % (len(data),)
-
-        if not options.skip_filter_overlap:
-            d1 = []
-            overlappings = ['ensembl_fully_overlapping_genes.txt',
-                            'ensembl_same_strand_overlapping_genes.txt',
-#                            'refseq_fully_overlapping_genes.txt',
-#                            'refseq_same_strand_overlapping_genes.txt',
-#                            'ucsc_fully_overlapping_genes.txt',
-#                            'ucsc_same_strand_overlapping_genes.txt',
-#                            'pairs_pseudogenes.txt',
-#                            'paralogs.txt'
-                            ]
-            for ov in overlappings:
-                p = os.path.join(options.output_directory,ov)
-                print "Parsing file:",p
-                if os.path.isfile(p):
-                    d2 = sorted(set([tuple(sorted(line.rstrip('\r\n').split('\t'))) for line in file(p,'r').readlines() if line.rstrip('\r\n')]))
-                d1.extend(d2)
-            d = set()
-            for line in d1:
-                (a,b) = (line[0],line[1])
-                if a > b:
-                    (a,b) = (b,a)
-                d.add("%s\t%s\n" % (a,b))
-            skipped = [line for line in data if line in d]
-            data = [line for line in data if not line in d]
-            file(os.path.join(options.output_directory,'1000genomes_known_but_overlapping.txt'),'w').writelines(sorted(skipped))
-
-            print "%d known fusion genes left after removing the overlappings" % (len(data),)
-
-    file(os.path.join(options.output_directory,'1000genomes.txt'),'w').writelines(sorted(data))
+    labels.generate(label = '1000genomes',
+                    organism = options.organism,
+                    output_directory = options.output_directory,
+                    output_filename = '1000genomes.txt',
+                    skip_filter_overlap = options.skip_filter_overlap,
+                    overlappings = ['ensembl_fully_overlapping_genes.txt',
+                                    'ensembl_same_strand_overlapping_genes.txt'],
+                    skipped_filename = '1000genomes_known_but_overlapping.txt',
+                    description = 'manually currated database')
     #
@@ -1,8 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 """
-It generates the list of allowed candidate fusion genes. This list is hard coded
-inhere and it is manually curated from publications.
+It generates the list of allowed candidate fusion genes. This list is read from
+the dataset 'labels.txt.gz' (see 'labels.py') and it is manually curated from publications.
 
 
 
@@ -44,6 +44,7 @@ import sys
 import os
 import optparse
 import symbols
+import labels
 
 if __name__ == '__main__':
 
@@ -89,6976 +90,16 @@ if __name__ == '__main__':
     #
 
     print "Generating the list of allowed/known fusion genes..."
-    fusions = dict()
-
-    # manual curation from papers
-
-    fusions['rattus_norvegicus'] = []
-
-    fusions['mus_musculus'] = []
-
-    fusions['canis_familiaris'] = []
-
-    fusions['homo_sapiens'] = [
-        ['A1BG-AS1','APOA2'],
-        ['A2M','NOL10'],
-        ['AADACL2','ENSA'],
-        ['AADAT','TPT1'],
-        ['AAK1','ARNT2'],
-        ['AAK1','C2ORF42'],
-        ['AAK1','RPL36A'],
-        ['AAK1','TEX261'],
-        ['AAK1','WFDC10B'],
-        ['AAK1','WFDC13'],
-        ['AAMDC','SLC12A7'],
-        ['AARSD1','MAP2K6'],
-        ['AASDH','LRRC66'],
-        ['AASDH','PPAT'],
-        ['AATF','TADA2A'],
-        ['AATF','ZMYND11'],
-        ['ABAT','NAT10'],
-        ['ABCA2','FYTTD1'],
-        ['ABCA4','BCAR3'],
-        ['ABCA5','PPP4R1L'],
-        ['ABCA5','UNK'],
-        ['ABCA9','MED13'],
-        ['ABCB11','LRP2'],
-        ['ABCB9','ZDHHC7'],
-        ['ABCC1','C16ORF45'],
-        ['ABCC1','MPV17L'],
-        ['ABCC8','VCL'],
-        ['ABCD3','C1ORF123'],
-        ['ABCF1','PLVAP'],
-        ['ABCG1','SLC37A1'],
-        ['ABHD11','BAZ1B'],
-        ['ABHD12','ZNF337'],
-        ['ABHD12B','RCC1'],
-        ['ABHD15','TAOK1'],
-        ['ABHD3','ESCO1'],
-        ['ABHD3','ROCK1'],
-        ['ABI1','BMI1'],
-        ['ABI1','KMT2A'],
-        ['ABI1','MLL'],
-        ['ABI1','PDSS1'],
-        ['ABI2','KMT2A'],
-        ['ABI2','MLL'],
-        ['ABL','BCR'],
-        ['ABL1','ADAMTSL2'],
-        ['ABL1','ANXA4'],
-        ['ABL1','ARNT'],
-        ['ABL1','BCR'],
-        ['ABL1','CBFB'],
-        ['ABL1','CDX2'],
-        ['ABL1','CENPC'],
-        ['ABL1','CENPC1'],
-        ['ABL1','CHIC2'],
-        ['ABL1','DEK'],
-        ['ABL1','EML1'],
-        ['ABL1','ETV6'],
-        ['ABL1','EVI1'],
-        ['ABL1','EXOSC2'],
-        ['ABL1','FACL6'],
-        ['ABL1','FGFR1'],
-        ['ABL1','FGFR3'],
-        ['ABL1','FOXP1'],
-        ['ABL1','HLXB9'],
-        ['ABL1','INPP5D'],
-        ['ABL1','JAK2'],
-        ['ABL1','LSM14A'],
-        ['ABL1','MDS2'],
-        ['ABL1','MN1'],
-        ['ABL1','NUP153'],
-        ['ABL1','NUP214'],
-        ['ABL1','PAX5'],
-        ['ABL1','PER1'],
-        ['ABL1','PRDM12'],
-        ['ABL1','RANBP2'],
-        ['ABL1','RCSD1'],
-        ['ABL1','RNF213'],
-        ['ABL1','SEPT9'],
-        ['ABL1','SFPQ'],
-        ['ABL1','SNX2'],
-        ['ABL1','STL'],
-        ['ABL1','SYK'],
-        ['ABL1','TEL'],
-        ['ABL1','TTL'],
-        ['ABL1','ZMIZ1'],
-        ['ABL2','ETV6'],
-        ['ABL2','KMT2A'],
-        ['ABL2','PAG1'],
-        ['ABL2','RCSD1'],
-        ['ABL2','ZC3HAV1'],
-        ['ABLIM2','DIP2C'],
-        ['ABR','CLUH'],
-        ['ABR','FAM76A'],
-        ['ABR','GAS7'],
-        ['ABR','KCNK1'],
-        ['ABR','STAP2'],
-        ['ABR','YWHAE'],
-        ['ABRACL','MAP3K5'],
-        ['AC005262.1','AES'],
-        ['AC006372.2','KMT2C'],
-        ['AC007283.2','RPL38'],
-        ['AC008746.3','EPOR'],
-        ['AC011523.1','KDM4A'],
-        ['AC011523.1','KDM4B'],
-        ['AC011997.1','PLCB1'],
-        ['AC012314.2','TRPC5'],
-        ['AC016582.1','TP53'],
-        ['AC027612.3','MRPS6'],
-        ['AC079780.1','THADA'],
-        ['AC090627.1','THRA'],
-        ['AC099850.1','TMEM49'],
-        ['AC099850.1','VMP1'],
-        ['AC126544.2','EPOR'],
-        ['AC138031.1','ADRB2'],
-        ['ACACA','C20ORF72'],
-        ['ACACA','DDX52'],
-        ['ACACA','ERBB2'],
-        ['ACACA','HTRA4'],
-        ['ACACA','MLL'],
-        ['ACACA','MSI2'],
-        ['ACACA','STAC2'],
-        ['ACACA','UTP18'],
-        ['ACAD10','MAPKAPK5'],
-        ['ACAD11','CPNE4'],
-        ['ACAD9','C3ORF46'],
-        ['ACADSB','FGFR2'],
-        ['ACADVL','FXR2'],
-        ['ACBD3','ESRRG'],
-        ['ACBD6','IGF1R'],
-        ['ACBD6','RRP15'],
-        ['ACCN1','NF1'],
-        ['ACCS','EXT2'],
-        ['ACCS','KAT6A'],
-        ['ACE','KPNB1'],
-        ['ACE2','PIR'],
-        ['ACER1','MLL'],
-        ['ACER3','PAK1'],
-        ['ACER3','TAOK1'],
-        ['ACIN1','NUTM1'],
-        ['ACLY','NTN1'],
-        ['ACO1','GNRHR2P1'],
-        ['ACO2','ARHGEF17'],
-        ['ACOT11','BLK'],
-        ['ACOT2','RXFP1'],
-        ['ACOT7','RERE'],
-        ['ACOT9','SCHIP1'],
-        ['ACPL2','RASA2'],
-        ['ACPP','AXL'],
-        ['ACPP','CD200'],
-        ['ACPP','FGFR1'],
-        ['ACPP','PIK3CB'],
-        ['ACPP','SKIL'],
-        ['ACRBP','ENO2'],
-        ['ACS2','ETV6'],
-        ['ACSF2','MED1'],
-        ['ACSL3','C15ORF21'],
-        ['ACSL3','COL4A3'],
-        ['ACSL3','ETV1'],
-        ['ACSL3','MOGAT1'],
-        ['ACSL4','DCAF6'],
-        ['ACSL5','GUCY2GP'],
-        ['ACSL6','ETV6'],
-        ['ACSM1','IKBKE'],
-        ['ACSM3','EEF2K'],
-        ['ACSS1','C20ORF3'],
-        ['ACSS1','RARA'],
-        ['ACSS3','PITPNM2'],
-        ['ACTA1','CARD11'],
-        ['ACTB','COL1A1'],
-        ['ACTB','GLI1'],
-        ['ACTB','MAP7D1'],
-        ['ACTB','OXSR1'],
-        ['ACTG1','MITF'],
-        ['ACTG1','PDLIM5'],
-        ['ACTN2','TBCE'],
-        ['ACTN4','AKT2'],
-        ['ACTN4','C19ORF10'],
-        ['ACTN4','EIF3K'],
-        ['ACTN4','KMT2A'],
-        ['ACTN4','MLL'],
-        ['ACTR10','ARID4A'],
-        ['ACTR1B','ERVW-1'],
-        ['ACTR3','RPS15'],
-        ['ACTR3B','DPP6'],
-        ['ACTR3B','MLL3'],
-        ['ACTR8','IL17RB'],
-        ['ACVR1','NFATC1'],
-        ['ACVR1B','BAZ2A'],
-        ['ACVR1B','PGC'],
-        ['ACVR1C','CHN1'],
-        ['ACVR2A','AKT3'],
-        ['ACVR2A','CASP8'],
-        ['ACVR2A','IGF2R'],
-        ['ACVR2A','SUMO1'],
-        ['ADAM10','NUP37'],
-        ['ADAM12','AFF1'],
-        ['ADAM17','SLC23A3'],
-        ['ADAM17','YWHAQ'],
-        ['ADAM18','FGFR1'],
-        ['ADAM28','BCR'],
-        ['ADAM29','RBMY1J'],
-        ['ADAM9','ANK1'],
-        ['ADAM9','PLEKHA2'],
-        ['ADAM9','TM2D2'],
-        ['ADAMTS12','PXDNL'],
-        ['ADAMTS12','TRIO'],
-        ['ADAMTS14','SNHG11'],
-        ['ADAMTS17','ADAMTSL3'],
-        ['ADAMTS17','LRRK1'],
-        ['ADAMTS17','PML'],
-        ['ADAMTS19','RUNX1'],
-        ['ADAMTS19','SLC27A6'],
-        ['ADAMTSL1','DENND4C'],
-        ['ADAMTSL3','MAP2K5'],
-        ['ADAP1','SUN1'],
-        ['ADAP2','TTC28-AS1'],
-        ['ADAR','TPM3'],
-        ['ADARB1','PCBP3'],
-        ['ADAT3','SPRY4'],
-        ['ADC','SASS6'],
-        ['ADCK1','KCNQ2'],
-        ['ADCK1','OSBPL2'],
-        ['ADCK1','TMC1'],
-        ['ADCK2','HIPK2'],
-        ['ADCK2','TBXAS1'],
-        ['ADCK3','CYP2E1'],
-        ['ADCK3','EPHX1'],
-        ['ADCK3','SPRN'],
-        ['ADCK4','AKAP8'],
-        ['ADCK4','NUMBL'],
-        ['ADCK4','PPM1A'],
-        ['ADCY3','SOS1'],
-        ['ADCY4','RABGGTA'],
-        ['ADCY8','ASAP1'],
-        ['ADCY9','CDK12'],
-        ['ADCY9','PRKCB'],
-        ['ADCYAP1','CASP9'],
-        ['ADD1','HTT'],
-        ['ADD1','POMC'],
-        ['ADD2','EXOC6B'],
-        ['ADD3','NUP98'],
-        ['ADK','C10ORF11'],
-        ['ADK','CD133'],
-        ['ADK','DLG5'],
-        ['ADK','PI4K2A'],
-        ['ADK','VCL'],
-        ['ADNP','C20ORF132'],
-        ['ADNP2','ITGB3BP'],
-        ['ADORA2B','TTC19'],
-        ['ADPRHL1','ZP4'],
-        ['ADRA1A','GUF1'],
-        ['ADRA1A','YIPF7'],
-        ['ADRB3','DIS3'],
-        ['ADRBK1','BAIAP2'],
-        ['ADRBK1','CHGA'],
-        ['ADRBK1','IGH@'],
-        ['ADRBK1','IGHMBP2'],
-        ['ADRBK1','POLD4'],
-        ['ADRBK2','AP1B1'],
-        ['ADRBK2','EHD1'],
-        ['ADRBK2','EP300'],
-        ['ADRBK2','RHBDL3'],
-        ['ADRBK2','SF3A1'],
-        ['ADRBK2','SGSM3'],
-        ['ADRBK2','WWC1'],
-        ['AEBP2','PVT1'],
-        ['AES','FGFR3'],
-        ['AF10','CALM'],
-        ['AF10','HEAB'],
-        ['AF10','MLL'],
-        ['AF10','PICALM'],
-        ['AF15Q14','MLL'],
-        ['AF17','MLL'],
-        ['AF186192.5','AGAP5'],
-        ['AF1P','MLL'],
-        ['AF1Q','ARHGEF12'],
-        ['AF1Q','CBFA2T1'],
-        ['AF1Q','CREBBP'],
-        ['AF1Q','ELL'],
-        ['AF1Q','EP300'],
-        ['AF1Q','FNBP1'],
-        ['AF1Q','FOXO3A'],
-        ['AF1Q','GAS7'],
-        ['AF1Q','GMPS'],
-        ['AF1Q','GPHN'],
-        ['AF1Q','GRAF'],
-        ['AF1Q','HEAB'],
-        ['AF1Q','LAF4'],
-        ['AF1Q','LCX'],
-        ['AF1Q','LPP'],
-        ['AF1Q','MLL'],
-        ['AF1Q','MSF'],
-        ['AF1Q','PICALM'],
-        ['AF1Q','PNUTL1'],
-        ['AF1Q','SEPT6'],
-        ['AF1Q','SH3GL1'],
-        ['AF1Q','SSH3BP1'],
-        ['AF3P21','MLL'],
-        ['AF4','MLL'],
-        ['AF5Q31','MLL'],
-        ['AF6','MLL'],
-        ['AF6','MLLT4'],
-        ['AF9','MLL'],
-        ['AFAP','NTRK2'],
-        ['AFAP1','NTRK2'],
-        ['AFAP1L2','RET'],
-        ['AFF1','ARHGAP17'],
-        ['AFF1','C1QTNF1'],
-        ['AFF1','DOM'],
-        ['AFF1','DSCAML1'],
-        ['AFF1','ELF2'],
-        ['AFF1','FXYD6'],
-        ['AFF1','GAS7'],
-        ['AFF1','IL10RB'],
-        ['AFF1','KMT2A'],
-        ['AFF1','LYZ'],
-        ['AFF1','MLL'],
-        ['AFF1','PAIP2'],
-        ['AFF1','PBX1'],
-        ['AFF1','PHACTR2'],
-        ['AFF1','PIM1'],
-        ['AFF1','PTPN13'],
-        ['AFF1','RABGAP1L'],
-        ['AFF1','SRSF11'],
-        ['AFF1','TRIM33'],
-        ['AFF1','UBE2D3'],
-        ['AFF3','BCL2'],
-        ['AFF3','FGFR2'],
-        ['AFF3','KMT2A'],
-        ['AFF3','MAP4K4'],
-        ['AFF3','MLL'],
-        ['AFF3','PHF1'],
-        ['AFF3','RUNX1'],
-        ['AFF4','KMT2A'],
-        ['AFF4','MLL'],
-        ['AFF4','SEPT8'],
-        ['AFF4','SLC38A4'],
-        ['AFM','ALB'],
-        ['AFP','ALB'],
-        ['AFP','CUX1'],
-        ['AFX','PAX3'],
-        ['AFX1','FOXO4'],
-        ['AGAP1','IGFBP2'],
-        ['AGAP2','CYP27B1'],
-        ['AGAP2','MARS'],
-        ['AGAP2','TIE1'],
-        ['AGAP2','TMEM67'],
-        ['AGAP2','TSFM'],
-        ['AGAP3','BRAF'],
-        ['AGAP3','JAZF1'],
-        ['AGAP5','BMS1P4'],
-        ['AGGF1','RAF1'],
-        ['AGK','BRAF'],
-        ['AGK','KIAA1147'],
-        ['AGK','WDR60'],
-        ['AGL','C9ORF25'],
-        ['AGMO','MAP3K1'],
-        ['AGO2','PTK2'],
-        ['AGPAT5','MCPH1'],
-        ['AGPAT5','MSRA'],
-        ['AGT','CLU'],
-        ['AGTPBP1','DAPK1'],
-        ['AGTRAP','BRAF'],
-        ['AGXT2L2','CYB5R1'],
-        ['AHCTF1','NAAA'],
-        ['AHCY','TAX1BP1'],
-        ['AHCYL1','FGFR2'],
-        ['AHCYL1','KDM5B'],
-        ['AHCYL1','RAD51C'],
-        ['AHCYL2','MKLN1'],
-        ['AHCYL2','TMEM178B'],
-        ['AHDC1','MACF1'],
-        ['AHDC1','MAP3K6'],
-        ['AHDC1','WDFY3'],
-        ['AHI1','HBS1L'],
-        ['AHNAK','HNRNPUL2'],
-        ['AHNAK','KAT5'],
-        ['AHNAK','RPS6KA4'],
-        ['AHNAK2','PLD4'],
-        ['AHRR','ETV4'],
-        ['AHRR','NCOA2'],
-        ['AHSG','SERPINA1'],
-        ['AIDA','KCNH1'],
-        ['AIFM1','FGF13'],
-        ['AIG1','NFIB'],
-        ['AIM1','SOBP'],
-        ['AIP','ATE1'],
-        ['AK125726','ETV6'],
-        ['AK7','PAPOLA'],
-        ['AKAP1','RNF43'],
-        ['AKAP11','MRPS31'],
-        ['AKAP12','ESR1'],
-        ['AKAP13','GSN'],
-        ['AKAP13','NEDD4'],
-        ['AKAP13','PDE8A'],
-        ['AKAP13','PLDN'],
-        ['AKAP13','RET'],
-        ['AKAP6','EGLN3'],
-        ['AKAP6','ERBB4'],
-        ['AKAP6','NPAS3'],
-        ['AKAP6','PRKD1'],
-        ['AKAP8L','BRD4'],
-        ['AKAP8L','FGFR1'],
-        ['AKAP9','ANKIB1'],
-        ['AKAP9','BRAF'],
-        ['AKAP9','CDK6'],
-        ['AKAP9','KIAA1549'],
-        ['AKAP9','LSM14A'],
-        ['AKAP9','PON2'],
-        ['AKAP9','RUNX1'],
-        ['AKR1A1','PRDX1'],
-        ['AKR1C6P','B4GALT5'],
-        ['AKR1D1','BEND7'],
-        ['AKR1D1','RIOK1'],
-        ['AKR1E2','CCT4P1'],
-        ['AKR7A2','LMBRD2'],
-        ['AKT1','PGC'],
-        ['AKT1','PRKACA'],
-        ['AKT2','ART3'],
-        ['AKT2','BCAM'],
-        ['AKT2','C19ORF12'],
-        ['AKT2','C19ORF47'],
-        ['AKT2','CXCL11'],
-        ['AKT2','PAK4'],
-        ['AKT2','PRKACA'],
-        ['AKT2','SRRM5'],
-        ['AKT2','TSHZ3'],
-        ['AKT2','YIF1B'],
-        ['AKT2','ZNF576'],
-        ['AKT3','ARHGAP30'],
-        ['AKT3','C1ORF150'],
-        ['AKT3','CEP170'],
-        ['AKT3','CNOT6L'],
-        ['AKT3','MAGI3'],
-        ['AKT3','PLD5'],
-        ['AKT3','ZEB2'],
-        ['AL672183.2','CD55'],
-        ['AL672183.2','IRF2BP2'],
-        ['ALB','APOA2'],
-        ['ALB','H19'],
-        ['ALB','IGF2'],
-        ['ALB','SEPP1'],
-        ['ALDH16A1','PLEKHG5'],
-        ['ALDH18A1','DEPDC5'],
-        ['ALDH2','CCNB1IP1'],
-        ['ALDH2','CMKOR1'],
-        ['ALDH2','EBF1'],
-        ['ALDH2','FHIT'],
-        ['ALDH2','HMGA2'],
-        ['ALDH2','HMGIC'],
-        ['ALDH2','WIF1'],
-        ['ALDH7A1','SLC9A7'],
-        ['ALDOB','KNG1'],
-        ['ALG14','BCAR3'],
-        ['ALG14','CNN3'],
-        ['ALG5','PIGU'],
-        ['ALG5','POSTN'],
-        ['ALG9','PPP2R1B'],
-        ['ALK','ALO17'],
-        ['ALK','ATIC'],
-        ['ALK','ATRNL1'],
-        ['ALK','BCL11A'],
-        ['ALK','BEND5'],
-        ['ALK','BIRC6'],
-        ['ALK','C2ORF22'],
-        ['ALK','C2ORF44'],
-        ['ALK','CARS'],
-        ['ALK','CCDC88A'],
-        ['ALK','CEBPZ'],
-        ['ALK','CLTC'],
-        ['ALK','CLTCL1'],
-        ['ALK','CTLC'],
-        ['ALK','DCTN1'],
-        ['ALK','EEF1G'],
-        ['ALK','EML4'],
-        ['ALK','FN1'],
-        ['ALK','GCC2'],
-        ['ALK','GTF2IRD1'],
-        ['ALK','HIP1'],
-        ['ALK','HOOK1'],
-        ['ALK','IGFBP5'],
-        ['ALK','KIAA1618'],
-        ['ALK','KIF5B'],
-        ['ALK','KLC1'],
-        ['ALK','KTN1'],
-        ['ALK','MALAT1'],
-        ['ALK','MLF1'],
-        ['ALK','MSN'],
-        ['ALK','MYH9'],
-        ['ALK','NCOA1'],
-        ['ALK','NPM'],
-        ['ALK','NPM1'],
-        ['ALK','NTRK1'],
-        ['ALK','PICALM'],
-        ['ALK','PPFIBP1'],
-        ['ALK','PPP1CB'],
-        ['ALK','PRKAR1A'],
-        ['ALK','PTPN3'],
-        ['ALK','RANBP2'],
-        ['ALK','RARA'],
-        ['ALK','RNF213'],
-        ['ALK','ROS1'],
-        ['ALK','RRBP1'],
-        ['ALK','SEC31A'],
-        ['ALK','SEC31L1'],
-        ['ALK','SMEK2'],
-        ['ALK','SQSTM1'],
-        ['ALK','STRN'],
-        ['ALK','TERT'],
-        ['ALK','TFE3'],
-        ['ALK','TFG'],
-        ['ALK','TMP3'],
-        ['ALK','TMP4'],
-        ['ALK','TPM1'],
-        ['ALK','TPM3'],
-        ['ALK','TPM4'],
-        ['ALK','TPR'],
-        ['ALK','TRAF1'],
-        ['ALK','TRMT61B'],
-        ['ALK','VCL'],
-        ['ALKBH5','LLGL1'],
-        ['ALO17','MYC'],
-        ['ALOX12','MINK1'],
-        ['ALOXE3','TP53'],
-        ['ALPK1','ANK2'],
-        ['ALPK2','PRKCH'],
-        ['ALS2CL','ITGB4'],
-        ['ALS2CR16','ALS2CR8'],
-        ['ALX3','RECK'],
-        ['AMACR','FGFR1'],
-        ['AMACR','SDK1'],
-        ['AMD1','CDK19'],
-        ['AMDHD2','ATP6V0C'],
-        ['AMDHD2','TRIM77'],
-        ['AMER3','ANKRD42'],
-        ['AMFR','IGF2BP2'],
-        ['AML1','CBFA2T3'],
-        ['AML1','EAP'],
-        ['AML1','ETO'],
-        ['AML1','ETV6'],
-        ['AML1','EVI1'],
-        ['AML1','FOG2'],
-        ['AML1','JAK2'],
-        ['AML1','MDS1'],
-        ['AML1','PRPF38A'],
-        ['AML1','TEL'],
-        ['AML1','USP25'],
-        ['AMN1','C12ORF35'],
-        ['AMPD1','BCAS3'],
-        ['AMPH','FDFT1'],
-        ['AMPH','ST7'],
-        ['ANAPC1','RGPD3'],
-        ['ANAPC1','RMND5A'],
-        ['ANAPC2','EHMT1'],
-        ['ANAPC5','CAMKK2'],
-        ['ANAPC7','SLC2A13'],
-        ['ANGPT1','PEAK1'],
-        ['ANGPT1','PTK2'],
-        ['ANGPTL6','GOLGA2P2Y'],
-        ['ANGPTL6','KRI1'],
-        ['ANK1','FGFR1'],
-        ['ANK1','RTN3'],
-        ['ANK1','ZMAT4'],
-        ['ANK2','ARHGAP10'],
-        ['ANK2','CAMK2D'],
-        ['ANK2','RRN3P2'],
-        ['ANK3','CCDC6'],
-        ['ANK3','LDLRAD3'],
-        ['ANK3','RET'],
-        ['ANKDD1A','SPG21'],
-        ['ANKFY1','ZZEF1'],
-        ['ANKHD1','C5ORF32'],
-        ['ANKHD1','PCDH1'],
-        ['ANKIB1','LMTK2'],
-        ['ANKIB1','TRRAP'],
-        ['ANKRD11','DPEP1'],
-        ['ANKRD11','FANCA'],
-        ['ANKRD11','KIT'],
-        ['ANKRD11','PTK2'],
-        ['ANKRD11','UBQLN1'],
-        ['ANKRD12','TWSG1'],
-        ['ANKRD13A','FLJ40142'],
-        ['ANKRD17','WDFY3'],
-        ['ANKRD18B','SIN3A'],
-        ['ANKRD23','ANKRD39'],
-        ['ANKRD23','CNNM3'],
-        ['ANKRD24','NOVA1'],
-        ['ANKRD26','ZNF354C'],
-        ['ANKRD27','RHPN2'],
-        ['ANKRD28','BCR'],
-        ['ANKRD28','FLT3'],
-        ['ANKRD28','FNDC3B'],
-        ['ANKRD28','NSD1'],
-        ['ANKRD28','NUP98'],
-        ['ANKRD28','STK38'],
-        ['ANKRD29','PDS5A'],
-        ['ANKRD29','ROCK1'],
-        ['ANKRD34A','ATP5O'],
-        ['ANKRD34C','EIF2AK4'],
-        ['ANKRD42','SRPK1'],
-        ['ANKRD65','MMP25'],
-        ['ANKRD66','MOK'],
-        ['ANKS1A','PPARD'],
-        ['ANKS1A','UHRF1BP1'],
-        ['ANKS1B','CCDC53'],
-        ['ANKS1B','SCYL2'],
-        ['ANKS1B','STK24'],
-        ['ANKS3','GJB7'],
-        ['ANO1','ZNF331'],
-        ['ANO4','GALNT9'],
-        ['ANO4','KIF21A'],
-        ['ANO4','TMTC3'],
-        ['ANO5','RPS6KB2'],
-        ['ANP32B','GABBR2'],
-        ['ANP32B','SLC35B3'],
-        ['ANP32E','SET'],
-        ['ANRIL','MTAP'],
-        ['ANTXR1','GKN1'],
-        ['ANTXR2','IGFBP3'],
-        ['ANTXR2','NPLOC4'],
-        ['ANTXR2','RNF111'],
-        ['ANTXRL','RGS10'],
-        ['ANXA1','FNDC1'],
-        ['ANXA1','PRKG1'],
-        ['ANXA2','TRIM2'],
-        ['ANXA3','GPR107'],
-        ['ANXA3','UQCRFS1'],
-        ['ANXA4','DENND1A'],
-        ['ANXA4','PKN1'],
-        ['ANXA4','TMEM67'],
-        ['ANXA6','CPNE5'],
-        ['AOAH','RBM28'],
-        ['AOF2','C1ORF201'],
-        ['AP1GBP1','TOB1'],
-        ['AP1M2','LAG3'],
-        ['AP1M2','LINC00662'],
-        ['AP1M2','SRP68'],
-        ['AP2A1','ZNF544'],
-        ['AP2A2','SBF2'],
-        ['AP2A2','SBF2-AS1'],
-        ['AP2A2','SFMBT1'],
-        ['AP2M1','SEC63'],
-        ['AP3B1','APC'],
-        ['AP3B1','BRAF'],
-        ['AP3B1','TTTY10'],
-        ['AP3S1','COMMD10'],
-        ['AP3S1','LMAN2'],
-        ['AP4B1','RSBN1'],
-        ['AP4B1','VAV3'],
-        ['AP4B1-AS1','RSBN1'],
-        ['AP4B1-AS1','VAV3'],
-        ['AP4E1','CSNK1G1'],
-        ['AP5M1','SULT1E1'],
-        ['APAF1','TLN1'],
-        ['APAF1','UNC13B'],
-        ['APBA1','DEGS1'],
-        ['APBB1IP','GOLPH3'],
-        ['APBB1IP','MICU1'],
-        ['APBB1IP','SCARB1'],
-        ['APBB3','SRA1'],
-        ['APC','REEP5'],
-        ['APC2','C19ORF25'],
-        ['APEH','SHISA5'],
-        ['APH1B','USP3'],
-        ['API2','MALT1'],
-        ['APIP','FGFR2'],
-        ['APIP','PVT1'],
-        ['APIP','SLC1A2'],
-        ['APLP2','CD40'],
-        ['APLP2','EEA1'],
-        ['APLP2','TNFSF11'],
-        ['APMAP','LYN'],
-        ['APOA1','APOC3'],
-        ['APOA1','RBP4'],
-        ['APOA2','APOC2'],
-        ['APOA2','FGB'],
-        ['APOA2','H19'],
-        ['APOA2','OAZ1'],
-        ['APOA2','P4HB'],
-        ['APOA2','RBP4'],
-        ['APOA2','TMEM176B'],
-        ['APOA2','XBP1'],
-        ['APOBEC2','TMPRSS7'],
-        ['APOBEC3B','WEE2'],
-        ['APOC1','FGA'],
-        ['APOC2','APOC4'],
-        ['APOE','SERPINA1'],
-        ['APOLD1','RUNX1'],
-        ['APOPT1','MARK3'],
-        ['APP','C21ORF7'],
-        ['APP','SEC63'],
-        ['APPBP2','KIF19'],
-        ['APPBP2','PHF20L1'],
-        ['APPBP2','PPM1D'],
-        ['APPL2','CIT'],
-        ['APRIL','IGH@'],
-        ['AQP5','C11ORF85'],
-        ['AQP9','TCF12'],
-        ['ARF3','PDRG1'],
-        ['ARFGAP1','SEC31A'],
-        ['ARFGEF2','CSE1L'],
-        ['ARFGEF2','FAM65C'],
-        ['ARFGEF2','IGF2R'],
-        ['ARFGEF2','ITCH'],
-        ['ARFGEF2','STAU1'],
-        ['ARFGEF2','SULF2'],
-        ['ARFIP1','FHDC1'],
-        ['ARFIP2','SLC11A1'],
-        ['ARGLU1','ENOPH1'],
-        ['ARGLU1','TMEM38A'],
-        ['ARHGAP1','CPNE3'],
-        ['ARHGAP10','TMEM184C'],
-        ['ARHGAP12','BMX'],
-        ['ARHGAP18','TMEM244'],
-        ['ARHGAP19','DRG1'],
-        ['ARHGAP19','RRP12'],
-        ['ARHGAP20','BRWD3'],
-        ['ARHGAP21','C15ORF32'],
-        ['ARHGAP21','ENKUR'],
-        ['ARHGAP21','PIP4K2A'],
-        ['ARHGAP24','ARHGAP24'],
-        ['ARHGAP24','BANK1'],
-        ['ARHGAP24','C4ORF14'],
-        ['ARHGAP24','FGD6'],
-        ['ARHGAP24','NENF'],
-        ['ARHGAP24','NOA1'],
-        ['ARHGAP26','CLDN18'],
-        ['ARHGAP26','KMT2A'],
-        ['ARHGAP26','MLL'],
-        ['ARHGAP27','SH3D20'],
-        ['ARHGAP29','KDM1A'],
-        ['ARHGAP32','TIMM23'],
-        ['ARHGAP33','YWHAB'],
-        ['ARHGAP4','TBC1D27'],
-        ['ARHGAP40','CNTF'],
-        ['ARHGAP44','LCE2C'],
-        ['ARHGAP6','CLDN18'],
-        ['ARHGAP6','MID1'],
-        ['ARHGAP9','GLI1'],
-        ['ARHGAP9','RUNX2'],
-        ['ARHGDIG','ASTN2'],
-        ['ARHGEF10L','PAK4'],
-        ['ARHGEF12','KCTD2'],
-        ['ARHGEF12','KMT2A'],
-        ['ARHGEF12','MLL'],
-        ['ARHGEF17','KMT2A'],
-        ['ARHGEF17','MLL'],
-        ['ARHGEF17','P2RY6'],
-        ['ARHGEF17','SHANK2'],
-        ['ARHGEF18','INSR'],
-        ['ARHGEF2','NTRK1'],
-        ['ARHGEF2','QSOX2'],
-        ['ARHGEF25','B4GALNT1'],
-        ['ARHGEF25','NTRK1'],
-        ['ARHGEF3','C8ORF38'],
-        ['ARHGEF4','IGFBP5'],
-        ['ARHGEF4','PLEKHB2'],
-        ['ARHGEF5','HIPK2'],
-        ['ARHGEF7','CDC16'],
-        ['ARHGEF7','ZDHHC11'],
-        ['ARHH','BCL6'],
-        ['ARHH','EIF4A2'],
-        ['ARHH','SFRS3'],
-        ['ARID1A','BEND5'],
-        ['ARID1A','HOIP'],
-        ['ARID1A','MAST2'],
-        ['ARID1A','PRKCZ'],
-        ['ARID1A','PRKD1'],
-        ['ARID1A','RNF31'],
-        ['ARID1A','RPS6KA1'],
-        ['ARID1A','UBR4'],
-        ['ARID1B','SNX9'],
-        ['ARID1B','TIAM2'],
-        ['ARID1B','ZNF384'],
-        ['ARID4B','TARBP1'],
-        ['ARIH2','CAMP'],
-        ['ARIH2','PRKAR2A'],
-        ['ARL1','CCBL1'],
-        ['ARL11','RNASEH2B'],
-        ['ARL13A','TRMT2B'],
-        ['ARL17A','GSTT2B'],
-        ['ARL17A','KANSL1'],
-        ['ARL17B','KANSL1'],
-        ['ARL3','CAMK1D'],
-        ['ARL6IP1','RPS15A'],
-        ['ARL6IP4','NKX2-1'],
-        ['ARMC10','BRAF'],
-        ['ARMC4','PATE4'],
-        ['ARMC6','DHX57'],
-        ['ARMCX3','FRAS1'],
-        ['ARMCX5','B3GNT4'],
-        ['ARNT','ETV6'],
-        ['ARNT','TEL'],
-        ['ARNT2','MESDC2'],
-        ['ARNTL','PTPRD'],
-        ['ARPC1A','HIPK2'],
-        ['ARPC1B','TRRAP'],
-        ['ARPC2','TXNDC15'],
-        ['ARPC5','SEC31A'],
-        ['ARRB1','KLHL35'],
-        ['ARRDC1','ZMYND19'],
-        ['ARSG','MAP2K6'],
-        ['ART3','CDKL2'],
-        ['ART3','GLUL'],
-        ['ART3','KCTD8'],
-        ['ART3','NUP54'],
-        ['ART4','C12ORF69'],
-        ['AS3MT','PI4K2A'],
-        ['ASAH1','SHROOM3'],
-        ['ASAH2','NT5C2'],
-        ['ASAP1','PVT1'],
-        ['ASAP2','CPSF3'],
-        ['ASAP3','USP34'],
-        ['ASB11','URM1'],
-        ['ASB17','CHST2'],
-        ['ASB9','WDR59'],
-        ['ASCC1','CBARA1'],
-        ['ASCC1','MICU1'],
-        ['ASCC1','VCL'],
-        ['ASCC2','ZMAT5'],
-        ['ASCC3','DST'],
-        ['ASCC3','UBE2E1'],
-        ['ASGR2','NDEL1'],
-        ['ASGR2','TAOK1'],
-        ['ASH1L','C1ORF61'],
-        ['ASIC2','NF1'],
-        ['ASIP','ITCH'],
-        ['ASL','CRCP'],
-        ['ASNA1','RFX1'],
-        ['ASNA1','WDR20'],
-        ['ASNS','KMT2E'],
-        ['ASPH','MRPS28'],
-        ['ASPL','TFE3'],
-        ['ASPSCR1','CLTC'],
-        ['ASPSCR1','CSNK1D'],
-        ['ASPSCR1','NONO'],
-        ['ASPSCR1','PRCC'],
-        ['ASPSCR1','SFPQ'],
-        ['ASPSCR1','TFE3'],
-        ['ASTN1','TRIO'],
-        ['ASTN2','PAPPA'],
-        ['ASTN2','PDIA2'],
-        ['ASTN2','PTPRG'],
-        ['ASTN2','TBC1D16'],
-        ['ASUN','RASSF8'],
-        ['ASXL1','BPIL3'],
-        ['ASXL1','PAX5'],
-        ['ASXL1','RUNX1'],
-        ['ASXL1','SNX14'],
-        ['ASXL2','EPC1'],
-        ['ASXL2','MYST3'],
-        ['ASZ1','VSTM2L'],
-        ['ATAD1','PTEN'],
-        ['ATAD1','SLIT1'],
-        ['ATAD1','STAMBPL1'],
-        ['ATAD3B','NIPAL3'],
-        ['ATAD5','TLK2'],
-        ['ATE1','FGFR2'],
-        ['ATE1','HTRA1'],
-        ['ATE1','PVT1'],
-        ['ATF1','CREB1'],
-        ['ATF1','CREB3L1'],
-        ['ATF1','CREB3L2'],
-        ['ATF1','DDIT3'],
-        ['ATF1','ERG'],
-        ['ATF1','ETV1'],
-        ['ATF1','ETV4'],
-        ['ATF1','EWS'],
-        ['ATF1','EWSR1'],
-        ['ATF1','FUS'],
-        ['ATF1','NFATC2'],
-        ['ATF1','PBX1'],
-        ['ATF1','POU5F1'],
-        ['ATF1','WT1'],
-        ['ATF1','ZNF384'],
-        ['ATF5','PRKDC'],
-        ['ATF6','FAM78B'],
-        ['ATF7','STK24'],
-        ['ATF7IP','JAK2'],
-        ['ATF7IP','PDGFRB'],
-        ['ATG14','FUT8'],
-        ['ATG16L1','SHIP1'],
-        ['ATG16L2','KMT2A'],
-        ['ATG16L2','LRP5'],
-        ['ATG4A','PSMD10'],
-        ['ATG4B','DTYMK'],
-        ['ATG4C','FBXO38'],
-        ['ATG4D','C4ORF22'],
-        ['ATG5','EIF3E'],
-        ['ATG5','PDSS2'],
-        ['ATG7','BRAF'],
-        ['ATG7','RAF1'],
-        ['ATL2','LINC00330'],
-        ['ATM','GRIA4'],
-        ['ATP10A','C12ORF49'],
-        ['ATP10B','EBF1'],
-        ['ATP11A','ULK4'],
-        ['ATP11B','GSK3B'],
-        ['ATP1A1','NOTCH2'],
-        ['ATP1A1','ZFP64'],
-        ['ATP1A2','CSDE1'],
-        ['ATP1A2','DCAF8'],
-        ['ATP1B1','PRKACA'],
-        ['ATP1B1','PRKACB'],
-        ['ATP1B2','COPZ1'],
-        ['ATP1B3','GRK7'],
-        ['ATP1B3','PRKAA2'],
-        ['ATP1B4','CHST11'],
-        ['ATP5A1','ZNF146'],
-        ['ATP5I','MFSD7'],
-        ['ATP5I','SLK'],
-        ['ATP5L','TEAD1'],
-        ['ATP5O','TIAM1'],
-        ['ATP6V0A1','MB'],
-        ['ATP6V0D2','STIP1'],
-        ['ATP6V1C1','VEGFB'],
-        ['ATP7B','FNDC3A'],
-        ['ATP8A1','RASGEF1B'],
-        ['ATP8A2','LATS2'],
-        ['ATP8A2','RUNX1'],
-        ['ATP8B2','IL6R'],
-        ['ATP8B4','ATRX'],
-        ['ATP8B5P','PABPC1L2B-AS1'],
-        ['ATR','DBR1'],
-        ['ATR','EIF2AK1'],
-        ['ATR','TOP3B'],
-        ['ATR','WWTR1'],
-        ['ATRN','ESYT2'],
-        ['ATRNL1','EML4'],
-        ['ATRX','RPS6KA6'],
-        ['ATRX','STAG2'],
-        ['ATXN1','NOTCH4'],
-        ['ATXN2','RPL6'],
-        ['ATXN7','BCAS3'],
-        ['ATXN7','FHIT'],
-        ['ATXN7','OXSR1'],
-        ['ATXN7','RAD51C'],
-        ['ATXN7L3','FAM171A2'],
-        ['ATXN7L3','GRN'],
-        ['AUNIP','HELZ'],
-        ['AURKA','BCAS4'],
-        ['AURKA','SOGA1'],
-        ['AURKC','PPP6R1'],
-        ['AUTS2','BAZ1B'],
-        ['AUTS2','GLI3'],
-        ['AUTS2','PAX5'],
-        ['AVEN','FAM178A'],
-        ['AVEN','NEO1'],
-        ['AVIL','MARS'],
-        ['AVIL','PPM1H'],
-        ['AVIL','PVT1'],
-        ['AVIL','TMEM120B'],
-        ['AVIL','TSFM'],
-        ['AVIL','VSNL1'],
-        ['AXDND1','UBE2T'],
-        ['AXIN1','LMF1'],
-        ['AXL','MBIP'],
-        ['AXL','ZNF565'],
-        ['AZGP1','GJC3'],
-        ['AZIN1','PRPF6'],
-        ['B2M','IGFBP5'],
-        ['B3GALNT2','GNG4'],
-        ['B3GALNT2','TOMM20'],
-        ['B3GALT5','FAM217A'],
-        ['B3GALTL','STK33'],
-        ['B3GAT3','CAPN5'],
-        ['B3GNT1','NPSR1'],
-        ['B3GNT9','DSCR8'],
-        ['B3GNTL1','METRNL'],
-        ['B3GNTL1','SLC9A8'],
-        ['B4GALNT1','FAM19A2'],
-        ['B4GALNT1','SLC26A10'],
-        ['B4GALNT1','TSFM'],
-        ['B4GALNT3','DENND5B'],
-        ['B4GALNT3','WNK1'],
-        ['B4GALT1','CSPP1'],
-        ['B4GALT2','JAK1'],
-        ['B4GALT2','ZSWIM5'],
-        ['B4GALT5','ERBB4'],
-        ['BACH2','IGH@'],
-        ['BACH2','METTL24'],
-        ['BACH2','RNGTT'],
-        ['BAG4','FGFR1'],
-        ['BAG6','SLC44A4'],
-        ['BAGE2','UBA52'],
-        ['BAGE3','UBA52'],
-        ['BAHD1','IVD'],
-        ['BAI2','HS3ST4'],
-        ['BAIAP2','DENR'],
-        ['BAIAP2','SLC38A10'],
-        ['BAIAP2','TMEM66'],
-        ['BAIAP2L1','BRAF'],
-        ['BAIAP2L1','FGFR3'],
-        ['BAIAP2L1','MET'],
-        ['BAIAP2L2','SLC16A8'],
-        ['BANF1','EIF1AD'],
-        ['BANF2','RBM43'],
-        ['BANK1','IGH@'],
-        ['BAP1','CCDC66'],
-        ['BAP1','PBRM1'],
-        ['BARD1','FN1'],
-        ['BAT3','SLC44A4'],
-        ['BATF2','FARS2'],
-        ['BATF2','MARK2'],
-        ['BAZ1A','NKX2-1'],
-        ['BAZ1A','NUMB'],
-        ['BAZ1A','RNF115'],
-        ['BAZ1A','SFTA3'],
-        ['BAZ1A','SNX6'],
-        ['BAZ1A','ZNF253'],
-        ['BAZ1B','GRID1'],
-        ['BAZ2A','ETV6'],
-        ['BAZ2A','FSIP1'],
-        ['BAZ2A','LRP1'],
-        ['BAZ2A','METTL1'],
-        ['BBF2H7','FUS'],
-        ['BBS10','FGFR3'],
-        ['BBS2','OGFOD1'],
-        ['BBS9','BRAF'],
-        ['BBS9','PKD1L1'],
-        ['BCAN','FOXJ2'],
-        ['BCAN','NTRK1'],
-        ['BCAP29','DUS4L'],
-        ['BCAP31','TEX28'],
-        ['BCAR1','RBM6'],
-        ['BCAR4','CLEC16A'],
-        ['BCAS1','BRAF'],
-        ['BCAS1','ZBP1'],
-        ['BCAS3','BCAS4'],
-        ['BCAS3','CLTC'],
-        ['BCAS3','DPY19L2P1'],
-        ['BCAS3','DUSP14'],
-        ['BCAS3','ERBB2'],
-        ['BCAS3','HOXB9'],
-        ['BCAS3','MAP3K3'],
-        ['BCAS3','MED13'],
-        ['BCAS3','NLK'],
-        ['BCAS3','PARD6B'],
-        ['BCAS3','PRKAA2'],
-        ['BCAS3','RARA'],
-        ['BCAS3','RSBN1'],
-        ['BCAS3','TAOK1'],
-        ['BCAS3','TG'],
-        ['BCAS3','TRIM37'],
-        ['BCAS3','UBE3C'],
-        ['BCAS4','C16ORF97'],
-        ['BCAS4','PRKCBP1'],
-        ['BCAS4','ZMYND8'],
-        ['BCAT1','FIP1L1'],
-        ['BCAT1','MLL'],
-        ['BCHE','MTERFD3'],
-        ['BCKDHA','TMEM91'],
-        ['BCKDHB','PTPRK'],
-        ['BCKDHB','RIPK1'],
-        ['BCKDHB','SEC31A'],
-        ['BCKDHB','TTK'],
-        ['BCL1','IGH@'],
-        ['BCL10','BCL11A'],
-        ['BCL10','BCL2'],
-        ['BCL10','C17ORF76-AS1'],
-        ['BCL10','CRLF2'],
-        ['BCL10','DDX6'],
-        ['BCL10','IGH@'],
-        ['BCL10','IGK@'],
-        ['BCL10','LHX4'],
-        ['BCL10','NFKB2'],
-        ['BCL10','PAFAH1B2'],
-        ['BCL10','PCSK7'],
-        ['BCL11A','GRIP2'],
-        ['BCL11A','IGH@'],
-        ['BCL11B','IKZF2'],
-        ['BCL11B','NKX2-5'],
-        ['BCL11B','RUNX1'],
-        ['BCL11B','TLX3'],
-        ['BCL11B','TRD@'],
-        ['BCL11B','ZEB2'],
-        ['BCL2','BCL3'],
-        ['BCL2','BCL6'],
-        ['BCL2','IGH@'],
-        ['BCL2','IGHG1'],
-        ['BCL2','IGK@'],
-        ['BCL2','IGL@'],
-        ['BCL2','MYC'],
-        ['BCL2L1','BMP8B'],
-        ['BCL2L1','DEM1'],
-        ['BCL2L1','HM13'],
-        ['BCL2L1','PPT1'],
-        ['BCL2L1','RIMS3'],
-        ['BCL2L1','RLF'],
-        ['BCL2L1','ZNF643'],
-        ['BCL2L1','ZNF684'],
-        ['BCL2L11','BRAF'],
-        ['BCL2L13','SLC39A9'],
-        ['BCL2L14','ETV6'],
-        ['BCL3','IGH@'],
-        ['BCL3','IGK@'],
-        ['BCL3','IGL@'],
-        ['BCL3','MYC'],
-        ['BCL5','BCL7A'],
-        ['BCL5','BTG1'],
-        ['BCL5','IGH@'],
-        ['BCL5','IGK@'],
-        ['BCL5','MYC'],
-        ['BCL5','TRA@'],
-        ['BCL6','BCL8'],
-        ['BCL6','C16ORF75'],
-        ['BCL6','CIITA'],
-        ['BCL6','DMRT1'],
-        ['BCL6','EIF4A2'],
-        ['BCL6','FBXO18'],
-        ['BCL6','GAPDH'],
-        ['BCL6','GAS5'],
-        ['BCL6','GRHPR'],
-        ['BCL6','H4'],
-        ['BCL6','H4FM'],
-        ['BCL6','HIST1H4I'],
-        ['BCL6','HSP90AA1'],
-        ['BCL6','HSP90AB1'],
-        ['BCL6','HSPCA'],
-        ['BCL6','HSPCB'],
-        ['BCL6','IGH@'],
-        ['BCL6','IGHG3'],
-        ['BCL6','IGK@'],
-        ['BCL6','IGL@'],
-        ['BCL6','IKAROS'],
-        ['BCL6','IKZF1'],
-        ['BCL6','IL21R'],
-        ['BCL6','LCP1'],
-        ['BCL6','LPP'],
-        ['BCL6','LRMP'],
-        ['BCL6','MBNL1'],
-        ['BCL6','MYC'],
-        ['BCL6','NACA'],
-        ['BCL6','NAPA'],
-        ['BCL6','OBF1'],
-        ['BCL6','PIM1'],
-        ['BCL6','POU2AF1'],
-        ['BCL6','RAF1'],
-        ['BCL6','RARA'],
-        ['BCL6','RHOH'],
-        ['BCL6','SFRS3'],
-        ['BCL6','SNHG5'],
-        ['BCL6','SRSF3'],
-        ['BCL6','ST6GAL1'],
-        ['BCL6','TFRC'],
-        ['BCL6','TTF'],
-        ['BCL6','ZNFN1A1'],
-        ['BCL7A','C12ORF42'],
-        ['BCL7A','IGH@'],
-        ['BCL7A','MYC'],
-        ['BCL7A','S100A6'],
-        ['BCL7B','TNFRSF12A'],
-        ['BCL8','BCL9'],
-        ['BCL8','IGH@'],
-        ['BCL9','CCND1'],
-        ['BCL9','CCND2'],
-        ['BCL9','CLEC2A'],
-        ['BCL9','IGH@'],
-        ['BCL9','IGL@'],
-        ['BCL9','MEF2D'],
-        ['BCL9','MYC'],
-        ['BCL9L','CHRNA9'],
-        ['BCL9L','KMT2A'],
-        ['BCL9L','MLL'],
-        ['BCLAF1','GRM1'],
-        ['BCOR','CCNB3'],
-        ['BCOR','CREBBP'],
-        ['BCOR','MAML3'],
-        ['BCOR','PAX5'],
-        ['BCOR','RARA'],
-        ['BCOR','ZC3H7'],
-        ['BCOR','ZC3H7B'],
-        ['BCORL1','CREBBP'],
-        ['BCORL1','JAZF1'],
-        ['BCR','C9ORF78'],
-        ['BCR','CEP1'],
-        ['BCR','ETV6'],
-        ['BCR','EXOSC2'],
-        ['BCR','FGFR1'],
-        ['BCR','FOP'],
-        ['BCR','JAK2'],
-        ['BCR','LZTR1'],
-        ['BCR','MRVI1'],
-        ['BCR','MYH11'],
-        ['BCR','MYH9'],
-        ['BCR','NDUFAF6'],
-        ['BCR','PDGFRA'],
-        ['BCR','PPIL2'],
-        ['BCR','PTPRD'],
-        ['BCR','RALGPS1'],
-        ['BCR','RET'],
-        ['BCR','TOM1'],
-        ['BCR','UPB1'],
-        ['BCR','ZNF198'],
-        ['BCR','ZNRF3'],
-        ['BCS1L','MLL'],
-        ['BDH1','NEK11'],
-        ['BDH1','PAK2'],
-        ['BDNF','CLTC'],
-        ['BEND5','NTRK2'],
-        ['BEST3','NUP107'],
-        ['BEST3','TMTC2'],
-        ['BF104016','NSMCE2'],
-        ['BFSP2','EPHB1'],
-        ['BFSP2','PIK3CB'],
-        ['BGLAP','PMF1'],
-        ['BGN','PODXL'],
-        ['BGN','TSGA13'],
-        ['BICC1','FGFR2'],
-        ['BICC1','LDB1'],
-        ['BICD2','SBNO1'],
-        ['BID','NELFE'],
-        ['BIN2','CELA1'],
-        ['BIRC3','MALT1'],
-        ['BIRC3','REXO2'],
-        ['BIRC6','IYD'],
-        ['BIRC6','LTBP1'],
-        ['BIRC6','WTIP'],
-        ['BLM','ROCK2'],
-        ['BLMH','FOXN1'],
-        ['BLNK','DNTT'],
-        ['BLOC1S1','CBFA2T3'],
-        ['BMI1','IGH@'],
-        ['BMP2K','CCSER1'],
-        ['BMP2K','LEKR1'],
-        ['BMP2K','NCOR2'],
-        ['BMP2K','SHROOM3'],
-        ['BMP2K','SLC25A31'],
-        ['BMP2K','SLC4A4'],
-        ['BMP2K','ZNF384'],
-        ['BMP3','TRAF3'],
-        ['BMP6','CENPW'],
-        ['BMP6','FARS2'],
-        ['BMP7','COL22A1'],
-        ['BMPER','ZNF416'],
-        ['BMPR1A','C10ORF11'],
-        ['BMPR1A','LIPA'],
-        ['BMPR1A','ZYG11A'],
-        ['BMPR1B','ETV1'],
-        ['BMPR1B','NPTX1'],
-        ['BMPR1B','NRG1'],
-        ['BMPR1B','PAWR'],
-        ['BMPR1B','PDLIM5'],
-        ['BMPR1B','SMARCAD1'],
-        ['BMPR1B','ZMIZ1'],
-        ['BMPR2','CADM2'],
-        ['BMPR2','FAM117B'],
-        ['BMPR2','MARCH4'],
-        ['BMPR2','SPATS2L'],
-        ['BMPR2','WDTC1'],
-        ['BMS1','PARG'],
-        ['BMX','RPS6KA3'],
-        ['BNC2','ESR1'],
-        ['BNC2','LPP'],
-        ['BNC2','MTAP'],
-        ['BNIP2','MYLK2'],
-        ['BOK','PASK'],
-        ['BOLA2B','ZNF813'],
-        ['BORCS5','ETV6'],
-        ['BPESC1','C6ORF10'],
-        ['BPGM','FUCA1'],
-        ['BPIFA2','PIGU'],
-        ['BPTF','LRRC37A2'],
-        ['BPTF','METTL2A'],
-        ['BPTF','NUP98'],
-        ['BPTF','RARA'],
-        ['BRAF','BTF3L4'],
-        ['BRAF','C7ORF10'],
-        ['BRAF','CCDC6'],
-        ['BRAF','CCDC91'],
-        ['BRAF','CCNY'],
-        ['BRAF','CDC27'],
-        ['BRAF','CDK5RAP2'],
-        ['BRAF','CEP89'],
-        ['BRAF','CIITA'],
-        ['BRAF','CLCN6'],
-        ['BRAF','CUL1'],
-        ['BRAF','CUX1'],
-        ['BRAF','DYNC1I2'],
-        ['BRAF','EML4'],
-        ['BRAF','EPS15'],
-        ['BRAF','ERC1'],
-        ['BRAF','ETFA'],
-        ['BRAF','FAM114A2'],
-        ['BRAF','FAM131A'],
-        ['BRAF','FAM131B'],
-        ['BRAF','FCHSD1'],
-        ['BRAF','FXR1'],
-        ['BRAF','GATM'],
-        ['BRAF','GHR'],
-        ['BRAF','GIPC2'],
-        ['BRAF','GNAI1'],
-        ['BRAF','GTF2I'],
-        ['BRAF','HERPUD1'],
-        ['BRAF','JHDM1D'],
-        ['BRAF','KDM7A'],
-        ['BRAF','KIAA1549'],
-        ['BRAF','KLHL7'],
-        ['BRAF','LSM14A'],
-        ['BRAF','MACF'],
-        ['BRAF','MACF1'],
-        ['BRAF','MKRN1'],
-        ['BRAF','MYRIP'],
-        ['BRAF','MZT1'],
-        ['BRAF','NFYA'],
-        ['BRAF','NRF1'],
-        ['BRAF','NUB1'],
-        ['BRAF','NUP214'],
-        ['BRAF','OSBPL9'],
-        ['BRAF','PAPSS1'],
-        ['BRAF','PHTF2'],
-        ['BRAF','PICALM'],
-        ['BRAF','PJA2'],
-        ['BRAF','POR'],
-        ['BRAF','PRKAR1B'],
-        ['BRAF','PRKAR2B'],
-        ['BRAF','QKI'],
-        ['BRAF','RAD18'],
-        ['BRAF','RBM33'],
-        ['BRAF','RBMS3'],
-        ['BRAF','RNF130'],
-        ['BRAF','RUNDC1'],
-        ['BRAF','SCRIB'],
-        ['BRAF','SLC12A7'],
-        ['BRAF','SLC45A3'],
-        ['BRAF','SND1'],
-        ['BRAF','STK35'],
-        ['BRAF','STRN3'],
-        ['BRAF','SVOPL'],
-        ['BRAF','TANK'],
-        ['BRAF','TAX1BP1'],
-        ['BRAF','TLK2'],
-        ['BRAF','TMEM106B'],
-        ['BRAF','TNS3'],
-        ['BRAF','TRIM24'],
-        ['BRAF','TRIM4'],
-        ['BRAF','ZC3HAV1'],
-        ['BRAF','ZKSCAN1'],
-        ['BRAF','ZNF207'],
-        ['BRAF','ZNF767'],
-        ['BRAF','ZSCAN30'],
-        ['BRCA2','TPP2'],
-        ['BRCC3','FUNDC2'],
-        ['BRD1','PAX5'],
-        ['BRD1','PIM3'],
-        ['BRD2','PIGR'],
-        ['BRD3','C15ORF55'],
-        ['BRD3','NUT'],
-        ['BRD3','NUTM1'],
-        ['BRD3','PIP5KL1'],
-        ['BRD4','C15ORF55'],
-        ['BRD4','FRMD3'],
-        ['BRD4','IGH@'],
-        ['BRD4','NOTCH3'],
-        ['BRD4','NUT'],
-        ['BRD4','NUTM1'],
-        ['BRD4','RFX1'],
-        ['BRD9','NUTM1'],
-        ['BRDT','MTF2'],
-        ['BRE','FOSL2'],
-        ['BRE','RBKS'],
-        ['BRE','RMND1'],
-        ['BRE','SEMA4C'],
-        ['BRIP1','EGFR'],
-        ['BRIP1','GPATCH8'],
-        ['BRIP1','KIAA1468'],
-        ['BRIP1','POLDIP2'],
-        ['BRIP1','TAF4'],
-        ['BRIP1','TRIM13'],
-        ['BRK1','VHL'],
-        ['BRPF3','CLPSL1'],
-        ['BRPF3','NUDT3'],
-        ['BRPF3','STARD9'],
-        ['BRS3','HTATSF1'],
-        ['BRSK1','COX6B1'],
-        ['BRSK1','HSPBP1'],
-        ['BRSK1','ZNF587'],
-        ['BRWD1','DYRK1A'],
-        ['BRWD1','LACTBL1'],
-        ['BRWD1','LMTK3'],
-        ['BSCL2','TMEM260'],
-        ['BSDC1','FAM229A'],
-        ['BSG','EEA1'],
-        ['BSG','NFIX'],
-        ['BSG','RAB22A'],
-        ['BSG','STK11'],
-        ['BSN','RBM6'],
-        ['BSND','DDX21'],
-        ['BSX','FDX1L'],
-        ['BTBD1','NTRK3'],
-        ['BTBD11','DGKK'],
-        ['BTBD18','KMT2A'],
-        ['BTBD7','SLC2A5'],
-        ['BTBD9','CDC5L'],
-        ['BTC','FGD5'],
-        ['BTD','DPF3'],
-        ['BTF3L4','ZFYVE9'],
-        ['BTG1','MYC'],
-        ['BTG4','REST'],
-        ['BTL','ETV6'],
-        ['BTNL2','GLCCI1'],
-        ['BUB1B','CCDC170'],
-        ['BUB1B','EIF2AK4'],
-        ['BUB1B','MARK2'],
-        ['BUB1B','PCM1'],
-        ['BUB1B','SPRED1'],
-        ['BX648577','CIITA'],
-        ['BZW2','RPH3AL'],
-        ['C10ORF111','COPS8'],
-        ['C10ORF118','ZFP82'],
-        ['C10ORF140','EIF4G3'],
-        ['C10ORF18','NET1'],
-        ['C10ORF26','SUFU'],
-        ['C10ORF32','PI4K2A'],
-        ['C10ORF35','EEF2K'],
-        ['C10ORF54','RPS6KB2'],
-        ['C10ORF59','NFIA'],
-        ['C10ORF68','FGFR2'],
-        ['C11ORF1','FCGR1B'],
-        ['C11ORF1','KIAA0999'],
-        ['C11ORF20','ESRRA'],
-        ['C11ORF34','TRMT6'],
-        ['C11ORF48','CDK6'],
-        ['C11ORF49','PHF21A'],
-        ['C11ORF52','DIXDC1'],
-        ['C11ORF52','SRD5A2'],
-        ['C11ORF58','SBSPON'],
-        ['C11ORF63','STARD10'],
-        ['C11ORF67','SLC12A7'],
-        ['C11ORF70','FAM122C'],
-        ['C11ORF80','MKNK1'],
-        ['C11ORF82','CELF1'],
-        ['C11ORF84','MARK2'],
-        ['C11ORF93','HYOU1'],
-        ['C11ORF95','LTBP3'],
-        ['C11ORF95','MAML2'],
-        ['C11ORF95','MKL2'],
-        ['C11ORF95','PRG2'],
-        ['C11ORF95','RELA'],
-        ['C11ORF95','YAP1'],
-        ['C12ORF10','CTDSP2'],
-        ['C12ORF11','RASSF8'],
-        ['C12ORF4','EFCAB4B'],
-        ['C12ORF42','PPP1R12A'],
-        ['C12ORF42','TM7SF3'],
-        ['C12ORF45','CDK7'],
-        ['C12ORF49','MDM2'],
-        ['C12ORF5','KCNC2'],
-        ['C12ORF5','KIF21A'],
-        ['C12ORF56','LEMD3'],
-        ['C12ORF57','CHD4'],
-        ['C12ORF59','TTLL9'],
-        ['C12ORF59','XIAP'],
-        ['C12ORF65','NUAK1'],
-        ['C12ORF73','HSP90B1'],
-        ['C12ORF74','CLDN16'],
-        ['C12ORF79','SCYL2'],
-        ['C14ORF166','ERG'],
-        ['C14ORF166','KRAS'],
-        ['C14ORF166','SLC25A1'],
-        ['C14ORF166','SLC25A21'],
-        ['C14ORF177','NGDN'],
-        ['C14ORF182','CDC42BPB'],
-        ['C14ORF49','IGHV@'],
-        ['C15ORF21','ETV1'],
-        ['C15ORF21','HNRNPA2B1'],
-        ['C15ORF21','MYC'],
-        ['C15ORF27','CSK'],
-        ['C15ORF41','PTPRT'],
-        ['C15ORF41','WWOX'],
-        ['C15ORF57','CBX3'],
-        ['C15ORF59','SLC36A4'],
-        ['C16ORF11','RAB40C'],
-        ['C16ORF14','RAB40C'],
-        ['C16ORF57','ZNF319'],
-        ['C16ORF62','C1ORF123'],
-        ['C16ORF62','IQCK'],
-        ['C16ORF70','ENKD1'],
-        ['C16ORF75','CD273'],
-        ['C16ORF75','CIITA'],
-        ['C17ORF104','ZNF202'],
-        ['C17ORF105','TAOK1'],
-        ['C17ORF106','CDK3'],
-        ['C17ORF57','NSF'],
-        ['C17ORF64','TOP1'],
-        ['C17ORF75','NR1D1'],
-        ['C17ORF77','TRIM60P15'],
-        ['C17ORF80','GGNBP2'],
-        ['C17ORF85','ITGAE'],
-        ['C18ORF1','PARD6G'],
-        ['C18ORF45','HM13'],
-        ['C19MC','RPLP1'],
-        ['C19MC','TTYH1'],
-        ['C19ORF10','MAP2K3'],
-        ['C19ORF10','MAST3'],
-        ['C19ORF33','MYCBPAP'],
-        ['C19ORF33','SPINT2'],
-        ['C19ORF38','SMARCA4'],
-        ['C19ORF47','MAP3K10'],
-        ['C19ORF56','FBXL18'],
-        ['C19ORF57','PVT1'],
-        ['C19ORF77','DAD1'],
-        ['C1ORF100','CEP170'],
-        ['C1ORF109','MACF1'],
-        ['C1ORF151','RCC2'],
-        ['C1ORF173','FKBP11'],
-        ['C1ORF177','DHCR24'],
-        ['C1ORF185','NRD1'],
-        ['C1ORF194','UQCR10'],
-        ['C1ORF21','MIXL1'],
-        ['C1ORF226','NOS1AP'],
-        ['C1ORF43','TBC1D3B'],
-        ['C1ORF61','CCT3'],
-        ['C1ORF61','RHBG'],
-        ['C1ORF86','MUC1'],
-        ['C1ORF87','ERBB2'],
-        ['C1ORF95','TAF5L'],
-        ['C1QBP','HOXB2'],
-        ['C1QL4','SLC6A10P'],
-        ['C1QTNF1','STK32C'],
-        ['C1QTNF2','HS3ST3A1'],
-        ['C1QTNF9','PTPRZ1'],
-        ['C1RL','LPCAT3'],
-        ['C1S','MAP3K13'],
-        ['C20ORF112','PAX5'],
-        ['C20ORF112','RUNX1'],
-        ['C20ORF151','DIDO1'],
-        ['C20ORF195','PTK6'],
-        ['C20ORF197','STK4'],
-        ['C20ORF201','N6AMT1'],
-        ['C20ORF24','LIFR'],
-        ['C21ORF37','CXADR'],
-        ['C21ORF91','ZNF638'],
-        ['C22ORF25','RANBP1'],
-        ['C2CD2','TFF1'],
-        ['C2CD2L','ZNF585B'],
-        ['C2CD3','KMT2A'],
-        ['C2CD3','MLL'],
-        ['C2CD3','SMAD9'],
-        ['C2CD4B','LZTFL1'],
-        ['C2ORF28','GPR107'],
-        ['C2ORF3','CNTNAP2'],
-        ['C2ORF42','DIRC2'],
-        ['C2ORF43','PUM2'],
-        ['C2ORF48','PRMT8'],
-        ['C2ORF48','RRM2'],
-        ['C2ORF54','CST3'],
-        ['C2ORF55','SERINC5'],
-        ['C2ORF56','PRKD3'],
-        ['C2ORF61','PI4K2B'],
-        ['C2ORF66','NRP2'],
-        ['C2ORF66','WNT2'],
-        ['C2ORF67','KIF1A'],
-        ['C2ORF74','USP34'],
-        ['C2ORF82','NBAS'],
-        ['C2ORF88','DDX27'],
-        ['C3','ELK3'],
-        ['C3','H19'],
-        ['C3','HP'],
-        ['C3ORF27','EVI1'],
-        ['C3ORF27','MECOM'],
-        ['C3ORF62','SRF'],
-        ['C4ORF22','MYH13'],
-        ['C4ORF22','RBFOX3'],
-        ['C4ORF22','RERE'],
-        ['C4ORF28','INPP4A'],
-        ['C5','MLLT10'],
-        ['C5ORF22','MAP2K5'],
-        ['C5ORF22','PDCD6'],
-        ['C5ORF30','CCNH'],
-        ['C5ORF47','PDE4D'],
-        ['C5ORF63','TMEM138'],
-        ['C6ORF106','SPDEF'],
-        ['C6ORF123','ECHDC1'],
-        ['C6ORF138','CAND1'],
-        ['C6ORF138','HSP90AB1'],
-        ['C6ORF204','ROS1'],
-        ['C6ORF204','SYTL3'],
-        ['C6ORF211','ESR1'],
-        ['C6ORF211','PDPK1'],
-        ['C6ORF223','TMEM63B'],
-        ['C6ORF225','TLK1'],
-        ['C6ORF35','PREP'],
-        ['C6ORF35','ZDHHC14'],
-        ['C6ORF48','MKNK2'],
-        ['C6ORF52','MAST2'],
-        ['C6ORF62','SEC31A'],
-        ['C6ORF80','NUP98'],
-        ['C6ORF97','ESR1'],
-        ['C6ORF97','PPP1R14C'],
-        ['C7ORF10','CDK13'],
-        ['C7ORF10','HIBADH'],
-        ['C7ORF16','SRRT'],
-        ['C7ORF34','TXNRD1'],
-        ['C7ORF44','HECW1'],
-        ['C7ORF50','MACROD1'],
-        ['C7ORF55','MRPS14'],
-        ['C7ORF57','COBL'],
-        ['C7ORF61','TSC22D4'],
-        ['C7ORF72','INSR'],
-        ['C8B','PAH'],
-        ['C8ORF34','MET'],
-        ['C8ORF37','CRTC1'],
-        ['C8ORF38','PLEC1'],
-        ['C8ORF42','FBXO25'],
-        ['C8ORF47','PGCP'],
-        ['C9ORF163','SEC16A'],
-        ['C9ORF24','NFX1'],
-        ['C9ORF25','POLN'],
-        ['C9ORF25','ZCCHC7'],
-        ['C9ORF3','PRUNE2'],
-        ['C9ORF3','ZNF169'],
-        ['C9ORF85','MED6'],
-        ['C9ORF9','SNAP91'],
-        ['C9ORF9','SUGP2'],
-        ['C9ORF92','HMGA2'],
-        ['C9ORF92','MTAP'],
-        ['C9ORF93','FREM1'],
-        ['CA1','LMTK2'],
-        ['CA10','ROR1'],
-        ['CA2','RUNX1T1'],
-        ['CA2','SLC6A17'],
-        ['CA4','TANC2'],
-        ['CA7','USP22'],
-        ['CAAP1','RPGRIP1L'],
-        ['CABLES1','TM9SF4'],
-        ['CABLES2','LAMA5'],
-        ['CABLES2','SNTA1'],
-        ['CABP5','STAU1'],
-        ['CABP7','NF2'],
-        ['CACNA1A','STK11'],
-        ['CACNA1G','DGKE'],
-        ['CACNA2D1','PCLO'],
-        ['CACNA2D3','CAPN11'],
-        ['CACNA2D3','FLNB'],
-        ['CACNA2D3','IFT74'],
-        ['CACNA2D4','WDR43'],
-        ['CACNB1','CCDC47'],
-        ['CACNB1','CDK12'],
-        ['CACNB1','PGAP3'],
-        ['CACNG6','PAK4'],
-        ['CACNG8','PTK2'],
-        ['CADM2','MAP2K3'],
-        ['CADM2','MITF'],
-        ['CADM2','NANS'],
-        ['CADM2-AS2','RNF169'],
-        ['CADPS','SLC25A26'],
-        ['CALB2','CYB5B'],
-        ['CALCR','SEPT11'],
-        ['CALCRL','MFSD6'],
-        ['CALD1','GPATCH4'],
-        ['CALD1','MTMR8'],
-        ['CALD1','PDK4'],
-        ['CALML4','CLN6'],
-        ['CALML4','CUX1'],
-        ['CALU','CAP2'],
-        ['CAMK1','SNHG8'],
-        ['CAMK1D','FAM188A'],
-        ['CAMK1D','FUBP1'],
-        ['CAMK1D','TSPAN18'],
-        ['CAMK2A','CD74'],
-        ['CAMK2A','FGFR3'],
-        ['CAMK2A','TNIP1'],
-        ['CAMK2B','SPIDR'],
-        ['CAMK2D','KDR'],
-        ['CAMK2D','SHROOM3'],
-        ['CAMK2D','TLL2'],
-        ['CAMK2G','FAM102A'],
-        ['CAMK2G','NDUFA13'],
-        ['CAMK2G','P4HA1'],
-        ['CAMK4','FHIT'],
-        ['CAMK4','SEMA6A'],
-        ['CAMK4','SFXN1'],
-        ['CAMKK1','MAP2K2'],
-        ['CAMKK2','DIP2B'],
-        ['CAMKK2','HPD'],
-        ['CAMKK2','KDM2B'],
-        ['CAMKK2','NR2C1'],
-        ['CAMKK2','PMCH'],
-        ['CAMKMT','PRRC1'],
-        ['CAMSAP1','NOTCH1'],
-        ['CAMTA1','FOXJ3'],
-        ['CAMTA1','GPATCH3'],
-        ['CAMTA1','MTOR'],
-        ['CAMTA1','PER3'],
-        ['CAMTA1','PGD'],
-        ['CAMTA1','WWTR1'],
-        ['CAMTA2','LCK'],
-        ['CAN','DEK'],
-        ['CAND1','EGFR'],
-        ['CAND1','PPP1R12A'],
-        ['CAND1','PTCHD4'],
-        ['CANT1','DDX5'],
-        ['CANT1','ETV4'],
-        ['CAP1','MACF1'],
-        ['CAP2','CSF1R'],
-        ['CAPG','RBED1'],
-        ['CAPN1','POLA2'],
-        ['CAPN11','CPM'],
-        ['CAPN11','PPM1H'],
-        ['CAPN12','EHD1'],
-        ['CAPN2','SMARCB1'],
-        ['CAPN7','FGD5'],
-        ['CAPRIN1','NSD1'],
-        ['CAPRIN1','PDGFRB'],
-        ['CAPS','CCNG2'],
-        ['CAPS','JMJD2B'],
-        ['CAPZA2','FOXP2'],
-        ['CAPZA2','MET'],
-        ['CAPZB','EEF2'],
-        ['CAPZB','PAFAH2'],
-        ['CAPZB','UBR4'],
-        ['CAPZB','ZC3H12A'],
-        ['CARD17','SIK2'],
-        ['CARD6','CXCL9'],
-        ['CARM1','SMARCA4'],
-        ['CARM1','YIPF2'],
-        ['CARMN','NOTCH1'],
-        ['CARMN','NOTCH2'],
-        ['CARMN','NOTCH3'],
-        ['CARS2','XPO4'],
-        ['CASC1','ETV6'],
-        ['CASC11','PVT1'],
-        ['CASC3','CCDC46'],
-        ['CASC3','RGS9'],
-        ['CASC3','SPOP'],
-        ['CASC3','SUPT6H'],
-        ['CASC3','WIPF2'],
-        ['CASC5','KMT2A'],
-        ['CASC5','MLL'],
-        ['CASC8','FGFR2'],
-        ['CASC8','PDHX'],
-        ['CASC8','PVT1'],
-        ['CASD1','VWC2'],
-        ['CASK','EML4'],
-        ['CASK','SQRDL'],
-        ['CASK','TM9SF2'],
-        ['CASP14','ERN1'],
-        ['CASP7','FGFR2'],
-        ['CASP7','SRGAP1'],
-        ['CASP8AP2','KMT2A'],
-        ['CASP9','FAM210A'],
-        ['CASR','LPP'],
-        ['CASZ1','DFFA'],
-        ['CASZ1','KAZN'],
-        ['CASZ1','MTOR'],
-        ['CASZ1','OBSCN'],
-        ['CASZ1','PRKD2'],
-        ['CAT','HIPK3'],
-        ['CAT','TLK1'],
-        ['CATSPER2','PPIP5K1'],
-        ['CATSPERB','TMEM182'],
-        ['CATSPERD','ILF3'],
-        ['CATSPERG','KCNK6'],
-        ['CAV1','ST7'],
-        ['CAV3','SLC6A11'],
-        ['CBARP','SBNO2'],
-        ['CBFA2T1','CBFA2T3'],
-        ['CBFA2T1','ETV6'],
-        ['CBFA2T1','LAF4'],
-        ['CBFA2T1','MLL'],
-        ['CBFA2T1','RUNX1'],
-        ['CBFA2T2','CHMP4B'],
-        ['CBFA2T2','RUNX1'],
-        ['CBFA2T3','EVI1'],
-        ['CBFA2T3','GALNS'],
-        ['CBFA2T3','GLIS2'],
-        ['CBFA2T3','IGH@'],
-        ['CBFA2T3','KCNIP2'],
-        ['CBFA2T3','MAP4'],
-        ['CBFA2T3','NFIA'],
-        ['CBFA2T3','PAX5'],
-        ['CBFA2T3','PIEZO1'],
-        ['CBFA2T3','RUNX1'],
-        ['CBFB','MYH11'],
-        ['CBFB','RERG'],
-        ['CBL','FBXO2'],
-        ['CBL','KANK1'],
-        ['CBL','KMT2A'],
-        ['CBL','MLL'],
-        ['CBLC','RELB'],
-        ['CBP','MORF'],
-        ['CBP','MOZ'],
-        ['CBS','CHI3L1'],
-        ['CBS','CTSB'],
-        ['CBWD2','DOCK8'],
-        ['CBWD3','PNN'],
-        ['CBX1','LEPREL1'],
-        ['CBX1','RNF169'],
-        ['CBX3','ETV6'],
-        ['CBX5','DCD'],
-        ['CBX5','SMARCD1'],
-        ['CBX5','TFE3'],
-        ['CBX7','ENTHD1'],
-        ['CCAR1','PAM16'],
-        ['CCAR2','CD8A'],
-        ['CCAR2','FGFR2'],
-        ['CCBL1','GLE1'],
-        ['CCDC101','NBPF8'],
-        ['CCDC101','NSMCE1'],
-        ['CCDC102A','ZNF207'],
-        ['CCDC112','CDC25C'],
-        ['CCDC117','HSCB'],
-        ['CCDC117','MELK'],
-        ['CCDC12','SETD2'],
-        ['CCDC122','VPS36'],
-        ['CCDC127','TERT'],
-        ['CCDC127','ZNF235'],
-        ['CCDC129','PTPRG'],
-        ['CCDC130','DOCK6'],
-        ['CCDC132','CDH1'],
-        ['CCDC136','FKBP9L'],
-        ['CCDC142','MRPL53'],
-        ['CCDC148','WFDC10A'],
-        ['CCDC158','SCARB2'],
-        ['CCDC170','ESR1'],
-        ['CCDC170','RARA'],
-        ['CCDC22','KMT2C'],
-        ['CCDC26','NSMCE2'],
-        ['CCDC28A','NUP98'],
-        ['CCDC30','PPCS'],
-        ['CCDC39','GPR162'],
-        ['CCDC43','YBX2'],
-        ['CCDC46','FGFR2'],
-        ['CCDC46','SMURF2'],
-        ['CCDC46','SUPT4H1'],
-        ['CCDC46','TAOK1'],
-        ['CCDC49','USP32'],
-        ['CCDC50','DSCAM'],
-        ['CCDC50','MAP3K13'],
-        ['CCDC50','VPRBP'],
-        ['CCDC57','NKD2'],
-        ['CCDC57','TP53'],
-        ['CCDC6','FGFR2'],
-        ['CCDC6','GOLGA5'],
-        ['CCDC6','HPR'],
-        ['CCDC6','PDGFRB'],
-        ['CCDC6','RET'],
-        ['CCDC6','ROS1'],
-        ['CCDC6','VPS13B'],
-        ['CCDC67','TMEM135'],
-        ['CCDC67','TMEM137'],
-        ['CCDC67','VAV2'],
-        ['CCDC73','GCC2'],
-        ['CCDC81','PICALM'],
-        ['CCDC82','FAM19A2'],
-        ['CCDC85C','SETD3'],
-        ['CCDC86','TMEM192'],
-        ['CCDC88C','NAP1L1'],
-        ['CCDC88C','PDGFRB'],
-        ['CCDC88C','SMEK1'],
-        ['CCDC9','KIAA0134'],
-        ['CCDC91','STK38L'],
-        ['CCKBR','NGLY1'],
-        ['CCL2','MCP1'],
-        ['CCL2','MED1'],
-        ['CCL27','DCP1A'],
-        ['CCL4L2','MYO19'],
-        ['CCM2','OGDH'],
-        ['CCN3','IGH@'],
-        ['CCNA1','ORC4'],
-        ['CCNB1','CDK7'],
-        ['CCNB1','TP53'],
-        ['CCNB1IP1','HMGA2'],
-        ['CCNB1IP1','PLEKHG1'],
-        ['CCNB1IP1','PVT1'],
-        ['CCNC','USP45'],
-        ['CCND1','FGFR3'],
-        ['CCND1','FSTL3'],
-        ['CCND1','IGH@'],
-        ['CCND1','IGHG1'],
-        ['CCND1','IGK@'],
-        ['CCND1','IGL@'],
-        ['CCND1','IGLC1'],
-        ['CCND1','MRCK'],
-        ['CCND1','PLAT'],
-        ['CCND1','PTH'],
-        ['CCND1','TACSTD2'],
-        ['CCND1','TROP2'],
-        ['CCND2','IGH@'],
-        ['CCND2','IGK@'],
-        ['CCND2','IGL@'],
-        ['CCND2','TRA@'],
-        ['CCND2','TRB@'],
-        ['CCND3','FGF11'],
-        ['CCND3','IGH@'],
-        ['CCND3','IGL@'],
-        ['CCND3','KCNMB4'],
-        ['CCND3','UBR2'],
-        ['CCNE1','IGH@'],
-        ['CCNE2','FAM82B'],
-        ['CCNF','PDPK1'],
-        ['CCNG2','G3BP2'],
-        ['CCNG2','GALNS'],
-        ['CCNG2','MAML3'],
-        ['CCNI','CTSZ'],
-        ['CCNI','MALAT1'],
-        ['CCNI','SHROOM3'],
-        ['CCNI','TXLNG2P'],
-        ['CCNK','NPR3'],
-        ['CCNT1','HECTD4'],
-        ['CCNY','WARS'],
-        ['CCNYL1','CREB1'],
-        ['CCNYL1','PLOD2'],
-        ['CCR10','NR1I3'],
-        ['CCR3','DHRS4L2'],
-        ['CCR6','FGFR1'],
-        ['CCR9','SVIP'],
-        ['CCRL2','SFMBT1'],
-        ['CCSER1','FRAS1'],
-        ['CCSER1','MAPK10'],
-        ['CCT2','NUP107'],
-        ['CCT3','PPP2R2B'],
-        ['CD101','SEC31A'],
-        ['CD151','TSPAN4'],
-        ['CD1A','SLAMF1'],
-        ['CD1B','GTF2F2'],
-        ['CD1C','NEK7'],
-        ['CD244','CLK2'],
-        ['CD273','CD274'],
-        ['CD273','CIITA'],
-        ['CD273','RALGDS'],
-        ['CD273','RUNDC2A'],
-        ['CD274','CIITA'],
-        ['CD274','PDCD1LG2'],
-        ['CD28','CKMT2'],
-        ['CD28','CTLA4'],
-        ['CD2AP','MARCH9'],
-        ['CD300A','DHRS2'],
-        ['CD300E','NPC1'],
-        ['CD302','LY75'],
-        ['CD302','MARCH7'],
-        ['CD34','PTN'],
-        ['CD36','ITK'],
-        ['CD37','MAP3K13'],
-        ['CD3D','MLL'],
-        ['CD3D','SIK3'],
-        ['CD4','CHD4'],
-        ['CD4','M6PR'],
-        ['CD4','PTPN6'],
-        ['CD44','EAAT2'],
-        ['CD44','FGFR2'],
-        ['CD44','IGH@'],
-        ['CD44','PDHX'],
-        ['CD44','SLC1A2'],
-        ['CD46','PAQR3'],
-        ['CD46','USH2A'],
-        ['CD48','PARD6B'],
-        ['CD58','COPA'],
-        ['CD63','DPM1'],
-        ['CD70','ETV6'],
-        ['CD74','CRP'],
-        ['CD74','LTF'],
-        ['CD74','NRG1'],
-        ['CD74','NTRK1'],
-        ['CD74','PDGFRB'],
-        ['CD74','ROS1'],
-        ['CD79B','MAP2K4'],
-        ['CD81','SPAG6'],
-        ['CD81','TSSC4'],
-        ['CD83','JARID2'],
-        ['CD9','CDKN1A'],
-        ['CD9','STAT2'],
-        ['CDADC1','GORASP2'],
-        ['CDC14B','HLX'],
-        ['CDC16','GPATCH11'],
-        ['CDC16','UPF3A'],
-        ['CDC2L1','SLC35E2'],
-        ['CDC42BPA','RASAL1'],
-        ['CDC42BPA','WWOX'],
-        ['CDC42BPB','PET112'],
-        ['CDC42BPB','SYNJ2BP'],
-        ['CDC42BPB','ZFYVE1'],
-        ['CDC42BPG','MAPKAPK2'],
-        ['CDC42EP1','FGFR1'],
-        ['CDC42EP2','NFAT5'],
-        ['CDC42EP2','POLA2'],
-        ['CDC42SE1','PIP5K1A'],
-        ['CDC42SE2','FAM114A2'],
-        ['CDC42SE2','TRDMT1'],
-        ['CDC6','CDK12'],
-        ['CDC6','IKZF3'],
-        ['CDC6','PML'],
-        ['CDC7','LRIG1'],
-        ['CDC73','FAM172A'],
-        ['CDCA5','PHLDB1'],
-        ['CDCA5','SEPT6'],
-        ['CDH1','CIRH1A'],
-        ['CDH1','TANGO6'],
-        ['CDH10','PI4KA'],
-        ['CDH11','COL1A1'],
-        ['CDH11','OMD'],
-        ['CDH11','THRAP3'],
-        ['CDH11','UBFD1'],
-        ['CDH11','USP6'],
-        ['CDH11','ZNF9'],
-        ['CDH17','FGFR2'],
-        ['CDH17','SLCO2B1'],
-        ['CDH23','KLK5'],
-        ['CDH4','TRIO'],
-        ['CDH6','PDCD6IP'],
-        ['CDHR1','WAPL'],
-        ['CDHR2','CLTB'],
-        ['CDK1','WDR11'],
-        ['CDK11A','GNB1'],
-        ['CDK12','CLCN4'],
-        ['CDK12','FBXL20'],
-        ['CDK12','GRB7'],
-        ['CDK12','LASP1'],
-        ['CDK12','MED1'],
-        ['CDK12','MIEN1'],
-        ['CDK12','MSL1'],
-        ['CDK12','PPM1E'],
-        ['CDK12','RECQL4'],
-        ['CDK12','SMG6'],
-        ['CDK12','SYNRG'],
-        ['CDK13','DIP2C'],
-        ['CDK13','PDE1C'],
-        ['CDK13','POU6F2'],
-        ['CDK13','RALA'],
-        ['CDK13','TAX1BP1'],
-        ['CDK14','MKLN1'],
-        ['CDK14','PRKCZ'],
-        ['CDK14','TFEC'],
-        ['CDK16','USP11'],
-        ['CDK17','ELK3'],
-        ['CDK17','KCNC2'],
-        ['CDK19','LYZ'],
-        ['CDK19','PRDM1'],
-        ['CDK19','REV3L'],
-        ['CDK19','SYNJ2'],
-        ['CDK2','IKZF1'],
-        ['CDK2','PAN2'],
-        ['CDK2','RAB5B'],
-        ['CDK2AP1','ETV6'],
-        ['CDK4','MDM2'],
-        ['CDK4','SUDS3'],
-        ['CDK4','TSFM'],
-        ['CDK4','TSPAN31'],
-        ['CDK5RAP2','MEGF9'],
-        ['CDK5RAP2','PDGFRA'],
-        ['CDK6','EVI1'],
-        ['CDK6','FAM133B'],
-        ['CDK6','FN1'],
-        ['CDK6','GATAD1'],
-        ['CDK6','HEPACAM2'],
-        ['CDK6','IGH@'],
-        ['CDK6','IGK@'],
-        ['CDK6','IGL@'],
-        ['CDK6','KMT2A'],
-        ['CDK6','METTL12'],
-        ['CDK6','MLL'],
-        ['CDK6','MLLT10'],
-        ['CDK6','PIM3'],
-        ['CDK6','PPM1H'],
-        ['CDK6','RPSA'],
-        ['CDK6','STXBP6'],
-        ['CDK6','TAF1D'],
-        ['CDK6','TCP1'],
-        ['CDK6','TLX3'],
-        ['CDK8','CDX2'],
-        ['CDK8','GTF2F2'],
-        ['CDK8','IKZF3'],
-        ['CDK8','UVRAG'],
-        ['CDKAL1','E2F3'],
-        ['CDKAL1','EGFR'],
-        ['CDKAL1','RANBP9'],
-        ['CDKL1','FOXN3'],
-        ['CDKL1','TSEN2'],
-        ['CDKL2','COMMD9'],
-        ['CDKL2','CXCL11'],
-        ['CDKL2','G3BP2'],
-        ['CDKL2','ULK4'],
-        ['CDKN1A','RAB44'],
-        ['CDKN1B','ETV6'],
-        ['CDKN2A','FAM230A'],
-        ['CDKN2A','FOXJ3'],
-        ['CDKN2A','TRA@'],
-        ['CDKN2AIP','SYNE1'],
-        ['CDKN2B','DGKD'],
-        ['CDKN2B','RPS2'],
-        ['CDKN2B-AS1','MTAP'],
-        ['CDKN2BAS','MTAP'],
-        ['CDKN2D','WDFY2'],
-        ['CDR2','RRN3P3'],
-        ['CDS1','CDS1'],
-        ['CDS1','RPLP0'],
-        ['CDX1','IRF2BP2'],
-        ['CDX2','ETV6'],
-        ['CDYL','FARS2'],
-        ['CDYL','RERE'],
-        ['CDYL2','PLXNA4'],
-        ['CEACAM8','RELB'],
-        ['CEACAM8','SIRT2'],
-        ['CEACAMP1','DIS3L'],
-        ['CEBPA','IGH@'],
-        ['CEBPB','IGH@'],
-        ['CEBPD','IGH@'],
-        ['CEBPE','IGH@'],
-        ['CEBPE','TRA@'],
-        ['CEBPG','IGH@'],
-        ['CEBPZ','EIF2AK2'],
-        ['CEL','CELP'],
-        ['CEL','NTRK1'],
-        ['CELF1','DDIAS'],
-        ['CELF5','ESPL1'],
-        ['CELSR1','SNAP29'],
-        ['CELSR3','IP6K1'],
-        ['CENPE','SLC9B2'],
-        ['CENPK','KMT2A'],
-        ['CENPK','LGR5'],
-        ['CENPK','MLL'],
-        ['CEP1','FGFR1'],
-        ['CEP110','FGFR1'],
-        ['CEP120','CSNK1G3'],
-        ['CEP128','NOTCH2'],
-        ['CEP152','IQGAP1'],
-        ['CEP164','MLLT10'],
-        ['CEP170','PRKACB'],
-        ['CEP170','RAD51B'],
-        ['CEP170B','KMT2A'],
-        ['CEP250','ZMYND8'],
-        ['CEP290','PRKDC'],
-        ['CEP55','PIK3C2G'],
-        ['CEP55','RET'],
-        ['CEP57','NAT10'],
-        ['CEP57L1','SRPK1'],
-        ['CEP72','FNTA'],
-        ['CEP76','RUNX1'],
-        ['CEP85','TMPRSS2'],
-        ['CEP85L','PDGFRB'],
-        ['CEP85L','ROS1'],
-        ['CERS2','PIGC'],
-        ['CERS5','TMEM136'],
-        ['CES1P2','ZNF317'],
-        ['CEV14','PDGFRB'],
-        ['CFB','ERBB2'],
-        ['CFHR2','CFHR5'],
-        ['CFLAR-AS1','ORC6'],
-        ['CFTR','SND1'],
-        ['CGA','ZFYVE9'],
-        ['CGNL1','CYP19A1'],
-        ['CHAF1A','SH3GL1'],
-        ['CHAF1A','SHD'],
-        ['CHCHD10','FGA'],
-        ['CHCHD2','HES1'],
-        ['CHCHD5','GUSBP3'],
-        ['CHCHD7','CTNNB1'],
-        ['CHCHD7','PLAG1'],
-        ['CHD1','FRAP1'],
-        ['CHD1','MTOR'],
-        ['CHD1','RUNX1'],
-        ['CHD2','SLCO3A1'],
-        ['CHD3','DNAH2'],
-        ['CHD3','SHBG'],
-        ['CHD4','EP300'],
-        ['CHD4','GPX3'],
-        ['CHD4','ZNF384'],
-        ['CHD6','STK35'],
-        ['CHD7','IGF1R'],
-        ['CHD7','PVT1'],
-        ['CHD7','RAB2A'],
-        ['CHD7','TOX'],
-        ['CHD9','CRLF3'],
-        ['CHD9','TOX3'],
-        ['CHDC2','MAP3K8'],
-        ['CHEK1','EXOC6'],
-        ['CHEK1','NTM'],
-        ['CHEK2','KIAA1984'],
-        ['CHEK2','MPG'],
-        ['CHEK2','PPP2R2A'],
-        ['CHEK2','PPP2RA'],
-        ['CHEK2','THOC5'],
-        ['CHEK2','XBP1'],
-        ['CHERP','SLMO2'],
-        ['CHFR','PAX5'],
-        ['CHFR','SMARCD1'],
-        ['CHGA','FGFR2'],
-        ['CHGA','MAPKAPK2'],
-        ['CHGB','KMT2C'],
-        ['CHGB','MLL3'],
-        ['CHGN','PSD3'],
-        ['CHI3L1','GFAP'],
-        ['CHIA','ZNF138'],
-        ['CHIC1','MACROD1'],
-        ['CHIC2','ETV6'],
-        ['CHIC2','FIP1L1'],
-        ['CHIC2','PDGFRA'],
-        ['CHID1','CORO7'],
-        ['CHID1','MAGMAS'],
-        ['CHKA','PTK2'],
-        ['CHMP1A','ZC3H18'],
-        ['CHMP2B','ZNF197'],
-        ['CHMP3','PIGF'],
-        ['CHMP4B','PTPN1'],
-        ['CHN','EWS'],
-        ['CHN','RBP56'],
-        ['CHN1','TAF15'],
-        ['CHN1','ZNF384'],
-        ['CHN2','RALY'],
-        ['CHN2','TSPAN33'],
-        ['CHOP','EWS'],
-        ['CHOP','FUS'],
-        ['CHOP','TLS'],
-        ['CHPF','CPNE5'],
-        ['CHPT1','MED13L'],
-        ['CHPT1','UTP20'],
-        ['CHRM1','MRPS28'],
-        ['CHRNA1','SPIRE1'],
-        ['CHRNA6','POMK'],
-        ['CHRNG','PTBP3'],
-        ['CHST11','FAM70A'],
-        ['CHST11','IGH@'],
-        ['CHST3','PTCH2'],
-        ['CHTOP','FGFR1'],
-        ['CHTOP','INTS3'],
-        ['CHTOP','NTRK1'],
-        ['CIB2','PEAK1'],
-        ['CIC','DUX4'],
-        ['CIC','DUX4L1'],
-        ['CIC','FOXO4'],
-        ['CIC','LEUTX'],
-        ['CIC','NUTM1'],
-        ['CIC','NUTM2A'],
-        ['CICP6','EIF4E3'],
-        ['CICP6','HTR1F'],
-        ['CIDEB','NOP9'],
-        ['CIITA','DEXI'],
-        ['CIITA','FLJ27352'],
-        ['CIITA','PDCD1LG2'],
-        ['CIITA','RALGDS'],
-        ['CIITA','RUNDC2A'],
-        ['CIP29','KMT2A'],
-        ['CIP29','MLL'],
-        ['CIRH1A','TMCO7'],
-        ['CIT','ETV6'],
-        ['CIT','ETV7'],
-        ['CIT','FAM222A'],
-        ['CIT','FGFR2'],
-        ['CIT','RFC5'],
-        ['CITED1','HDAC8'],
-        ['CITED1','PC'],
-        ['CITED2','PRDM10'],
-        ['CITED2','VGLL2'],
-        ['CKLF','CMTM4'],
-        ['CKM','PRKD2'],
-        ['CKS1B','SHC1'],
-        ['CLASP1','DTNB'],
-        ['CLASP1','INHBB'],
-        ['CLASRP','SYMPK'],
-        ['CLCA2','RUNX1'],
-        ['CLCC1','KIAA0391'],
-        ['CLCF1','POLD4'],
-        ['CLCN3','NEK1'],
-        ['CLCN4','IPO9'],
-        ['CLCN6','RAF1'],
-        ['CLCN7','CRAMP1L'],
-        ['CLDN10','DNAJC3'],
-        ['CLDN6','PKMYT1'],
-        ['CLDN7','CUX1'],
-        ['CLDN7','SLC34A2'],
-        ['CLDN9','THOC6'],
-        ['CLEC16A','EMP2'],
-        ['CLEC16A','TXNDC11'],
-        ['CLEC17A','TBC1D15'],
-        ['CLEC19A','ST6GAL1'],
-        ['CLEC4D','CLEC6A'],
-        ['CLEC4E','ZNF765'],
-        ['CLEC7A','SUPT5H'],
-        ['CLHC1','TREML3P'],
-        ['CLIC4','DNAJC8'],
-        ['CLIC4','PLOD1'],
-        ['CLIC4','SRRM1'],
-        ['CLIC5','HNF1A'],
-        ['CLIC5','RAI1'],
-        ['CLIC5','SCO1'],
-        ['CLIC5','SUPT3H'],
-        ['CLIC5','TRIO'],
-        ['CLIP1','ERC1'],
-        ['CLIP1','KIAA1598'],
-        ['CLIP1','PWWP2A'],
-        ['CLIP1','ROS1'],
-        ['CLIP1','TNIK'],
-        ['CLIP1','TPM3'],
-        ['CLIP2','FGFR2'],
-        ['CLIP2','FOXK2'],
-        ['CLIP2','GTF2I'],
-        ['CLIP2','MET'],
-        ['CLIP4','EPHB4'],
-        ['CLIP4','MCFD2'],
-        ['CLIP4','SAP130'],
-        ['CLIP4','VSNL1'],
-        ['CLK2','MARS'],
-        ['CLK2','PPP1R12B'],
-        ['CLK2','RBM19'],
-        ['CLN5','FBXL3'],
-        ['CLNK','TRIO'],
-        ['CLOCK','SCFD2'],
-        ['CLOCK','TMEM165'],
-        ['CLP1','MLLT10'],
-        ['CLPTM1L','GLIS3'],
-        ['CLPTM1L','SERBP1'],
-        ['CLSTN1','KAZN'],
-        ['CLSTN1','STOX1'],
-        ['CLSTN2','FSD1'],
-        ['CLTA','UBE2R2'],
-        ['CLTC','JAK1'],
-        ['CLTC','MLL'],
-        ['CLTC','MYO1D'],
-        ['CLTC','PPP1R9B'],
-        ['CLTC','ROS1'],
-        ['CLTC','TEX14'],
-        ['CLTC','TFE3'],
-        ['CLTC','TFEB'],
-        ['CLTC','TMEM49'],
-        ['CLTC','VMP1'],
-        ['CLU','DIS3L'],
-        ['CLU','MYH14'],
-        ['CLU','NRG1'],
-        ['CLVS1','PVT1'],
-        ['CLVS2','MAP3K5'],
-        ['CMAHP','MLL'],
-        ['CMAS','PIK3C2G'],
-        ['CMIP','DYNLRB2'],
-        ['CMKOR1','COX6C'],
-        ['CMKOR1','HMGA2'],
-        ['CMKOR1','NFIB'],
-        ['CMPK2','ZNF90'],
-        ['CMTM7','GLB1'],
-        ['CMTM8','RAF1'],
-        ['CMYA5','MIIP'],
-        ['CNBP','USP6'],
-        ['CNGB1','KIFC3'],
-        ['CNIH','MPP7'],
-        ['CNIH2','RPS6KB2'],
-        ['CNIH4','ERBB2'],
-        ['CNIH4','PAK1'],
-        ['CNKSR3','IPCEF1'],
-        ['CNN3','IGH@'],
-        ['CNNM2','SUFU'],
-        ['CNNM3','RNF138'],
-        ['CNNM4','CTDSP2'],
-        ['CNNM4','PARD3B'],
-        ['CNOT2','PTK7'],
-        ['CNOT2','WT1'],
-        ['CNOT6L','FRAS1'],
-        ['CNPY3','TPO'],
-        ['CNRIP1','DHX57'],
-        ['CNTN1','PDZRN4'],
-        ['CNTN1','USP15'],
-        ['CNTN2','DYRK2'],
-        ['CNTN4','SATB1'],
-        ['CNTN5','RAB3C'],
-        ['CNTN6','EPHA6'],
-        ['CNTNAP2','CUL1'],
-        ['CNTNAP2','GCFC2'],
-        ['CNTNAP2','KIAA2013'],
-        ['CNTNAP2','SORL1'],
-        ['CNTNAP2','UBE3C'],
-        ['CNTRL','FGFR1'],
-        ['COBL','ELMO1'],
-        ['COBL','GLI3'],
-        ['COBL','SEPT14'],
-        ['COG3','GPC6'],
-        ['COG5','HMGA2'],
-        ['COG6','MAPK8'],
-        ['COG8','TMED6'],
-        ['COL10A1','HIPK1'],
-        ['COL12A1','COL4A5'],
-        ['COL12A1','GRM1'],
-        ['COL14A1','DEPTOR'],
-        ['COL14A1','FAM84B'],
-        ['COL14A1','FGFR2'],
-        ['COL14A1','MTSS1'],
-        ['COL14A1','SKAP1'],
-        ['COL15A1','TGFBR1'],
-        ['COL17A1','PTEN'],
-        ['COL1A1','HSP90AB1'],
-        ['COL1A1','PDGFB'],
-        ['COL1A1','PEAK1'],
-        ['COL1A1','PIKFYVE'],
-        ['COL1A1','PPP2R2C'],
-        ['COL1A1','USP6'],
-        ['COL1A2','EXPH5'],
-        ['COL1A2','MAPK10'],
-        ['COL1A2','MMP14'],
-        ['COL1A2','PDGFB'],
-        ['COL1A2','PLAG1'],
-        ['COL22A1','FAM135B'],
-        ['COL23A1','TKT'],
-        ['COL25A1','NFKB2'],
-        ['COL26A1','YES1'],
-        ['COL2A1','HAPLN1'],
-        ['COL3A1','PSMC5'],
-        ['COL4A1','FAM155A'],
-        ['COL4A2','FAM155A'],
-        ['COL4A6','USP20'],
-        ['COL5A1','GAPVD1'],
-        ['COL6A3','CSF1'],
-        ['COL8A2','EPHA10'],
-        ['COL9A2','RLF'],
-        ['COL9A3','ELK3'],
-        ['COL9A3','MAN2A2'],
-        ['COLCA2','NAA20'],
-        ['COLEC10','TAF2'],
-        ['COLEC10','TNFRSF11B'],
-        ['COLQ','HACL1'],
-        ['COMMD1','EHBP1'],
-        ['COMMD10','SEMA6A'],
-        ['COMT','GAPDH'],
-        ['COMT','MED15'],
-        ['COPG1','RASA2'],
-        ['COPS4','SNRNP25'],
-        ['COQ10A','NINJ2'],
-        ['COQ10A','USP5'],
-        ['COQ6','MAST2'],
-        ['CORO1C','VEZT'],
-        ['CORO7','VPS13D'],
-        ['COX4I2','ERBB3'],
-        ['COX5A','EDC3'],
-        ['COX5A','PARP16'],
-        ['COX6C','HMGA2'],
-        ['COX6C','HMGIC'],
-        ['COX6C','LAPTM4B'],
-        ['COX6C','PCBD2'],
-        ['COX7A1','ZNF790'],
-        ['COX7B2','SLC30A9'],
-        ['COX8C','IAPP'],
-        ['CPA2','FAM69B'],
-        ['CPD','ERBB2'],
-        ['CPD','PXT1'],
-        ['CPD','TAOK1'],
-        ['CPEB1','GOLGA6L17P'],
-        ['CPLX2','MAP3K1'],
-        ['CPLX2','UBXD8'],
-        ['CPM','LEMD3'],
-        ['CPM','LYZ'],
-        ['CPM','MDM2'],
-        ['CPM','PDZRN4'],
-        ['CPM','PRKAA2'],
-        ['CPM','RAP1B'],
-        ['CPM','STAT6'],
-        ['CPN1','PKD2L1'],
-        ['CPN2','PTPRC'],
-        ['CPNE1','PI3'],
-        ['CPNE1','PREX1'],
-        ['CPNE2','NFATC3'],
-        ['CPNE4','LLGL2'],
-        ['CPNE4','STK36'],
-        ['CPNE8','RPAP3'],
-        ['CPNE8','RUNX1'],
-        ['CPPED1','GNPTAB'],
-        ['CPPED1','NUP153'],
-        ['CPQ','PRKDC'],
-        ['CPS1','WNT10B'],
-        ['CPSF3L','EPHB2'],
-        ['CPSF3L','TWIST2'],
-        ['CPSF4L','ERBB4'],
-        ['CPSF6','FGFR1'],
-        ['CPSF6','KCNMB4'],
-        ['CPT1A','HRASLS2'],
-        ['CPT1A','RPS4XP19'],
-        ['CPT1C','JAZF1'],
-        ['CR848007.2','LEFTY2'],
-        ['CRABP2','RNF146'],
-        ['CRB1','NEK7'],
-        ['CRCP','TPST1'],
-        ['CREB1','EWS'],
-        ['CREB1','EWSR1'],
-        ['CREB1','PARD3B'],
-        ['CREB1','TMEM131'],
-        ['CREB3L1','EWSR1'],
-        ['CREB3L1','EWS'],
-        ['CREB3L1','FUS'],
-        ['CREB3L1','HNRNPA1'],
-        ['CREB3L1','STIP1'],
-        ['CREB3L2','EWSR1'],
-        ['CREB3L3','EWSR1'],
-        ['CREB3L2','FUS'],
-        ['CREB3L2','PPARG'],
-        ['CREB3L4','CRTC2'],
-        ['CREB5','CWC27'],
-        ['CREB5','FGFR2'],
-        ['CREB5','KALRN'],
-        ['CREB5','KCNH2'],
-        ['CREBBP','DEXI'],
-        ['CREBBP','EP300'],
-        ['CREBBP','ETV6'],
-        ['CREBBP','KAT6A'],
-        ['CREBBP','KMT2A'],
-        ['CREBBP','MEFV'],
-        ['CREBBP','MLL'],
-        ['CREBBP','MORF'],
-        ['CREBBP','MYST3'],
-        ['CREBBP','MYST4'],
-        ['CREBBP','NCOA2'],
-        ['CREBBP','RUNXBP2'],
-        ['CREBBP','SLX4'],
-        ['CREBBP','TFAP4'],
-        ['CREBBP','TRAP1'],
-        ['CREBBP','ZNF384'],
-        ['CREG2','TLK1'],
-        ['CREM','EWSR1'],
-        ['CREM','FUS'],
-        ['CRHR1','EPOR'],
-        ['CRHR1','KANSL1'],
-        ['CRHR1','SWSAP1'],
-        ['CRHR1-IT1','EPOR'],
-        ['CRHR1-IT1','SWSAP1'],
-        ['CRHR1-IT1_','EPOR'],
-        ['CRKL','KLHL22'],
-        ['CRKL','MAPK1'],
-        ['CRKRS','FBXL20'],
-        ['CRKRS','TMEM104'],
-        ['CRLF2','CSF2RA'],
-        ['CRLF2','IGH@'],
-        ['CRLF2','IGHD'],
-        ['CRLF2','IGHM'],
-        ['CRLF2','P2RY8'],
-        ['CRLF3','SUZ12'],
-        ['CRLS1','KCNK17'],
-        ['CRLS1','PFN1'],
-        ['CRLS1','ZFAT'],
-        ['CROCC','NBPF1'],
-        ['CRTAC1','EXOSC1'],
-        ['CRTC1','KLHL26'],
-        ['CRTC1','MAML1'],
-        ['CRTC1','MAML2'],
-        ['CRTC1','SS18'],
-        ['CRTC3','MAML2'],
-        ['CRYBB1','PLA2G6'],
-        ['CRYBB2','KIAA1671'],
-        ['CRYL1','PSPC1'],
-        ['CRYL1','USP31'],
-        ['CS','STAT6'],
-        ['CSAG1','F8'],
-        ['CSB','ERCC6'],
-        ['CSDE1','FAR2P3'],
-        ['CSF1','S100A10'],
-        ['CSF1','TRIM63'],
-        ['CSF1R','IGF2R'],
-        ['CSF1R','MEF2D'],
-        ['CSF1R','PDGFRB'],
-        ['CSF1R','PGC'],
-        ['CSF1R','RBM6'],
-        ['CSF1R','SSBP2'],
-        ['CSF1R','TBL1XR1'],
-        ['CSF2RA','IGH@'],
-        ['CSF2RA','IGHD'],
-        ['CSF2RA','IGHM'],
-        ['CSF2RA','IL9R'],
-        ['CSGALNACT2','RET'],
-        ['CSGALNACT2','SLC16A9'],
-        ['CSMD1','PRKDC'],
-        ['CSMD2','TMEM222'],
-        ['CSMD3','MYC'],
-        ['CSMD3','SAMD12'],
-        ['CSNK1A1','PDE6A'],
-        ['CSNK1A1','SCGB3A2'],
-        ['CSNK1D','PGC'],
-        ['CSNK1D','SCPEP1'],
-        ['CSNK1D','SECTM1'],
-        ['CSNK1D','ST6GALNAC1'],
-        ['CSNK1E','DMC1'],
-        ['CSNK1G1','DPYD'],
-        ['CSNK1G1','INTS2'],
-        ['CSNK1G1','MBOAT2'],
-        ['CSNK1G1','ZNF609'],
-        ['CSNK1G2','GANAB'],
-        ['CSNK1G2','HSD17B13'],
-        ['CSNK1G2','PDE5A'],
-        ['CSNK1G2-AS1','LPCAT2'],
-        ['CSNK2A1','DDX39B'],
-        ['CSNK2A1','SNRPB'],
-        ['CT45A2','KMT2A'],
-        ['CT45A2','MLL'],
-        ['CTAGE5','GEMIN2'],
-        ['CTAGE5','KHDRBS3'],
-        ['CTAGE5','PSMA3'],
-        ['CTAGE5','SIP1'],
-        ['CTC1','TMEM117'],
-        ['CTCF','NFATC3'],
-        ['CTCF','PARD6A'],
-        ['CTCF','SLC7A6'],
-        ['CTCF','ZDHHC1'],
-        ['CTDSP2','DCUN1D4'],
-        ['CTDSP2','MARS'],
-        ['CTDSP2','MON2'],
-        ['CTDSP2','RAP1B'],
-        ['CTDSP2','SLC6A15'],
-        ['CTDSP2','XRCC6BP1'],
-        ['CTGLF10P','PFKM'],
-        ['CTL4','NEU1'],
-        ['CTNNA1','JMJD1B'],
-        ['CTNNA3','FGFR2'],
-        ['CTNNB1','FGFR2'],
-        ['CTNNB1','GSN'],
-        ['CTNNB1','LIFR'],
-        ['CTNNB1','PLAG1'],
-        ['CTNNB1','ULK4'],
-        ['CTNNBIP1','TRIT1'],
-        ['CTNNBL1','VSTM2L'],
-        ['CTNND1','TMEM135'],
-        ['CTNND2','NRBP1'],
-        ['CTPS2','SEC31A'],
-        ['CTSB','EIF2AK1'],
-        ['CTSB','EIF4A2'],
-        ['CTSB','PXK'],
-        ['CTSC','RAB38'],
-        ['CTSD','JUP'],
-        ['CTSD','KRT19'],
-        ['CTSF','PRSS44'],
-        ['CTSLP5','RCOR2'],
-        ['CTSZ','KRT19'],
-        ['CTTN','ERBB2'],
-        ['CTTNBP2','ST7'],
-        ['CTTNBP2','ST7-AS1'],
-        ['CTTNBP2','ST7-OT4'],
-        ['CTXN3','PITPNM2'],
-        ['CUL1','DPP6'],
-        ['CUL4A','GRK1'],
-        ['CUL4B','DAPK2'],
-        ['CUTA','SLC22A1'],
-        ['CUX1','FGFR1'],
-        ['CUX1','MAP2K1'],
-        ['CUX1','NUTM1'],
-        ['CUX1','PRKRIP1'],
-        ['CUX1','RET'],
-        ['CUX1','ZNF398'],
-        ['CUX2','ZNF140'],
-        ['CWC22','MAP4K3'],
-        ['CWC22','WNK1'],
-        ['CWC25','PIP4K2B'],
-        ['CWC25','USP32'],
-        ['CXCL11','ZZZ3'],
-        ['CXCL17','PSG3'],
-        ['CXCL9','SOD1'],
-        ['CXCR4','MAML2'],
-        ['CXCR4','UBXN4'],
-        ['CXCR4','ZEB2'],
-        ['CXCR7','HMGA2'],
-        ['CXORF15','SYAP1'],
-        ['CXORF21','SORT1'],
-        ['CXORF25','IL2RG'],
-        ['CXORF40A','IDS'],
-        ['CXORF67','MBTD1'],
-        ['CYB561D2','PBRM1'],
-        ['CYB5R1','NUAK2'],
-        ['CYB5R3','FDCSP'],
-        ['CYHR1','SEPT9'],
-        ['CYP11A1','TFE3'],
-        ['CYP19A1','SCARB2'],
-        ['CYP19A1','TMOD3'],
-        ['CYP19A1','TRPM7'],
-        ['CYP1A2','POLR2G'],
-        ['CYP21A','CYP21B'],
-        ['CYP21A2','IDI1'],
-        ['CYP2A6','PAK4'],
-        ['CYP2C19','FAM190B'],
-        ['CYP2C19','SNX9'],
-        ['CYP2E1','FGA'],
-        ['CYP2U1','PERLD1'],
-        ['CYP39A1','EIF3K'],
-        ['CYP4F35P','IFFO1'],
-        ['CYP4X1','CYP4Z2P'],
-        ['CYP51A1','GBAS'],
-        ['CYTH1','EIF3H'],
-        ['CYTH1','EXOC7'],
-        ['CYTH1','PRPSAP1'],
-        ['CYTH3','PKN3'],
-        ['CYTIP','ERMN'],
-        ['CYTIP','PMP22'],
-        ['CYTSB','PDGFRB'],
-        ['D10S170','PDGFRB'],
-        ['D10S170','RET'],
-        ['D2HGDH','GAL3ST2'],
-        ['DA750114','TRBC2'],
-        ['DAAM2','SLC6A6'],
-        ['DAB1','RYR3'],
-        ['DAB2','ESR1'],
-        ['DAB2','FRYL'],
-        ['DAB2IP','HCFC1R1'],
-        ['DAB2IP','KMT2A'],
-        ['DAB2IP','MLL'],
-        ['DAB2IP','SUSD1'],
-        ['DACH1','PAX5'],
-        ['DACH2','PAX5'],
-        ['DAPK1','KCTD2'],
-        ['DAPK1','TRIM52'],
-        ['DAPK3','FERMT1'],
-        ['DAZ4','MAP4K1'],
-        ['DAZAP1','DYM'],
-        ['DAZAP1','MEF2D'],
-        ['DAZAP2','LOC57228'],
-        ['DAZL','RAF1'],
-        ['DBN1','GRK6'],
-        ['DBNDD1','NAT8L'],
-        ['DBX1','PAX5'],
-        ['DCAF6','MPZL1'],
-        ['DCAF8','UHMK1'],
-        ['DCBLD2','STXBP5L'],
-        ['DCC','IGF1R'],
-        ['DCC','ROCK1'],
-        ['DCC','SLIT3'],
-        ['DCC','SYNJ2'],
-        ['DCK','FRAS1'],
-        ['DCLK1','ELF1'],
-        ['DCLK1','SERPINE3'],
-        ['DCLK2','UST'],
-        ['DCN','LRRC8A'],
-        ['DCP1A','MLL'],
-        ['DCP2','HIF1A'],
-        ['DCP2','IGH@'],
-        ['DCP2','UBR1'],
-        ['DCPS','KMT2A'],
-        ['DCPS','MLL'],
-        ['DCPS','ST3GAL4'],
-        ['DCST2','PMVK'],
-        ['DCTD','ECE2'],
-        ['DCUN1D1','MCCC1'],
-        ['DCUN1D4','RAB3IP'],
-        ['DCUN1D4','SCN2A'],
-        ['DDAH1','SRPK1'],
-        ['DDHD2','NAT1'],
-        ['DDIT2','FUS'],
-        ['DDIT3','ERG'],
-        ['DDIT3','EWS'],
-        ['DDIT3','EWSR1'],
-        ['DDIT3','FEV'],
-        ['DDIT3','FUS'],
-        ['DDIT3','GLI1'],
-        ['DDIT3','MARS'],
-        ['DDR1','GFAP'],
-        ['DDR1','PAK1'],
-        ['DDR2','FMO4'],
-        ['DDR2','TRABD'],
-        ['DDX10','HOXA11'],
-        ['DDX10','HOXA13'],
-        ['DDX10','HOXA9'],
-        ['DDX10','HOXC11'],
-        ['DDX10','HOXD11'],
-        ['DDX10','HOXD13'],
-        ['DDX10','NUP98'],
-        ['DDX10','PMX1'],
-        ['DDX10','RAP1GDS1'],
-        ['DDX10','TOP1'],
-        ['DDX11L16','MMP23A'],
-        ['DDX19A','SPATA31D1'],
-        ['DDX19B','SF3B3'],
-        ['DDX20','TBX15'],
-        ['DDX21','MRPS18C'],
-        ['DDX3X','DEFB127'],
-        ['DDX3X','MLLT10'],
-        ['DDX3X','PRKD1'],
-        ['DDX42','MAP3K3'],
-        ['DDX42','RPS6KB1'],
-        ['DDX47','RUNX1'],
-        ['DDX5','DEPDC6'],
-        ['DDX5','DEPTOR'],
-        ['DDX5','ETV4'],
-        ['DDX5','IQCG'],
-        ['DDX5','KLK2'],
-        ['DDX5','LINC00511'],
-        ['DDX5','SRSF1'],
-        ['DDX55','GTF2H3'],
-        ['DDX6','FOXR1'],
-        ['DDX6','IGH@'],
-        ['DEFB103B','PRKDC'],
-        ['DEFB112','NOMO3'],
-        ['DEGS2','IGHV@'],
-        ['DEK','NUP214'],
-        ['DEK','SET'],
-        ['DENND1A','ZCCHC7'],
-        ['DENND1B','ZCCHC7'],
-        ['DENND1C','SURF1'],
-        ['DENND2A','GTF2IRD1'],
-        ['DENND2A','HIPK2'],
-        ['DENND2C','HIPK1'],
-        ['DENND3','LPCAT1'],
-        ['DENND3','PTK2'],
-        ['DENND5B','NUP54'],
-        ['DEPDC1B','ELOVL7'],
-        ['DEPDC1B','PDE4D'],
-        ['DEPDC7','NR3C2'],
-        ['DEPTOR','TATDN1'],
-        ['DERL1','TSC1'],
-        ['DGAT2','WASH7P'],
-        ['DGCR8','MAGED4B'],
-        ['DGKB','MAPK9'],
-        ['DGKB','MIPOL1'],
-        ['DGKB','SNX13'],
-        ['DGKD','SPP2'],
-        ['DGKG','SPERT'],
-        ['DGKH','ZFAND3'],
-        ['DGKI','EPHA5'],
-        ['DGKI','PTN'],
-        ['DHCR24','MFSD4'],
-        ['DHFR','PABPC1'],
-        ['DHH','RHEBL1'],
-        ['DHODH','NDUFAB1'],
-        ['DHPS','SMARCA4'],
-        ['DHRS11','GGNBP2'],
-        ['DHRS4','STEAP4'],
-        ['DHRS7C','POTEA'],
-        ['DHX30','RNASEH2B'],
-        ['DHX35','FAM83D'],
-        ['DHX35','ITCH'],
-        ['DHX35','LPAR1'],
-        ['DHX37','NCOR2'],
-        ['DHX57','MAP4K3'],
-        ['DHX57','TMEM178'],
-        ['DHX8','ETV4'],
-        ['DHX9','NPL'],
-        ['DHX9','USP25'],
-        ['DIAPH3','RPS6KB1'],
-        ['DIDO1','KIAA0406'],
-        ['DIDO1','TTI1'],
-        ['DIEXF','SYT14'],
-        ['DIP2B','LINC00330'],
-        ['DIP2B','TAF8'],
-        ['DIP2B','TMBIM6'],
-        ['DIP2C','LARGE'],
-        ['DIP2C','PARD3'],
-        ['DIP2C','PDGFRA'],
-        ['DIP2C','ZMYND11'],
-        ['DIRAS3','GNLY'],
-        ['DIRC2','TIA1'],
-        ['DIRC3','HSPBAP1'],
-        ['DISC1','DISC1FP1'],
-        ['DISC1','OBSCN'],
-        ['DISP1','SNX5'],
-        ['DKFZP586P0123','SHANK2'],
-        ['DLEC1','ODZ4'],
-        ['DLEU2','NDFIP2'],
-        ['DLEU2','PSPC1'],
-        ['DLEU2','RNASEH2B'],
-        ['DLG1','PAK2'],
-        ['DLG1','PRKCI'],
-        ['DLG2','KPNA1'],
-        ['DLG2','UNC45B'],
-        ['DLGAP1','GRLF1'],
-        ['DLK2','PTK7'],
-        ['DMBX1','MAST2'],
-        ['DMC1','KRT18P40'],
-        ['DMD','IL1RAPL1'],
-        ['DMD','SSR1'],
-        ['DMD','TAB3'],
-        ['DMGDH','JMY'],
-        ['DMKN','LGI4'],
-        ['DMRT1','RFX3'],
-        ['DMRT3','FBXO4'],
-        ['DMRTA2','PAX5'],
-        ['DNAH11','LANCL2'],
-        ['DNAH11','RAPGEF5'],
-        ['DNAH5','TRIO'],
-        ['DNAH6','LRRC8A'],
-        ['DNAH9','MAP2K4'],
-        ['DNAH9','RABEP1'],
-        ['DNAJA2','NETO2'],
-        ['DNAJB1','PRKACA'],
-        ['DNAJC13','ZNF212'],
-        ['DNAJC18','SIL1'],
-        ['DNAJC2','POLR2J2'],
-        ['DNAJC3','RNASEH2B-AS1'],
-        ['DNAJC5','XKR7'],
-        ['DNAJC5','ZBTB46'],
-        ['DNAJC6','PDE1C'],
-        ['DNAJC6','ROR1'],
-        ['DNAJC7','ERBB2'],
-        ['DNAL4','PTRH2'],
-        ['DNASE1L3','PATL1'],
-        ['DND1','WDR55'],
-        ['DNER','ELL2'],
-        ['DNER','PSMD1'],
-        ['DNM1P46','ZKSCAN1'],
-        ['DNM2','NMRK2'],
-        ['DNMBP','TACC2'],
-        ['DNMT1','KEAP1'],
-        ['DNMT3B','MDM4'],
-        ['DOCK1','DPCD'],
-        ['DOCK1','STK32C'],
-        ['DOCK11','THOC2'],
-        ['DOCK5','STARD3'],
-        ['DOCK6','RAVER1'],
-        ['DOCK6','ULK2'],
-        ['DOCK8','JAK2'],
-        ['DOCK9','STK24'],
-        ['DOK5','STARD3'],
-        ['DOT1L','HES6'],
-        ['DPF2','METTL12'],
-        ['DPF2','POLA2'],
-        ['DPH7','PNPLA7'],
-        ['DPM1','GRID1'],
-        ['DPM1','MTMR2'],
-        ['DPP3','PPP6R3'],
-        ['DPP4','PDK1'],
-        ['DPP9','PPP6R3'],
-        ['DPY19L2','PPFIA2'],
-        ['DPY19L2','PPM1H'],
-        ['DPY19L2','TUBA1A'],
-        ['DPYS','RIMS2'],
-        ['DPYS','SSR1'],
-        ['DPYSL2','GFAP'],
-        ['DROSHA','NRBP1'],
-        ['DSCAM','DYRK1A'],
-        ['DSCAM','RUNX1'],
-        ['DSCAML1','FXYD2'],
-        ['DSCAML1','KMT2A'],
-        ['DSCR3','FBLN7'],
-        ['DSE','FHL5'],
-        ['DSP','RREB1'],
-        ['DSP','STK24'],
-        ['DSTYK','NAV1'],
-        ['DSTYK','NUCKS1'],
-        ['DSTYK','PIGK'],
-        ['DSTYK','PIK3C2B'],
-        ['DSTYK','THSD4'],
-        ['DTD1','PDGFRB'],
-        ['DTD1','RRBP1'],
-        ['DTNB','FARP2'],
-        ['DTNB','SPTLC1'],
-        ['DTNB','VEGFA'],
-        ['DTNBP1','FRK'],
-        ['DUS2L','PSKH1'],
-        ['DUSP10','PRDM16'],
-        ['DUSP10','TSPAN15'],
-        ['DUSP22','IGH@'],
-        ['DUSP22','PTK7'],
-        ['DUX4','ERG'],
-        ['DUX4','EWSR1'],
-        ['DUX4','IGH@'],
-        ['DVL2','TFE3'],
-        ['DXO','SHISA5'],
-        ['DYDC2','TSPAN14'],
-        ['DYM','MYO5B'],
-        ['DYNC1H1','SIAE'],
-        ['DYNC1I1','IMMP2L'],
-        ['DYNC1LI1','GADL1'],
-        ['DYNLL1','SMS'],
-        ['DYRK1A','ERG'],
-        ['DYRK1A','HUNK'],
-        ['DYRK1A','KDM4B'],
-        ['DYRK1A','RUNX1'],
-        ['DYRK1A','TTC3'],
-        ['DYRK1A','ZNF709'],
-        ['DYRK2','HMGA2'],
-        ['DYRK2','PKP1'],
-        ['DYRK2','SMS'],
-        ['DYX1C1','SGK3'],
-        ['DZIP1','GPR180'],
-        ['E1AF','EWS'],
-        ['E1AF','EWSR1'],
-        ['E2A','HLF'],
-        ['E2A','PBX1'],
-        ['E2A','TFPT'],
-        ['E2F1','TAT'],
-        ['E2F3','ER'],
-        ['E2F3','LINC00340'],
-        ['E2F5','FER1L6'],
-        ['E2F6','STK36'],
-        ['E2F7','NAV3'],
-        ['E4F1','RAB26'],
-        ['EAPP','REST'],
-        ['EBF','HMGA2'],
-        ['EBF1','ETV6'],
-        ['EBF1','FBXL17'],
-        ['EBF1','FEM1C'],
-        ['EBF1','HMGA2'],
-        ['EBF1','IGH@'],
-        ['EBF1','JAK2'],
-        ['EBF1','KCNN2'],
-        ['EBF1','LOC204010'],
-        ['EBF1','PDGFR'],
-        ['EBF1','PDGFRB'],
-        ['EBF1','PVT1'],
-        ['EBF3','TSPAN15'],
-        ['ECE2','PAK2'],
-        ['ECHDC1','FYN'],
-        ['ECT2','KALRN'],
-        ['EDIL3','MKLN1'],
-        ['EEF1A1','TG'],
-        ['EEF1A1','VIM'],
-        ['EEF1D','NAPRT1'],
-        ['EEF1D','SDC4'],
-        ['EEF1DP3','FRY'],
-        ['EEF1E1','RREB1'],
-        ['EEF2','ENHO'],
-        ['EEF2K','KIAA0430'],
-        ['EEF2K','NUP210L'],
-        ['EEFSEC','KMT2A'],
-        ['EEFSEC','MLL'],
-        ['EEN','MLL'],
-        ['EEN','SH3GL1'],
-        ['EFCAB3','RPS6KB1'],
-        ['EFCAB4A','WDTC1'],
-        ['EFCAB5','KSR1'],
-        ['EFCAB6','SREBF2'],
-        ['EFNA1','PVT1'],
-        ['EFNA3','PIK3C2G'],
-        ['EFNA5','PCDHB7'],
-        ['EFTUD1','IGF1R'],
-        ['EFTUD2','KIF18B'],
-        ['EFTUD2','NAGLU'],
-        ['EGF','FN1'],
-        ['EGFL6','RAB9A'],
-        ['EGFR','ERP44'],
-        ['EGFR','FANCC'],
-        ['EGFR','FKBP9L'],
-        ['EGFR','GASP'],
-        ['EGFR','GNS'],
-        ['EGFR','IGH@'],
-        ['EGFR','KIAA0573'],
-        ['EGFR','LANCL2'],
-        ['EGFR','MDM2'],
-        ['EGFR','PDE1C'],
-        ['EGFR','PDGFC'],
-        ['EGFR','POLD1'],
-        ['EGFR','PPARGC1A'],
-        ['EGFR','PSPH'],
-        ['EGFR','SDK1'],
-        ['EGFR','SEC61G'],
-        ['EGFR','SEPT14'],
-        ['EGFR','VOPP1'],
-        ['EGFR','VSTM2A'],
-        ['EGFR','WIF1'],
-        ['EGLN1','RBBP9'],
-        ['EHBP1','NRF1'],
-        ['EHF','NFIA'],
-        ['EHMT2','SLC44A4'],
-        ['EHMT2','SRPK1'],
-        ['EIF1AX','GLIS2'],
-        ['EIF1B','SRPK1'],
-        ['EIF2AK3','PIEZO1'],
-        ['EIF2AK3','PRKD3'],
-        ['EIF2AK4','EPB42'],
-        ['EIF2AK4','PKM'],
-        ['EIF2C2','PTK2'],
-        ['EIF2C3','THRAP3'],
-        ['EIF2C3','ZP2'],
-        ['EIF2S1','RBM25'],
-        ['EIF3A','SFXN4'],
-        ['EIF3D','TXN2'],
-        ['EIF3E','RSPO2'],
-        ['EIF3E','RSPO3'],
-        ['EIF3H','FAM65C'],
-        ['EIF3H','MRPS28'],
-        ['EIF3H','NUDCD1'],
-        ['EIF3H','TPD52'],
-        ['EIF3H','TRPS1'],
-        ['EIF4A1','PHOSPHO1'],
-        ['EIF4A2','MECOM'],
-        ['EIF4A3','TSPEAR'],
-        ['EIF4E1B','MTMR12'],
-        ['EIF4E2','HJURP'],
-        ['EIF4E3','FOXP1'],
-        ['EIF4E3','IQSEC1'],
-        ['EIF4ENIF1','TEX14'],
-        ['EIF4G2','NFATC3'],
-        ['EIF4G2','NUCB2'],
-        ['EIF4G3','GNL2'],
-        ['EIF4G3','MAN1C1'],
-        ['EIF4G3','SESN2'],
-        ['EIF4G3','ZNF683'],
-        ['EIF4H','GTF2I'],
-        ['EIF5','MARK3'],
-        ['EIF5A','HMGN2'],
-        ['ELAVL1','FASN'],
-        ['ELAVL1','TYK2'],
-        ['ELAVL2','IFT74'],
-        ['ELAVL2','PLGRKT'],
-        ['ELAVL3','FGFR3'],
-        ['ELF1','ROCK1'],
-        ['ELF3','RNPEP'],
-        ['ELF4','ERG'],
-        ['ELF4','FUS'],
-        ['ELF4','HERPUD1'],
-        ['ELF4','NDRG1'],
-        ['ELF5','ZFPM2'],
-        ['ELK1','GPRC5A'],
-        ['ELK4','ERG'],
-        ['ELK4','ETV1'],
-        ['ELK4','REPIN1'],
-        ['ELK4','SLC45A3'],
-        ['ELKS','RET'],
-        ['ELL','EPS15'],
-        ['ELL','HNRNPD'],
-        ['ELL','KMT2A'],
-        ['ELL','MLL'],
-        ['ELMO1','ETV6'],
-        ['ELMO1','NLK'],
-        ['ELMO2','RAE1'],
-        ['ELMOD1','LTB4R2'],
-        ['ELMOD3','RSAD2'],
-        ['ELN','ETV6'],
-        ['ELN','PAX5'],
-        ['ELOVL2','MED29'],
-        ['ELOVL4','USP15'],
-        ['ELOVL5','PMP22'],
-        ['ELOVL6','POMK'],
-        ['EMB','S100A13'],
-        ['EMID2','GGCT'],
-        ['EML1','EVL'],
-        ['EML1','RAGE'],
-        ['EML4','NTRK3'],
-        ['EML5','HMGA2'],
-        ['EMP1','RPS24'],
-        ['EMP3','IFT52'],
-        ['EMR1','TP53'],
-        ['ENAH','MLL'],
-        ['ENL','MLL'],
-        ['ENO1','ERBB2'],
-        ['ENO1','PDK4'],
-        ['ENOPH1','MRPS18C'],
-        ['ENOPH1','TSNAX'],
-        ['ENOSF1','YES1'],
-        ['ENOX1','TYRO3'],
-        ['ENOX2','ODZ1'],
-        ['ENPP1','TESK2'],
-        ['ENPP2','PLEC'],
-        ['ENPP2','PLEC1'],
-        ['ENTPD1','PDLIM1'],
-        ['ENTPD1','RNASEH2B'],
-        ['ENTPD3','RBCK1'],
-        ['ENTPD4','PSD3'],
-        ['ENTPD5','FAM161B'],
-        ['ENTPD7','IDE'],
-        ['EP300','KAT6A'],
-        ['EP300','KMT2A'],
-        ['EP300','MLL'],
-        ['EP300','MYST3'],
-        ['EP300','RUNXBP2'],
-        ['EP300','ZNF384'],
-        ['EP400','PHF1'],
-        ['EP400','TRIT1'],
-        ['EP400','YEATS4'],
-        ['EPB41L2','OSTM1'],
-        ['EPB41L2','PTPRK'],
-        ['EPB41L2','TBCB'],
-        ['EPB41L5','PCDP1'],
-        ['EPB41L5','ZDHHC5'],
-        ['EPC1','PHF1'],
-        ['EPC2','MORC1'],
-        ['EPC2','MORC1-AS1'],
-        ['EPC2','SYNCRIP'],
-        ['EPHA1','USP32'],
-        ['EPHA2','FBXO42'],
-        ['EPHA2','HCK'],
-        ['EPHA2','PREX1'],
-        ['EPHA3','LCLAT1'],
-        ['EPHA3','LRRFIP2'],
-        ['EPHA4','POU2F1'],
-        ['EPHA5','HOXB6'],
-        ['EPHA5','MGA'],
-        ['EPHA6','PPM1D'],
-        ['EPHA6','TMEM39A'],
-        ['EPHA7','MYH11'],
-        ['EPHA7','NDE1'],
-        ['EPHA7','NPDC1'],
-        ['EPHA7','PIGH'],
-        ['EPHB1','GMPS'],
-        ['EPHB1','MOBKL1B'],
-        ['EPHB1','STAG2'],
-        ['EPHB2','NBPF3'],
-        ['EPHB2','NTRK1'],
-        ['EPHB2','PDZD4'],
-        ['EPHB3','PAX2'],
-        ['EPHB3','PGC'],
-        ['EPHB4','PGC'],
-        ['EPOR','FGFR2'],
-        ['EPOR','IGH@'],
-        ['EPOR','IGHV3-73'],
-        ['EPOR','IGHV@'],
-        ['EPOR','IGK@'],
-        ['EPOR','LAIR1'],
-        ['EPS15','KMT2A'],
-        ['EPS15','MLL'],
-        ['EPS15','MTA1'],
-        ['EPS8L1','OGFR'],
-        ['EPT1','GUCY1A3'],
-        ['EPYC','UHRF1BP1'],
-        ['ERBB','IKZF2'],
-        ['ERBB','NRG1'],
-        ['ERBB2','FKBP10'],
-        ['ERBB2','GPATCH8'],
-        ['ERBB2','GRB7'],
-        ['ERBB2','GTF2E2'],
-        ['ERBB2','IFLTD1'],
-        ['ERBB2','IFT20'],
-        ['ERBB2','IGH@'],
-        ['ERBB2','IGHG1'],
-        ['ERBB2','IKZF3'],
-        ['ERBB2','JUP'],
-        ['ERBB2','KRT20'],
-        ['ERBB2','KRT39'],
-        ['ERBB2','KRTAP1-4'],
-        ['ERBB2','LTBP4'],
-        ['ERBB2','MED1'],
-        ['ERBB2','MTSS1'],
-        ['ERBB2','MUC6'],
-        ['ERBB2','NOS2'],
-        ['ERBB2','PARN'],
-        ['ERBB2','PPP1R1B'],
-        ['ERBB2','PSMB3'],
-        ['ERBB2','RARA'],
-        ['ERBB2','SDK2'],
-        ['ERBB2','SHC1'],
-        ['ERBB2','SLC29A3'],
-        ['ERBB2','SMIM18'],
-        ['ERBB2','SPTBN2'],
-        ['ERBB2','SRCIN1'],
-        ['ERBB2','TADA2A'],
-        ['ERBB2','WIPF2'],
-        ['ERBB4','EZR'],
-        ['ERBB4','FN1'],
-        ['ERBB4','IKZF1'],
-        ['ERBB4','IKZF2'],
-        ['ERBB4','PHLDA3'],
-        ['ERC1','EZR'],
-        ['ERC1','PDGFRB'],
-        ['ERC1','PIK3C2G'],
-        ['ERC1','RET'],
-        ['ERC1','ROS1'],
-        ['ERC1','WNK1'],
-        ['ERCC2','KLC3'],
-        ['ERCC2','MARK4'],
-        ['ERCC2','POU6F2'],
-        ['ERF','GSK3A'],
-        ['ERG','ERG'],
-        ['ERG','ETV1'],
-        ['ERG','ETV4'],
-        ['ERG','ETV5'],
-        ['ERG','EWS'],
-        ['ERG','EWSR1'],
-        ['ERG','FEV'],
-        ['ERG','FKBP5'],
-        ['ERG','FUS'],
-        ['ERG','HERPUD1'],
-        ['ERG','IFNGR2'],
-        ['ERG','KCNJ6'],
-        ['ERG','NDRG1'],
-        ['ERG','NR4A3'],
-        ['ERG','PTEN'],
-        ['ERG','SLC45A3'],
-        ['ERG','SPINK1'],
-        ['ERG','TLS'],
-        ['ERG','TMPRSS2'],
-        ['ERG','ZNF278'],
-        ['ERLIN2','FGFR1'],
-        ['ERN1','ST14'],
-        ['ERO1A','FERMT2'],
-        ['ERO1L','FERMT2'],
-        ['ERP44','MRPL50'],
-        ['ERRFI1','SSR2'],
-        ['ERVK-28','FGFR1'],
-        ['ERVK3-1','FGFR1'],
-        ['ERVK3-1','LINC00208'],
-        ['ERVW-1','FGFR1'],
-        ['ERVW-1','IGH@'],
-        ['ERVWE1','IGH@'],
-        ['ESAM','MSANTD2'],
-        ['ESCO2','PTK2B'],
-        ['ESD','TDRD3'],
-        ['ESPN','ZBTB48'],
-        ['ESR1','GNAS'],
-        ['ESR1','LATS1'],
-        ['ESR1','MYB'],
-        ['ESR1','NCOA2'],
-        ['ESR1','NCOA3'],
-        ['ESR1','PCDH11X'],
-        ['ESR1','POLH'],
-        ['ESR1','SOX9'],
-        ['ESR1','USP25'],
-        ['ESR1','UTRN'],
-        ['ESR1','YAP1'],
-        ['ESRP1','RAF1'],
-        ['ESRP2','SCARB2'],
-        ['ESRRB','PAX5'],
-        ['ESRRG','SMYD3'],
-        ['EST14','ETV1'],
-        ['ESYT1','FN3K'],
-        ['ETNK1','IFT81'],
-        ['ETO','RUNX1'],
-        ['ETO2','GLIS2'],
-        ['ETS1','IGH@'],
-        ['ETV1','EWS'],
-        ['ETV1','EWSR1'],
-        ['ETV1','FOXA1'],
-        ['ETV1','FOXP1'],
-        ['ETV1','FUBP1'],
-        ['ETV1','HERVK'],
-        ['ETV1','HERVK17'],
-        ['ETV1','HMGN2P46'],
-        ['ETV1','HNRNPA2B1'],
-        ['ETV1','HNRPA2B1'],
-        ['ETV1','KLK2'],
-        ['ETV1','MIPOL1'],
-        ['ETV1','OR51E2'],
-        ['ETV1','SLC45A3'],
-        ['ETV1','SNURF'],
-        ['ETV1','TMPRSS2'],
-        ['ETV4','EWS'],
-        ['ETV4','EWSR1'],
-        ['ETV4','HERVK17'],
-        ['ETV4','KLK2'],
-        ['ETV4','NCOA2'],
-        ['ETV4','SLC45A3'],
-        ['ETV4','STAT3'],
-        ['ETV4','TMPRSS2'],
-        ['ETV4','UBTF'],
-        ['ETV5','SCL45A3'],
-        ['ETV5','SLC45A3'],
-        ['ETV5','TMPRSS2'],
-        ['ETV6','EVI1'],
-        ['ETV6','FACL6'],
-        ['ETV6','FGFR3'],
-        ['ETV6','FLT3'],
-        ['ETV6','FOXP1'],
-        ['ETV6','GOT1'],
-        ['ETV6','GSX2'],
-        ['ETV6','H4'],
-        ['ETV6','HCMOGT-1'],
-        ['ETV6','HIP1'],
-        ['ETV6','HLXB9'],
-        ['ETV6','IGH@'],
-        ['ETV6','IGK@'],
-        ['ETV6','IKZF1'],
-        ['ETV6','INO80D'],
-        ['ETV6','ITK'],
-        ['ETV6','ITPR2'],
-        ['ETV6','JAK2'],
-        ['ETV6','KIAA1257'],
-        ['ETV6','LOH12CR1'],
-        ['ETV6','LPXN'],
-        ['ETV6','LRP6'],
-        ['ETV6','LYN'],
-        ['ETV6','MDS2'],
-        ['ETV6','MECOM'],
-        ['ETV6','MN1'],
-        ['ETV6','MNX1'],
-        ['ETV6','MSH6'],
-        ['ETV6','MST2'],
-        ['ETV6','NA'],
-        ['ETV6','NCOA2'],
-        ['ETV6','NELL2'],
-        ['ETV6','NID1'],
-        ['ETV6','NIN'],
-        ['ETV6','NIPBL'],
-        ['ETV6','NTRK2'],
-        ['ETV6','NTRK3'],
-        ['ETV6','PAX5'],
-        ['ETV6','PCM1'],
-        ['ETV6','PDE4DIP'],
-        ['ETV6','PDGFRA'],
-        ['ETV6','PDGFRB'],
-        ['ETV6','PDZD7'],
-        ['ETV6','PER1'],
-        ['ETV6','PEX5'],
-        ['ETV6','PMEL'],
-        ['ETV6','PML'],
-        ['ETV6','PRDM16'],
-        ['ETV6','PTPRO'],
-        ['ETV6','PTPRR'],
-        ['ETV6','QSOX1'],
-        ['ETV6','RAB5EP'],
-        ['ETV6','RNU6-19P'],
-        ['ETV6','RPN1'],
-        ['ETV6','RUNX1'],
-        ['ETV6','SENP7'],
-        ['ETV6','SLC15A5'],
-        ['ETV6','STL'],
-        ['ETV6','SYK'],
-        ['ETV6','SYN1'],
-        ['ETV6','TRIP11'],
-        ['ETV6','TTL'],
-        ['ETV6','YTHDF2'],
-        ['ETV6','ZNF521'],
-        ['ETV7','GTF2I'],
-        ['EU154352','PLXNA2'],
-        ['EVC2','STK32B'],
-        ['EVI1','MDS1'],
-        ['EVI1','NRIP1'],
-        ['EVI1','PRDM16'],
-        ['EVI1','RPN1'],
-        ['EVI1','RUNX1'],
-        ['EVI2A','KDM2A'],
-        ['EVL','LCK'],
-        ['EVX1','RUNX1'],
-        ['EWS','FEV'],
-        ['EWS','FIL1'],
-        ['EWS','FLI1'],
-        ['EWS','NR4A3'],
-        ['EWS','POU5F1'],
-        ['EWS','SP3'],
-        ['EWS','TEC'],
-        ['EWS','UQCRH'],
-        ['EWS','WT1'],
-        ['EWS','ZNF278'],
-        ['EWS','ZSG'],
-        ['EWSR1','FEV'],
-        ['EWSR1','FLI1'],
-        ['EWSR1','FUS'],
-        ['EWSR1','KLF17'],
-        ['EWSR1','NF2'],
-        ['EWSR1','NFATC1'],
-        ['EWSR1','NFATC2'],
-        ['EWSR1','NR4A3'],
-        ['EWSR1','PATZ1'],
-        ['EWSR1','PBX1'],
-        ['EWSR1','PBX3'],
-        ['EWSR1','POU5F1'],
-        ['EWSR1','SMAD3'],
-        ['EWSR1','SMARCA5'],
-        ['EWSR1','SP3'],
-        ['EWSR1','TAF15'],
-        ['EWSR1','WT1'],
-        ['EWSR1','YY1'],
-        ['EWSR1','ZNF278'],
-        ['EWSR1','ZNF384'],
-        ['EWSR1','ZNF444'],
-        ['EXD1','INO80'],
-        ['EXOC1','GABRR3'],
-        ['EXOC1','PDGFRA'],
-        ['EXOC3L2','LIPE'],
-        ['EXOC3L2','PLAUR'],
-        ['EXOC4','PVT1'],
-        ['EXOC4','WDR64'],
-        ['EXOC6B','RALGPS1'],
-        ['EXOD1','IQCK'],
-        ['EXT1','PLA2G2A'],
-        ['EYA2','NCOA3'],
-        ['EYS','LMBRD1'],
-        ['EYS','PHF3'],
-        ['EYS','SCARB2'],
-        ['EYS','SH3BGRL2'],
-        ['EZR','GOPC'],
-        ['EZR','HLA-A'],
-        ['EZR','LRIG3'],
-        ['EZR','MYO5A'],
-        ['EZR','PPFIBP1'],
-        ['EZR','ROS1'],
-        ['F13A1','PRPF4B'],
-        ['F13A1','TRIB3'],
-        ['FAAH','HSPB11'],
-        ['FABP3','ZCCHC17'],
-        ['FAF1','OSBPL9'],
-        ['FAF1','SIKE1'],
-        ['FAF1','SLC2A1'],
-        ['FAF1','TAS1R2'],
-        ['FAF1','UBE4B'],
-        ['FAHD1','NUDT16L1'],
-        ['FAM102A','PTGES2'],
-        ['FAM107A','TEX264'],
-        ['FAM107B','FRMD4A'],
-        ['FAM109A','SSH1'],
-        ['FAM110A','TLK2'],
-        ['FAM111A','MYB'],
-        ['FAM117A','LGALS9'],
-        ['FAM117A','RUNX1'],
-        ['FAM119B','MAPK1'],
-        ['FAM119B','METTL1'],
-        ['FAM119B','SRGAP1'],
-        ['FAM120AOS','PTCH1'],
-        ['FAM120C','PAGE1'],
-        ['FAM125B','SPTLC1'],
-        ['FAM129C','PGLS'],
-        ['FAM132A','RLF'],
-        ['FAM133A','ZNF845'],
-        ['FAM135A','PKIB'],
-        ['FAM13A','MAPK10'],
-        ['FAM13A-AS1','HERC3'],
-        ['FAM13C','SUFU'],
-        ['FAM155A','MAPK1'],
-        ['FAM155A','WNK1'],
-        ['FAM156B','RPS6KA3'],
-        ['FAM157B','FBXO25'],
-        ['FAM159A','ZCCHC11'],
-        ['FAM161B','PCM1'],
-        ['FAM162A','KMO'],
-        ['FAM163B','TMEM185AP1'],
-        ['FAM167B','FAM222B'],
-        ['FAM168A','MARK2'],
-        ['FAM168A','SLC43A1'],
-        ['FAM172A','PDE4D'],
-        ['FAM172A','PPP2R2B'],
-        ['FAM175A','PI4KA'],
-        ['FAM179A','PSPC1'],
-        ['FAM180B','TRIM60'],
-        ['FAM186B','NUDT3'],
-        ['FAM188B','STEAP4'],
-        ['FAM188B','VWC2'],
-        ['FAM190A','FRAS1'],
-        ['FAM190A','MAPK10'],
-        ['FAM193A','FITM2'],
-        ['FAM198B','TMEM144'],
-        ['FAM19A2','SRGAP1'],
-        ['FAM19A2','STRBP'],
-        ['FAM19A2','ZNF462'],
-        ['FAM201A','PRKCDBP'],
-        ['FAM204A','PARS2'],
-        ['FAM20B','RALGPS2'],
-        ['FAM20B','SAMD7'],
-        ['FAM20B','UNC5A'],
-        ['FAM20C','MKRN1'],
-        ['FAM211B','FIGN'],
-        ['FAM21C','POTEC'],
-        ['FAM222A','MVK'],
-        ['FAM222A','SIRT4'],
-        ['FAM222B','NEK8'],
-        ['FAM228B','TP53I3'],
-        ['FAM22A','YWHAE'],
-        ['FAM22B','YWHAE'],
-        ['FAM23A','MRC1'],
-        ['FAM26D','RWDD1'],
-        ['FAM33A','MYO1D'],
-        ['FAM47E','SHROOM3'],
-        ['FAM48A','SLC45A3'],
-        ['FAM49B','PSKH2'],
-        ['FAM53B','SLC7A10'],
-        ['FAM5C','PLA2G4A'],
-        ['FAM62B','PTPRN2'],
-        ['FAM65B','VPS54'],
-        ['FAM66C','TRIM42'],
-        ['FAM69B','MOB2'],
-        ['FAM70B','GAS6'],
-        ['FAM71C','SCYL2'],
-        ['FAM71D','MPP5'],
-        ['FAM71F1','SEPT14'],
-        ['FAM83B','ICK'],
-        ['FAM83D','ZNF807'],
-        ['FAM83F','GDAP1L1'],
-        ['FAM84B','FGFR2'],
-        ['FAM84B','PTK2'],
-        ['FAM86C2P','SSBP3'],
-        ['FAM90A21P','IFNG'],
-        ['FAM91A1','ZNF343'],
-        ['FAM92B','PTTG1IP'],
-        ['FANCD2','PRKCD'],
-        ['FANCD2OS','PRKCD'],
-        ['FARS2','RUNX1'],
-        ['FARSA','ZNF564'],
-        ['FAS','PTEN'],
-        ['FASN','RGPD2'],
-        ['FASN','SGMS1'],
-        ['FBLN1','PDGFRB'],
-        ['FBLN2','HDAC11'],
-        ['FBLN5','MARK3'],
-        ['FBN3','POLR2A'],
-        ['FBP17','MLL'],
-        ['FBRS','ZNF771'],
-        ['FBRSL1','PAX5'],
-        ['FBRSL1','TMTC3'],
-        ['FBXL15','TREML1'],
-        ['FBXL17','PJA2'],
-        ['FBXL18','RNF216'],
-        ['FBXL20','GDPD5'],
-        ['FBXL20','MIEN1'],
-        ['FBXL20','MYO1D'],
-        ['FBXL20','NOTCH2'],
-        ['FBXL20','NSF'],
-        ['FBXL20','RARA'],
-        ['FBXL20','SIRT6'],
-        ['FBXL20','SNF8'],
-        ['FBXL20','TLK2'],
-        ['FBXL20','TOM1L1'],
-        ['FBXL7','TRIO'],
-        ['FBXL7','UHMK1'],
-        ['FBXO11','MAP2K5'],
-        ['FBXO21','TESC'],
-        ['FBXO28','MLLT4'],
-        ['FBXO3','RDH13'],
-        ['FBXO38','TRIM40'],
-        ['FBXO42','RUNX1'],
-        ['FBXO45','PLGLA'],
-        ['FBXO7','PPIL2'],
-        ['FBXW7','MLL3'],
-        ['FBXW8','ULK1'],
-        ['FCGR2B','IGH@'],
-        ['FCHO1','MYO9B'],
-        ['FCHSD2','MAP3K3'],
-        ['FCN1','KIAA1217'],
-        ['FCRL4','IGH@'],
-        ['FCRL4','IGHA1'],
-        ['FDCSP','MGP'],
-        ['FDFT1','FZD3'],
-        ['FEM1C','SEMA6A'],
-        ['FER','ITK'],
-        ['FER','MAN2A1'],
-        ['FER1L6','RAD21'],
-        ['FER1L6-AS2','PVT1'],
-        ['FEV','FUS'],
-        ['FGA','FTL'],
-        ['FGB','MAT1A'],
-        ['FGB','ORM1'],
-        ['FGD3','TYK2'],
-        ['FGD4','LRRK2'],
-        ['FGD4','SP1'],
-        ['FGF12','IL1RAP'],
-        ['FGF19','SPTBN2'],
-        ['FGF3','RBM14'],
-        ['FGF3','RBM4'],
-        ['FGF3','SHANK2'],
-        ['FGF5','HLA-DRB1'],
-        ['FGFR1','FGFR1'],
-        ['FGFR1','FGFR1OP'],
-        ['FGFR1','FGFR1OP1'],
-        ['FGFR1','FGFR1OP2'],
-        ['FGFR1','FN1'],
-        ['FGFR1','FOP'],
-        ['FGFR1','FOXO1'],
-        ['FGFR1','FSIP1'],
-        ['FGFR1','GPR124'],
-        ['FGFR1','HERVK'],
-        ['FGFR1','HOOK3'],
-        ['FGFR1','IGFBP5'],
-        ['FGFR1','KAT6B'],
-        ['FGFR1','LRRFIP1'],
-        ['FGFR1','MTERF4'],
-        ['FGFR1','MYO18A'],
-        ['FGFR1','NTM'],
-        ['FGFR1','NUP358'],
-        ['FGFR1','NUP98'],
-        ['FGFR1','PLAG1'],
-        ['FGFR1','RAB11FIP1'],
-        ['FGFR1','RAD23A'],
-        ['FGFR1','RANBP2'],
-        ['FGFR1','RHOT1'],
-        ['FGFR1','SLC20A2'],
-        ['FGFR1','SQSTM1'],
-        ['FGFR1','TACC1'],
-        ['FGFR1','TIAF1'],
-        ['FGFR1','TIF1'],
-        ['FGFR1','TPR'],
-        ['FGFR1','TRIM24'],
-        ['FGFR1','WHSC1L1'],
-        ['FGFR1','WNK1'],
-        ['FGFR1','ZMYM2'],
-        ['FGFR1','ZNF198'],
-        ['FGFR1','ZNF577'],
-        ['FGFR1','ZNF703'],
-        ['FGFR1','ZNF791'],
-        ['FGFR1OP1','RET'],
-        ['FGFR2','FGFR2'],
-        ['FGFR2','G3BP2'],
-        ['FGFR2','GLB1L2'],
-        ['FGFR2','KCNH7'],
-        ['FGFR2','KCTD1'],
-        ['FGFR2','KIAA1217'],
-        ['FGFR2','KIAA1598'],
-        ['FGFR2','KIAA1967'],
-        ['FGFR2','KIF14'],
-        ['FGFR2','KLRAQ1'],
-        ['FGFR2','LAMC1'],
-        ['FGFR2','LINC01153'],
-        ['FGFR2','MAN2B2'],
-        ['FGFR2','MGEA5'],
-        ['FGFR2','MRPL13'],
-        ['FGFR2','MTSS1'],
-        ['FGFR2','MYH9'],
-        ['FGFR2','NCALD'],
-        ['FGFR2','NOL4'],
-        ['FGFR2','NPM1'],
-        ['FGFR2','NRAP'],
-        ['FGFR2','NRBF2'],
-        ['FGFR2','NSMCE4A'],
-        ['FGFR2','OFD1'],
-        ['FGFR2','OPTN'],
-        ['FGFR2','PKM'],
-        ['FGFR2','PPAPDC1A'],
-        ['FGFR2','PPHLN1'],
-        ['FGFR2','PVT1'],
-        ['FGFR2','RABGAP1L'],
-        ['FGFR2','RASAL2'],
-        ['FGFR2','ROCK1'],
-        ['FGFR2','SHC2'],
-        ['FGFR2','SLC45A3'],
-        ['FGFR2','SNX19'],
-        ['FGFR2','TACC2'],
-        ['FGFR2','TACC3'],
-        ['FGFR2','TFEC'],
-        ['FGFR2','TXLNA'],
-        ['FGFR2','ULK4'],
-        ['FGFR2','USP10'],
-        ['FGFR2','VCL'],
-        ['FGFR2','WARS'],
-        ['FGFR2','WDR11'],
-        ['FGFR2','ZMYM4'],
-        ['FGFR3','IGH@'],
-        ['FGFR3','IGHG1'],
-        ['FGFR3','IGK@'],
-        ['FGFR3','IGL@'],
-        ['FGFR3','IRF4'],
-        ['FGFR3','IRTA1'],
-        ['FGFR3','JAKMIP1'],
-        ['FGFR3','PAX5'],
-        ['FGFR3','TACC3'],
-        ['FGFR3','TNIP2'],
-        ['FGFR3','TPRG1'],
-        ['FGFR3','WHSC1'],
-        ['FGFR4','ZNF346'],
-        ['FGGY','TESK2'],
-        ['FGR','WASF2'],
-        ['FHIT','HMGA2'],
-        ['FHIT','MACROD2'],
-        ['FIBCD1','TTLL11'],
-        ['FIG','ROS1'],
-        ['FIG4','SEC63'],
-        ['FIGLA','MAP4K3'],
-        ['FIGN','STK25'],
-        ['FIGNL1','VOPP1'],
-        ['FILIP1','PTPRK'],
-        ['FIP1L1','PDGFRA'],
-        ['FIP1L1','RARA'],
-        ['FKBP15','PAX5'],
-        ['FKBP15','RET'],
-        ['FKBP15','SLC31A1'],
-        ['FKBP5','TMPRSS2'],
-        ['FKBP8','SLC1A6'],
-        ['FKBPL','UCHL5'],
-        ['FKHR','PAX3'],
-        ['FKHR','PAX7'],
-        ['FLI1','FLI1'],
-        ['FLI1','SCL45A3'],
-        ['FLI1','TCF3'],
-        ['FLJ10661','THADA'],
-        ['FLJ22447','PRKCH'],
-        ['FLNA','KMT2A'],
-        ['FLNA','MLL'],
-        ['FLNB','LGALS12'],
-        ['FLNB','PXK'],
-        ['FLT1','IRS2'],
-        ['FLT1','LHFP'],
-        ['FLT1','OLFM4'],
-        ['FLT1','SRPK2'],
-        ['FLT1','ZNF436'],
-        ['FLT3','PAN3'],
-        ['FLT3','RPL21'],
-        ['FLT3','USP12'],
-        ['FLT3','ZMYM2'],
-        ['FLT3LG','RPS11'],
-        ['FLT4','LBH'],
-        ['FLT4','RRP7A'],
-        ['FLT4','RUFY1'],
-        ['FLVCR1','LYST'],
-        ['FLVCR2','TTLL5'],
-        ['FMN2','NVL'],
-        ['FMNL3','FRS2'],
-        ['FN1','ICAM1'],
-        ['FN1','MKNK2'],
-        ['FNBP1','KMT2A'],
-        ['FNBP1','MLL'],
-        ['FNDC3B','MST1R'],
-        ['FNDC3B','PIK3CA'],
-        ['FNDC3B','PRKCI'],
-        ['FNDC3B','RARA'],
-        ['FNDC3B','TNIK'],
-        ['FNDC7','TRIM33'],
-        ['FOS','MBNL1'],
-        ['FOS','VIM'],
-        ['FOSB','SERPINE1'],
-        ['FOSB','WWTR1'],
-        ['FOSB','ZFP36'],
-        ['FOXJ2','MEF2D'],
-        ['FOXJ2','TSPAN9'],
-        ['FOXJ3','GUCA2B'],
-        ['FOXK2','HEXDC'],
-        ['FOXK2','KRT20'],
-        ['FOXM1','SLC2A14'],
-        ['FOXN1','PRKDC'],
-        ['FOXN1','TNFAIP1'],
-        ['FOXN4','IRF2'],
-        ['FOXO1','PAX3'],
-        ['FOXO1','PAX7'],
-        ['FOXO1A','NCOA1'],
-        ['FOXO1A','PAX3'],
-        ['FOXO1A','PAX7'],
-        ['FOXO3','KMT2A'],
-        ['FOXO3','MLL'],
-        ['FOXO3','MYC'],
-        ['FOXO3A','MLL'],
-        ['FOXO4','KMT2A'],
-        ['FOXO4','MLL'],
-        ['FOXO4','PAX3'],
-        ['FOXP1','GOLGA4'],
-        ['FOXP1','IGH@'],
-        ['FOXP1','IGHA2'],
-        ['FOXP1','MIPEP'],
-        ['FOXP1','MITF'],
-        ['FOXP1','PAX5'],
-        ['FOXP1','PDGFRA'],
-        ['FOXP1','PLVAP'],
-        ['FOXP1','PPP1R2'],
-        ['FOXP1','RYBP'],
-        ['FOXP1','STK4'],
-        ['FOXP2','MET'],
-        ['FOXP4','TGFBR3'],
-        ['FOXR1','KMT2A'],
-        ['FOXR1','MLL'],
-        ['FOXR1','PAFAH1B2'],
-        ['FRAS1','HADH'],
-        ['FRAS1','LRRC8D'],
-        ['FRAS1','MRPL1'],
-        ['FRAS1','SHROOM3'],
-        ['FRAS1','WDFY3'],
-        ['FREM2','MTRF1'],
-        ['FRG1B','PPP1R1B'],
-        ['FRG2','UTP14C'],
-        ['FRK','PRIM2'],
-        ['FRMD4A','PFKP'],
-        ['FRMD4B','MITF'],
-        ['FRMD8','SCYL1'],
-        ['FRS2','KIF5A'],
-        ['FRS2','LYZ'],
-        ['FRYL','KMT2A'],
-        ['FRYL','MLL'],
-        ['FRYL','OCIAD2'],
-        ['FSD1','SPAG16'],
-        ['FSTL1','GSK3B'],
-        ['FTO','HERPUD1'],
-        ['FTX','XIST'],
-        ['FUBP1','SEC31A'],
-        ['FUBP3','PRRC2B'],
-        ['FUNDC2','RPS6KA6'],
-        ['FUS','GABRA3'],
-        ['FUS','KLF17'],
-        ['FUS','LGMN'],
-        ['FUS','NFATC2'],
-        ['FUS','POU5F1'],
-        ['FUS','PUM1'],
-        ['FUT8','KCNH5'],
-        ['FVT1','IGK@'],
-        ['FXR2','SLC30A1'],
-        ['FXYD6','KMT2A'],
-        ['FYCO1','RAF1'],
-        ['FYN','MLL'],
-        ['FYN','SF1'],
-        ['FZD6','SDC2'],
-        ['G2E3','SPRED2'],
-        ['G3BP2','NAAA'],
-        ['G3BP2','PDGFC'],
-        ['G6PC3','MRPS31'],
-        ['GAB2','INTS4'],
-        ['GAB2','MYO7A'],
-        ['GAB2','PLXDC1'],
-        ['GABBR1','UBD'],
-        ['GABBR2','NOTCH1'],
-        ['GABRA3','SLC6A8'],
-        ['GABRB3','GAS5'],
-        ['GADL1','GNG12-AS1'],
-        ['GADL1','TGFBR2'],
-        ['GAGE2E','KLHL25'],
-        ['GAK','LUC7L3'],
-        ['GAK','MAGI1'],
-        ['GAK','PGC'],
-        ['GAK','TG'],
-        ['GAL','LRP5'],
-        ['GALNT18','TYSND1'],
-        ['GALNT6','NENF'],
-        ['GALNT7','ORC4L'],
-        ['GALNT7','PDLIM1'],
-        ['GALNT9','LMBR1L'],
-        ['GALNT9','POLE'],
-        ['GALNTL6','NEK1'],
-        ['GANAB','NXF1'],
-        ['GAP43','MECOM'],
-        ['GAPVD1','ZNF483'],
-        ['GART','IFNGR2'],
-        ['GAS5','MDN1'],
-        ['GAS6','RASA3'],
-        ['GAS7','KMT2A'],
-        ['GAS7','MLL'],
-        ['GAS7','MYH1'],
-        ['GAS7','RCVRN'],
-        ['GAS8','HDAC4'],
-        ['GAS8','WDR59'],
-        ['GATA1','MYB'],
-        ['GATA4','LIFR'],
-        ['GATA4','YTHDC1'],
-        ['GATA6','ROCK1'],
-        ['GATAD2A','LYN'],
-        ['GATAD2A','NFIX'],
-        ['GATAD2B','NUP210L'],
-        ['GATAD2B','SLC19A2'],
-        ['GATAD2B','TNFSF18'],
-        ['GBAS','PCLO'],
-        ['GBAS','UBXN2A'],
-        ['GC','TTR'],
-        ['GCGR','LRRC45'],
-        ['GCH1','SERPINA6'],
-        ['GCM1','MTSS1'],
-        ['GCN1L1','MSI1'],
-        ['GCN1L1','PLA2G1B'],
-        ['GDAP1L1','WASH1'],
-        ['GDE1','LIN54'],
-        ['GDF5','MGLL'],
-        ['GDPD4','PAK1'],
-        ['GDPD5','MAP6'],
-        ['GDPD5','RELT'],
-        ['GEMIN7','ZNF296'],
-        ['GFAP','SPARC'],
-        ['GFAP','TPT1'],
-        ['GFAP','VIM'],
-        ['GGA2','PRKCB'],
-        ['GGA3','VRK2'],
-        ['GGNBP2','MYO19'],
-        ['GGNBP2','ZDHHC16'],
-        ['GGT1','IGSF3'],
-        ['GGT1','NCOR1'],
-        ['GGT5','USP18'],
-        ['GIGYF2','NGEF'],
-        ['GIGYF2','TRPM8'],
-        ['GIPC1','WNK1'],
-        ['GIT1','SHMT1'],
-        ['GIT2','PDGFRB'],
-        ['GIT2','SCYL2'],
-        ['GJB1','PSEN1'],
-        ['GJD2','RPN1'],
-        ['GK5','METTL15'],
-        ['GLB1L','RDH5'],
-        ['GLCCI1','TRIM7'],
-        ['GLCE','TMEM52B'],
-        ['GLDC','KDM4C'],
-        ['GLDN','WDFY2'],
-        ['GLG1','GRM5'],
-        ['GLI1','MALAT1'],
-        ['GLI1','MARS'],
-        ['GLI1','SEMA4A'],
-        ['GLIPR2','NUDT2'],
-        ['GLIS1','PAX8'],
-        ['GLIS2','PHF21A'],
-        ['GLIS3','LATS1'],
-        ['GLIS3','PAX8'],
-        ['GLO1','LMBRD1'],
-        ['GLRA1','SPARC'],
-        ['GLRX5','RUNX1'],
-        ['GLTP','IGF1R'],
-        ['GLTP','VPS29'],
-        ['GLTSCR1','MPND'],
-        ['GLYAT','MTA2'],
-        ['GLYATL1P3','PURA'],
-        ['GLYR1','SLC9A8'],
-        ['GMDS','PDE8B'],
-        ['GMDS','TMEM189'],
-        ['GMFG','KLHL15'],
-        ['GMPS','KMT2A'],
-        ['GMPS','MLL'],
-        ['GMPS','SYNPR'],
-        ['GNA12','SHANK2'],
-        ['GNAO1','TOX3'],
-        ['GNAQ','PLEKHA8'],
-        ['GNAS','LAPTM5'],
-        ['GNB3','METAP2'],
-        ['GNG3','TAF6L'],
-        ['GNGT1','KRIT1'],
-        ['GNGT1','SBK1'],
-        ['GNL2','SF3A3'],
-        ['GNPDA2','OTUD3'],
-        ['GNPTAB','MAPKAPK5'],
-        ['GNPTG','TNFRSF9'],
-        ['GNS','PAWR'],
-        ['GNS','STK10'],
-        ['GOLGA3','MYH6'],
-        ['GOLGA4','LRRFIP2'],
-        ['GOLGA4','PDGFRB'],
-        ['GOLGA4','RARA'],
-        ['GOLGA5','H4'],
-        ['GOLGA5','HOOK3'],
-        ['GOLGA5','KIF5B'],
-        ['GOLGA5','KTN1'],
-        ['GOLGA5','RET'],
-        ['GOLGA5','TRIM27'],
-        ['GOLGA5','TRIM33'],
-        ['GOLGA7','PVT1'],
-        ['GOLGB1','ILDR1'],
-        ['GOLGB1','ROS1'],
-        ['GOLIM4','PPM1L'],
-        ['GOLM1','MAK10'],
-        ['GOLT1A','KISS1'],
-        ['GOLT1A','PLEKHA6'],
-        ['GON4L','INSRR'],
-        ['GON4L','NTRK1'],
-        ['GOPC','KDELR2'],
-        ['GOPC','ROS1'],
-        ['GOPC','SDC4'],
-        ['GOPC','SLC34A2'],
-        ['GOPC','TRMT11'],
-        ['GOSR1','NF1'],
-        ['GOSR1','SSH2'],
-        ['GOSR1','TAOK1'],
-        ['GOSR1','ZNF207'],
-        ['GOT1L1','IKBKB'],
-        ['GOT1L1','SLC25A33'],
-        ['GP1BA','IQSEC1'],
-        ['GPATCH2','PTBP2'],
-        ['GPATCH8','HDAC5'],
-        ['GPATCH8','MPP2'],
-        ['GPATCH8','PCDHA1'],
-        ['GPBP1','YEATS2'],
-        ['GPBP1L1','IPP'],
-        ['GPBP1L1','MAST2'],
-        ['GPC2','MCM7'],
-        ['GPC3','NUP85'],
-        ['GPC4','HS6ST2'],
-        ['GPC5','MYO10'],
-        ['GPHN','KMT2A'],
-        ['GPHN','MLL'],
-        ['GPHN','MPP5'],
-        ['GPIAP1','PDGFRB'],
-        ['GPLD1','TDP2'],
-        ['GPM6B','RAB9A'],
-        ['GPN1','SLC4A1AP'],
-        ['GPNMB','SP4'],
-        ['GPR126','PRKCE'],
-        ['GPR128','TFG'],
-        ['GPR133','TXNRD1'],
-        ['GPR137','ZDHHC5'],
-        ['GPR149','MAFK'],
-        ['GPR158','WAC'],
-        ['GPR160','NCEH1'],
-        ['GPR160','PRKCI'],
-        ['GPR34','IGH@'],
-        ['GPR37L1','IPO9-AS1'],
-        ['GPR37L1','NAV1'],
-        ['GPR37L1','TESK2'],
-        ['GPR4','ZNF787'],
-        ['GPR56','TAOK2'],
-        ['GPRC5C','RECQL5'],
-        ['GPS2','MLL4'],
-        ['GPS2','MPP2'],
-        ['GPS2','SENP3'],
-        ['GPSM3','UBE2QL1'],
-        ['GPSN2','STRN4'],
-        ['GPT','PPP1R16A'],
-        ['GPX3','SEC63'],
-        ['GPX3','SQSTM1'],
-        ['GPX4','SEC63'],
-        ['GRAF','MLL'],
-        ['GRAMD2','NUDCD1'],
-        ['GRB10','TRRAP'],
-        ['GRB10','VOPP1'],
-        ['GRB2','HHATL'],
-        ['GRB7','PERLD1'],
-        ['GRB7','PPP1R1B'],
-        ['GRB7','STAT3'],
-        ['GREB1','MBOAT2'],
-        ['GRHL2','HNRNPD'],
-        ['GRHL2','MAP2K2'],
-        ['GRHL2','NRBP2'],
-        ['GRHL2','RSPO2'],
-        ['GRIA2','ZW10'],
-        ['GRID2','PDK4'],
-        ['GRID2','SCARB2'],
-        ['GRID2','UBXN7'],
-        ['GRIK2','TRMT11'],
-        ['GRIK4','GRM5'],
-        ['GRIN2B','SSPN'],
-        ['GRIN2B','TCF12'],
-        ['GRIN2B','TMEM87A'],
-        ['GRIN3A','TJP2'],
-        ['GRIP1','MED13L'],
-        ['GRIP1','PPM1H'],
-        ['GRIP1','RNFT2'],
-        ['GRIP1','SOX5'],
-        ['GRIP1','TBK1'],
-        ['GRIP1','TNIP1'],
-        ['GRIPAP1','TFE3'],
-        ['GRK1','PCID2'],
-        ['GRK1','TFDP1'],
-        ['GRK4','HTT'],
-        ['GRK4','LRPAP1'],
-        ['GRK4','WHSC1'],
-        ['GRK5','INPP5F'],
-        ['GRK5','STOX1'],
-        ['GRK6','UIMC1'],
-        ['GRM1','MEF2A'],
-        ['GRM1','TBL1XR1'],
-        ['GRM3','PAX5'],
-        ['GRM8','HIPK2'],
-        ['GSDMA','THRA'],
-        ['GSDMB','MED1'],
-        ['GSDMB','TATDN1'],
-        ['GSK3A','ZNF541'],
-        ['GSK3B','TIAM1'],
-        ['GSR','GTF2E2'],
-        ['GSR','PRKDC'],
-        ['GSS','SRC'],
-        ['GSS','VAV1'],
-        ['GSTT1','NF2'],
-        ['GSX2','SCFD2'],
-        ['GTF2H3','SETD1B'],
-        ['GTF2I','GTF2IRD1'],
-        ['GTF2I','NCOA2'],
-        ['GTF2I','RARA'],
-        ['GTPBP2','POLH'],
-        ['GUCA2B','PID1'],
-        ['GUCY2C','TSPAN9'],
-        ['GUCY2D','RPA1'],
-        ['GUF1','MTFR1'],
-        ['GUSBP12','PSMC3'],
-        ['GXYLT1','LRRK2'],
-        ['GXYLT2','NEK3'],
-        ['GYG1P1','TAF1B'],
-        ['GYLTL1B','HIPK3'],
-        ['GYPB','SAV1'],
-        ['GYPC','MRPS34'],
-        ['GZMK','IL10RB'],
-        ['GZMM','RERG'],
-        ['H19','HSP90B1'],
-        ['H2AFX','LAMB4'],
-        ['H2AFX','WDR18'],
-        ['H2AFY','HMHB1'],
-        ['H3F3B','ZDHHC7'],
-        ['H4','NCOA4'],
-        ['H4','PCM1'],
-        ['H4','PRKAR1A'],
-        ['H4','RET'],
-        ['H6PD','SPSB1'],
-        ['HACL1','RAF1'],
-        ['HADHB','RBKS'],
-        ['HAO2','VANGL1'],
-        ['HAPLN2','RBX1'],
-        ['HAPLN3','MFGE8'],
-        ['HARS2','ZMAT2'],
-        ['HAS2','PLAG1'],
-        ['HAUS1','NPM1'],
-        ['HAUS6','SLC1A1'],
-        ['HBS1L','MYB'],
-        ['HCFC1R1','THOC6'],
-        ['HCG24','TRIM49B'],
-        ['HCK','PLAGL2'],
-        ['HCK','POFUT1'],
-        ['HCMOGT-1','PDGFRB'],
-        ['HCMOGT1','PDGFRB'],
-        ['HDAC1','SERINC2'],
-        ['HDAC7','IRAK4'],
-        ['HDDC2','STBD1'],
-        ['HDDC3','IGLVI-70'],
-        ['HDGF','S100A10'],
-        ['HDHD1','MACROD1'],
-        ['HDHD2','IER3IP1'],
-        ['HDLBP','HJURP'],
-        ['HDLBP','SCCPDH'],
-        ['HDX','RPS6KA6'],
-        ['HEAB','MLL'],
-        ['HEATR1','TMEM27'],
-        ['HEATR3','SMEK1'],
-        ['HECTD4','PSD3'],
-        ['HEI10','HMGIC'],
-        ['HELZ','PITPNC1'],
-        ['HENMT1','RCC1'],
-        ['HEPACAM2','ZSCAN21'],
-        ['HER2','WIPF2'],
-        ['HES4','TRIM52'],
-        ['HEY1','NCOA2'],
-        ['HFM1','PPEF2'],
-        ['HFM1','SLCO5A1'],
-        ['HGSNAT','KIAA0146'],
-        ['HHEX','NUP98'],
-        ['HHLA1','OC90'],
-        ['HIATL1','RPS26P55'],
-        ['HIC2','TEC'],
-        ['HIF1A','VRK1'],
-        ['HIP1','PDGFRB'],
-        ['HIPK1','LRRC42'],
-        ['HIPK1','NT5DC1'],
-        ['HIPK1','PAX5'],
-        ['HIPK2','STAT6'],
-        ['HIPK3','NRD1'],
-        ['HIST4H4','MGP'],
-        ['HIVEP3','JAK1'],
-        ['HIVEP3','SUPT6H'],
-        ['HJURP','INPP4A'],
-        ['HK1','MYPN'],
-        ['HK1','PITRM1'],
-        ['HK1','TSPAN15'],
-        ['HLA-A','ROS1'],
-        ['HLA-DRB1','MET'],
-        ['HLA-DRB1','PDK2'],
-        ['HLF','PBX1'],
-        ['HLF','TCF3'],
-        ['HLF','TFPT'],
-        ['HLF','TOM1L1'],
-        ['HLTF','HPS3'],
-        ['HM13','RLF'],
-        ['HM13','TM9SF4'],
-        ['HM13','TPX2'],
-        ['HM13','TSPAN31'],
-        ['HMBOX1','JAK2'],
-        ['HMBOX1','ZFAND3'],
-        ['HMCES','MECOM'],
-        ['HMGA1','LAMA4'],
-        ['HMGA1','RAD51L1'],
-        ['HMGA1','TBL1XR1'],
-        ['HMGA2','LEMD3'],
-        ['HMGA2','LHFP'],
-        ['HMGA2','LPP'],
-        ['HMGA2','MLL'],
-        ['HMGA2','MSRB3'],
-        ['HMGA2','MYB'],
-        ['HMGA2','NAV3'],
-        ['HMGA2','NFIB'],
-        ['HMGA2','NUP107'],
-        ['HMGA2','PCBP2'],
-        ['HMGA2','PLAG1'],
-        ['HMGA2','PPAP2B'],
-        ['HMGA2','PTPRR'],
-        ['HMGA2','RAD51B'],
-        ['HMGA2','RAD51L1'],
-        ['HMGA2','SENP1'],
-        ['HMGA2','SETBP1'],
-        ['HMGA2','SOX5'],
-        ['HMGA2','TSFM'],
-        ['HMGA2','WIF1'],
-        ['HMGB1','ZDHHC21'],
-        ['HMGB3','NUP98'],
-        ['HMGB3P22','MATR3'],
-        ['HMGCLL1','MAP2K3'],
-        ['HMGCLL1','TEC'],
-        ['HMGIC','LHFP'],
-        ['HMGIC','LPP'],
-        ['HMGIC','RAD51L1'],
-        ['HMGN2P46','MYC'],
-        ['HMGN2P46','SKIL'],
-        ['HMGXB3','PPARGC1B'],
-        ['HMHA1','POLR3D'],
-        ['HMHA1','STK11'],
-        ['HMMR','MPDU1'],
-        ['HN1','USH1G'],
-        ['HN1L','STK10'],
-        ['HNF1A','SUPT3H'],
-        ['HNF1B','LUC7L3'],
-        ['HNF1B','NOTCH1'],
-        ['HNF4A','TTPAL'],
-        ['HNF4G','ZMAT4'],
-        ['HNRNPA2B1','PCBD2'],
-        ['HNRNPD','HNRNPD'],
-        ['HNRNPD','LAMB2'],
-        ['HNRNPD','NFE2L2'],
-        ['HNRNPD','NHP2L1'],
-        ['HNRNPD','NOL6'],
-        ['HNRNPD','PDCD10'],
-        ['HNRNPD','PPDPF'],
-        ['HNRNPD','RASGRF1'],
-        ['HNRNPD','RILPL2'],
-        ['HNRNPD','TMEM67'],
-        ['HNRNPD','VAMP2'],
-        ['HNRNPF','RASGEF1A'],
-        ['HNRNPH1','MLLT10'],
-        ['HNRNPH3','SF1'],
-        ['HNRNPM','RFX2'],
-        ['HNRNPU','PIM3'],
-        ['HNRNPUL1','MEF2D'],
-        ['HNRNPUL1','TGFB1'],
-        ['HOMEZ','MYH6'],
-        ['HOMEZ','PRMT5'],
-        ['HOOK1','RAB6A'],
-        ['HOOK3','IKBKB'],
-        ['HOOK3','RET'],
-        ['HOPX','PDCL2'],
-        ['HORMAD1','SLC22A20'],
-        ['HOX11','LCK'],
-        ['HOX11','LMO1'],
-        ['HOX11','LMO2'],
-        ['HOX11','LYL1'],
-        ['HOX11','NOTCH1'],
-        ['HOX11','RANBP17'],
-        ['HOX11','TAL1'],
-        ['HOX11','TAL2'],
-        ['HOX11','TLX1'],
-        ['HOX11','TRB@'],
-        ['HOXA1','TRB@'],
-        ['HOXA10','NUP98'],
-        ['HOXA10','TCRBV@'],
-        ['HOXA10','TCRVB@'],
-        ['HOXA10','TRB@'],
-        ['HOXA10','TRBV@'],
-        ['HOXA11','NUP98'],
-        ['HOXA11','TRB@'],
-        ['HOXA11-AS','MIR181A1HG'],
-        ['HOXA11-AS','TRBC2'],
-        ['HOXA13','NUP98'],
-        ['HOXA3','NUP98'],
-        ['HOXA6','NUP98'],
-        ['HOXA9','MED12'],
-        ['HOXA9','MSI2'],
-        ['HOXA9','NSD1'],
-        ['HOXA9','NUP98'],
-        ['HOXA9','TRB@'],
-        ['HOXA9','WHSC1L1'],
-        ['HOXB3','NUP98'],
-        ['HOXB3','RARA'],
-        ['HOXB4','NUP98'],
-        ['HOXC10','WIBG'],
-        ['HOXC11','NUP98'],
-        ['HOXC13','NUP98'],
-        ['HOXD11','NUP98'],
-        ['HOXD13','NUP98'],
-        ['HOXD3','NUP98'],
-        ['HOXD8','TM9SF4'],
-        ['HP','RSPO1'],
-        ['HPCA','TAT'],
-        ['HPR','MRPS10'],
-        ['HPR','RPS10'],
-        ['HPRG1','LRRC6'],
-        ['HPS3','MYO10'],
-        ['HPSE2','PRKD2'],
-        ['HRAS','RAB3GAP1'],
-        ['HSD11B1','KCNH1'],
-        ['HSD17B14','PLEKHA4'],
-        ['HSF1','RERE'],
-        ['HSP90AA1','PIM3'],
-        ['HSP90AB1','PTCHD4'],
-        ['HSP90AB1','SLC29A1'],
-        ['HSP90AB1','SYNGAP1'],
-        ['HSP90B1','RDH13'],
-        ['HSPA8','NR4A3'],
-        ['HSPBP1','PLGRKT'],
-        ['HSPE1','MOBKL3'],
-        ['HSPG2','TMCO4'],
-        ['HTN3','MSANTD3'],
-        ['HTR2A','MED4'],
-        ['HTRA1','SH3PXD2A'],
-        ['HTRA3','TBC1D14'],
-        ['HUNK','MAMLD1'],
-        ['HUNK','SNRPD3'],
-        ['HUWE1','RIBC1'],
-        ['ID4','IGH@'],
-        ['IDO1','ME3'],
-        ['IDUA','PTPRC'],
-        ['IER2','STARD9'],
-        ['IFI16','NOS1AP'],
-        ['IFI44','LPHN2'],
-        ['IFITM10','PPP1R12C'],
-        ['IFNL1','IL10RA'],
-        ['IFT172','KRTCAP3'],
-        ['IFT46','TBRG1'],
-        ['IFT52','TRIO'],
-        ['IFT80','MLH1'],
-        ['IGF1R','MFGE8'],
-        ['IGF1R','PPP4R1'],
-        ['IGF1R','TOLLIP'],
-        ['IGF1R','TRIP4'],
-        ['IGF1R','TTC23'],
-        ['IGF1R','WDR93'],
-        ['IGF2','INS'],
-        ['IGF2','INS-IGF2'],
-        ['IGF2','SNW1'],
-        ['IGF2','TF'],
-        ['IGF2','WNK2'],
-        ['IGF2BP1','IGH@'],
-        ['IGF2BP1','KAT7'],
-        ['IGF2BP3','PRKCA'],
-        ['IGF2BP3','RPS6KA2'],
-        ['IGF2BP3','THADA'],
-        ['IGF2R','SYTL3'],
-        ['IGFBP3','LIMK1'],
-        ['IGFBP5','PLAT'],
-        ['IGFBP5','RGS5'],
-        ['IGFBP5','SIAE'],
-        ['IGH@','IL3'],
-        ['IGH@','IL31'],
-        ['IGH@','IL31RA'],
-        ['IGH@','IL32'],
-        ['IGH@','IL33'],
-        ['IGH@','IL34'],
-        ['IGH@','IL36A'],
-        ['IGH@','IL36B'],
-        ['IGH@','IL36G'],
-        ['IGH@','IL36RN'],
-        ['IGH@','IL37'],
-        ['IGH@','IL3RA'],
-        ['IGH@','IRF'],
-        ['IGH@','IRF4'],
-        ['IGH@','IRF8'],
-        ['IGH@','IRTA1'],
-        ['IGH@','KDM4C'],
-        ['IGH@','LAPTM5'],
-        ['IGH@','LHX2'],
-        ['IGH@','LHX4'],
-        ['IGH@','MAF'],
-        ['IGH@','MAFB'],
-        ['IGH@','MALT1'],
-        ['IGH@','MIR100HG'],
-        ['IGH@','MIR125B1'],
-        ['IGH@','MMSET'],
-        ['IGH@','MRPL21'],
-        ['IGH@','MUC1'],
-        ['IGH@','MUM2'],
-        ['IGH@','MYC'],
-        ['IGH@','MYCN'],
-        ['IGH@','NBEAP1'],
-        ['IGH@','NFKB2'],
-        ['IGH@','ODZ2'],
-        ['IGH@','PAFAH1B2'],
-        ['IGH@','PAX5'],
-        ['IGH@','PCSK7'],
-        ['IGH@','RHOH'],
-        ['IGH@','SPIB'],
-        ['IGH@','TCRA@'],
-        ['IGH@','TENM2'],
-        ['IGH@','TERT'],
-        ['IGH@','TNFSF13'],
-        ['IGH@','WHSC1'],
-        ['IGH@','WWOX'],
-        ['IGH@','ZEB2'],
-        ['IGH@','ZFP36L1'],
-        ['IGHA2','ZFP36L1'],
-        ['IGHG1','LHX4'],
-        ['IGHG1','MYC'],
-        ['IGHMBP2','MRPL21'],
-        ['IGK@','IRF4'],
-        ['IGK@','KDSR'],
-        ['IGK@','MMSET'],
-        ['IGK@','MYC'],
-        ['IGK@','PVT1'],
-        ['IGK@','WHSC1'],
-        ['IGL@','MAF'],
-        ['IGL@','MYC'],
-        ['IGL@','PVT1'],
-        ['IGL@','WWOX'],
-        ['IGLC','PVT1'],
-        ['IGSF10','MED12L'],
-        ['IGSF21','OBSCN'],
-        ['IGSF9B','TOM1L2'],
-        ['IKBKB','TNPO1'],
-        ['IKBKB','UNC5D'],
-        ['IKBKE','NFASC'],
-        ['IKBKG','PLXNB3'],
-        ['IKZF1','KLF2'],
-        ['IKZF1','NUTM1'],
-        ['IKZF1','RNASEH2B'],
-        ['IKZF1','SETD5'],
-        ['IKZF1','STIM2'],
-        ['IKZF1','TRPV2'],
-        ['IKZF1','ZEB2'],
-        ['IKZF3','MED1'],
-        ['IKZF3','NF1'],
-        ['IKZF3','RARA'],
-        ['IKZF3','VAPB'],
-        ['IKZF4','RAB40B'],
-        ['IL1RAP','TFRC'],
-        ['IL1RAPL1','VDAC3'],
-        ['IL1RAPL2','MYO3B'],
-        ['IL1RL1','ZCCHC2'],
-        ['IL2','TNFRSF17'],
-        ['IL22','VOPP1'],
-        ['IL26','PPM1H'],
-        ['IL27RA','SMARCA4'],
-        ['IL2RB','MYH9'],
-        ['IL32','NAA60'],
-        ['IL32','TNFRSF12A'],
-        ['IL6R','TPM3'],
-        ['IMMP2L','LMTK2'],
-        ['IMMT','SLC25A26'],
-        ['INHBC','METTL1'],
-        ['INHBC','TSFM'],
-        ['INHBE','TSFM'],
-        ['INO80','PET112'],
-        ['INPP1','MFSD6'],
-        ['INPP4A','TMEM131'],
-        ['INPP4B','MAPK10'],
-        ['INPP5A','ROR1'],
-        ['INPP5A','TMEM189-UBE2V1'],
-        ['INS','INS-IGF2'],
-        ['INSL6','JAK2'],
-        ['INSR','MAP2K2'],
-        ['INSR','RBFOX3'],
-        ['INSR','S1PR2'],
-        ['INTS1','PRKAR1B'],
-        ['INTS12','MAK'],
-        ['INTS2','TMEM49'],
-        ['INTS2','ZNF652'],
-        ['INTS6','SMIM14'],
-        ['IP6K1','MST1R'],
-        ['IP6K1','TRAIP'],
-        ['IP6K2','USP19'],
-        ['IPO11','LRRC70'],
-        ['IQCG','NUP98'],
-        ['IQCH','MAP2K5'],
-        ['IQCJ','SCHIP1'],
-        ['IQGAP1','ZNF774'],
-        ['IQGAP2','TSLP'],
-        ['IQSEC3','MAPKAPK2'],
-        ['IQSEC3','WNK1'],
-        ['IRAK1','LYZ'],
-        ['IRAK1','PIGR'],
-        ['IRAK2','SRGAP3'],
-        ['IRAK3','RUNX2'],
-        ['IRAK3','TLK2'],
-        ['IRF2BP2','NTRK1'],
-        ['IRF2BP2','RARA'],
-        ['IRF4','TRA@'],
-        ['IRF9','RNF31'],
-        ['IRX2','TERT'],
-        ['ITCH','RPRD1B'],
-        ['ITFG1','NETO2'],
-        ['ITFG1','RYK'],
-        ['ITGA1','PDE4D'],
-        ['ITGA11','NARF'],
-        ['ITGA6','PDK1'],
-        ['ITGA6','RAPGEF4'],
-        ['ITGB5','SNX4'],
-        ['ITGB6','RBMS1'],
-        ['ITGB6','TANC1'],
-        ['ITGB8','ZCWPW1'],
-        ['ITK','SYK'],
-        ['ITLN1','PIP5K1A'],
-        ['ITM2B','RB1'],
-        ['ITPKC','PPFIA3'],
-        ['ITPR2','TMED10'],
-        ['ITPR3','PNPLA1'],
-        ['ITPRIPL1','YWHAQ'],
-        ['ITSN1','KCNE2'],
-        ['ITSN1','PAM'],
-        ['IZUMO3','MLLT3'],
-        ['JAK1','RB1CC1'],
-        ['JAK1','SCARB2'],
-        ['JAK1','ZC3H7B'],
-        ['JAK2','KIAA1432'],
-        ['JAK2','LRP8'],
-        ['JAK2','NFE2'],
-        ['JAK2','OFD1'],
-        ['JAK2','PAX5'],
-        ['JAK2','PCM1'],
-        ['JAK2','PPFIBP1'],
-        ['JAK2','RFX3'],
-        ['JAK2','RPN1'],
-        ['JAK2','SEC31A'],
-        ['JAK2','SMU1'],
-        ['JAK2','SNX29'],
-        ['JAK2','SPAG9'],
-        ['JAK2','SSBP2'],
-        ['JAK2','STRN3'],
-        ['JAK2','TEL'],
-        ['JAK2','TERF2'],
-        ['JAK2','TPR'],
-        ['JAK2','TTC13'],
-        ['JAK2','USP25'],
-        ['JAK2','ZNF274'],
-        ['JAK2','ZNF340'],
-        ['JAK2','ZNF430'],
-        ['JAK3','SEC31A'],
-        ['JAM3','MAP4K5'],
-        ['JAM3','NCAPD3'],
-        ['JARID1A','NUP98'],
-        ['JAZF1','JJAZ1'],
-        ['JAZF1','PHF1'],
-        ['JAZF1','SUZ12'],
-        ['JMJD1C','MICU1'],
-        ['JMJD1C','NRBF2'],
-        ['JMJD7','PLA2G4B'],
-        ['JSRP1','THAP9'],
-        ['JUNB','SEC63'],
-        ['KAL1','PNPLA4'],
-        ['KANK1','PDGFRB'],
-        ['KANSL1','KAT6B'],
-        ['KANSL1','LRRC37A3'],
-        ['KAT5','PPP1R21'],
-        ['KAT6A','LEUTX'],
-        ['KAT6A','LRP5'],
-        ['KAT6A','NCOA2'],
-        ['KATNAL1','ZC3H13'],
-        ['KAZN','MTOR'],
-        ['KAZN','TRPM7'],
-        ['KCNAB1','PIK3CB'],
-        ['KCNAB2','POLB'],
-        ['KCND3','PPM1E'],
-        ['KCNIP2','SGSM1'],
-        ['KCNJ10','MSTO1'],
-        ['KCNJ16','TLK2'],
-        ['KCNJ4','MAPK1'],
-        ['KCNMA1','MDS1'],
-        ['KCNMA1','RUNX1'],
-        ['KCNQ5','RIMS1'],
-        ['KCNS3','ZNF638'],
-        ['KCTD10','PTGR2'],
-        ['KCTD19','SDHB'],
-        ['KCTD20','SORBS2'],
-        ['KCTD21','PAK1'],
-        ['KCTD3','RPL23AP7'],
-        ['KDELR2','ROS1'],
-        ['KDM2A','RHOD'],
-        ['KDM2A','RPS6KB2'],
-        ['KDM2A','SYT12'],
-        ['KDM2A','WWTR1'],
-        ['KDM2B','XIRP2'],
-        ['KDM4A','RASSF5'],
-        ['KDM4A','ST3GAL3'],
-        ['KDM4B','STK11'],
-        ['KDM4D','ZC3H12D'],
-        ['KDM5A','NUP98'],
-        ['KDM5A','WNK1'],
-        ['KDM6A','PTK2B'],
-        ['KDM6A','RPS6KA3'],
-        ['KDM6A','XIST'],
-        ['KDR','SH3BP2'],
-        ['KHDRBS3','PVT1'],
-        ['KHNYN','SDR39U1'],
-        ['KHSRP','TFE3'],
-        ['KIAA0040','RFWD2'],
-        ['KIAA0100','UBE4B'],
-        ['KIAA0146','MCM4'],
-        ['KIAA0195','MGAT5B'],
-        ['KIAA0284','KMT2A'],
-        ['KIAA0319L','ZMYM4'],
-        ['KIAA0430','SPR'],
-        ['KIAA0515','PPAPDC3'],
-        ['KIAA0564','SCAF8'],
-        ['KIAA0642','TRPM8'],
-        ['KIAA0660','TK14'],
-        ['KIAA0753','TP53'],
-        ['KIAA0756','NTRK1'],
-        ['KIAA0825','MGAT5'],
-        ['KIAA0833','MTOR'],
-        ['KIAA0895','PDE1C'],
-        ['KIAA0984','PPM1H'],
-        ['KIAA0999','PPP2R1B'],
-        ['KIAA1033','LGR5'],
-        ['KIAA1199','ZYX'],
-        ['KIAA1211','NMU'],
-        ['KIAA1217','RET'],
-        ['KIAA1267','MBTD1'],
-        ['KIAA1324L','SRPK2'],
-        ['KIAA1429','SUSD3'],
-        ['KIAA1462','KIF5B'],
-        ['KIAA1467','TTLL9'],
-        ['KIAA1468','RET'],
-        ['KIAA1509','PDGFRB'],
-        ['KIAA1524','KMT2A'],
-        ['KIAA1524','MLL'],
-        ['KIAA1549L','PAX5'],
-        ['KIAA1549L','RUNX1'],
-        ['KIAA1598','ROS1'],
-        ['KIAA1598','UTP11L'],
-        ['KIAA1618','TBC1D16'],
-        ['KIAA1737','NGFR'],
-        ['KIAA1787','SENP3'],
-        ['KIAA1797','MOBKL2B'],
-        ['KIAA1967','SORBS3'],
-        ['KIAA2018','MBNL1'],
-        ['KIAA2026','MIR31HG'],
-        ['KIAA2026','NUDT11'],
-        ['KIAA2026','UHRF2'],
-        ['KIDINS220','PAX5'],
-        ['KIDINS220','PHF20'],
-        ['KIF13B','NRG1'],
-        ['KIF16B','PCSK2'],
-        ['KIF18A','MTFR1L'],
-        ['KIF1B','TCF7L1'],
-        ['KIF1B','UBE4B'],
-        ['KIF1C','RNF167'],
-        ['KIF1C','SOAT2'],
-        ['KIF21A','MED13L'],
-        ['KIF21A','ZNF664'],
-        ['KIF26A','MARK3'],
-        ['KIF3B','PAX5'],
-        ['KIF5A','OS9'],
-        ['KIF5B','MET'],
-        ['KIF5B','PDGFRA'],
-        ['KIF5B','RET'],
-        ['KIF5C','LYPD6B'],
-        ['KIFAP3','SCYL3'],
-        ['KIFC1','RPS6KA2'],
-        ['KIRREL','PRKCA'],
-        ['KIRREL','ZFYVE9'],
-        ['KIRREL3','RN7SL167P'],
-        ['KIRREL3','VPS37C'],
-        ['KIT','SGCB'],
-        ['KIT','SLC4A4'],
-        ['KLB','PDS5A'],
-        ['KLF10','PVT1'],
-        ['KLF2','OAZ1'],
-        ['KLF2','TPM4'],
-        ['KLHDC10','STAC'],
-        ['KLHDC4','LRPAP1'],
-        ['KLHL29','NR5A2'],
-        ['KLHL9','MLLT3'],
-        ['KLK3','NUAK1'],
-        ['KLK4','KLKP1'],
-        ['KLRD1','LINC00545'],
-        ['KMO','RPS6KC1'],
-        ['KMT2A','LASP1'],
-        ['KMT2A','LPP'],
-        ['KMT2A','MAML2'],
-        ['KMT2A','MAPRE1'],
-        ['KMT2A','MATR3'],
-        ['KMT2A','ME2'],
-        ['KMT2A','MEF2C'],
-        ['KMT2A','MLL'],
-        ['KMT2A','MLLT1'],
-        ['KMT2A','MLLT10'],
-        ['KMT2A','MLLT11'],
-        ['KMT2A','MLLT3'],
-        ['KMT2A','MLLT4'],
-        ['KMT2A','MLLT6'],
-        ['KMT2A','MYH11'],
-        ['KMT2A','MYO1F'],
-        ['KMT2A','NCKIPSD'],
-        ['KMT2A','NRIP3'],
-        ['KMT2A','NT5C2'],
-        ['KMT2A','NUP98'],
-        ['KMT2A','PDS5A'],
-        ['KMT2A','PICALM'],
-        ['KMT2A','PRRC1'],
-        ['KMT2A','RFX2'],
-        ['KMT2A','SARNP'],
-        ['KMT2A','SEPT11'],
-        ['KMT2A','SEPT2'],
-        ['KMT2A','SEPT5'],
-        ['KMT2A','SEPT6'],
-        ['KMT2A','SEPT9'],
-        ['KMT2A','SH3GL1'],
-        ['KMT2A','SMAP1'],
-        ['KMT2A','SORBS2'],
-        ['KMT2A','SUGP2'],
-        ['KMT2A','TCF12'],
-        ['KMT2A','TET1'],
-        ['KMT2A','TIRAP'],
-        ['KMT2A','TNRC18'],
-        ['KMT2A','TOP3A'],
-        ['KMT2A','UBE4A'],
-        ['KMT2A','VAV1'],
-        ['KMT2A','ZFYVE19'],
-        ['KMT2C','LMTK3'],
-        ['KMT2D','SEC31A'],
-        ['KPNA2','OSBPL9'],
-        ['KPNA3','SLC2A8'],
-        ['KRAS','SOX5'],
-        ['KRAS','UBE2L3'],
-        ['KRR1','RUNX1'],
-        ['KRT14','RARA'],
-        ['KRT18P6','TAL1'],
-        ['KRT223P','NIPAL2'],
-        ['KRT32','SEPT9'],
-        ['KRT6A','ZNF821'],
-        ['KRT8','PKM2'],
-        ['KRT86','MDM2'],
-        ['KRTDAP','NPVF'],
-        ['KSR1','ODZ1'],
-        ['KSR1','PKN3'],
-        ['KSR2','SETMAR'],
-        ['KTN1','RET'],
-        ['L3MBTL4','PAK4'],
-        ['LACC1','NRBF2'],
-        ['LACE1','LATS1'],
-        ['LACTB','USP8'],
-        ['LACTB2','NCOA2'],
-        ['LAF4','MLL'],
-        ['LAF4','RUNX1'],
-        ['LAG3','MYH11'],
-        ['LAMA1','PTPRM'],
-        ['LAMA3','RBBP8'],
-        ['LAMA3','RIOK3'],
-        ['LAMA3','ROCK1'],
-        ['LAMC1','PIK3C2B'],
-        ['LAMP1','MCF2L'],
-        ['LAMP2','SCARB2'],
-        ['LAMTOR1','PRKCD'],
-        ['LAMTOR4','SRPK2'],
-        ['LANCL2','PLEKHA7'],
-        ['LANCL2','PSPH'],
-        ['LANCL2','SEC61G'],
-        ['LANCL2','SEPT14'],
-        ['LANCL2','VOPP1'],
-        ['LANCL2','VSTM2A'],
-        ['LANCL2','ZNF713'],
-        ['LAPTM4A','PRMT8'],
-        ['LARG','MLL'],
-        ['LARP4B','PPIL4'],
-        ['LARP4B','SEC63'],
-        ['LAS1L','OPHN1'],
-        ['LASP1','MLL'],
-        ['LASP1','TRPS1'],
-        ['LASP1','WIPF2'],
-        ['LASS6','USP32'],
-        ['LATS1','NUP43'],
-        ['LATS1','PCMT1'],
-        ['LATS1','PSEN1'],
-        ['LCAT','SLC12A4'],
-        ['LCK','TRB@'],
-        ['LCLAT1','TMEM55A'],
-        ['LCX','MLL'],
-        ['LDHB','MTX1'],
-        ['LDHC','SERGEF'],
-        ['LDLRAD3','RICS'],
-        ['LDLRAD3','TCP11L1'],
-        ['LDLRAD4','PHACTR3'],
-        ['LDLRAD4','RUNX1'],
-        ['LDLRAD4','SPECC1'],
-        ['LEDGF','NUP98'],
-        ['LEF1','METTL23'],
-        ['LEKR1','TIPARP'],
-        ['LEMD1','NUAK2'],
-        ['LEMD3','NUP107'],
-        ['LEMD3','PPM1H'],
-        ['LEP','SND1'],
-        ['LGALS12','SYNPO2L'],
-        ['LGALS2','RBFOX2'],
-        ['LGALS2','RBM9'],
-        ['LGALS9','NLK'],
-        ['LGR5','NUP107'],
-        ['LGSN','LMBRD1'],
-        ['LHFP','LNX2'],
-        ['LHFP','SERP2'],
-        ['LIFR','PLAG1'],
-        ['LIFR','TRIO'],
-        ['LIMA1','SCMH1'],
-        ['LIMK1','TYW1'],
-        ['LIN28A','SRGAP1'],
-        ['LIN28B','STX7'],
-        ['LIN52','S100A12'],
-        ['LIN54','NAGS'],
-        ['LINC00152','RUFY1'],
-        ['LINC00176','SLC6A19'],
-        ['LINC00243','RASAL1'],
-        ['LINC00330','PQLC1'],
-        ['LINC00330','ZNF664'],
-        ['LINC00478','NRIP1'],
-        ['LINC00545','MEDAG'],
-        ['LINC00843','TIMM23B'],
-        ['LINC01504','TRIO'],
-        ['LINC01545','TFE3'],
-        ['LIPA','RUNX1'],
-        ['LIPF','MELK'],
-        ['LIPJ','PTEN'],
-        ['LITAF','LRP5'],
-        ['LMBRD1','TFDP2'],
-        ['LMBRD2','SLC25A1'],
-        ['LMNA','NTRK1'],
-        ['LMNA','RAF1'],
-        ['LMO1','TRA@'],
-        ['LMO1','TRB@'],
-        ['LMO1','TRD@'],
-        ['LMO2','TRA@'],
-        ['LMO2','TRB@'],
-        ['LMO2','TRBC2'],
-        ['LMO2','TRD@'],
-        ['LMTK2','RBFOX3'],
-        ['LMX1B','MVB12B'],
-        ['LNP1','NUP98'],
-        ['LNP1','PAK1'],
-        ['LNPEP','RASGEF1B'],
-        ['LNX1','NMU'],
-        ['LNX1','PDGFRA'],
-        ['LNX1','USP46'],
-        ['LNX2','POLR1D'],
-        ['LOC284100','PSMD3'],
-        ['LOC728621','PPCS'],
-        ['LONP1','MAP2K7'],
-        ['LPAR1','NAA15'],
-        ['LPCAT1','TERT'],
-        ['LPCAT3','MAP3K13'],
-        ['LPGAT1','RPS6KC1'],
-        ['LPL','ZNF641'],
-        ['LPP','MLL'],
-        ['LPPR1','SLC35D2'],
-        ['LPXN','PTPRJ'],
-        ['LPXN','RUNX1'],
-        ['LRBA','SH3D19'],
-        ['LRCH3','RAB7A'],
-        ['LRCH4','SEC31A'],
-        ['LRIG3','PIP4K2C'],
-        ['LRIG3','ROCK1'],
-        ['LRIG3','ROS1'],
-        ['LRIG3','TSFM'],
-        ['LRMP','PTPRD'],
-        ['LRP1','RBMS2'],
-        ['LRP1','SNRNP25'],
-        ['LRP1','TMBIM4'],
-        ['LRP1','XPO5'],
-        ['LRP1B','MAST4'],
-        ['LRP5','PPP6R3'],
-        ['LRP5','SLC22A24'],
-        ['LRP5','SRPK2'],
-        ['LRP5','TPCN2'],
-        ['LRP6','STYK1'],
-        ['LRP8','PAX8'],
-        ['LRP8','TMEM48'],
-        ['LRR1','PPIL6'],
-        ['LRRC2','PRAMEF13'],
-        ['LRRC36','SLC7A6'],
-        ['LRRC37A3','NSF'],
-        ['LRRC37B','NF1'],
-        ['LRRC59','NEUROD2'],
-        ['LRRC59','SLC22A10'],
-        ['LRRC6','PHF20L1'],
-        ['LRRC6','POLB'],
-        ['LRRC61','PTPN13'],
-        ['LRRC8D','ZNF804A'],
-        ['LRRFIP1','RBM44'],
-        ['LRRFIP2','SUMF1'],
-        ['LRRK1','METTL3'],
-        ['LRRK1','TOX4'],
-        ['LRRN2','NFASC'],
-        ['LRWD1','MAGEA9'],
-        ['LSAMP','ZBTB20'],
-        ['LSAMP','ZNF596'],
-        ['LSM14A','SLIT3'],
-        ['LSM14B','TAF4'],
-        ['LSM4','PAK4'],
-        ['LSS','POMK'],
-        ['LSS','UMODL1'],
-        ['LST1','LTB'],
-        ['LTBP3','RELA'],
-        ['LTK','UACA'],
-        ['LUC7L3','TFE3'],
-        ['LUZP6','OSBPL1A'],
-        ['LXN','RPL21'],
-        ['LY6G6D','STK19'],
-        ['LY6H','PVT1'],
-        ['LY9','SDHC'],
-        ['LYL1','TRB@'],
-        ['LYN','NCOR1'],
-        ['LYN','NTRK3'],
-        ['LYN','SHB'],
-        ['LYN','VPS13B'],
-        ['LYPD1','SCGB1A1'],
-        ['LYPD5','MARK4'],
-        ['LYST','RPS6KC1'],
-        ['LYZ','PRKCI'],
-        ['LYZ','STK10'],
-        ['LYZ','STRADA'],
-        ['LYZL2','MAP3K8'],
-        ['LZTR1','PI4KA'],
-        ['MACF','NOTCH2'],
-        ['MACF1','MYCL'],
-        ['MACF1','NOTCH2'],
-        ['MACF1','RRAGC'],
-        ['MACROD1','RUNX1'],
-        ['MACROD1','VEGFB'],
-        ['MAD1L1','RARS'],
-        ['MAFF','STK16'],
-        ['MAFG','NELL2'],
-        ['MAFK','OAZ'],
-        ['MAGI1','PDZRN3'],
-        ['MAGI1','STMN2'],
-        ['MAGI3','NOTCH2'],
-        ['MALAT1','RGPD2'],
-        ['MALAT1','SMARCB1'],
-        ['MALAT1','TFEB'],
-        ['MALAT1','USO1'],
-        ['MALT1','MAP4'],
-        ['MALT1','SEC11C'],
-        ['MAMDC1','SLC25A21'],
-        ['MAML2','MECT1'],
-        ['MAML2','MLL'],
-        ['MAML2','MTMR2'],
-        ['MAML2','MYB'],
-        ['MAML2','PAFAH1B2'],
-        ['MAML2','POMC'],
-        ['MAML2','SMARCB1'],
-        ['MAML2','YAP'],
-        ['MAML2','YAP1'],
-        ['MAML3','MRPL39'],
-        ['MAML3','PAX3'],
-        ['MAML3','TCF4'],
-        ['MAML3','UBTF'],
-        ['MAMLD1','YAP1'],
-        ['MANBA','WNK1'],
-        ['MANBAL','SRC'],
-        ['MAP2K1','PLEKHO2'],
-        ['MAP2K1','SMAD3'],
-        ['MAP2K2','PSMD9'],
-        ['MAP2K2','RAB8A'],
-        ['MAP2K4','MYH3'],
-        ['MAP2K5','RAB27A'],
-        ['MAP2K5','SNRNP40'],
-        ['MAP2K7','PRDM15'],
-        ['MAP2K7','SH3GL1'],
-        ['MAP2K7','SNAPC2'],
-        ['MAP3K1','PARN'],
-        ['MAP3K10','SUPT5H'],
-        ['MAP3K12','TEAD4'],
-        ['MAP3K13','NSUN2'],
-        ['MAP3K13','UTS2B'],
-        ['MAP3K13','VKORC1'],
-        ['MAP3K14','ZNF257'],
-        ['MAP3K15','POLA1'],
-        ['MAP3K2','SUPT3H'],
-        ['MAP3K2','TIAM1'],
-        ['MAP3K3','MRC2'],
-        ['MAP3K3','MYO15B'],
-        ['MAP3K3','TNS3'],
-        ['MAP3K4','ZNF292'],
-        ['MAP3K5','NKAIN2'],
-        ['MAP3K5','PERP'],
-        ['MAP3K5','TCF12'],
-        ['MAP3K8','MROH2B'],
-        ['MAP3K9','RBM15'],
-        ['MAP3K9','SLC39A9'],
-        ['MAP4K3','SMC6'],
-        ['MAP4K3','SOS1'],
-        ['MAP4K3','TMEM178'],
-        ['MAP4K4','RRBP1'],
-        ['MAP4K4','SYF2'],
-        ['MAP4K5','NIN'],
-        ['MAP4K5','THSD7A'],
-        ['MAP4K5','TRIM9'],
-        ['MAP7','PERP'],
-        ['MAP7','RNF217'],
-        ['MAPK1','METTL21B'],
-        ['MAPK1','PRODH'],
-        ['MAPK1','SSU72'],
-        ['MAPK10','NUP188'],
-        ['MAPK10','UGT8'],
-        ['MAPK14','MICU2'],
-        ['MAPK14','SIN3A'],
-        ['MAPK15','MED25'],
-        ['MAPK4','RTTN'],
-        ['MAPK4','SMAD4'],
-        ['MAPK6','USO1'],
-        ['MAPK8','RAP1B'],
-        ['MAPK8IP3','PDPK1'],
-        ['MAPK8IP3','UBE2I'],
-        ['MAPK9','RAI14'],
-        ['MAPKAPK2','PLA2G2A'],
-        ['MAPKBP1','MGA'],
-        ['MAPRE1','MLL'],
-        ['MARCH1','PTPN13'],
-        ['MARCH10','USP32'],
-        ['MARCH6','MYO10'],
-        ['MARCH6','TXLNA'],
-        ['MARCH8','PRKG1'],
-        ['MARCH9','METTL1'],
-        ['MARCH9','NOL10'],
-        ['MARCH9','OS9'],
-        ['MARCH9','SLCO1B7'],
-        ['MARK1','PA2G4'],
-        ['MARK1','RHOU'],
-        ['MARK2','PPFIA1'],
-        ['MARK2','RTN3'],
-        ['MARK3','MIA2'],
-        ['MARK3','PDIA4'],
-        ['MARK3','SLC25A21'],
-        ['MARK3','SMARCB1'],
-        ['MARS','MON2'],
-        ['MARS','PPM1H'],
-        ['MARVELD1','SYNDIG1'],
-        ['MARVELD3','PJA2'],
-        ['MAST1','NFIX'],
-        ['MAST1','TADA2A'],
-        ['MAST1','TADA2L'],
-        ['MAST1','ZNF700'],
-        ['MAST2','METTL21A'],
-        ['MAST2','MMEL1'],
-        ['MAST2','PSMA5'],
-        ['MAST2','SLC39A6'],
-        ['MAST3','TBL1XR1'],
-        ['MAST4','NDUFAF2'],
-        ['MAST4','NLN'],
-        ['MAST4','PLIN2'],
-        ['MAST4','SREK1IP1'],
-        ['MASTL','SEL1L'],
-        ['MAT1A','STK39'],
-        ['MAT1A','ZMIZ1'],
-        ['MATK','PIP5K1C'],
-        ['MATK','ZFR2'],
-        ['MATN2','PKHD1L1'],
-        ['MATN2','POP1'],
-        ['MAX','TTC7B'],
-        ['MAZ','MKL1'],
-        ['MBD1','RET'],
-        ['MBD3','ULK2'],
-        ['MBD4','PTPRC'],
-        ['MBNL1','MYB'],
-        ['MBNL1','PAX5'],
-        ['MBNL1','RAF1'],
-        ['MBOAT2','PRKCE'],
-        ['MBOAT7','SIGLEC8'],
-        ['MBTD1','ZMYND11'],
-        ['MBTPS1','TCEANC2'],
-        ['MBTPS2','YY2'],
-        ['MCHR2','RPS6KA2'],
-        ['MCM3AP-AS1','MRFAP1L1'],
-        ['MCM5','TOM1'],
-        ['MCM5','TRPM7'],
-        ['MCM9','ROS1'],
-        ['MCMBP','PDCD11'],
-        ['MCTP1','SNTB2'],
-        ['MDGA1','PTK7'],
-        ['MDGA2','SRPK2'],
-        ['MDM2','NUP107'],
-        ['MDM2','PPM1H'],
-        ['MDM2','RUNX2'],
-        ['MDM2','SYK'],
-        ['MDM2','VOPP1'],
-        ['MDM2','ZFC3H1'],
-        ['MDM4','STK40'],
-        ['MDS1','RPL22'],
-        ['MDS1','RUNX1'],
-        ['ME2','MLL'],
-        ['ME2','SMAD4'],
-        ['MEAF6','PHF1'],
-        ['MEAF6','SCMH1'],
-        ['MECOM','NRIP1'],
-        ['MECOM','RPN1'],
-        ['MECOM','RUNX1'],
-        ['MECOM','TCRB@'],
-        ['MECOM','THADA'],
-        ['MECOM','TTC18'],
-        ['MECP2','TMLHE'],
-        ['MED1','RARA'],
-        ['MED1','STXBP4'],
-        ['MED1','USP32'],
-        ['MED1','WSB1'],
-        ['MED12','PRDM10'],
-        ['MED13','TGFBR3'],
-        ['MED13L','YEATS4'],
-        ['MED15','TFE3'],
-        ['MED18','UBE4B'],
-        ['MED21','PIP5K1C'],
-        ['MED24','PIP4K2B'],
-        ['MED24','RARA'],
-        ['MED6','RGS6'],
-        ['MEF2D','SS18'],
-        ['MEF2D','ZDHHC5'],
-        ['MEGF11','SIK2'],
-        ['MEGF11','TIPIN'],
-        ['MEIS1','ROCK2'],
-        ['MEIS2','TBC1D22A'],
-        ['MELK','RNF38'],
-        ['MELK','SDK1'],
-        ['MEMO1','SEC31A'],
-        ['MERTK','TMEM87B'],
-        ['MESDC2','SENP1'],
-        ['MET','OXR1'],
-        ['MET','PTPRZ'],
-        ['MET','PTPRZ1'],
-        ['MET','SLC1A2'],
-        ['MET','ST7'],
-        ['MET','TFG'],
-        ['MET','TPR'],
-        ['MET','TRIM4'],
-        ['MET','ZKSCAN1'],
-        ['METAP2','PIK3C2G'],
-        ['METTL21B','TSFM'],
-        ['METTL5','TLK1'],
-        ['METTL7A','SRPK1'],
-        ['MFSD1','STARD3NL'],
-        ['MFSD2A','ZMPSTE24'],
-        ['MFSD2B','ZFYVE9'],
-        ['MGAT4C','PPP1R12A'],
-        ['MGEA5','RNLS'],
-        ['MIB1','YOD1'],
-        ['MICA','RAB1B'],
-        ['MICAL1','TMEM198B'],
-        ['MICAL2','PPAP2A'],
-        ['MICAL2','TEAD1'],
-        ['MICAL3','SPANXN4'],
-        ['MICAL3','XBP1'],
-        ['MICALCL','SMAD4'],
-        ['MICALL2','RIMKLB'],
-        ['MIDN','STK11'],
-        ['MIER2','RSRC2'],
-        ['MINK1','NASP'],
-        ['MINK1','NQO2'],
-        ['MINK1','SLA'],
-        ['MINK1','SPNS3'],
-        ['MINK1','TG'],
-        ['MINK1','USO1'],
-        ['MINPP1','NUTM2A-AS1'],
-        ['MIOS','RENBP'],
-        ['MIPEP','SKIL'],
-        ['MIPOL1','NPAS3'],
-        ['MIPOL1','SKIL'],
-        ['MIPOL1','TTC6'],
-        ['MIPOL1','TTTY25P'],
-        ['MIR143','NOTCH1'],
-        ['MIR143','NOTCH2'],
-        ['MIR143','NOTCH3'],
-        ['MIR143HG','NOTCH1'],
-        ['MIR143HG','NOTCH2'],
-        ['MIR143HG','NOTCH3'],
-        ['MIXL1','PARP1'],
-        ['MKL1','NIPA1'],
-        ['MKL1','RBM15'],
-        ['MKLN1','PTK2'],
-        ['MKLN1','SCRN1'],
-        ['MLEC','UNC119B'],
-        ['MLF1','NPM'],
-        ['MLF1','NPM1'],
-        ['MLF2','SLC25A42'],
-        ['MLKL','TMEM231'],
-        ['MLL','MLLT1'],
-        ['MLL','MLLT10'],
-        ['MLL','MLLT11'],
-        ['MLL','MLLT2'],
-        ['MLL','MLLT3'],
-        ['MLL','MLLT4'],
-        ['MLL','MLLT6'],
-        ['MLL','MLLT7'],
-        ['MLL','MSF'],
-        ['MLL','MYO1F'],
-        ['MLL','NCKIPSD'],
-        ['MLL','NEBL'],
-        ['MLL','NRIP3'],
-        ['MLL','NUP98'],
-        ['MLL','PDS5A'],
-        ['MLL','PICALM'],
-        ['MLL','PNUTL1'],
-        ['MLL','PRRC1'],
-        ['MLL','RARA'],
-        ['MLL','RFX2'],
-        ['MLL','RREB1'],
-        ['MLL','SARNP'],
-        ['MLL','SEPT11'],
-        ['MLL','SEPT2'],
-        ['MLL','SEPT5'],
-        ['MLL','SEPT6'],
-        ['MLL','SEPT9'],
-        ['MLL','SH3GL1'],
-        ['MLL','SMAP1'],
-        ['MLL','SNAPC3'],
-        ['MLL','SORBS2'],
-        ['MLL','TET1'],
-        ['MLL','TIRAP'],
-        ['MLL','TNRC18'],
-        ['MLL','UBE4A'],
-        ['MLL','USP2'],
-        ['MLL','VAV'],
-        ['MLL','ZFYVE19'],
-        ['MLL3','PRKAG2'],
-        ['MLL3','TPTE'],
-        ['MLL4','RB1'],
-        ['MLLT10','NAP1L1'],
-        ['MLLT10','PICALM'],
-        ['MLLT10','PPP2R1B'],
-        ['MLLT11','PIP5K1A'],
-        ['MLLT3','PAX5'],
-        ['MLLT3','PLIN2'],
-        ['MLLT3','PPP6R1'],
-        ['MLLT6','PIP4K2B'],
-        ['MLLT6','TEM7'],
-        ['MLLT7','PAX3'],
-        ['MLPH','PIKFYVE'],
-        ['MLYCD','RUNX1'],
-        ['MMAA','YTHDF3'],
-        ['MMP16','RBM12B'],
-        ['MMP20','TMEM123'],
-        ['MMP27','TMEM123'],
-        ['MN1','PATZ1'],
-        ['MN1','TEL'],
-        ['MNAT1','RASGEF1B'],
-        ['MNDA','NOTCH2'],
-        ['MNX1','MYB'],
-        ['MOB3A','STK11'],
-        ['MOB3C','SLA2'],
-        ['MOBKL2B','PCA3'],
-        ['MOGAT2','UVRAG'],
-        ['MOK','MUCL1'],
-        ['MOK','WARS'],
-        ['MON2','SLC16A7'],
-        ['MORN1','SLC6A9'],
-        ['MOV10','STK25'],
-        ['MOZ','TIF2'],
-        ['MPC2','SLCO1A2'],
-        ['MPHOSPH8','ZBTB17'],
-        ['MPND','RAB8A'],
-        ['MPP2','NRXN3'],
-        ['MPRIP','NTRK1'],
-        ['MPRIP','RAF1'],
-        ['MPRIP','UBB'],
-        ['MRAS','NME9'],
-        ['MRAS','UBA5'],
-        ['MRC2','RND2'],
-        ['MRM1','ZNF33A'],
-        ['MROH1','PARP10'],
-        ['MROH9','RCN2'],
-        ['MRPL13','MTBP'],
-        ['MRPL27','SPAG9'],
-        ['MRPL39','NRIP1'],
-        ['MRPL45','TRPC4AP'],
-        ['MRPL48','STK3'],
-        ['MRPL51','NCAPD2'],
-        ['MRPS16','TTC18'],
-        ['MRPS18C','SIGLEC10'],
-        ['MRPS22','ZNF622'],
-        ['MRPS23','SECISBP2L'],
-        ['MRPS28','PC1'],
-        ['MRPS6','MYO3A'],
-        ['MS4A2','SLC17A3'],
-        ['MSANTD3','XRCC4'],
-        ['MSH5','NFKBIL1'],
-        ['MSH6','RUNX1'],
-        ['MSI1','PXN'],
-        ['MSI2','NEK8'],
-        ['MSI2','SETBP1'],
-        ['MSI2','TEX14'],
-        ['MSI2','TTC40'],
-        ['MSL2','STAG1'],
-        ['MSL2L1','SFRS10'],
-        ['MSLN','WDR90'],
-        ['MSMB','NCOA4'],
-        ['MSMB','PGC'],
-        ['MSN','ROS1'],
-        ['MSRB2','PTER'],
-        ['MSRB3','SRGAP1'],
-        ['MSRB3','TMBIM4'],
-        ['MST1','OSBPL6'],
-        ['MTA1','PIEZO2'],
-        ['MTA3','SEC31A'],
-        ['MTA3','THADA'],
-        ['MTAP','PCDH7'],
-        ['MTBP','SAMD12'],
-        ['MTCP1','TRA@'],
-        ['MTCP1','TRB@'],
-        ['MTF1','SF3A3'],
-        ['MTHFD1','PYGL'],
-        ['MTMR12','TERT'],
-        ['MTMR2','SYVN1'],
-        ['MTMR2','TMEM135'],
-        ['MTMR4','TANC1'],
-        ['MTOR','RASGEF1B'],
-        ['MTOR','TP53BP1'],
-        ['MTS1','MTS2'],
-        ['MTSS1','TATDN1'],
-        ['MTUS2','RIMS1'],
-        ['MUC1','VEGFR2'],
-        ['MUC6','PCBD2'],
-        ['MUC7','RUFY3'],
-        ['MUC7','SEC31A'],
-        ['MUCL1','SLC16A7'],
-        ['MUSK','ZNF618'],
-        ['MYB','NFIB'],
-        ['MYB','PCDHGA1'],
-        ['MYB','QKI'],
-        ['MYB','TRB@'],
-        ['MYB','TYK2'],
-        ['MYBL1','NFIB'],
-        ['MYBL1','RAD51B'],
-        ['MYBL1','YTHDF3'],
-        ['MYBPC1','PDZRN4'],
-        ['MYC','PVT1'],
-        ['MYC','PVT1_1'],
-        ['MYC','RLF'],
-        ['MYC','SDF4'],
-        ['MYC','TRA@'],
-        ['MYC','TXNDC5'],
-        ['MYC','ZBTB5'],
-        ['MYC','ZCCHC7'],
-        ['MYCBP2','RNASEH2B'],
-        ['MYCL','RLF'],
-        ['MYCL1','RLF'],
-        ['MYCL1','SMAP2'],
-        ['MYD88','OXSR1'],
-        ['MYH10','NDEL1'],
-        ['MYH10','RARA'],
-        ['MYH10','USP22'],
-        ['MYH11','SMG1'],
-        ['MYH11','TRIO'],
-        ['MYH11','WNK2'],
-        ['MYH13','RET'],
-        ['MYH14','PRKD2'],
-        ['MYH7','PVT1'],
-        ['MYH9','MYO18B'],
-        ['MYH9','USP6'],
-        ['MYL6B','VWA3A'],
-        ['MYLK','NXPH1'],
-        ['MYLK','REEP5'],
-        ['MYLK','TM7SF2'],
-        ['MYO15B','PRPF3'],
-        ['MYO18A','PDGFRB'],
-        ['MYO18A','SSH2'],
-        ['MYO18B','PI4KA'],
-        ['MYO18B','UBE2R2'],
-        ['MYO19','SKA2'],
-        ['MYO19','TRIM37'],
-        ['MYO1A','RNFT2'],
-        ['MYO1A','XPO5'],
-        ['MYO1D','RARA'],
-        ['MYO1F','VAV1'],
-        ['MYO3A','SLC5A3'],
-        ['MYO3B','TSHZ2'],
-        ['MYO5A','ROS1'],
-        ['MYO5C','TNFAIP8L3'],
-        ['MYO6','SENP6'],
-        ['MYO7A','PAK1'],
-        ['MYO7A','SESN3'],
-        ['MYO9B','RAB22A'],
-        ['MYOF','TNKS2'],
-        ['MYOM1','PTPRM'],
-        ['MYOM1','TGIF1'],
-        ['MYST3','NCOA2'],
-        ['MYST3','NCOA3'],
-        ['MZF1','SMG6'],
-        ['N4BP1','VPS35'],
-        ['NA','RHOA'],
-        ['NA','USP25'],
-        ['NAA30','TERT'],
-        ['NAA50','SLC19A2'],
-        ['NAAA','NAAA'],
-        ['NAAA','PPBPP1'],
-        ['NAALADL2','PIK3CA'],
-        ['NAB2','STAT6'],
-        ['NAB2','TAC3'],
-        ['NABP1','RARA'],
-        ['NACA','NWD1'],
-        ['NACA','PRIM1'],
-        ['NACA','RPL41'],
-        ['NACC2','NTRK2'],
-        ['NADSYN1','SUV420H1'],
-        ['NADSYN1','TMEM138'],
-        ['NAIF1','SCAND2P'],
-        ['NAIP','OCLN'],
-        ['NAMPT','TSPY18P'],
-        ['NAP1L1','STK38L'],
-        ['NAPEPLD','TNFSF12'],
-        ['NARG1','NDUFC1'],
-        ['NARS2','PAK1'],
-        ['NARS2','RARA'],
-        ['NARS2','TMPRSS2'],
-        ['NAT8','PDK4'],
-        ['NAV1','NTRK2'],
-        ['NAV2','TCF7L1'],
-        ['NAV3','PDK3'],
-        ['NAV3','WDFY3'],
-        ['NBEAL2','SETD2'],
-        ['NBPF10','NOTCH2NL'],
-        ['NBPF4','SLC25A24'],
-        ['NBPF6','SLC25A24'],
-        ['NBR1','WSB1'],
-        ['NCAM2','TEC'],
-        ['NCAPD2','PRPF3'],
-        ['NCAPD2','TNFRSF1A'],
-        ['NCAPD3','VPS26B'],
-        ['NCBP1','XPA'],
-        ['NCBP2','ZNF844'],
-        ['NCEH1','TSC22D2'],
-        ['NCK2','RAVER1'],
-        ['NCKAP5','STK39'],
-        ['NCOA1','PAX3'],
-        ['NCOA2','PAX3'],
-        ['NCOA2','RUNXBP2'],
-        ['NCOA2','SRF'],
-        ['NCOA2','TEAD1'],
-        ['NCOA2','VGLL2'],
-        ['NCOA2','ZNF704'],
-        ['NCOA3','SGK2'],
-        ['NCOA3','SULF2'],
-        ['NCOA4','RET'],
-        ['NCOA5','PAX5'],
-        ['NCOA6','PIGU'],
-        ['NCOA6','PRDM14'],
-        ['NCOR1','PIGL'],
-        ['NCOR1','RHOU'],
-        ['ABBA01006766.1','TPPP2'],
-        ['NCOR2','SCARB1'],
-        ['NCOR2','UBC'],
-        ['NDE1','PDGFRB'],
-        ['NDE1','SMG1'],
-        ['NDE1','TRIO'],
-        ['NDE1','WNK2'],
-        ['NDEL1','NISCH'],
-        ['NDEL1','PDGFRB'],
-        ['NDEL1','TNS1'],
-        ['NDFIP1','THEM4'],
-        ['NDRG1','PVT1'],
-        ['NDST2','RUNX1'],
-        ['NDUFA11','RNF126'],
-        ['NDUFA7','PRKCG'],
-        ['NDUFA7','TBRG1'],
-        ['NDUFB4P12','SDR16C5'],
-        ['NDUFB9','PGCP'],
-        ['NDUFS4','PDE4D'],
-        ['NEAT1','RGPD2'],
-        ['NEB','ZBTB17'],
-        ['NEDD4L','NPAS2'],
-        ['NEDD4L','PRPH2'],
-        ['NEGR1','ZRANB2'],
-        ['NEK1','RUNX2'],
-        ['NEK11','TOPBP1'],
-        ['NEK11','UBE2H'],
-        ['NEK2','NVL'],
-        ['NEK4','SETD2'],
-        ['NEK6','PSMB7'],
-        ['NEK6','PTGS1'],
-        ['NEK6','RXRA'],
-        ['NEK6','TNRC6B'],
-        ['NEK7','RAB3GAP2'],
-        ['NEK9','TMED10'],
-        ['NELFA','ZNF177'],
-        ['NELL1','WEE1'],
-        ['NELL2','OS9'],
-        ['NELL2','TMEM117'],
-        ['NEXN-AS1','TINF2'],
-        ['NF1','NLE1'],
-        ['NF1','NLK'],
-        ['NF1','PSMD11'],
-        ['NF1','RAB11FIP4'],
-        ['NF1','SETD2'],
-        ['NF1','TAOK1'],
-        ['NF1','TEX14'],
-        ['NF2','PI4KA'],
-        ['NF2','PIEZO2'],
-        ['NF2','PPIL2'],
-        ['NF2','RHOT1'],
-        ['NFAM1','PTPRZ1'],
-        ['NFASC','NTRK1'],
-        ['NFASC','PRELP'],
-        ['NFASC','RTN3'],
-        ['NFASC','SOX13'],
-        ['NFATC3','PLA2G15'],
-        ['NFE2','R3HDM2'],
-        ['NFE2L2','PAX8'],
-        ['NFIA','RNLS'],
-        ['NFIB','NKAIN2'],
-        ['NFIB','PIM2'],
-        ['NFIB','PTPRD'],
-        ['NFIB','XRCC4'],
-        ['NFKBIB','PAK4'],
-        ['NFKBIL2','RAE1'],
-        ['NFS1','PREX1'],
-        ['NFS1','PXDC1'],
-        ['NFYA','TDRG1'],
-        ['NGFR','SPAG9'],
-        ['NICN1','RASA2'],
-        ['NIN','PDGFRB'],
-        ['NIN','SAV1'],
-        ['NIPAL1','TRPC6'],
-        ['NIPBL','SPEF2'],
-        ['NIPBL','STK24'],
-        ['NISCH','TF'],
-        ['NKAIN2','SENP6'],
-        ['NKAIN3','POMK'],
-        ['NKIRAS1','RAF1'],
-        ['NKTR','TMEM79'],
-        ['NKX2-2','TMPRSS3'],
-        ['NKX2-5','TRD@'],
-        ['NKX6-1','SHANK2-AS3'],
-        ['NLK','PPP1R1B'],
-        ['NLK','RAD51D'],
-        ['NLK','TAOK1'],
-        ['NLK','TMEM199'],
-        ['NLK','WRB'],
-        ['NLRP4','TOX'],
-        ['NLRP8','PPP2R1A'],
-        ['NLRP9P','SRPX2'],
-        ['NME2','RPL27'],
-        ['NME4','TMC5'],
-        ['NOC4L','SDS'],
-        ['NOL4','PVT1'],
-        ['NOL4L','PAX5'],
-        ['NOL4L','RUNX1'],
-        ['NOL5A','TMC2'],
-        ['NOLC1','SHROOM3'],
-        ['NONO','TFE3'],
-        ['NOP2','TCF3'],
-        ['NOP58','STRADB'],
-        ['NOSIP','STK11'],
-        ['NOTCH1','NUP214'],
-        ['NOTCH1','SEC16A'],
-        ['NOTCH1','SNHG7'],
-        ['NOTCH1','TCRB@'],
-        ['NOTCH1','TRA@'],
-        ['NOTCH1','TRB@'],
-        ['NOTCH2','PTGFRN'],
-        ['NOTCH2','SEC22B'],
-        ['NOTCH2','TMEM150C'],
-        ['NOTCH3','SLCO1A2'],
-        ['NOTCH3','VIM'],
-        ['NPAS2','RIF1'],
-        ['NPAT','RPS11'],
-        ['NPEPL1','STX16'],
-        ['NPEPPS','OSBPL9'],
-        ['NPEPPS','RSF1'],
-        ['NPEPPS','TBC1D3'],
-        ['NPEPPS','USP32'],
-        ['NPHS1','SIRT2'],
-        ['NPIPB5','SMG1'],
-        ['NPLOC4','PDE6G'],
-        ['NPM1','NUMA1'],
-        ['NPM1','PTMA'],
-        ['NPM1','RARA'],
-        ['NPM1','TYK2'],
-        ['NPSR1','POU6F2'],
-        ['NPW','SLC9A3R2'],
-        ['NR1D1','THRA'],
-        ['NR4A1','PRG4'],
-        ['NR4A3','PIK3R1'],
-        ['NR4A3','RBP56'],
-        ['NR4A3','TAF15'],
-        ['NR4A3','TAFII68'],
-        ['NR4A3','TCF12'],
-        ['NR4A3','TFG'],
-        ['NR6A1','OBP2B'],
-        ['NRBP1','PMEL'],
-        ['NRBP1','RAB10'],
-        ['NRG1','ODZ4'],
-        ['NRG1','RAB2'],
-        ['NRG1','RBPMS'],
-        ['NRG1','SLC3A2'],
-        ['NRG1','TBL1XR1'],
-        ['NRG1','VAMP2'],
-        ['NRG1','VTCN1'],
-        ['NRG1','WRN'],
-        ['NRG4','PEAK1'],
-        ['NRIP1','TIAM1'],
-        ['NRIP1','UHRF1'],
-        ['NRROS','SGK1'],
-        ['NRXN3','TSHR'],
-        ['NSD1','NUP98'],
-        ['NSD1','RALBP1'],
-        ['NSD1','STIM1'],
-        ['NSD3','NUP98'],
-        ['NSD3','NUT'],
-        ['NSFL1C','SIRPB2'],
-        ['NSL1','VASH2'],
-        ['NSMCE2','PVT1'],
-        ['NSMCE2','SQLE'],
-        ['NTNG2','NUP153'],
-        ['NTRK1','PPL'],
-        ['NTRK1','RABGAP1L'],
-        ['NTRK1','RET'],
-        ['NTRK1','SQSTM1'],
-        ['NTRK1','SSBP2'],
-        ['NTRK1','TFG'],
-        ['NTRK1','TP53'],
-        ['NTRK1','TPM3'],
-        ['NTRK1','TPR'],
-        ['NTRK1','VANGL2'],
-        ['NTRK2','PAN3'],
-        ['NTRK2','QKI'],
-        ['NTRK2','SLMAP'],
-        ['NTRK2','SQSTM1'],
-        ['NTRK2','TFG'],
-        ['NTRK2','TRIM24'],
-        ['NTRK3','RBPMS'],
-        ['NTRK3','SQSTM1'],
-        ['NTRK3','VPS18'],
-        ['NTRK3','ZNF710'],
-        ['NTSR2','ROCK2'],
-        ['NUAK1','UHRF1BP1L'],
-        ['NUAK2','RBM24'],
-        ['NUCKS1','PM20D1'],
-        ['NUDCD1','SYBU'],
-        ['NUDT15','PTMS'],
-        ['NUDT9','SETD5'],
-        ['NUMA1','PML'],
-        ['NUMA1','RARA'],
-        ['NUMA1','SFMBT1'],
-        ['NUMB','TAOK3'],
-        ['NUP107','PDZRN4'],
-        ['NUP107','TSFM'],
-        ['NUP153','RBM24'],
-        ['NUP160','SLC43A3'],
-        ['NUP188','PHYHD1'],
-        ['NUP188','SPTAN1'],
-        ['NUP214','SET'],
-        ['NUP214','SQSTM1'],
-        ['NUP214','XKR3'],
-        ['NUP98','PHF23'],
-        ['NUP98','PMX1'],
-        ['NUP98','POU1F1'],
-        ['NUP98','PRRX1'],
-        ['NUP98','PRRX2'],
-        ['NUP98','PSIP1'],
-        ['NUP98','RAP1GDS1'],
-        ['NUP98','RARG'],
-        ['NUP98','SETBP1'],
-        ['NUP98','TOP1'],
-        ['NUP98','TOP2B'],
-        ['NUP98','WHSC1L1'],
-        ['NUS1','SLC25A13'],
-        ['NUT','ZNF532'],
-        ['NUTM1','SLC12A6'],
-        ['NUTM1','YWHAE'],
-        ['NUTM1','ZNF618'],
-        ['NUTM2A','YWHAE'],
-        ['NUTM2B','YWHAE'],
-        ['NUTM2E','YWHAE'],
-        ['OAZ1','P4HB'],
-        ['OBFC1','SH3PXD2A'],
-        ['OBFC2A','RARA'],
-        ['OBSCN','RNF187'],
-        ['ODF1','STK3'],
-        ['ODF2','TCF7L1'],
-        ['ODF4','ZFYVE20'],
-        ['ODZ2','SRGAP1'],
-        ['ODZ4','PACS1'],
-        ['ODZ4','SAPS3'],
-        ['OGFOD1','TUBD1'],
-        ['OGT','SARM1'],
-        ['OLFML2A','SEPT11'],
-        ['OLIG2','TRA@'],
-        ['OLR1','XIAP'],
-        ['OMA1','TACSTD2'],
-        ['OMD','USP6'],
-        ['OPA3','SIRT2'],
-        ['OPRD1','UNQ2998'],
-        ['OPRD1','ZMYM4'],
-        ['OPRL1','SGPP2'],
-        ['ORC2L','SF3B1'],
-        ['OS9','PPP1R12A'],
-        ['OS9','PTGES3'],
-        ['OS9','SLC35E3'],
-        ['OSBPL2','PLCG1'],
-        ['OSBPL9','ZNF326'],
-        ['OSGIN1','TCF25'],
-        ['OSGIN2','RIPK2'],
-        ['OSTBETA','RASL12'],
-        ['OTUB1','SHANK2'],
-        ['OVCH2','ZBTB8OS'],
-        ['P11','RAPGEF3'],
-        ['P2RX3','RTN4RL2'],
-        ['P2RY8','PAX5'],
-        ['P4HA2','TBCK'],
-        ['P54NRB','TFE3'],
-        ['PACRG','QKI'],
-        ['PACS1','PTEN'],
-        ['PACS1','RBM14'],
-        ['PACS1','SCYL1'],
-        ['PAFAH1B1','USP6'],
-        ['PAFAH1B2','SIK3'],
-        ['PAFAH1B2','STAU1'],
-        ['PAK1','PDGFD'],
-        ['PAK1','SPINT2'],
-        ['PAK2','RPL19'],
-        ['PAK3','STAG2'],
-        ['PAK7','PANK2'],
-        ['PALM','PIP5K1C'],
-        ['PALM','PRSSL1'],
-        ['PAM','ST8SIA4'],
-        ['PANK1','PPP2R2D'],
-        ['PANX1','TIMP3'],
-        ['PAPD7','RAF1'],
-        ['PAPSS2','SCGB2A2'],
-        ['PAQR3','ULK4'],
-        ['PARD3','PRTFDC1'],
-        ['PARD6G','TAOK1'],
-        ['PARP14','TFE3'],
-        ['PARP14','TTBK1'],
-        ['PARP4','VRK3'],
-        ['PARP4','ZNF331'],
-        ['PASD1','TEC'],
-        ['PATL1','TECTA'],
-        ['PAX3','STK39'],
-        ['PAX5','PML'],
-        ['PAX5','POM121'],
-        ['PAX5','RHOXF2'],
-        ['PAX5','RNF38'],
-        ['PAX5','SLCO1B3'],
-        ['PAX5','SP2'],
-        ['PAX5','TAF3'],
-        ['PAX5','TEL'],
-        ['PAX5','TMEM14B'],
-        ['PAX5','TMPRSS9'],
-        ['PAX5','ZCCHC7'],
-        ['PAX5','ZNF276'],
-        ['PAX5','ZNF521'],
-        ['PAX7','TNKS1BP1'],
-        ['PAX7','VPS13D'],
-        ['PAX8','PPARG'],
-        ['PAX9','RND2'],
-        ['PBRM1','WDR82'],
-        ['PBX1','TCF3'],
-        ['PBX4','SLC44A2'],
-        ['PBXIP1','PMVK'],
-        ['PCBD2','TPM3'],
-        ['PCBP2','UHRF1BP1L'],
-        ['PCCB','PIK3CB'],
-        ['PCDHGC3','QKI'],
-        ['PCDHGC4','QKI'],
-        ['PCGF2','TAOK1'],
-        ['PCIF1','TENM2'],
-        ['PCLO','STK3'],
-        ['PCLO','TRRAP'],
-        ['PCM1','RET'],
-        ['PCMTD2','SAMD10'],
-        ['PCSK1','UNC119'],
-        ['PCTP','RARA'],
-        ['PDAP1','SMURF1'],
-        ['PDCD10','RET'],
-        ['PDCD2L','UBA2'],
-        ['PDCD6','SLC12A7'],
-        ['PDE10A','POLB'],
-        ['PDE10A','PSMB1'],
-        ['PDE11A','ZNF521'],
-        ['PDE1C','ZIM2'],
-        ['PDE4D','PLK2'],
-        ['PDE4D','PPP2R2B'],
-        ['PDE4DIP','PDGFRB'],
-        ['PDE8A','SCAND2'],
-        ['PDE8B','UIMC1'],
-        ['PDE8B','WDR41'],
-        ['PDE9A','VWF'],
-        ['PDGFRA','SCAF11'],
-        ['PDGFRA','STRN'],
-        ['PDGFRA','TMEM165'],
-        ['PDGFRB','PRKG2'],
-        ['PDGFRB','RAB5EP'],
-        ['PDGFRB','RABEP1'],
-        ['PDGFRB','RABPT5'],
-        ['PDGFRB','SART3'],
-        ['PDGFRB','SDHA'],
-        ['PDGFRB','SPECC1'],
-        ['PDGFRB','SPTBN1'],
-        ['PDGFRB','SSBP2'],
-        ['PDGFRB','TEL'],
-        ['PDGFRB','TNIP1'],
-        ['PDGFRB','TP53BP1'],
-        ['PDGFRB','TPM3'],
-        ['PDGFRB','TRIP11'],
-        ['PDGFRB','WDR48'],
-        ['PDGFRB','ZEB2'],
-        ['PDGFRB','ZMYND8'],
-        ['PDHX','PVT1'],
-        ['PDIA4','SIAE'],
-        ['PDIA5','RAB6B'],
-        ['PDK2','TMEM49'],
-        ['PDK2','USP54'],
-        ['PDLIM1','ZBBX'],
-        ['PDLIM4','RAD50'],
-        ['PDLIM5','TCEB1'],
-        ['PDPN','PRKCB'],
-        ['PDRG1','RUNX1T1'],
-        ['PDS5A','PLAC8'],
-        ['PDSS2','SGK1'],
-        ['PDZD7','RUNX1'],
-        ['PDZK1IP1','TAL1'],
-        ['PDZRN4','PKM2'],
-        ['PDZRN4','SCYL3'],
-        ['PDZRN4','SLC35E3'],
-        ['PEAK1','PSTPIP1'],
-        ['PEAK1','TJP1'],
-        ['PEAK1','TM9SF3'],
-        ['PEAK1','VPS33B'],
-        ['PEBP4','RHOBTB2'],
-        ['PELI2','PGF'],
-        ['PELP1','XAGE1B'],
-        ['PEMT','SLC35B1'],
-        ['PEPD','RHPN2'],
-        ['PERLD1','PPM1D'],
-        ['PERLD1','SGMS2'],
-        ['PEX2','YWHAZ'],
-        ['PFKFB3','RGS10'],
-        ['PFKM','SLC11A2'],
-        ['PFKP','ZNF423'],
-        ['PGA4','TSPYL2'],
-        ['PGAP3','RARA'],
-        ['PGC','SGK1'],
-        ['PGC','WNK1'],
-        ['PGGT1B','TERT'],
-        ['PGLYRP1','TMEM45B'],
-        ['PGM5','PIP5K1B'],
-        ['PHACTR4','PIP5K1A'],
-        ['PHACTR4','RCC1'],
-        ['PHB','SPINK13'],
-        ['PHB','ZNF652'],
-        ['PHF11','RNASEH2B'],
-        ['PHF15','SEC31A'],
-        ['PHF15','UBE2B'],
-        ['PHF17','ZFHX3'],
-        ['PHF20L1','SAMD12'],
-        ['PHF21A','SLC1A2'],
-        ['PHF21B','PI4KA'],
-        ['PHF3','PTP4A1'],
-        ['PHKG1','PSPH'],
-        ['PHLPP1','ZNF804A'],
-        ['PHOSPHO1','SPAG9'],
-        ['PHTF2','PPP3CB'],
-        ['PI3','RBM12'],
-        ['PI4K2A','ZDHHC16'],
-        ['PI4KB','SELENBP1'],
-        ['PIBF1','POR'],
-        ['PICALM','RCC1'],
-        ['PICALM','SYTL2'],
-        ['PICALM','TEX10'],
-        ['PIGG','SPINK2'],
-        ['PIK3C2A','TEAD1'],
-        ['PIK3C2B','PLEKHA6'],
-        ['PIK3C3','RPRD1A'],
-        ['PIK3C3','TRPC6'],
-        ['PIK3C3','TWSG1'],
-        ['PIK3CA','TBL1XR1'],
-        ['PIK3CA','USP13'],
-        ['PIK3CB','PLS1'],
-        ['PIK3CB','TSPO'],
-        ['PIK3CB','VTI1A'],
-        ['PIK3CD','RERE'],
-        ['PIK3R2','USP8'],
-        ['PIKFYVE','TDRD3'],
-        ['PIKFYVE','ZNF124'],
-        ['PIM3','SCO2'],
-        ['PIM3','SELO'],
-        ['PIM3','SIK1'],
-        ['PIM3','SRSF7'],
-        ['PIM3','TRABD'],
-        ['PIM3','ZADH2'],
-        ['PION','STYXL1'],
-        ['PIP4K2A','RIMKLB'],
-        ['PIP4K2A','XRN1'],
-        ['PIP4K2B','RAD51C'],
-        ['PIP4K2C','R3HDM2'],
-        ['PIP4K2C','SRI'],
-        ['PIP5K1B','PTAR1'],
-        ['PIP5K1B','STK24'],
-        ['PIP5K1B','ZNF37A'],
-        ['PIP5K1C','PPM1H'],
-        ['PIP5K2B','RAD51C'],
-        ['PIPOX','PPP1R1B'],
-        ['PIR','SIK2'],
-        ['PIRT','ZNF566'],
-        ['PITPNA','RAD51C'],
-        ['PITPNC1','PRKCA'],
-        ['PITPNC1','RARA'],
-        ['PITPNC1','TLK2'],
-        ['PKD1','UBE2J2'],
-        ['PKD1L1','RIF1'],
-        ['PKD1L1','TNS3'],
-        ['PKHD1L1','PTK2'],
-        ['PKIA','RARA'],
-        ['PKIG','STK4'],
-        ['PKMYT1','ZNF707'],
-        ['PKN1','TECR'],
-        ['PKN2','RAB3B'],
-        ['PKN2','TUFT1'],
-        ['PKN3','TRIM65'],
-        ['PKP2','TNFAIP2'],
-        ['PLA2R1','RBMS1'],
-        ['PLAG1','RAD51L1'],
-        ['PLAG1','TCEA1'],
-        ['PLCB1','ROR1'],
-        ['PLCB3','VEGFB'],
-        ['PLCD4','STK16'],
-        ['PLCG1','TOP1'],
-        ['PLDN','SQRDL'],
-        ['PLEKHD1','SLC39A9'],
-        ['PLEKHF2','ZEB1'],
-        ['PLEKHH2','PRKCE'],
-        ['PLEKHM2','TMEM51'],
-        ['PLGRKT','RAB3GAP2'],
-        ['PLK1','RNF40'],
-        ['PLK4','TBC1D9'],
-        ['PLK4','UPF3B'],
-        ['PLSCR1','SLC25A36'],
-        ['PLXDC1','RARA'],
-        ['PLXNA2','RUNX1'],
-        ['PLXND1','TMCC1'],
-        ['PLZF','RARA'],
-        ['PMEL','RIPK4'],
-        ['PML','RARA'],
-        ['PML','TIF1'],
-        ['PML','ZNF145'],
-        ['PMS2','POLR2J3'],
-        ['PNPLA7','WDR34'],
-        ['PNPLA7','WDR85'],
-        ['POLB','UNC5D'],
-        ['POLB','UVRAG'],
-        ['POLD1','PRR12'],
-        ['POLDIP2','RARA'],
-        ['POLN','SH3BP2'],
-        ['POLR1D','SPECC1'],
-        ['POLR2A','WRAP53'],
-        ['POLR2K','STK3'],
-        ['POLR2K','VPS13B'],
-        ['POLR3GL','PROM2'],
-        ['POMGNT1','TSPAN1'],
-        ['POMK','ST6GAL1'],
-        ['POMT2','SCN2B'],
-        ['POU2F2','VRK3'],
-        ['PPA2','TBCK'],
-        ['PPAP2C','RTCA'],
-        ['PPAPDC1A','PVT1'],
-        ['PPARD','TP53'],
-        ['PPARG','VGLL4'],
-        ['PPARGC1B','SMF'],
-        ['PPFIA1','RARA'],
-        ['PPFIBP1','ROS1'],
-        ['PPFIBP1','SMCO2'],
-        ['PPFIBP2','RET'],
-        ['PPIG','ZNF430'],
-        ['PPIL4','SEC63'],
-        ['PPM1B','SLC3A1'],
-        ['PPM1F','SPECC1L'],
-        ['PPM1H','TBC1D30'],
-        ['PPOX','UHMK1'],
-        ['PPP1CA','RPS6KB2'],
-        ['PPP1CB','YPEL5'],
-        ['PPP1R12A','SEPT10'],
-        ['PPP1R12B','SNX27'],
-        ['PPP1R13L','ZNF541'],
-        ['PPP1R1B','PSMD3'],
-        ['PPP1R1B','STARD3'],
-        ['PPP1R9A','WBSCR17'],
-        ['PPP2CA','ROCK2'],
-        ['PPP2R2B','YTHDC2'],
-        ['PPP2R2C','SEC31A'],
-        ['PPP2R5E','PTK2'],
-        ['PPP3CA','SEPT11'],
-        ['PPP3R1','TTC27'],
-        ['PPP5D1','ZNF83'],
-        ['PPP6R2','SPECC1L'],
-        ['PPT1','SPP1'],
-        ['PRAME','RPTOR'],
-        ['PRAMEF15','PUS1'],
-        ['PRAP1','ZNF511'],
-        ['PRB3','ZNF217'],
-        ['PRCC','TFE3'],
-        ['PRCC','TMED5'],
-        ['PRDM1','TMEM41B'],
-        ['PRDM16','PRKCZ'],
-        ['PRDM16','PSMD2'],
-        ['PRDM16','RPN1'],
-        ['PRDM16','RUNX1'],
-        ['PRDM16','SKI'],
-        ['PRDM6','SNX2'],
-        ['PRDM7','RUNX1'],
-        ['PRDX1','TESK2'],
-        ['PRDX4','RUNX1'],
-        ['PRDX4','ZNF668'],
-        ['PREX1','SERINC2'],
-        ['PREX1','SLC9A8'],
-        ['PRG2','SLC43A3'],
-        ['PRICKLE2','SULF2'],
-        ['PRICKLE2-AS1','SULF2'],
-        ['PRKAA1','TBC1D5'],
-        ['PRKAA2','SLC35B1'],
-        ['PRKAA2','USP24'],
-        ['PRKAG2','RHEB'],
-        ['PRKAG2','ST7'],
-        ['PRKAR1A','RARA'],
-        ['PRKAR1A','RET'],
-        ['PRKAR2A','SLC26A6'],
-        ['PRKCA','SLC44A1'],
-        ['PRKCA','TANC2'],
-        ['PRKCB','SPNS1'],
-        ['PRKCB','TNRC6A'],
-        ['PRKCE','TRIM13'],
-        ['PRKCH','VWA2'],
-        ['PRKCI','PTBP2'],
-        ['PRKCZ','SKI'],
-        ['PRKD3','TMEM51'],
-        ['PRKDC','PXDNL'],
-        ['PRKDC','SPIDR'],
-        ['PRKDC','ZNF114'],
-        ['PRKG1','SUPV3L1'],
-        ['PRKG1','TRIM22'],
-        ['PRKG1','TRIM5'],
-        ['PRKG1','VGLL4'],
-        ['PRMT2','RCAN1'],
-        ['PRMT7','SLC7A6'],
-        ['PRMT8','WNK1'],
-        ['PROM1','TAPT1'],
-        ['PROX1','SMOC2'],
-        ['PRPF38A','RUNX1'],
-        ['PRPSAP1','PSCD1'],
-        ['PRR11','RARA'],
-        ['PRR11','WDR68'],
-        ['PRR12','ZMIZ1'],
-        ['PRR5','SYT13'],
-        ['PRR5-ARHGAP8','SRRD'],
-        ['PRRC1','RUNX1'],
-        ['PRRC2A','SETX'],
-        ['PRSS3','UBE2R2'],
-        ['PRSS50','TTTY5'],
-        ['PSEN1','STK4'],
-        ['PSF','TFE3'],
-        ['PSKH1','RANBP10'],
-        ['PSKH1','TSNAXIP1'],
-        ['PSMA6','SHMT1'],
-        ['PSMB5','RBM23'],
-        ['PSMB8','TAP1'],
-        ['PSMD8','SIPA1L3'],
-        ['PSPC1','ZMYM5'],
-        ['PSPH','SEPT7P2'],
-        ['PTBP2','UBIAD1'],
-        ['PTBP2','VRK2'],
-        ['PTBP3','SUSD1'],
-        ['PTC','RET'],
-        ['PTC3','RET'],
-        ['PTC7','RET'],
-        ['PTCH1','RET'],
-        ['PTDSS1','SPRYD3'],
-        ['PTEN','SEC31A'],
-        ['PTGES3','PTPRB'],
-        ['PTHLH','RUNX1'],
-        ['PTK2','RNF139'],
-        ['PTK2','STK3'],
-        ['PTK2','THOC2'],
-        ['PTK2B','STAG2'],
-        ['PTK2B','TMEM2'],
-        ['PTK6','ZNF142'],
-        ['PTOV1','VRK3'],
-        ['PTPN13','PTPN13'],
-        ['PTPN13','TMEM63A'],
-        ['PTPN13','TUBA1A'],
-        ['PTPN2','UBLCP1'],
-        ['PTPN21','TBC1D10B'],
-        ['PTPN22','VAV3'],
-        ['PTPRD','RPS6KC1'],
-        ['PTPRD','SPTAN1'],
-        ['PTPRF','ST3GAL3'],
-        ['PTPRG','TEX14'],
-        ['PTPRK','RSPO3'],
-        ['PTPRK','THEMIS'],
-        ['PTPRR','SRGAP1'],
-        ['PTPRT','RALY'],
-        ['PTRF','STAT3'],
-        ['PUM1','SAPS3'],
-        ['PUM1','TRERF1'],
-        ['PUS7','SRPK2'],
-        ['PVRL2','SNTG1'],
-        ['PVRL2','TRA@'],
-        ['PVT1','RBBP8NL'],
-        ['PVT1','RGS22'],
-        ['PVT1','SLC1A2'],
-        ['PVT1','SLC30A8'],
-        ['PVT1','SLC7A7'],
-        ['PVT1','SNRPB2'],
-        ['PVT1','TATDN1'],
-        ['PVT1','TLE4'],
-        ['PVT1','TMEM87B'],
-        ['PVT1','TRD@'],
-        ['PVT1','WWOX'],
-        ['PVT1','ZCCHC7'],
-        ['PWP1','TNFRSF11A'],
-        ['PWWP2A','ROS1'],
-        ['PXK','RPP14'],
-        ['PXT1','SRPK1'],
-        ['PYY','UBE2M'],
-        ['QKI','RAF1'],
-        ['QRICH1','RHOA'],
-        ['R3HDM2','RDH16'],
-        ['R3HDM2','SORBS2'],
-        ['R3HDM2','TSFM'],
-        ['R3HDM2','XRCC6BP1'],
-        ['RAB1A','XPO1'],
-        ['RAB20','VWC2'],
-        ['RAB22A','TTC3'],
-        ['RAB2A','SNX9'],
-        ['RAB3IP','SRGAP1'],
-        ['RAB6A','RARA'],
-        ['RAB6A','ZFP91'],
-        ['RAB6IP2','RET'],
-        ['RABGAP1L','RBKS'],
-        ['RABGAP1L','ZBTB37'],
-        ['RABL3','RYK'],
-        ['RACGAP1','WIBG'],
-        ['RAD21','UTP23'],
-        ['RAD23A','ZNF562'],
-        ['RAD51D','SLCO6A1'],
-        ['RAD52','WNK1'],
-        ['RAD54B','SSBP4'],
-        ['RAD54L2','VPRBP'],
-        ['RAD9A','SHANK2'],
-        ['RAE1','STX16'],
-        ['RAE1','STX16-NPEPL1'],
-        ['RAE1','ZMYND8'],
-        ['RAF1','RBM35A'],
-        ['RAF1','SRGAP3'],
-        ['RAF1','TMEM40'],
-        ['RAF1','TRAK1'],
-        ['RAF1','XPC'],
-        ['RALA','ZNF610'],
-        ['RALY','SYNGAP1'],
-        ['RANBP17','TRD@'],
-        ['RAP1B','SCYL2'],
-        ['RAP1B','TMBIM4'],
-        ['RAPGEF3','SLC48A1'],
-        ['RARA','STAT5B'],
-        ['RARA','TBLR1'],
-        ['RARA','TIF1'],
-        ['RARA','USP22'],
-        ['RARA','USP32'],
-        ['RARA','ZBTB16'],
-        ['RARA','ZNF145'],
-        ['RARA','ZNF595'],
-        ['RARA','ZNF732'],
-        ['RARB','UBE2E1'],
-        ['RARG','WIPI1'],
-        ['RASA2','SPATA21'],
-        ['RASGRF2','RNF145'],
-        ['RASGRP3','RPS6KA1'],
-        ['RASSF2','SRXN1'],
-        ['RASSF3','TBK1'],
-        ['RASSF3','TTYH2'],
-        ['RASSF4','RET'],
-        ['RASSF7','SCUBE2'],
-        ['RASSF8','SSPN'],
-        ['RASSF8','WNK1'],
-        ['RAX','SMAD4'],
-        ['RB1','RFX3'],
-        ['RB1','SLC15A2'],
-        ['RB1','TSC22D1'],
-        ['RB1','UNC79'],
-        ['RBBP4','STK40'],
-        ['RBFOX1','SIK2'],
-        ['RBFOX1','VASN'],
-        ['RBM10','TFE3'],
-        ['RBM23','TMEM68'],
-        ['RBM28','VWA5B2'],
-        ['RBM42','TCEAL4'],
-        ['RBM47','ROCK1'],
-        ['RBM6','SRGAP1'],
-        ['RBMS1','SEMA4C'],
-        ['RBMS2','SPRYD4'],
-        ['RC3H2','RGS3'],
-        ['RCAN1','RUNX1'],
-        ['RCC','TFE3'],
-        ['RCC1','UBE2D2'],
-        ['RCC17','TFE3'],
-        ['RCHY1','SFXN3'],
-        ['RCHY1','YWHAG'],
-        ['RDH11','VTI1B'],
-        ['RDM1','TANC2'],
-        ['REEP5','SLC35A2'],
-        ['REEP6','STK11'],
-        ['REG4','RPS10'],
-        ['REG4','RPS10-NUDT3'],
-        ['REG4','TFF2'],
-        ['RELA','SRF'],
-        ['RELA','YAP1'],
-        ['RELA','ZMYND8'],
-        ['REN','ZC3H11A'],
-        ['RER1','ZC3H7B'],
-        ['RERE','SLC2A5'],
-        ['RERE','SLC9A1'],
-        ['RET','RUFY2'],
-        ['RET','SPECC1L'],
-        ['RET','TBL1XR1'],
-        ['RET','TFG'],
-        ['RET','TRIM24'],
-        ['RET','TRIM27'],
-        ['RET','TRIM33'],
-        ['RET','UEVLD'],
-        ['RFT1','UQCRC2'],
-        ['RFTN1','SCD5'],
-        ['RFWD3','STK31'],
-        ['RFX5','SELENBP1'],
-        ['RFX5','ZC3H12B'],
-        ['RGNEF','ZFP62'],
-        ['RGS17','TBL1XR1'],
-        ['RGS22','SYCP1'],
-        ['RGS3','SLC31A2'],
-        ['RGS7','SMYD3'],
-        ['RHOA','TAL1'],
-        ['RHOA','WWTR1'],
-        ['RHOC','RPS6KA1'],
-        ['RIC3','TMEM38B'],
-        ['RIC3','TRB@'],
-        ['RIC3','TRBC2'],
-        ['RIMS2','STK3'],
-        ['RIN2','RPL36'],
-        ['RIOK1','USP45'],
-        ['RIOK3','TAF4B'],
-        ['RIOK3','TMEM241'],
-        ['RIPK1','SERPINB9'],
-        ['RIPK4','TMPRSS2'],
-        ['RIT2','TMX3'],
-        ['RLF','SMAP2'],
-        ['RLF','UBE2J2'],
-        ['RLN1','RLN2'],
-        ['RMI1','STX17'],
-        ['RMND5B','SFXN1'],
-        ['RNASEH2B','RREB1'],
-        ['RNASEH2B','TRIM13'],
-        ['RNF103','UCK2'],
-        ['RNF11','TAOK3'],
-        ['RNF111','TCF12'],
-        ['RNF121','SFRS2IP'],
-        ['RNF125','RNF138'],
-        ['RNF165','SSR1'],
-        ['RNF170','YES1'],
-        ['RNF19A','STK3'],
-        ['RNF19B','YARS'],
-        ['RNF213','RPS6KB1'],
-        ['RNF213','SLC26A11'],
-        ['RNF38','ROCK1'],
-        ['RNF43','SUPT4H1'],
-        ['RNFT1','TRIM37'],
-        ['ROBO1','XPC'],
-        ['ROCK1','TBL1XR1'],
-        ['ROD1','SUSD1'],
-        ['ROR1','ZNF362'],
-        ['RORA','SMARCB1'],
-        ['ROS1','SDC4'],
-        ['ROS1','SLC16A10'],
-        ['ROS1','SLC34A2'],
-        ['ROS1','SLC4A4'],
-        ['ROS1','TFG'],
-        ['ROS1','TPM3'],
-        ['ROS1','ZCCHC8'],
-        ['RPAP3','TRPM2'],
-        ['RPL14','SLC7A11'],
-        ['RPL14','SRP14'],
-        ['RPL22','RUNX1'],
-        ['RPL22','RUNX1'],
-        ['RPL28','TMEM190'],
-        ['RPL3','SEPT11'],
-        ['RPL36','TTYH1'],
-        ['RPL38','TTYH2'],
-        ['RPL39L','UBXN7'],
-        ['RPN2','STK17A'],
-        ['RPN2','UQCC'],
-        ['RPRD2','SHC1'],
-        ['RPS2P32','THADA'],
-        ['RPS6KA3','VPREB1'],
-        ['RPS6KB1','SNF8'],
-        ['RPS6KB1','TMEM49'],
-        ['RPS6KB1','TUBD1'],
-        ['RPS6KB1','VMP1'],
-        ['RPS6KB2','ST3GAL2'],
-        ['RPS6KC1','SDCCAG8'],
-        ['RPS6KC1','TFPI'],
-        ['RPTOR','TULP4'],
-        ['RREB1','TFE3'],
-        ['RRM2B','STK3'],
-        ['RRP15','USH2A'],
-        ['RSBN1','TRBVA'],
-        ['RTF1','TYRO3'],
-        ['RTN1','SSH2'],
-        ['RTN3','TRPC6'],
-        ['RUFY1','TMEM178B'],
-        ['RUNDC2A','SNX29'],
-        ['RUNX1','RUNX1T1'],
-        ['RUNX1','SH3D19'],
-        ['RUNX1','SIN3A'],
-        ['RUNX1','SUMO2P13'],
-        ['RUNX1','SV2B'],
-        ['RUNX1','TCF12'],
-        ['RUNX1','TRPS1'],
-        ['RUNX1','TSPEAR'],
-        ['RUNX1','UBL7-AS1'],
-        ['RUNX1','UGGT2'],
-        ['RUNX1','USP16'],
-        ['RUNX1','USP42'],
-        ['RUNX1','YTHDF2'],
-        ['RUNX1','ZADH2'],
-        ['RUNX1','ZFPM2'],
-        ['RUNX1','ZNF687'],
-        ['RUNX2','USP6'],
-        ['RWDD3','TMEM56'],
-        ['RXFP2','ZNF828'],
-        ['RYR1','SMARCA4'],
-        ['RYR2','USH2A'],
-        ['S100A7','VAV1'],
-        ['S100B','WBP2NL'],
-        ['SACS','SGCG'],
-        ['SAE1','TGFB1'],
-        ['SAMD5','SASH1'],
-        ['SBF1','TSHR'],
-        ['SBF2','TMEM99'],
-        ['SBK1','TXLNA'],
-        ['SBNO2','STK11'],
-        ['SCAF1','TRAPPC6A'],
-        ['SCAI','ZBTB34'],
-        ['SCAMP2','WDR72'],
-        ['SCAPER','TM6SF1'],
-        ['SCARB1','UBC'],
-        ['SCARB2','SCARB2'],
-        ['SCARB2','SERPINE1'],
-        ['SCARB2','STAU2'],
-        ['SCARB2','TNFAIP8'],
-        ['SCD5','TMEM150C'],
-        ['SCFD2','YES1'],
-        ['SCGB3A1','ZGLP1'],
-        ['SCL','TRD@'],
-        ['SCML2','SH3KBP1'],
-        ['SCN4B','SCNN1G'],
-        ['SCNN1A','TNFRSF1A'],
-        ['SCO1','TTC7A'],
-        ['SCUBE2','ZNF195'],
-        ['SCYL1','SPATA2L'],
-        ['SCYL3','SYN3'],
-        ['SCYL3','TIMP3'],
-        ['SDC1','SMYD1'],
-        ['SDC4','SPCS1'],
-        ['SDC4P','SEC14L4'],
-        ['SEC31A','SEC31A'],
-        ['SEC31A','SMC1A'],
-        ['SECISBP2L','USO1'],
-        ['SELT','TRIM36'],
-        ['SEMA3C','VRK3'],
-        ['SEMA6B','SLC27A1'],
-        ['SEPP1','SERPINA3'],
-        ['SEPT11','SEPT11'],
-        ['SEPT11','SHROOM3'],
-        ['SEPT11','SYT11'],
-        ['SEPT11','UBE3C'],
-        ['SEPT9','ZMYND8'],
-        ['SERF1A','SMN1'],
-        ['SERHL2','THSD4'],
-        ['SERP1','ZBTB41'],
-        ['SERPINA1','TF'],
-        ['SERPINB9','TBCEL'],
-        ['SERPINE3','ZNF22'],
-        ['SETD2','SPATA12'],
-        ['SF1','SF3B1'],
-        ['SF3B4','SMYD5'],
-        ['SFPQ','TFE3'],
-        ['SFSWAP','TCP11L2'],
-        ['SFSWAP','ULK1'],
-        ['SGCD','SNRPG'],
-        ['SGK1','UTRN'],
-        ['SGMS1','STK10'],
-        ['SGMS1','ZEB1'],
-        ['SGPP2','ULK4'],
-        ['SGTA','SLC39A3'],
-        ['SH2B1','ZDHHC8'],
-        ['SH2B3','WNK1'],
-        ['SH3BP5','VGLL4'],
-        ['SH3KBP1','TMTC4'],
-        ['SH3PXD2B','STK10'],
-        ['SHBG','TP53'],
-        ['SHC2','TMEM259'],
-        ['SHC2','TYK2'],
-        ['SHFM1','ZNF569'],
-        ['SHROOM3','SHROOM3'],
-        ['SIAE','TPT1'],
-        ['SIDT2','TAGLN'],
-        ['SIGLEC17P','SORCS1'],
-        ['SIGLEC9','TLK2'],
-        ['SIK1','TMPRSS2'],
-        ['SIK1','TRAPPC10'],
-        ['SIK3','UBR1'],
-        ['SIL','TAL1'],
-        ['SIP1','ZEB2'],
-        ['SIPA1L3','ZNF585A'],
-        ['SIRPG','WWOX'],
-        ['SIRT2','ZNF45'],
-        ['SKAP1','THRA'],
-        ['SKI','SSU72'],
-        ['SKIL','SLC45A3'],
-        ['SKIL','TMPRSS2'],
-        ['SKP2','SLC1A3'],
-        ['SLAMF1','UVRAG'],
-        ['SLC12A2','ZNF322A'],
-        ['SLC22A23','TNFRSF21'],
-        ['SLC22A9','TMED8'],
-        ['SLC25A32','TRIB1'],
-        ['SLC25A32','UBR5'],
-        ['SLC26A10','TSFM'],
-        ['SLC26A4','SLC39A9'],
-        ['SLC2A5','ZNF292'],
-        ['SLC30A8','WDR67'],
-        ['SLC35A1','TSHZ2'],
-        ['SLC35E3','YEATS4'],
-        ['SLC35F1','STK24'],
-        ['SLC45A3','UBE3A'],
-        ['SLC4A1AP','SUPT7L'],
-        ['SLC5A3','ZNF252P'],
-        ['SLC6A16','TEAD2'],
-        ['SLC6A20','URI1'],
-        ['SLC7A13','TSSC2'],
-        ['SLC9A3','TRIO'],
-        ['SLC9B2','TBCK'],
-        ['SMARCA2','VLDLR'],
-        ['SMARCA2','ZNF384'],
-        ['SMARCA4','TYK2'],
-        ['SMARCA4','ZNF254'],
-        ['SMARCC2','TSFM'],
-        ['SMARCD2','STK11'],
-        ['SMARCE1','TMEM99'],
-        ['SMCHD1','USP9X'],
-        ['SMEK1','SRM'],
-        ['SMG5','TMEM79'],
-        ['SMIM14','STK32B'],
-        ['SMYD3','XRN1'],
-        ['SMYD3','ZNF670'],
-        ['SMYD3','ZNF695'],
-        ['SNAP91','USP45'],
-        ['SNHG5','SNX14'],
-        ['SNTB2','VPS4A'],
-        ['SNTG2','TRPM6'],
-        ['SNX2','STK10'],
-        ['SORCS2','TADA2B'],
-        ['SORD','SPG11'],
-        ['SOX8','TRAC'],
-        ['SP1','TMEM132D'],
-        ['SP3','STK39'],
-        ['SP7','TUBB1P2'],
-        ['SPAG16','YES1'],
-        ['SPARC','TNKS1BP1'],
-        ['SPECC1L','TXNRD2'],
-        ['SPINK5','STK32A'],
-        ['SPOCK1','TBC1D9B'],
-        ['SPRR2B','STK3'],
-        ['SPRR2E','STK3'],
-        ['SPRYD3','TRAPPC9'],
-        ['SPTAN1','TRAF4'],
-        ['SREBF1','TOM1L2'],
-        ['SREBF2','XRCC6'],
-        ['SRGAP3','TATDN2'],
-        ['SRP68','URM1'],
-        ['SRSF3','USP6'],
-        ['SRSF6','SVEP1'],
-        ['SS18','SSX'],
-        ['SS18','SSX1'],
-        ['SS18','SSX2'],
-        ['SS18','SSX2B'],
-        ['SS18','SSX4'],
-        ['SS18L1','SSX1'],
-        ['SSB','UBR3'],
-        ['SSBP1','WEE2'],
-        ['SSBP3','TMEM48'],
-        ['SSH2','SUZ12'],
-        ['SSH2','TCEAL6'],
-        ['SSX','SYT'],
-        ['SSX1','SSX1'],
-        ['SSX1','SYT'],
-        ['SSX2','SYT'],
-        ['ST6GAL1','WHSC1'],
-        ['ST7L','THAP1'],
-        ['STAG1','STXBP5L'],
-        ['STAG3L2','TSGA10IP'],
-        ['STARD3','STRADA'],
-        ['STARD3','TAC4'],
-        ['STAU1','TOP1'],
-        ['STIL','TAL1'],
-        ['STK10','UBE2D2'],
-        ['STK11','TYK2'],
-        ['STK24','TMEM159'],
-        ['STK24','TMTC4'],
-        ['STK24','TRIQK'],
-        ['STK3','SULT1A3'],
-        ['STK3','VPS13B'],
-        ['STK3','ZNF706'],
-        ['STK38','TDRD7'],
-        ['STK38','VEGFA'],
-        ['STK38','ZNF184'],
-        ['STK38L','WNK1'],
-        ['STK39','TMEM245'],
-        ['STK4','TSHZ2'],
-        ['STK40','THRAP3'],
-        ['STRADA','TANC2'],
-        ['STRN4','TECR'],
-        ['STXBP6','TCF12'],
-        ['SUB1','WHSC1'],
-        ['SULF2','UBE2V1'],
-        ['SUPT4H1','ZBTB40'],
-        ['SUSP1','TCBA1'],
-        ['SYAP1','TXLNG'],
-        ['SYNRG','TOB1'],
-        ['SYNRG','ZNF384'],
-        ['SYT9','TDRD5'],
-        ['TAF15','TEC'],
-        ['TAF15','ZNF384'],
-        ['TAF3','ZDHHC14'],
-        ['TAF6L','TMEM179B'],
-        ['TAL1','TCTA'],
-        ['TAL1','TRB@'],
-        ['TAL1','TRD@'],
-        ['TAL1','TRDC'],
-        ['TAL2','TRB@'],
-        ['TAOK1','VMP1'],
-        ['TAOK1','ZNF207'],
-        ['TAP1','ZAP70'],
-        ['TAX1BP3','TRPV3'],
-        ['TBC1D19','TMEM199'],
-        ['TBC1D22A','TP73'],
-        ['TBC1D23','TF'],
-        ['TBC1D3','USP32'],
-        ['TBC1D31','ZNF704'],
-        ['TBCB','UBE4B'],
-        ['TBCD','ZNF750'],
-        ['TBCEL','TECTA'],
-        ['TBL1XR1','TP63'],
-        ['TBRG1','TMEM25'],
-        ['TBX2','UBE2V1'],
-        ['TBX2-AS1','UBE2V1'],
-        ['TCF12','TEC'],
-        ['TCF12','TMEM87A'],
-        ['TCF21','TMED1'],
-        ['TCF3','TFPT'],
-        ['TCF3','ZNF384'],
-        ['TCF7L2','VTI1A'],
-        ['TCL1A','TRA@'],
-        ['TCL1A','TRB@'],
-        ['TCL1A','TRD@'],
-        ['TCL6','TRA@'],
-        ['TEAD4','TSPAN9'],
-        ['TEC','TFG'],
-        ['TENC1','TP53'],
-        ['TENC1','TTLL9'],
-        ['TERT','TPPP'],
-        ['TERT','TRIO'],
-        ['TEX10','XPA'],
-        ['TFDP2','XRN1'],
-        ['TFE3','TFEB'],
-        ['TFE3','YAP1'],
-        ['TFEB','TRERF1'],
-        ['TG','THADA'],
-        ['TG','WNK3'],
-        ['TGFBR2','XPC'],
-        ['TGM7','UBAP1'],
-        ['THADA','TRA2A'],
-        ['THAP4','VAV1'],
-        ['THEM7P','WT1'],
-        ['THRAP3','USP6'],
-        ['THUMPD3','ZNF713'],
-        ['TLCD1','ZNF672'],
-        ['TLN1','TMEM8B'],
-        ['TLX1','TRA@'],
-        ['TLX1','TRB@'],
-        ['TLX1','TRD@'],
-        ['TLX1NB','TRDC'],
-        ['TLX3','TRD@'],
-        ['TM9SF2','UBAC2'],
-        ['TMCO1','UCK2'],
-        ['TMED10','ZNF252'],
-        ['TMEM120B','UBR4'],
-        ['TMEM127','ZAP70'],
-        ['TMEM138','TMEM216'],
-        ['TMEM168','TRRAP'],
-        ['TMEM184B','VPS13C'],
-        ['TMEM19','TSPAN8'],
-        ['TMEM25','USP28'],
-        ['TMEM256-PLSCR3','TNK1'],
-        ['TMEM38B','TRBC2'],
-        ['TMEM49','TRIM37'],
-        ['TMEM63B','TTK'],
-        ['TMEM91','ZNF550'],
-        ['TMOD4','VPS72'],
-        ['TMPRSS2','ZFAT'],
-        ['TNK1','ZBTB7A'],
-        ['TNRC18','XPO1'],
-        ['TOP2A','TTBK2'],
-        ['TP53','VAV1'],
-        ['TP53RK','ZNF227'],
-        ['TPM3','TPR'],
-        ['TPM3','TRKA'],
-        ['TRA2A','UBASH3B'],
-        ['TRAF4','WSB1'],
-        ['TRAP1','UBIAD1'],
-        ['TRAPPC10','USP25'],
-        ['TRDN','UBR4'],
-        ['TRIO','ZNF558'],
-        ['TRIP10','VAV1'],
-        ['TRMT1L','XPR1'],
-        ['TRPM7','USP8'],
-        ['TRUB2','VAV2'],
-        ['TSEN54','UNC84A'],
-        ['TSHZ2','UAP1'],
-        ['TSHZ2','ZNF251'],
-        ['TTC6','TXK'],
-        ['TTLL3','ZC3H4'],
-        ['TTR','TYRO3'],
-        ['TTYH3','ZNF652'],
-        ['TUBGCP2','ZNF511'],
-        ['TUT1','ZNF564'],
-        ['TXNDC11','ZC3H7A'],
-        ['TYK2','UPF1'],
-        ['TYK2','ZNF340'],
-        ['TYK2','ZNF430'],
-        ['UBA2','WTIP'],
-        ['UBQLN4','ZSWIM4'],
-        ['UBR4','ZFP37'],
-        ['UBR5','ZNF423'],
-        ['UBXN4','ZNF729'],
-        ['ULK2','UQCR11'],
-        ['UNK','ZDHHC7'],
-        ['USO1','XPNPEP3'],
-        ['USP10','ZDHHC7'],
-        ['USP31','WNK1'],
-        ['USP32','ZMYND8'],
-        ['USP33','ZFYVE9'],
-        ['USP34','XPO1'],
-        ['USP54','ZMIZ1'],
-        ['USP6','ZNF9'],
-        ['VAPA','ZNF880'],
-        ['VGLL2','ZNF84'],
-        ['VPS18','ZFYVE19'],
-        ['VPS4A','ZDHHC9'],
-        ['VSTM2A','ZNF713'],
-        ['WDFY3','WDFY3'],
-        ['WDFY3','ZNF578'],
-        ['WDR67','ZNF704'],
-        ['WNK1','WNT5B'],
-        ['XPA','ZNF680'],
-        ['IGH@','MIR100HG'],
-        ['XRCC6BP1','YEATS4'],
-        ['HNRNPA1','ALK'],
-        ['USP9X','ERAS'],
-        ['USP9X','DDX3X'],
-        ['NUP98','HOX@'],
-        ['NUP98','HOXA10'],
-        ['NUP98','HOXA1'],
-        ['NUP98','HOXA9'],
-        ['NUP98','HOXD13'],
-        ['NUP98','HOXD1'],
-        ['NUP98','HOXC13'],
-        ['NUP98','HOXC12'],
-        ['NUP98','HOXC11'],
-        ['NUP98','HOXA9'],
-        ['NUP98','DDX10'],
-        ['NUP98','HOXA9'],
-        ['NUP98','HOXA11'],
-        ['NUP98','HOXA13'],
-        ['NUP98','HOXD11'],
-        ['NUP98','HOXD1'],
-        ['NUP98','HOXD13'],
-        ['NUP98','LEDGF'],
-        ['NUP98','NSD1'],
-        ['NUP98','NSD3'],
-        ['NUP98','PMX1'],
-        ['NUP98','RAP1GDS1'],
-        ['NUP98','TOP1'],
-        ['NUP98','HOXC13'],
-        ['NUP98','JARID1A'],
-        ['EP300','ZNF384'],
-        ['NRG1','SLC3A2'],
-        ['NRG1','CD74'],
-        ['CLU','NRG1'],
-        ['MCM4','SNTB1'],
-        ['KLC1','ALK'],
-        ['UEVLD','RET'],
-        ['OSBPL9','BRAF'],
-        ['SQSTM1','NTRK3'],
-        ['ZMYM2','FGFR1'],
-        ['CIC','NUTM2A'],
-        ['FLT3','GOLGB1'],
-        ['CRTC1','SS18'],
-        ['KDM2A','WWTR1'],
-        ['CREBBP','BCORL1'],
-        ['TNIP1','PDGFRB'],
-        ['STAT5B','RARA'],
-        ['NDEL1','PDGFRB'],
-        ['CRYL1','IFT88'],
-        ['LMNA','NTRK1'],
-        ['TPM3','NTRK1'],
-        ['SQSTM1','NTRK1'],
-        ['NFASC','NTRK1'],
-        ['BCAN','NTRK1'],
-        ['PPL','NTRK1'],
-        ['RFWD2','NTRK1'],
-        ['CD74','NTRK1'],
-        ['MPRIP','NTRK1'],
-        ['RABGAP1L','NTRK1'],
-        ['TFG','NTRK1'],
-        ['TP53','NTRK1'],
-        ['AFAP1','NTRK2'],
-        ['AGBL4','NTRK2'],
-        ['NACC2','NTRK2'],
-        ['PAN3','NTRK2'],
-        ['QKI','NTRK2'],
-        ['TRIM24','NTRK2'],
-        ['VCL','NTRK2'],
-        ['ETV6','NTRK3'],
-        ['SRF','E2F1'],
-        ['HSPA8','NR4A3'],
-        ['CSF3R','SPTAN1'],
-        ['BCAM','AKT2'],
-        ['FGFR3','NBR1'],
-        ['FGFR3','BRAP'],
-        ['PTPRZ1','MET'],
-        ['ST7','MET'],
-        ['CAPZA2','MET'],
-        ['TPR','MET'],
-        ['BCAN','NTRK1'],
-        ['NOS1AP','NTRK2'],
-        ['GKAP1','NTRK2'],
-        ['KCTD8','NTRK2'],
-        ['TBC1D2','NTRK2'],
-        ['SQSTM1','NTRK2'],
-        ['VCAN','NTRK2'],
-        ['EGFR','SEPT14'],
-        ['EGFR','VWC2'],
-        ['KIAA1549','BRAF'],
-        ['ZSCAN23','BRAF'],
-        ['RAB3IP','PDGFRA'],
-        ['C11ORF95','RELA'],
-        ['EGFR','VWC2'],
-        ['FGFR3','NBR1'],
-        ['KIAA1549','BRAF'],
-        ['QKI','RAF1'],
-        ['SRGAP3','RAF1'],
-        ['NFU1','TRIM24'],
-        ['RARA','TRIM24'],
-        ['RET','TRIM24'],
-        ['ST7','TRIM24'],
-        ['TRIM24','BRAF'],
-        ['TRIM24','FGFR1'],
-        ['TRIM24','NTN4'],
-        ['TRIM24','NTRK2'],
-        ['TRIM24','RARA'],
-        ['TRIM24','RET'],
-        ['TRIM24','SVOPL'],
-        ['TRIM24','ULK4'],
-        ['AGAP3','BRAF'],
-        ['DLG1','BRAF'],
-        ['NCOA4','RET'],
-        ['TRIM24','RET'],
-        ['EML4','RET'],
-        ['EML4','ALK'],
-        ['STRN','ALK'],
-        ['GTF2IRD1','ALK'],
-        ['KTN1','RET'],
-        ['PRKG1','RET'],
-        ['TPM3','NTRK1'],
-        ['EWS','CREB3L3'],
-        ['CSF3R','SPTAN1'],
-        ['ABL1','NUP214'],
-        ['EBF1','PDGFRB'],
-        ['LMO2','RAG1'],
-        ['MYH11','CBFB'],
-        ['NSD1','NUP98'],
-        ['STIL','TAL1'],
-        ['ZNF384','TCF3'],
-        ['P2RY8','CRLF2'],
-        ['RUNX1T1','RUNX1'],
-        ['FAM131B','BRAF'],
-        ['RAF1','QKI'],
-        ['COL1A1','PDGFB'],
-        ['CRTC1','MAML2'],
-        ['PAX7','FOXO1'],
-        ['PAX3','FOXO1'],
-        ['FGFR1','USP6'],
-        ['HEY1','NCOA2'],
-        ['COL1A1','PDGFB'],
-        ['ETV6','NTRK3'],
-        ['ERC1','RET'],
-        ['NUMB','HEATR4'],
-        ['RHOH','BCL6'],
-        ['TBL1XR1','PIK3CA'],
-        ['RCC1','BCL6'],
-        ['CTBP2','CTNNB1'],
-        ['RBM6','BCL6'],
-        ['SF3B3','CDH1'],
-        ['RNF38','PDCD1LG2'],
-        ['CCDC6','RET'],
-        ['ERC1','RET'],
-        ['FGFR3','TACC3'],
-        ['TRIO','TERT'],
-        ['RPS6KB1','VMP1'],
-        ['SEC61G','EGFR'],
-        ['TMPRSS2','ERG'],
-        ['DCAF6','MPZL1'],
-        ['GNS','NUP107'],
-        ['BCL6','RHOH'],
-        ['BCL6','IGH@'],
-        ['NSD2','IGH@'],
-        ['BCL6','RCC1'],
-        ['BCL6','RBM6'],
-        ['BCL6','CBLB'],
-        ['BCL2','IGH@'],
-        ['RPS6KB1','VMP1'],
-        ['NUMB','HEATR4'],
-        ['ESR1','CCDC170'],
-        ['AFM','FBF1'],
-        ['DGUOK','ACTG2'],
-        ['MACF1','AKIRIN1'],
-        ['ITCH','AHCY'],
-        ['TRAF3IP2','FYN'],
-        ['PPFIBP1','SMCO2'],
-        ['MSL2','PMEPA1'],
-        ['SPAG9','MBTD1'],
-        ['SMCHD1','NDC80'],
-        ['TRIO','TERT'],
-        ['GNS','NUP107'],
-        ['STAT3','PTRF'],
-        ['TCF7L2','VTI1A'],
-        ['CHMP4B','CBFA2T2'],
-        ['ERC1','RET'],
-        ['PTPRK','RSPO3'],
-        ['DCAF6','MPZL1'],
-        ['TTC6','MIPOL1'],
-        ['MSN','ALK'],
-        ['FGFR2','PPHLN1'],
-        ['FGFR1','PLAG1'],
-        ['TGFBR3','PLAG1'],
-        ['TGFBR3','PLAG1'],
-        ['ND4','PLAG1'],
-        ['CTNNB1','PLAG1'],
-        ['ACTA2','PLAG1'],
-        ['GEM','PLAG1'],
-        ['NCALD','PLAG1'],
-        ['WWTR1','CAMTA1'],
-        ['TNIP1','PDGFRB'],
-        ['RUNX1','PRPF38A'],
-        ['CREBBP','BCORL1'],
-        ['KDM2A','WWTR1'],
-        ['FNDC3B','PRKCI'],
-        ['PICALM','ALK'],
-        ['BIRC6','ALK'],
-        ['SDC4','ROS1'],
-        ['FRMD4A','RET'],
-        ['DUS4L','BCAP29'],
-        ['TCF7L2','VTI1A'],
-        ['DNAJB1','PRKACA'],
-        ['SLC12A7','TERT'],
-        ['FIG','ROS1'],
-        ['SDC4','ROS1'],
-        ['SLC34A2','ROS1'],
-        ['CD74','ROS1'],
-        ['EZR','ROS1'],
-        ['TPM3','ROS1'],
-        ['GOPC','ROS1'],
-        ['LRIG3','ROS1'],
-        ['KDELR2','ROS1'],
-        ['BCOR','CCNB3'],
-        ['BCOR','MAML3'],
-        ['BCOR','ZC3H7B'],
-        ['BRD3','NUTM1'],
-        ['BRD4','NUTM1'],
-        ['CIC','DUX4'],
-        ['CIC','FOXO4'],
-        ['CIC','NUTM1'],
-        ['ETV6','NTRK3'],
-        ['EWSR1','ERG'],
-        ['EWSR1','NR4A3'],
-        ['FUS','ERG'],
-        ['FUS','NR4A3'],
-        ['FUS','TFCP2'],
-        ['VGLL2','CITED2'],
-        ['VGLL2','NCOA2'],
-        ['PAX3','FOXO1'],
-        ['PAX7','FOXO1'],
-        ['SS18','SSX'],
-        ['TAF15','NR4A3'],
-        ['TMP3','NTRK1'],
-        ['TRP','NTRK1'],
-        ['MOZ','TIF2'],
-        ['MLL','ENL'],
-        ['EWSR1','TFCP2'],
-        ['BCAN','NTRK1'],
-        ['C11ORF95','RELA'],
-        ['CAPZA2','MET'],
-        ['EGFR','SEPT14'],
-        ['EGFR','VWC2'],
-        ['EML4','NTRK3'],
-        ['FGFR3','BRAP'],
-        ['FGFR3','NBR1'],
-        ['FGFR3','TACC3'],
-        ['GKAP1','NTRK2'],
-        ['KCTD8','NTRK2'],
-        ['NOS1AP','NTRK2'],
-        ['PTPRZ1','MET'],
-        ['RAB3IP','PDGFRA'],
-        ['SQSTM1','NTRK2'],
-        ['ST7','MET'],
-        ['TBC1D2','NTRK2'],
-        ['TPR','MET'],
-        ['VCAN','NTRK2'],
-        ['ZSCAN23','BRAF'],
-        ['ZNF526','MEGF8'],
-        ['STYK1','YBX3'],
-        ['GTF2I','NCOA2'],
-        ['GAB1','ABL1'],
-        ['AHRR','NCOA2'],
-        ['NPC1','MELK'],
-        ['FGFR2','GAB2'],
-        ['NPC1','MELK'],
-        ['USP54','CAMK2G'],
-        ['MKL1','FBLN1'],
-        ['CNOT2','C12ORF49'],
-        ['MEGF9','GSN'],
-        ['NPC1','MELK']
-
-
-]
+    data = labels.read('known',options.organism)
 
     file(os.path.join(options.output_directory,'known_genes.txt'),'w').write("")
     file(os.path.join(options.output_directory,'known.txt'),'w').write("")
-
-    data = fusions.get(options.organism.lower(),[])
     data2 = []
     if data:
 
         #file_symbols = os.path.join(options.output_directory,'genes_symbols.txt')
         file_symbols = os.path.join(options.output_directory,'synonyms.txt')
-        loci = symbols.generate_loci(file_symbols)
-        genes = symbols.read_genes_symbols(file_symbols)
+        (index,loci) = symbols.read_index(file_symbols)
         full = set()
 
         ens2hugo = dict([tuple(line.rstrip('\r\n').split('\t')) for line in file(os.path.join(options.output_directory,'genes_symbols.txt'),'r').readlines() if line.rstrip('\r\n')])
@@ -7066,8 +107,8 @@ if __name__ == '__main__':
         d = []
         for (g1,g2) in data:
             if g1.upper() != g2.upper():
-                ens1 = symbols.ensembl(g1.upper(),genes,loci)
-                ens2 = symbols.ensembl(g2.upper(),genes,loci)
+                ens1 = symbols.index_ensembl(g1,index)
+                ens2 = symbols.index_ensembl(g2,index)
                 if ens1:
                     full.update(ens1)
                 if ens2:
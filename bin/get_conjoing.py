@@ -221,26 +221,9 @@ if __name__ == '__main__':
 
                 # read the gene symbols
                 file_symbols = os.path.join(options.output_directory,'synonyms.txt')
-                genes = symbols.read_genes_symbols(file_symbols)
-
-                banned = set()
-                loci = symbols.generate_loci(file_symbols)
-                #for v in symbols.locus.values():
-                for v in loci.values():
-                    if v:
-                        n = len(v)
-                        if n > 1:
-                            for i in xrange(n-1):
-                                for j in xrange(i+1,n):
-                                    if v[i].upper() != v[j].upper():
-                                        ens1 = symbols.ensembl(v[i].upper(),genes,loci)
-                                        ens2 = symbols.ensembl(v[j].upper(),genes,loci)
-                                        if ens1 and ens2:
-                                            for e1 in ens1:
-                                                for e2 in ens2:
-                                                    if e1 != e2:
-                                                        (e1,e2) = (e2,e1) if e2 < e1 else (e1,e2)
-                                                        banned.add((e1,e2))
+                (index,loci) = symbols.read_index(file_symbols)
+
+                banned = set(symbols.loci_pairs(index,loci))
 
 
                 d = []
@@ -248,8 +231,8 @@ if __name__ == '__main__':
                     if ( g1.upper() == g2.upper() or ((g1.endswith('@') and g2.endswith('@')) and g1.upper()[:2] == g2.upper()[:2])):
                         print "%s-%s skipped!" % (g1,g2)
                         continue
-                    ens1 = symbols.ensembl(g1,genes,loci)
-                    ens2 = symbols.ensembl(g2,genes,loci)
+                    ens1 = symbols.index_ensembl(g1,index)
+                    ens2 = symbols.index_ensembl(g2,index)
 
                     if ens1 and ens2:
                         for e1 in ens1:
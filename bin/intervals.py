@@ -0,0 +1,445 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It indexes the intervals of the exons, CDSes and genes of an organism (i.e. a
+static augmented interval tree for each kind of feature and chromosome) such
+that the features which overlap a given position or interval are found without
+scanning all of them. The index is built from 'organism.gtf' (format 'gtf',
+i.e. exons, CDSes and genes, where a gene spans its exons and CDSes),
+'exons.txt' (format 'exons', i.e. exons and genes) or 'genes.txt' (format
+'genes', i.e. genes) of the database of FusionCatcher.
+
+The index is built once per database (see 'fusioncatcher-build.py') and it is
+saved next to its file (i.e. '<file>.idx') from where it is loaded quickly by
+'label_exonexon.py', 'predict_frame.py', 'label_fusion_genes.py' and
+'find_fusion_genes_psl.py'. If the saved index is missing or it does not match
+its file then it is built on the fly (and saved, if possible). The size, the
+time of modification and the MD5 of the content of the file are saved in the
+index. The MD5 of the file is computed only when its size or time of
+modification differ from the saved ones (e.g. the database has been copied).
+
+A feature is a tuple, i.e. (kind, gene id, transcript id, exon number,
+chromosome, strand, start, end), where the coordinates are 1-based and the
+intervals are closed. The features are always given in the order in which
+they are found in the file.
+
+Example:
+
+import intervals
+db = intervals.load('organism.gtf', 'gtf')
+exons = db.overlap('exon', '7', 55086971)
+cdses = db.features('CDS', 'ENSG00000146648')
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+"""
+import os
+import sys
+import gzip
+import marshal
+import hashlib
+import optparse
+
+# the version of the saved index
+VERSION = 3
+
+# the formats of the files which are indexed
+FORMATS = ('gtf', 'exons', 'genes')
+
+# the fields of a feature
+KIND = 0
+GENE = 1
+TRANSCRIPT = 2
+NUMBER = 3
+CHROM = 4
+STRAND = 5
+START = 6
+END = 7
+
+#
+def tree(intervals):
+    """
+    It builds a static augmented interval tree from a list of (start, end,
+    value). The intervals are sorted by start and the tree is implicit, i.e.
+    the node i of level k has the children i - 2**(k-1) and i + 2**(k-1) and
+    it keeps the maximum end of its subtree. It returns a tuple (level,
+    starts, ends, maximums, values).
+    """
+    intervals = sorted(intervals)
+    n = len(intervals)
+    starts = [e[0] for e in intervals]
+    ends = [e[1] for e in intervals]
+    values = [e[2] for e in intervals]
+    maximums = ends[:]
+    if not n:
+        return (-1, starts, ends, maximums, values)
+    # the leaves are the even nodes
+    last_i = (n - 1) & ~1
+    last = ends[last_i]
+    k = 1
+    while (1 << k) <= n:
+        x = 1 << (k - 1)
+        for i in xrange((x << 1) - 1, n, x << 2):
+            el = maximums[i - x]
+            er = maximums[i + x] if i + x < n else last
+            maximums[i] = max(ends[i], el, er)
+        # the parent of the last node
+        last_i = last_i - x if (last_i >> k) & 1 else last_i + x
+        if last_i < n and maximums[last_i] > last:
+            last = maximums[last_i]
+        k = k + 1
+    return (k - 1, starts, ends, maximums, values)
+
+#
+def search(a_tree, start, end):
+    """
+    It returns the values of the intervals of the tree which overlap the
+    interval [start, end].
+    """
+    (level, starts, ends, maximums, values) = a_tree
+    n = len(starts)
+    r = []
+    if level < 0:
+        return r
+    stack = [(level, (1 << level) - 1, False)]
+    while stack:
+        (k, x, left) = stack.pop()
+        if k <= 3:
+            # small subtree, scanned
+            i = x >> k << k
+            j = min(n, i + (1 << (k + 1)) - 1)
+            while i < j and starts[i] <= end:
+                if ends[i] >= start:
+                    r.append(values[i])
+                i = i + 1
+        elif not left:
+            # the left child first
+            y = x - (1 << (k - 1))
+            stack.append((k, x, True))
+            if y >= n or maximums[y] >= start:
+                stack.append((k - 1, y, False))
+        elif x < n and starts[x] <= end:
+            if ends[x] >= start:
+                r.append(values[x])
+            stack.append((k - 1, x + (1 << (k - 1)), False))
+    return r
+
+#
+def parse_gtf(lines):
+    """
+    It gives the exons and the CDSes from the lines of a GTF file followed by
+    the genes (i.e. the interval spanned by the exons and CDSes of a gene on
+    each chromosome).
+    """
+    genes = dict()
+    order = []
+    for line in lines:
+        if line.startswith('#'):
+            continue
+        line = line.rstrip('\r\n').split('\t')
+        if len(line) < 9 or (line[2] != 'exon' and line[2] != 'CDS'):
+            continue
+        chrom = line[0]
+        start = int(line[3])
+        end = int(line[4])
+        strand = line[6]
+        if start > end:
+            (start, end) = (end, start)
+        ids = [l.replace('"','').replace("'","").strip().split(' ') for l in line[8].split(";") if l]
+        ids = dict([l for l in ids if len(l) == 2])
+        g = ids.get('gene_id','')
+        yield (line[2], g, ids.get('transcript_id',''), int(ids.get('exon_number',0)), chrom, strand, start, end)
+        k = (g, chrom)
+        x = genes.get(k)
+        if x is None:
+            genes[k] = [strand, start, end]
+            order.append(k)
+        else:
+            if start < x[1]:
+                x[1] = start
+            if end > x[2]:
+                x[2] = end
+    for k in order:
+        x = genes[k]
+        yield ('gene', k[0], '', 0, k[1], x[0], x[1], x[2])
+
+#
+def parse_exons(lines):
+    """
+    It gives the exons from the lines of 'exons.txt' followed by the genes
+    (i.e. the coordinates of a gene are the ones from its first exon).
+    """
+    # ensembl_peptide_id             0
+    # ensembl_gene_id                1
+    # ensembl_transcript_id          2
+    # ensembl_exon_id                3
+    # exon_chrom_start               4
+    # exon_chrom_end                 5
+    # rank                           6
+    # start_position                 7
+    # end_position                   8
+    # transcript_start               9
+    # transcript_end                 10
+    # strand                         11
+    # chromosome_name                12
+    genes = []
+    seen = set()
+    for line in lines:
+        line = line.rstrip('\r\n').split('\t')
+        if len(line) < 13:
+            continue
+        (start, end) = (int(line[4]), int(line[5]))
+        if start > end:
+            (start, end) = (end, start)
+        yield ('exon', line[1], line[2], int(line[6]) if line[6].isdigit() else 0, line[12], line[11], start, end)
+        if line[1] not in seen:
+            seen.add(line[1])
+            (start, end) = (int(line[7]), int(line[8]))
+            if start > end:
+                (start, end) = (end, start)
+            genes.append(('gene', line[1], '', 0, line[12], line[11], start, end))
+    for g in genes:
+        yield g
+
+#
+def parse_genes(lines):
+    """
+    It gives the genes from the lines of 'genes.txt' (i.e. gene id, end,
+    start, strand and chromosome), all of them (i.e. also the ones which are
+    not unique) and with the coordinates as they are found.
+    """
+    for line in lines:
+        line = line.rstrip('\r\n').split('\t')
+        if len(line) < 5:
+            continue
+        yield ('gene', line[0], '', 0, line[4], line[3], int(line[2]), int(line[1]))
+
+#
+class database:
+    """
+    It indexes the features, i.e. one interval tree for each kind of feature
+    and chromosome.
+    """
+    def __init__(self, features, trees = None):
+        self.items = features
+        self.trees = trees
+        if self.trees is None:
+            intervals = dict()
+            for (i,f) in enumerate(features):
+                k = (f[KIND], f[CHROM])
+                if k not in intervals:
+                    intervals[k] = []
+                intervals[k].append((min(f[START], f[END]), max(f[START], f[END]), i))
+            self.trees = dict([(k, tree(v)) for (k,v) in intervals.iteritems()])
+        self.genes = dict()
+        for (i,f) in enumerate(features):
+            if f[KIND] == 'gene':
+                if f[GENE] not in self.genes:
+                    self.genes[f[GENE]] = []
+                self.genes[f[GENE]].append(i)
+
+    def overlap(self, kind, chrom, start, end = None):
+        """
+        It returns the features of the given kind which overlap the position
+        START (or the interval [START, END]) on a chromosome.
+        """
+        t = self.trees.get((kind, chrom))
+        if t is None:
+            return []
+        r = search(t, start, start if end is None else end)
+        r.sort()
+        return [self.items[i] for i in r]
+
+    def gene(self, gene_id):
+        """
+        It returns the genes which have the given id.
+        """
+        return [self.items[i] for i in self.genes.get(gene_id,[])]
+
+    def features(self, kind, gene_id):
+        """
+        It returns the features of the given kind of a gene (i.e. the ones
+        overlapping the gene).
+        """
+        r = set()
+        for g in self.gene(gene_id):
+            t = self.trees.get((kind, g[CHROM]))
+            if t is not None:
+                r.update([i for i in search(t, min(g[START], g[END]), max(g[START], g[END])) if self.items[i][GENE] == gene_id])
+        return [self.items[i] for i in sorted(r)]
+
+#
+def digest(filename):
+    """
+    It returns the MD5 of the content of a file.
+    """
+    h = hashlib.md5()
+    fin = open(filename,'rb')
+    while True:
+        data = fin.read(2**20)
+        if not data:
+            break
+        h.update(data)
+    fin.close()
+    return h.hexdigest()
+
+#
+def stamp(filename):
+    """
+    It returns the size and the time of modification of a file.
+    """
+    s = os.stat(filename)
+    return (s.st_size, s.st_mtime)
+
+#
+def build(lines, kind):
+    """
+    It builds the index of the lines of a file of the given format.
+    """
+    if kind == 'gtf':
+        features = parse_gtf(lines)
+    elif kind == 'exons':
+        features = parse_exons(lines)
+    elif kind == 'genes':
+        features = parse_genes(lines)
+    else:
+        print >>sys.stderr,"ERROR: Unknown format '%s'!" % (kind,)
+        sys.exit(1)
+    return database(list(features))
+
+#
+def save(db, filename, kind, source = None):
+    """
+    It writes the index to a file (atomically, i.e. using a temporary file
+    which is renamed).
+    """
+    temp = '%s.%d.tmp' % (filename, os.getpid())
+    try:
+        fou = open(temp,'wb')
+        marshal.dump((VERSION, kind, stamp(source) if source else None, digest(source) if source else None, db.items, db.trees), fou)
+        fou.close()
+        os.rename(temp, filename)
+    except (IOError, OSError):
+        if os.path.isfile(temp):
+            os.remove(temp)
+        raise
+
+#
+def load(filename, kind, cache = True):
+    """
+    It returns the index of a file of the given format (i.e. 'gtf', 'exons'
+    or 'genes'). The saved index (i.e. '<file>.idx') is used if it matches the
+    file and otherwise the index is built (and saved, if CACHE is True and it
+    is possible). The file might be compressed using gzip or '-' for stdin.
+    """
+    if filename == '-':
+        return build(sys.stdin, kind)
+    idx = filename + '.idx'
+    if os.path.isfile(idx):
+        try:
+            (v, k, t, d, items, trees) = marshal.load(open(idx,'rb'))
+            if v == VERSION and k == kind:
+                if t == stamp(filename):
+                    return database(items, trees)
+                if d == digest(filename):
+                    # the same content (e.g. a copy of the database) and
+                    # therefore its new size and time are saved
+                    db = database(items, trees)
+                    if cache:
+                        try:
+                            save(db, idx, kind, filename)
+                        except (IOError, OSError):
+                            pass
+                    return db
+        except (ValueError, EOFError, TypeError, IOError, OSError):
+            pass
+    fin = gzip.open(filename,'r') if filename.lower().endswith('.gz') else open(filename,'r')
+    db = build(fin, kind)
+    fin.close()
+    if cache:
+        try:
+            save(db, idx, kind, filename)
+        except (IOError, OSError):
+            print >>sys.stderr,"Warning: Cannot save the interval index in '%s'!" % (idx,)
+    return db
+
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options]"
+    description = """It builds the interval index of the exons, CDSes and genes of an organism (i.e. 'organism.gtf', 'exons.txt' or 'genes.txt' of the database of FusionCatcher) which is used for finding quickly the features overlapping a given position."""
+    version = "%prog 0.10 beta"
+
+    parser = optparse.OptionParser(usage = usage,
+                                   description = description,
+                                   version = version)
+
+    parser.add_option("--input","-i",
+                      action = "store",
+                      type = "string",
+                      dest = "input_filename",
+                      help = """The input file, i.e. 'organism.gtf', 'exons.txt' or 'genes.txt' (see '--format').""")
+
+    parser.add_option("--format","-f",
+                      action = "store",
+                      type = "choice",
+                      choices = FORMATS,
+                      dest = "format",
+                      default = 'gtf',
+                      help = """The format of the input file, i.e. %s. Default is '%%default'.""" % (', '.join(["'%s'" % (e,) for e in FORMATS]),))
+
+    parser.add_option("--output","-o",
+                      action = "store",
+                      type = "string",
+                      dest = "output_filename",
+                      help = """The output file where the index is written. If it is not given then it is written next to the input file (i.e. '<input>.idx'), from where it is loaded by the tools which use it.""")
+
+    (options,args) = parser.parse_args()
+
+    # validate options
+    if not options.input_filename:
+        parser.print_help()
+        sys.exit(1)
+
+    fin = gzip.open(options.input_filename,'r') if options.input_filename.lower().endswith('.gz') else open(options.input_filename,'r')
+    db = build(fin, options.format)
+    fin.close()
+    save(db,
+         options.output_filename if options.output_filename else options.input_filename + '.idx',
+         options.format,
+         options.input_filename)
+    #
@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It filters out the reads (FASTQ) which do not share any k-mer with the given
+reference sequences (FASTA), e.g. the reads which cannot align on the
+candidate fusion genes (i.e. gene-gene sequences) are removed before they are
+given to BLAT, STAR and BOWTIE2 (see '--prefilter-kmer' of
+'fusioncatcher.py'). The k-mers of the reference sequences are indexed in
+memory, every '--step' nucleotides (like BLAT does), and all the k-mers of a
+read (and of its reverse complement) are searched in the index. Therefore a
+read is always kept if it has an exact match (with the reference) of at least
+k + step - 1 nucleotides.
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+
+"""
+import sys
+import gc
+import string
+import optparse
+import compression
+
+_complement = string.maketrans('ACGTNacgtn','TGCANtgcan')
+
+#
+def reverse_complement(seq):
+    return seq.translate(_complement)[::-1]
+
+#
+def read_fasta(filename):
+    """
+    It reads the sequences from a FASTA file (which might be compressed).
+    """
+    fin = compression.zopen(filename)
+    seq = []
+    for line in fin:
+        if line.startswith('>'):
+            if seq:
+                yield ''.join(seq).upper()
+            seq = []
+        else:
+            seq.append(line.rstrip('\r\n'))
+    if seq:
+        yield ''.join(seq).upper()
+    fin.close()
+
+#
+def index(filenames, kmer, step):
+    """
+    It returns the set of k-mers which start every STEP nucleotides in the
+    sequences of the given FASTA files (the k-mers containing N are skipped).
+    """
+    kmers = set()
+    for filename in filenames:
+        for seq in read_fasta(filename):
+            for i in xrange(0, len(seq) - kmer + 1, step):
+                k = seq[i:i+kmer]
+                if k.find('N') == -1:
+                    kmers.add(k)
+    return kmers
+
+#
+def shares(seq, kmers, kmer, hits = 1):
+    """
+    It returns True if the sequence (or its reverse complement) has at least
+    HITS k-mers in the index.
+    """
+    n = 0
+    for s in (seq, reverse_complement(seq)):
+        for i in xrange(len(s) - kmer + 1):
+            if s[i:i+kmer] in kmers:
+                n = n + 1
+                if n >= hits:
+                    return True
+    return False
+
+#
+def filter_reads(input_filename,
+                 output_filename,
+                 kmers,
+                 kmer,
+                 hits = 1,
+                 size_buffer = 10**8):
+    """
+    It writes the reads which share k-mers with the index. It returns the
+    number of reads read and the number of reads written.
+    """
+    total = 0
+    kept = 0
+    fin = compression.zopen(input_filename)
+    fou = open(output_filename,'w')
+    leftover = []
+    while True:
+        gc.disable()
+        data = fin.readlines(size_buffer)
+        gc.enable()
+        if not data:
+            break
+        if leftover:
+            data = leftover + data
+        n = len(data) - len(data) % 4
+        leftover = data[n:]
+        buf = []
+        for i in xrange(0, n, 4):
+            total = total + 1
+            if shares(data[i+1].rstrip('\r\n').upper(), kmers, kmer, hits):
+                buf.extend(data[i:i+4])
+                kept = kept + 1
+        fou.writelines(buf)
+    fin.close()
+    fou.close()
+    return (total, kept)
+
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options]"
+    description = """It filters out the reads which do not share any k-mer with the given reference sequences."""
+    version = "%prog 0.10 beta"
+
+    parser = optparse.OptionParser(usage = usage,
+                                   description = description,
+                                   version = version)
+
+    parser.add_option("--input","-i",
+                      action = "store",
+                      type = "string",
+                      dest = "input_filename",
+                      help = """The input FASTQ file (it might be compressed).""")
+
+    parser.add_option("--reference","-r",
+                      action = "append",
+                      type = "string",
+                      dest = "reference_filenames",
+                      help = """The reference sequences (FASTA file, it might be compressed). It can be given several times.""")
+
+    parser.add_option("--output","-o",
+                      action = "store",
+                      type = "string",
+                      dest = "output_filename",
+                      help = """The output FASTQ file, which contains the reads which share k-mers with the reference sequences.""")
+
+    parser.add_option("--kmer","-k",
+                      action = "store",
+                      type = "int",
+                      dest = "kmer",
+                      default = 20,
+                      help = """The length of the k-mers. Default is %default.""")
+
+    parser.add_option("--step","-s",
+                      action = "store",
+                      type = "int",
+                      dest = "step",
+                      default = 5,
+                      help = """The k-mers of the reference sequences are indexed every STEP nucleotides (a larger step uses less memory but a read needs a longer exact match in order to be kept, i.e. kmer + step - 1). Default is %default.""")
+
+    parser.add_option("--hits","-m",
+                      action = "store",
+                      type = "int",
+                      dest = "hits",
+                      default = 1,
+                      help = """The minimum number of k-mers of a read which should be found in the reference sequences in order to keep the read. Default is %default.""")
+
+    parser.add_option("--log","-l",
+                      action = "store",
+                      type = "string",
+                      dest = "log_filename",
+                      help = """The file where the counts of the reads (i.e. read and kept) are written.""")
+
+    (options, args) = parser.parse_args()
+
+    # validate options
+    if not (options.input_filename and
+            options.reference_filenames and
+            options.output_filename
+            ):
+        parser.print_help()
+        parser.error("No inputs and outputs specified!")
+
+    if options.kmer < 1 or options.step < 1 or options.hits < 1:
+        parser.error("The k-mer length, the step and the number of hits should be at least 1!")
+
+    print >>sys.stderr,"Starting..."
+    print >>sys.stderr,"Indexing the k-mers of the reference sequences..."
+    kmers = index(options.reference_filenames, options.kmer, options.step)
+    print >>sys.stderr,"%d k-mers indexed" % (len(kmers),)
+    print >>sys.stderr,"Filtering the reads..."
+    (total, kept) = filter_reads(input_filename = options.input_filename,
+                                 output_filename = options.output_filename,
+                                 kmers = kmers,
+                                 kmer = options.kmer,
+                                 hits = options.hits)
+    t = ["Reads filtered using k-mers (k=%d) of the reference sequences:" % (options.kmer,),
+         "  - reads read: %d" % (total,),
+         "  - reads kept: %d (%.2f%%)" % (kept, 100.0 * kept / total if total else 0.0)]
+    print >>sys.stderr,'\n'.join(t)
+    if options.log_filename:
+        file(options.log_filename,'w').writelines([el+'\n' for el in t])
+    print >>sys.stderr,"Done."
+    #
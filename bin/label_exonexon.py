@@ -40,29 +40,11 @@ This file is not running/executing/using BLAT.
 import os
 import sys
 import optparse
-import gzip
+import intervals
 
 
 
 
-#
-#
-#
-def add_line(aline,adict):
-    chrom = aline[0]
-    pstart = int(aline[3])
-    pend = int(aline[4])
-    strand = aline[6]
-    if pstart > pend:
-        (pstart,pend) = (pend,pstart)
-    ids = [l.replace('"','').replace("'","").strip().split(' ') for l in aline[8].split(";") if l]
-    ids = dict([l for l in ids if len(l) == 2])
-    g_id = ids["gene_id"]
-    if g_id not in adict:
-        adict[g_id] = set()
-    adict[g_id].add((chrom,strand,pstart,pend))
-
-
 #
 #
 #
@@ -83,39 +65,11 @@ def exonexon(gtf_file,
 
     if myg:
 
-        # read and pre-process the GTF file
+        # the exons of the GTF file (see 'intervals.py')
         if verbose:
-            print >>sys.stderr,"Parsing the GTF file..."
-        g = []
-        if gtf_file == '-':
-            g = [line.rstrip('\r\n').split("\t") for line in file(sys.stdin,"r").readlines() if (not line.startswith("#")) and line.rstrip()]
-        elif gtf_file.endswith('.gz'):
-            z = gzip.open(gtf_file,"r")
-            g = [line.rstrip('\r\n').split("\t") for line in z.readlines() if (not line.startswith("#")) and line.rstrip()]
-            z.close()
-        else:
-            g = [line.rstrip('\r\n').split("\t") for line in file(gtf_file,"r").readlines() if (not line.startswith("#")) and line.rstrip()]
+            print >>sys.stderr,"Loading the database of exons..."
+        exon = intervals.load(gtf_file,'gtf')
 
-
-
-        # get all exons per gene as a dictionary
-        if verbose:
-            print >>sys.stderr,"Building the database of exons..."
-        exon = dict()
-        q = 0
-        for line in g:
-            if line[2] == 'gene':
-                q = q + 1
-            flag = False
-            x = line[8].partition(";")
-            if x[0] and x[0].startswith("gene_id "):
-                x = x[0][9:-1]
-            if x not in myg:
-                continue
-            if line[2] == 'exon':
-                add_line(line,exon)
-
-        
         if verbose:
             print >>sys.stderr,"Checking exon borders..."
         for i in xrange(len(fusion1)):
@@ -132,18 +86,18 @@ def exonexon(gtf_file,
             p2 = int(f2[2])
             s2 = f2[3]
             
-            # check 5 prime partner
-            e = exon.get(g1,None)
+            # check 5 prime partner (the exons which overlap the fusion point)
+            e = exon.overlap('exon',c1,p1)
             ok5 = False
             if e:
-                x = [1 for v in e if v[0] == c1 and v[1] == s1 and ((s1 == "+" and v[3] == p1) or (s1 == "-" and v[2] == p1))]
+                x = [1 for v in e if v[intervals.GENE] == g1 and v[intervals.STRAND] == s1 and ((s1 == "+" and v[intervals.END] == p1) or (s1 == "-" and v[intervals.START] == p1))]
                 if x:
                     ok5 = True
             # check 3 prime partner
-            e = exon.get(g2,None)
+            e = exon.overlap('exon',c2,p2)
             ok3 = False
             if e:
-                x = [1 for v in e if v[0] == c2 and v[1] == s2 and ((s2 == "+" and v[2] == p2) or (s2 == "-" and v[3] == p2))]
+                x = [1 for v in e if v[intervals.GENE] == g2 and v[intervals.STRAND] == s2 and ((s2 == "+" and v[intervals.START] == p2) or (s2 == "-" and v[intervals.END] == p2))]
                 if x:
                     ok3 = True
 
@@ -42,6 +42,7 @@ This file is not running/executing/using BLAT.
 import sys
 import os
 import optparse
+import intervals
 
 if __name__ == '__main__':
 
@@ -154,48 +155,11 @@ if __name__ == '__main__':
         print "Reading...",options.input_filter_genes_filename
         no_proteins=set([line.rstrip('\r\n') for line in file(options.input_filter_genes_filename,'r') if line.rstrip('\r\n')])
 
-    genes = {}
+    genes = None
     if options.input_min_dist_gene_gene_database_filename:
-        print "Processing the exons database...",options.input_min_dist_gene_gene_database_filename
-        # ensembl_peptide_id             0
-        # ensembl_gene_id                1
-        # ensembl_transcript_id          2
-        # ensembl_exon_id                3
-        # exon_chrom_start               4
-        # exon_chrom_end                 5
-        # rank                           6
-        # start_position                 7
-        # end_position                   8
-        # transcript_start               9
-        # transcript_end                 10
-        # strand                         11
-        # chromosome_name                12
-        # cds_start                      13
-        # cds_end                        14
-        # 5_utr_start                    15
-        # 5_utr_end                      16
-        # 3_utr_start                    17
-        # 3_utr_end                      18
-        exons = [line.rstrip('\r\n').split('\t') for line in file(options.input_min_dist_gene_gene_database_filename,'r').readlines() if line.rstrip('\r\n')]
-        exons = [(line[1], # gene_id              0
-                  line[7], # gene_start           1
-                  line[8], # gene_end             2
-                  line[11],# strand               3
-                  line[12] # chromosome           4
-                  ) for line in exons]
-        for line in exons:
-            gn = line[0]
-            gs = int(line[1])
-            ge = int(line[2])
-            st = int(line[3])
-            ch = line[4]
-            if gs > ge:
-                (gs,ge) = (ge,gs)
-            if gn not in genes:
-                genes[gn] = {'start':gs,
-                             'end':ge,
-                             'strand':st,
-                             'chrom':ch}
+        print "Loading the exons database...",options.input_min_dist_gene_gene_database_filename
+        # the positions of the genes are indexed (see 'intervals.py')
+        genes = intervals.load(options.input_min_dist_gene_gene_database_filename,'exons')
 
 
     print "Reading...",options.input_fusion_genes_filename
@@ -218,20 +182,30 @@ if __name__ == '__main__':
 
     if options.input_min_dist_gene_gene:
         # deal with the distance between genes and label accordingly
+        d = options.input_min_dist_gene_gene
         for line in data:
             a = line[0]
             b = line[1]
 
-
-            if (genes.has_key(a) and
-                genes.has_key(b) and
-                genes[a]["chrom"] == genes[b]["chrom"] and
-                genes[a]["strand"] == genes[b]["strand"] and
-                min([abs(genes[a]["start"]-genes[b]["start"]),
-                     abs(genes[a]["start"]-genes[b]["end"]),
-                     abs(genes[a]["end"]-genes[b]["start"]),
-                     abs(genes[a]["end"]-genes[b]["end"])]) <= options.input_min_dist_gene_gene
-               ):
+            # the genes which are on the same chromosome and closer than
+            # the threshold to gene a
+            close = False
+            # without the database no pair of genes is labeled (like before)
+            x = genes.gene(a) if genes is not None else None
+            if x:
+                x = x[0]
+                for y in genes.overlap('gene',x[intervals.CHROM],x[intervals.START]-d,x[intervals.END]+d):
+                    if (y[intervals.GENE] == b and
+                        int(y[intervals.STRAND]) == int(x[intervals.STRAND]) and
+                        min([abs(x[intervals.START]-y[intervals.START]),
+                             abs(x[intervals.START]-y[intervals.END]),
+                             abs(x[intervals.END]-y[intervals.START]),
+                             abs(x[intervals.END]-y[intervals.END])]) <= d
+                       ):
+                        close = True
+                        break
+
+            if close:
                 if label_col:
                     temp.append(line+[label])
                 else:
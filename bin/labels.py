@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It handles the manually curated lists of genes and fusion genes (e.g. banned,
+healthy, tcga, hpa, known, etc.) which are used for labeling the candidate fusion
+genes. The lists are stored as gene symbols in one compressed dataset file
+('labels.txt.gz', found in the same directory as this script), where each line is:
+
+label <tab> organism <tab> gene_symbol_1 [<tab> gene_symbol_2]
+
+The lines are sorted and there are no duplicates (the gene symbols of a pair
+are sorted also). A new list can be added to the dataset without changing any
+code, for example:
+
+labels.py --import my_cohort.txt --label my_cohort --organism homo_sapiens
+
+and afterwards it can be generated (as Ensembl gene ids) using:
+
+labels.py --label my_cohort --organism homo_sapiens --output /some/database/
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+"""
+import os
+import sys
+import gzip
+import optparse
+import symbols
+
+# the dataset with all the lists of genes and fusion genes
+DATASET = os.path.join(os.path.dirname(os.path.abspath(__file__)),'labels.txt.gz')
+
+# the version of the format of the dataset
+VERSION = 1
+
+# the files with pairs of genes which are used (by default) for removing the
+# overlapping genes from a list of fusion genes
+OVERLAPPINGS = ['ensembl_fully_overlapping_genes.txt',
+                'ensembl_same_strand_overlapping_genes.txt',
+                'refseq_fully_overlapping_genes.txt',
+                'refseq_same_strand_overlapping_genes.txt',
+                'ucsc_fully_overlapping_genes.txt',
+                'ucsc_same_strand_overlapping_genes.txt',
+                'pairs_pseudogenes.txt',
+                'paralogs.txt']
+
+# read the entire dataset
+def read_dataset(dataset = None):
+    """
+    It reads the dataset and returns a dictionary: label => organism => list of genes/pairs.
+    """
+    if not dataset:
+        dataset = DATASET
+    data = dict()
+    for line in gzip.open(dataset,'r'):
+        if line.startswith('#'):
+            line = line.rstrip('\r\n').split('\t')
+            if line[0] == '#labels' and int(line[2]) > VERSION:
+                print >>sys.stderr,"ERROR: The dataset '%s' has version %s which is newer than the supported version %d!" % (dataset,line[2],VERSION)
+                sys.exit(1)
+            continue
+        line = line.rstrip('\r\n').split('\t')
+        if len(line) < 3 or (not line[0]) or (not line[1]) or [1 for el in line[2:] if not el]:
+            print >>sys.stderr,"ERROR: Wrong line in the dataset '%s':" % (dataset,),line
+            sys.exit(1)
+        if line[0] not in data:
+            data[line[0]] = dict()
+        if line[1] not in data[line[0]]:
+            data[line[0]][line[1]] = []
+        data[line[0]][line[1]].append(line[2:] if len(line) > 3 else line[2])
+    return data
+
+# read one list from the dataset
+def read(label, organism, dataset = None):
+    """
+    It returns the list of genes (or pairs of genes) for the given label and organism.
+    """
+    if not dataset:
+        dataset = DATASET
+    # only the lines of the given list are parsed
+    prefix = '%s\t%s\t' % (label,organism.lower())
+    n = len(prefix)
+    data = []
+    for line in gzip.open(dataset,'r').read().splitlines():
+        if line.startswith(prefix):
+            line = line[n:].split('\t')
+            data.append(line if len(line) > 1 else line[0])
+        elif line.startswith('#labels\t') and int(line.split('\t')[2]) > VERSION:
+            print >>sys.stderr,"ERROR: The dataset '%s' has version %s which is newer than the supported version %d!" % (dataset,line.split('\t')[2],VERSION)
+            sys.exit(1)
+    return data
+
+# write the entire dataset
+def write_dataset(data, dataset = None):
+    """
+    It writes the dataset (given as: label => organism => list of genes/pairs).
+    """
+    if not dataset:
+        dataset = DATASET
+    lines = set()
+    for (label,organisms) in data.iteritems():
+        for (organism,genes) in organisms.iteritems():
+            for g in genes:
+                g = [g] if isinstance(g,basestring) else sorted(g)
+                lines.add('\t'.join([label,organism.lower()]+g)+'\n')
+    fod = gzip.GzipFile(dataset,'wb',9,mtime=0)
+    fod.write('#labels\tversion\t%d\n' % (VERSION,))
+    fod.write('#label\torganism\tgene_symbol_1\tgene_symbol_2\n')
+    fod.writelines(sorted(lines))
+    fod.close()
+
+# convert the pairs of gene symbols to pairs of Ensembl gene ids
+def ensembl_pairs(data, output_directory):
+    """
+    It converts a list of pairs of gene symbols into a sorted list of
+    unique pairs of Ensembl gene ids (as lines of text).
+    """
+    (index,loci) = symbols.read_index(os.path.join(output_directory,'synonyms.txt'))
+    return ['%s\t%s\n' % (e1,e2) for (e1,e2) in symbols.ensembl_pairs(data,index)]
+
+# read pairs of genes from files
+def read_pairs(output_directory, filenames):
+    """
+    It reads the pairs of genes from several files (as lines of text where the
+    genes are sorted). The columns of a line are sorted and only the first two
+    of them are kept (e.g. a third column is ignored unless it sorts before the
+    genes).
+    """
+    d = set()
+    for ov in filenames:
+        p = os.path.join(output_directory,ov)
+        print "Parsing file:",p
+        if os.path.isfile(p):
+            d.update(['\t'.join(sorted(line.rstrip('\r\n').split('\t'))[:2])+'\n' for line in file(p,'r').readlines() if line.rstrip('\r\n')])
+    return d
+
+# generate one list of fusion genes
+def generate(label,
+             organism,
+             output_directory,
+             output_filename = None,
+             skip_filter_overlap = False,
+             overlappings = OVERLAPPINGS,
+             skipped_filename = None,
+             dataset = None,
+             description = 'manually currated database'):
+    """
+    It generates the list of fusion genes (as Ensembl gene ids) for the given
+    label. Optionally the fusion genes which are overlapping (according to
+    the files from 'overlappings') are removed (and saved in 'skipped_filename').
+    """
+    if not output_filename:
+        output_filename = '%s.txt' % (label,)
+    data = read(label, organism, dataset)
+    if data:
+        data = ensembl_pairs(data, output_directory)
+
+        print "%d known fusion genes found in %s" % (len(data),description)
+
+        if not skip_filter_overlap:
+            d = read_pairs(output_directory, overlappings)
+            skipped = [line for line in data if line in d]
+            data = [line for line in data if line not in d]
+            if skipped_filename:
+                file(os.path.join(output_directory,skipped_filename),'w').writelines(skipped)
+
+            print "%d known fusion genes left after removing the overlappings" % (len(data),)
+
+    file(os.path.join(output_directory,output_filename),'w').writelines(data)
+
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options]"
+    description = """It generates a list of fusion genes (as Ensembl gene ids) from the manually curated dataset of gene symbols or it imports a new list of fusion genes into the dataset."""
+    version = "%prog 0.10 beta"
+
+    parser = optparse.OptionParser(usage=usage,description=description,version=version)
+
+    parser.add_option("--label",
+                      action = "store",
+                      type = "string",
+                      dest = "label",
+                      help="""The label of the list of fusion genes, e.g. tcga, hpa, etc.""")
+
+    parser.add_option("--organism",
+                      action = "store",
+                      type = "string",
+                      dest = "organism",
+                      default = "homo_sapiens",
+                      help="""The name of the organism for which the list of fusion genes is generated, e.g. homo_sapiens, mus_musculus, etc. Default is '%default'.""")
+
+    parser.add_option("--output",
+                      action="store",
+                      type="string",
+                      dest="output_directory",
+                      default = '.',
+                      help="""The output directory where the list of fusion genes is generated. Default is '%default'.""")
+
+    parser.add_option("--skip-filter-overlap",
+                      action="store_true",
+                      dest="skip_filter_overlap",
+                      default = False,
+                      help="""If set then it does not filter out the fusion genes where the (i) genes are fully overlapping, or (ii) the genes are partially overlapping and are on the same strand. Default is '%default'.""")
+
+    parser.add_option("--import",
+                      action="store",
+                      type="string",
+                      dest="import_filename",
+                      help="""A text file with two columns (tab separated) containing the gene symbols of the fusion genes which will be added to the dataset under the given label and organism.""")
+
+    parser.add_option("--dataset",
+                      action="store",
+                      type="string",
+                      dest="dataset_filename",
+                      default = DATASET,
+                      help="""The dataset containing all the lists of fusion genes. Default is '%default'.""")
+
+    (options,args) = parser.parse_args()
+
+    # validate options
+    if not (options.label and
+            options.output_directory
+            ):
+        parser.print_help()
+        sys.exit(1)
+
+    if options.import_filename:
+        print "Importing the list '%s' into dataset..." % (options.label,)
+        data = read_dataset(options.dataset_filename)
+        pairs = [line.rstrip('\r\n').split('\t') for line in file(options.import_filename,'r').readlines() if line.rstrip('\r\n')]
+        pairs = [line[:2] for line in pairs if len(line) > 1 and line[0] and line[1]]
+        if options.label not in data:
+            data[options.label] = dict()
+        data[options.label][options.organism.lower()] = data[options.label].get(options.organism.lower(),[]) + pairs
+        write_dataset(data, options.dataset_filename)
+    else:
+        print "Generating the list '%s' of fusion genes..." % (options.label,)
+        generate(label = options.label,
+                 organism = options.organism,
+                 output_directory = options.output_directory,
+                 skip_filter_overlap = options.skip_filter_overlap,
+                 skipped_filename = '%s_known_but_overlapping.txt' % (options.label,),
+                 dataset = options.dataset_filename)
+    #
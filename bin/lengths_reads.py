@@ -44,6 +44,7 @@ import os
 import optparse
 import gc
 import gzip
+import compression
 
 if __name__ == '__main__':
 
@@ -84,13 +85,7 @@ if __name__ == '__main__':
         sys.exit(1)
 
 
-    fin = None
-    if options.input_filename == '-':
-        fin = sys.stdin
-    elif options.input_filename.lower().endswith('.gz'):
-        fin = gzip.open(options.input_filename,'r')
-    else:
-        fin = open(options.input_filename,'r')
+    fin = compression.zopen(options.input_filename)
     i = 0
     l = set()
     m = -1
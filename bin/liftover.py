@@ -2,7 +2,15 @@
 # -*- coding: utf-8 -*-
 """
 It takes a list of fusion genes and their genomic coordinates and converts them
-in another coordinates system using liftOver.
+in another coordinates system using a UCSC chain file (e.g. hg38ToHg19.over.chain.gz).
+The conversion is done in here (the external liftOver is not used anymore).
+
+The chain file is parsed once into sorted arrays of aligned blocks (for each
+chromosome) and this compiled form is cached next to the chain file (i.e.
+'hg38ToHg19.over.chain.gz.compiled'), such that the next runs only load it.
+A position is converted by a binary search of the aligned block containing it.
+If several chains contain it then the one with the highest score is used. The
+positions which fall into gaps (or outside of chains) are not converted.
 
 
 
@@ -45,20 +53,219 @@ This file is not running/executing/using BLAT.
 import os
 import sys
 import optparse
-import gc
 import gzip
-import tempfile
+import bisect
+import marshal
+import array
+
+# version of the compiled form of the chain file
+COMPILED_VERSION = 1
+
+# typecode of the arrays (it should hold genomic coordinates)
+TYPECODE = 'l'
+
+# parse the chain file
+def read_chain(chain_filename):
+    """
+    It parses a UCSC chain file and returns the aligned blocks as a dictionary:
+    target chromosome => list of (target start, target end, query start, chain index)
+    and the list of chains (query chromosome, query strand, query size, score).
+    """
+    blocks = dict()
+    chains = []
+    fid = gzip.open(chain_filename,'r') if chain_filename.lower().endswith('.gz') else open(chain_filename,'r')
+    tname = None
+    t = 0
+    q = 0
+    ci = -1
+    for line in fid:
+        line = line.rstrip('\r\n')
+        if not line:
+            continue
+        if line.startswith('chain'):
+            # chain score tName tSize tStrand tStart tEnd qName qSize qStrand qStart qEnd id
+            x = line.split()
+            tname = x[2]
+            t = int(x[5])
+            q = int(x[10])
+            chains.append((x[7],x[9],int(x[8]),float(x[1])))
+            ci = len(chains) - 1
+            if tname not in blocks:
+                blocks[tname] = []
+        elif line.startswith('#'):
+            continue
+        else:
+            # size [dt dq]
+            x = line.split()
+            size = int(x[0])
+            blocks[tname].append((t,t+size,q,ci))
+            if len(x) > 2:
+                t = t + size + int(x[1])
+                q = q + size + int(x[2])
+    fid.close()
+    return (blocks,chains)
+
+# compile the chain
+def compile_chain(blocks, chains):
+    """
+    It builds (for each chromosome) the sorted arrays of the aligned blocks which
+    are used for the binary search.
+    """
+    compiled = dict()
+    for (chrom,v) in blocks.iteritems():
+        v.sort()
+        starts = array.array(TYPECODE,[el[0] for el in v])
+        ends = array.array(TYPECODE,[el[1] for el in v])
+        qstarts = array.array(TYPECODE,[el[2] for el in v])
+        index = array.array(TYPECODE,[el[3] for el in v])
+        # maximum end of all the blocks up to here (blocks of several chains may overlap)
+        maxends = array.array(TYPECODE,ends)
+        for i in xrange(1,len(maxends)):
+            if maxends[i] < maxends[i-1]:
+                maxends[i] = maxends[i-1]
+        compiled[chrom] = (starts,ends,qstarts,index,maxends)
+    return (compiled,chains)
 
-def give_me_temp_filename(tmp_dir = None):
-    if tmp_dir and (not os.path.isdir(tmp_dir)) and (not os.path.islink(tmp_dir)):
-        os.makedirs(tmp_dir)
-    (ft,ft_name) = tempfile.mkstemp(dir = tmp_dir)
-    os.close(ft)
-    return ft_name
+# save the compiled chain
+def save(compiled, compiled_filename):
+    (c,chains) = compiled
+    data = dict([(k,tuple([a.tostring() for a in v])) for (k,v) in c.iteritems()])
+    fod = open(compiled_filename,'wb')
+    marshal.dump((COMPILED_VERSION,TYPECODE,data,chains),fod)
+    fod.close()
 
-def delete_file(some_file):
-    if os.path.isfile(some_file) or os.path.islink(some_file):
-        os.remove(some_file)
+# load the compiled chain
+def load(compiled_filename):
+    fid = open(compiled_filename,'rb')
+    (version,typecode,data,chains) = marshal.load(fid)
+    fid.close()
+    if version != COMPILED_VERSION or typecode != TYPECODE:
+        return None
+    c = dict()
+    for (k,v) in data.iteritems():
+        arrays = []
+        for el in v:
+            a = array.array(TYPECODE)
+            a.fromstring(el)
+            arrays.append(a)
+        c[k] = tuple(arrays)
+    return (c,[tuple(el) for el in chains])
+
+# give the chain (the compiled form is used if it is up to date)
+def chain(chain_filename, compiled_filename = None):
+    """
+    It gives the compiled chain. If the compiled form exists and it is newer than
+    the chain file then it is loaded, otherwise the chain file is parsed and
+    the compiled form is saved (if possible) for the next runs.
+    """
+    if not compiled_filename:
+        compiled_filename = chain_filename + '.compiled'
+    if (os.path.isfile(compiled_filename) and
+        os.path.getmtime(compiled_filename) >= os.path.getmtime(chain_filename)):
+        try:
+            r = load(compiled_filename)
+            if r:
+                return r
+        except (IOError,EOFError,ValueError,TypeError):
+            pass
+    r = compile_chain(*read_chain(chain_filename))
+    try:
+        save(r,compiled_filename)
+    except (IOError,OSError):
+        print >>sys.stderr,"WARNING: Not able to save the compiled chain in '%s'!" % (compiled_filename,)
+    return r
+
+# convert one position
+def convert(compiled, chrom, position):
+    """
+    It converts a position (0-based) from the target to the query genome. It
+    returns (chromosome, position) or None if the position cannot be converted.
+    """
+    (c,chains) = compiled
+    v = c.get(chrom,None)
+    if not v:
+        return None
+    (starts,ends,qstarts,index,maxends) = v
+    i = bisect.bisect_right(starts,position) - 1
+    best = None
+    while i >= 0 and maxends[i] > position:
+        if ends[i] > position and (best is None or chains[index[i]][3] > chains[index[best]][3]):
+            best = i
+        i = i - 1
+    if best is None:
+        return None
+    (qname,qstrand,qsize,score) = chains[index[best]]
+    q = qstarts[best] + position - starts[best]
+    if qstrand == '-':
+        q = qsize - q - 1
+    return (qname,q)
+
+# convert many positions
+def convert_batch(compiled, positions):
+    """
+    It converts a list of (chromosome, position) and it gives the list of converted
+    positions (None for the positions which cannot be converted).
+    """
+    done = dict()
+    r = []
+    for p in positions:
+        if p not in done:
+            done[p] = convert(compiled,p[0],p[1])
+        r.append(done[p])
+    return r
+
+# UCSC name of a chromosome
+def ucsc(chrom):
+    if chrom.isdigit():
+        chrom = "chr"+chrom
+    elif chrom.lower() == 'mt':
+        chrom = "chrM"
+    elif chrom.lower() == 'x':
+        chrom = "chrX"
+    elif chrom.lower() == 'y':
+        chrom = "chrY"
+    return chrom
+
+# Ensembl name of a chromosome
+def ensembl(chrom):
+    if chrom == 'chrM':
+        chrom = "MT"
+    elif chrom.startswith("chr"):
+        chrom = chrom[3:]
+    return chrom
+
+# convert the coordinates of the fusion genes from a file
+def convert_fusions(compiled, input_filename, output_filename):
+    """
+    It converts the genomic coordinates (columns 9 and 10) of the fusion genes.
+    """
+    coordinates = [line.rstrip("\r\n").split("\t") for line in file(input_filename,'r').readlines() if line.rstrip("\r\n")]
+    head = coordinates.pop(0)
+    if (not coordinates) or (not compiled[0]):
+        file(output_filename,'w').write('\t'.join(head)+'\n')
+        return
+    keys = []
+    for line in coordinates:
+        for k in (line[8],line[9]):
+            v = k.split(':')
+            keys.append((ucsc(v[0]),int(v[1])))
+    # the position is used as the start of an interval of length one (as given before to liftOver)
+    converted = convert_batch(compiled,keys)
+    fusions = [head]
+    i = 0
+    for line in coordinates:
+        for j in (8,9):
+            k = line[j]
+            y = converted[i]
+            i = i + 1
+            y = "%s:%d:" % (ensembl(y[0]),y[1]) if y else 'not-converted'
+            if k.endswith(":+"):
+                y = y + "+"
+            elif k.endswith(":-"):
+                y = y + "-"
+            line[j] = y
+        fusions.append(line)
+    file(output_filename,'w').writelines(['\t'.join(line)+'\n' for line in fusions])
 
 
 if __name__=='__main__':
@@ -66,8 +273,8 @@ if __name__=='__main__':
     #command line parsing
 
     usage="%prog [options]"
-    description="""It takes a list of fusion genes and their genomic coordinates and converts them in another coordinates system using liftOver."""
-    version="%prog 0.11 beta              Author: Daniel Nicorici, E-mail: Daniel.Nicorici@gmail.com"
+    description="""It takes a list of fusion genes and their genomic coordinates and converts them in another coordinates system using a chain file."""
+    version="%prog 0.12 beta              Author: Daniel Nicorici, E-mail: Daniel.Nicorici@gmail.com"
 
     parser = optparse.OptionParser(usage = usage,
                                    description = description,
@@ -77,136 +284,69 @@ if __name__=='__main__':
                       action="store",
                       type="string",
                       dest="input_filename",
-                      help="""The input list of fusion genes and their genome coordinates.""")
+                      help="""The input list of fusion genes and their genome coordinates. Several files can be given separated by comma.""")
 
     parser.add_option("--output","-o",
                       action="store",
                       type="string",
                       dest="output_filename",
-                      help="""The input list of fusion genes and their genome coordinates.""")
+                      help="""The output list of fusion genes and their converted genome coordinates. Several files can be given separated by comma (one for each input file).""")
 
     parser.add_option("--chain","-c",
                       action="store",
                       type="string",
                       dest="chain_filename",
-                      help="""The chain files needed by liftOver to do the conversion.""")
+                      help="""The chain file needed to do the conversion (e.g. hg38ToHg19.over.chain.gz).""")
+
+    parser.add_option("--compiled",
+                      action="store",
+                      type="string",
+                      dest="compiled_filename",
+                      help="""The file where the compiled form of the chain file is cached. Default is the chain file plus extension '.compiled'.""")
+
+    parser.add_option("--compile-only",
+                      action="store_true",
+                      dest="compile_only",
+                      default = False,
+                      help="""If set then the chain file is only compiled (and cached) and no conversion is done. Default is '%default'.""")
 
     parser.add_option("--path-liftover","-p",
                       action="store",
                       type="string",
                       dest="path_liftover",
-                      help="""Path to the liftover executable.""")
+                      help="""Not used anymore (it is kept for compatibility).""")
 
     parser.add_option("--tmp_dir",
                       action="store",
                       type="string",
                       dest="tmp_dir",
                       default = None,
-                      help="The directory which should be used as temporary directory. By default is the OS temporary directory.")
+                      help="Not used anymore (it is kept for compatibility).")
 
 
     (options,args) = parser.parse_args()
 
     # validate options
-    if not (options.input_filename and
-            options.chain_filename and
-            options.output_filename
+    if not (options.chain_filename and
+            (options.compile_only or (options.input_filename and options.output_filename))
             ):
         parser.print_help()
         parser.error("No inputs and outputs specified!")
         sys.exit(1)
 
-    # read the fusion genes and their fusion coordinates
-    coordinates = [line.rstrip("\r\n").split("\t") for line in file(options.input_filename,'r').readlines() if line.rstrip("\r\n")]
-    head = coordinates.pop(0)
-    if coordinates:
-        coord = dict()
-        bed = set()
-        for line in coordinates:
-            k = line[8]
-            v = k.split(':')[0:2]
-            if v[0].isdigit():
-                v[0] = "chr"+v[0]
-            elif v[0].lower() == 'mt':
-                v[0] = "chrM"
-            elif v[0].lower() == 'x':
-                v[0] = "chrX"
-            elif v[0].lower() == 'y':
-                v[0] = "chrY"
-            v = "%s\t%s\t%s\n" % (v[0],v[1],str(int(v[1])+1))
-            bed.add(v)
-            coord[k] = v
-            coord[k.replace(":+",":-") if k.endswith("+") else k.replace(":+",":-")] = v
-            k = line[9]
-            v = k.split(':')[0:2]
-            if v[0].isdigit():
-                v[0] = "chr"+v[0]
-            elif v[0].lower() == 'mt':
-                v[0] = "chrM"
-            elif v[0].lower() == 'x':
-                v[0] = "chrX"
-            elif v[0].lower() == 'y':
-                v[0] = "chrY"
-            v = "%s\t%s\t%s\n" % (v[0],v[1],str(int(v[1])+1))
-            bed.add(v)
-            coord[k] = v
-            coord[k.replace(":+",":-") if k.endswith("+") else k.replace(":+",":-")] = v
-        bed = sorted(bed)
-        filetemp1 = give_me_temp_filename(options.tmp_dir) #"temp1.bed"
-        filetemp2 = give_me_temp_filename(options.tmp_dir) #"temp2.bed"
-        filetemp3 = give_me_temp_filename(options.tmp_dir) #"temp3.bed"
-        file(filetemp1,'w').writelines(bed)
-        _LR_ = ""
-        if options.path_liftover:
-            _LR_ = options.path_liftover.rstrip("/")+"/"
-        cmd = [_LR_+'liftOver',filetemp1,options.chain_filename,filetemp2,filetemp3]
-        cmd = ' '.join(cmd)
-        r = os.system(cmd)
-        if r:
-            print >>sys.stderr, "WARNING: Not able to run '%s'" % (cmd,)
-            file(options.output_filename,'w').write('\t'.join(head)+'\n')
-        else:
-            unlifted = set(file(filetemp3,'r').readlines())
-            lifted = [line for line in bed if line not in unlifted]
-            newbed = file(filetemp2,'r').readlines()
-            n = len(lifted)
-            m = len(newbed)
-            if n!=m:
-                print >>sys.stderr, "WARNING: Lost into BED translation!"
-                print >>sys.stderr, lifted
-                print >>sys.stderr, unlifted
-                print >>sys.stderr, newbed
-                file(options.output_filename,'w').write('\t'.join(head)+'\n')
-            else:
-                translate = dict()
-                for i in xrange(n):
-                    v = newbed[i]
-                    if v.startswith('chrM\t'):
-                        v = "MT"+v[4:]
-                    elif v.startswith("chr"):
-                        v = v[3:]
-                    v = ':'.join(v.split('\t')[0:2])+':'
-                    translate[lifted[i]] = v
-                for k in coord.keys():
-                    x = coord[k]
-
-                    y = translate.get(x,'not-converted')
-                    if k.endswith(":+"):
-                        y = y + "+"
-                    elif k.endswith(":-"):
-                        y = y + "-"
-                    coord[k] = y
-                # now to final conversion step using the fusion file
-                fusions = []
-                fusions.append(head)
-                for line in coordinates:
-                    line[8] = coord[line[8]]
-                    line[9] = coord[line[9]]
-                    fusions.append(line)
-                file(options.output_filename,'w').writelines(['\t'.join(line)+'\n' for line in fusions])
-        delete_file(filetemp1)
-        delete_file(filetemp2)
-        delete_file(filetemp3)
-    else:
-        file(options.output_filename,'w').write('\t'.join(head)+'\n')
+    if options.compile_only:
+        compiled = compile_chain(*read_chain(options.chain_filename))
+        save(compiled,options.compiled_filename if options.compiled_filename else options.chain_filename + '.compiled')
+        sys.exit(0)
+
+    inputs = options.input_filename.split(',')
+    outputs = options.output_filename.split(',')
+    if len(inputs) != len(outputs):
+        parser.error("The number of input files and output files are different!")
+        sys.exit(1)
+
+    compiled = chain(options.chain_filename,options.compiled_filename)
+
+    for (fi,fo) in zip(inputs,outputs):
+        convert_fusions(compiled,fi,fo)
     #
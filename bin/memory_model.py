@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It predicts the peak memory (in GB) of the aligner steps of FusionCatcher
+(i.e. building an index and aligning reads using Bowtie, Bowtie2, STAR or
+BLAT) from the size of the reference sequences, the size of the input reads
+and the number of threads, using a linear model for each step:
+
+  peak = base + reference * nucleotides + reads * input + thread * threads
+
+where 'base' and 'thread' are given in GB and 'reference' and 'reads' in bytes
+per nucleotide. For the steps which run one process per thread (i.e. BLAT,
+see 'blat_parallel.py') the entire peak is multiplied by the number of
+threads. It is used by 'fusioncatcher.py' for choosing the size of the parts
+when the reference sequences are split (see 'split-fasta.py') such that the
+predicted peak memory of every step stays below a given cap, and by
+'fusioncatcher-build.py' for reserving the memory of the index builds which
+are executed concurrently.
+
+The built-in coefficients have NOT been calibrated on measurements. They are
+guesses derived from the memory requirements documented by the aligners
+(e.g. about 10 bytes per nucleotide for a STAR index of a genome) and they
+may be wrong by a large factor. Therefore 'fusioncatcher.py' uses the model
+for splitting the reference sequences only when '--limit-memory' is given.
+The coefficients should be calibrated on the local machine using the
+benchmark 'memory_model' of 'test/benchmark/benchmark.py', which writes a
+model file (tab separated, i.e. step, coefficient and value) that is read by
+'fusioncatcher.py' (see '--memory-model').
+
+Example:
+
+import memory_model
+model = memory_model.load('memory_model.txt')
+gb = memory_model.peak('STAR', 500*(10**6), threads = 16, model = model)
+nucleotides = memory_model.limit(['STAR-build','STAR'], 32, threads = 16, model = model)
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+"""
+import os
+import sys
+import copy
+
+# the coefficients of the steps (i.e. 'copies' is 1 if the step runs one
+# process per thread); they are not calibrated (see above)
+MODEL = {'bowtie-build':  {'base': 0.2, 'reference': 6.0,  'reads': 0.0, 'thread': 0.05, 'copies': 0},
+         'bowtie':        {'base': 0.1, 'reference': 6.0,  'reads': 0.0, 'thread': 0.02, 'copies': 0},
+         'bowtie2-build': {'base': 0.2, 'reference': 6.0,  'reads': 0.0, 'thread': 0.05, 'copies': 0},
+         'bowtie2':       {'base': 0.2, 'reference': 6.0,  'reads': 0.0, 'thread': 0.05, 'copies': 0},
+         'STAR-build':    {'base': 0.5, 'reference': 11.0, 'reads': 0.0, 'thread': 0.0,  'copies': 0},
+         'STAR':          {'base': 0.5, 'reference': 10.0, 'reads': 0.5, 'thread': 0.2,  'copies': 0},
+         'blat':          {'base': 0.05,'reference': 1.7,  'reads': 0.0, 'thread': 0.0,  'copies': 1}}
+
+# the coefficients which are given in bytes (the others are given in GB)
+BYTES = ('reference', 'reads')
+
+GB = float(2**30)
+
+#
+def load(filename = None):
+    """
+    It returns the model, i.e. the built-in coefficients updated with the ones
+    read from the given model file (if it exists).
+    """
+    model = copy.deepcopy(MODEL)
+    if filename and os.path.isfile(filename):
+        for line in file(filename,'r'):
+            line = line.rstrip('\r\n')
+            if (not line) or line.startswith('#'):
+                continue
+            line = line.split('\t')
+            if len(line) < 3:
+                continue
+            (step, coefficient, value) = line[:3]
+            if step not in model:
+                model[step] = dict([(k,0.0) for k in MODEL['bowtie']])
+            try:
+                model[step][coefficient] = float(value)
+            except ValueError:
+                print >>sys.stderr,"WARNING: Wrong value for '%s' of '%s' in '%s'!" % (coefficient, step, filename)
+    return model
+
+#
+def save(filename, model):
+    """
+    It writes the model to a model file.
+    """
+    fou = file(filename,'w')
+    fou.write('# step\tcoefficient\tvalue (base and thread in GB, reference and reads in bytes per nucleotide)\n')
+    for step in sorted(model.keys()):
+        for coefficient in sorted(model[step].keys()):
+            fou.write('%s\t%s\t%r\n' % (step, coefficient, model[step][coefficient]))
+    fou.close()
+
+#
+def peak(step, reference, reads = 0, threads = 1, model = None):
+    """
+    It returns the predicted peak memory (in GB) of a step for a reference of
+    the given size (nucleotides) and input reads of the given size (bytes).
+    """
+    c = (model or MODEL)[step]
+    p = (c['base'] +
+         (c['reference'] * float(reference) + c['reads'] * float(reads)) / GB +
+         c['thread'] * max(1, threads))
+    if c.get('copies',0):
+        p = p * max(1, threads)
+    return p
+
+#
+def limit(steps, cap, reads = 0, threads = 1, model = None):
+    """
+    It returns the largest size (nucleotides) of the reference for which the
+    predicted peak memory of all the given steps is below the cap (in GB). It
+    returns 1 if even the smallest reference does not fit under the cap (i.e.
+    the reference should be split as much as possible).
+    """
+    n = None
+    for step in steps:
+        c = (model or MODEL)[step]
+        a = float(cap)
+        if c.get('copies',0):
+            a = a / max(1, threads)
+        a = a - c['base'] - c['thread'] * max(1, threads) - c['reads'] * float(reads) / GB
+        if c['reference'] > 0:
+            x = int(a * GB / c['reference'])
+        else:
+            x = sys.maxint if a > 0 else 1
+        n = x if n is None else min(n, x)
+    return max(1, n) if n is not None else sys.maxint
+
+#
+def concurrency(steps, reference, parts, processes, available, model = None):
+    """
+    It returns how many parts of the reference (the largest one has the given
+    size in nucleotides) can be processed concurrently by the given steps,
+    the number of threads of each of them and their predicted peak memory (in
+    GB), such that the total predicted peak memory is below the available
+    memory (in GB). The peak memory is predicted for the number of threads of
+    a part (and not for all processes).
+    """
+    n = max(1, min(parts, processes))
+    while True:
+        threads = max(1, processes // n)
+        gb = 0
+        if reference:
+            gb = max([peak(step, reference, threads = threads, model = model) for step in steps])
+        if n == 1 or gb * n <= available:
+            break
+        n = n - 1
+    return (n, threads, gb)
+
+#
+def nucleotides(filename):
+    """
+    It returns the number of nucleotides of a FASTA file (i.e. without the
+    headers and the new lines).
+    """
+    n = 0
+    fin = file(filename,'r')
+    for line in fin:
+        if not line.startswith('>'):
+            n = n + len(line.rstrip('\r\n'))
+    fin.close()
+    return n
+
+#
+def fit(samples, step, reads = 0, threads = 1, model = None):
+    """
+    It calibrates the coefficients 'base' and 'reference' of a step from the
+    measured peaks, i.e. samples given as (nucleotides, peak in GB), and it
+    returns the model. The line is fitted using least squares and then it is
+    shifted upwards such that no measured peak is above the prediction.
+    """
+    model = copy.deepcopy(model or MODEL)
+    c = model[step]
+    k = float(max(1, threads)) if c.get('copies',0) else 1.0
+    # the part of the peak which does not depend on the reference
+    other = c['thread'] * max(1, threads) + c['reads'] * float(reads) / GB
+    x = [float(s[0]) for s in samples]
+    y = [float(s[1]) / k - other for s in samples]
+    if not x:
+        return model
+    mx = sum(x) / len(x)
+    my = sum(y) / len(y)
+    sxx = sum([(e - mx) ** 2 for e in x])
+    slope = sum([(a - mx) * (b - my) for (a,b) in zip(x,y)]) / sxx if sxx > 0 else 0.0
+    slope = max(0.0, slope)
+    base = max([b - slope * a for (a,b) in zip(x,y)])
+    c['base'] = max(0.0, base)
+    c['reference'] = slope * GB
+    return model
+#
@@ -306,6 +306,7 @@ import os
 import sys
 import optparse
 import gc
+import compression
 
 
 cigar_set = (['M','I','D','N','S','H','P','=','X'])
@@ -334,7 +335,7 @@ def merge_sam(file_in, file_ou, fr = False, mismatches = 10000, mismatches20 = 1
     if file_in == '-':
         fin = sys.stdin
     else:
-        fin = open(file_in,'r')
+        fin = compression.zopen(file_in) # it might be compressed
 
     fou = None
     if file_ou == '-':
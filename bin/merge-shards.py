@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It merges deterministically the files which have been produced independently
+for each shard of reads (see '--shards' of 'fusioncatcher.py' and
+'split-shards.py') into one file, such that the result is the same as the one
+obtained by processing all the reads at once. The supported methods are:
+ - cat    - the files are concatenated in the order of the shards,
+ - sum    - the numbers found on the first line of the files are added up,
+ - merge  - the files (which are sorted) are merged such that the result is
+            sorted in the same way as 'LC_ALL=C sort' does it (i.e. by the given
+            key and the entire record as last resort). If '--unique' is used
+            then only the first record (i.e. from the first shard) is kept for
+            each key, which is the same as 'sort -u' does it for the entire
+            input (i.e. exact deduplication across shards),
+ - bowtie - the summaries of Bowtie (i.e. reads processed, reads aligned,
+            reads failed to align, etc.) are added up.
+
+The files which are missing (i.e. the shard had no reads left) are considered
+empty. If the file is missing for all shards then no output file is created.
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+
+"""
+import os
+import sys
+import gc
+import heapq
+import optparse
+import compression
+
+#
+def records(file_name, lines = 1, size_buffer = 10**8):
+    """
+    It reads the records (i.e. LINES consecutive lines) from a file.
+    """
+    fin = compression.zopen(file_name)
+    leftover = []
+    while True:
+        gc.disable()
+        data = fin.readlines(size_buffer)
+        gc.enable()
+        if not data:
+            if leftover:
+                yield ''.join(leftover)
+            break
+        if leftover:
+            data = leftover + data
+        if lines == 1:
+            leftover = []
+            for line in data:
+                yield line
+        else:
+            n = len(data) - len(data) % lines
+            leftover = data[n:]
+            for i in xrange(0, n, lines):
+                yield ''.join(data[i:i+lines])
+    fin.close()
+
+#
+def keyed(file_name, index, lines = 1, key = None, unique = False):
+    """
+    It gives the records of a file together with their sorting key. The columns
+    of a record are the tab separated fields of its lines (as given by
+    'paste').
+    """
+    for record in records(file_name, lines):
+        if key:
+            columns = record.replace('\n','\t').split('\t')
+            k = tuple([columns[c] if c < len(columns) else '' for c in key])
+        else:
+            k = record
+        if unique:
+            # the first shard wins for records with the same key
+            yield (k, index, record)
+        else:
+            yield (k, record, index)
+
+#
+def merge(inputs, output, lines = 1, key = None, unique = False):
+    """
+    It merges the sorted files.
+    """
+    fou = open(output,'w')
+    if not key and not unique:
+        # plain sorted lines (fast)
+        streams = [records(f, lines) for f in inputs]
+        for record in heapq.merge(*streams):
+            fou.write(record)
+    else:
+        streams = [keyed(f, i, lines, key, unique) for (i,f) in enumerate(inputs)]
+        last = None
+        for item in heapq.merge(*streams):
+            if unique:
+                if item[0] == last:
+                    continue
+                last = item[0]
+                fou.write(item[2])
+            else:
+                fou.write(item[1])
+    fou.close()
+
+#
+def cat(inputs, output):
+    """
+    It concatenates the files.
+    """
+    fou = open(output,'w')
+    for f in inputs:
+        fin = compression.zopen(f)
+        while True:
+            data = fin.read(2**24)
+            if not data:
+                break
+            fou.write(data)
+        fin.close()
+    fou.close()
+
+#
+def add(inputs, output):
+    """
+    It adds up the numbers found on the first line of the files.
+    """
+    n = 0
+    for f in inputs:
+        line = file(f,'r').readline().strip()
+        if line:
+            n = n + int(float(line))
+    file(output,'w').write("%d\n" % (n,))
+
+#
+def bowtie(inputs, output):
+    """
+    It adds up the summaries of Bowtie (the percentages are computed again).
+    """
+    processed = 0
+    counts = dict()
+    order = []
+    reported = 0
+    for f in inputs:
+        for line in file(f,'r'):
+            line = line.rstrip('\r\n')
+            if line.startswith('# reads processed:'):
+                processed = processed + int(line.split(':',1)[1].strip())
+            elif line.startswith('# reads'):
+                (label, value) = line.split(':',1)
+                value = int(value.strip().split(' ')[0])
+                if label not in counts:
+                    counts[label] = 0
+                    order.append(label)
+                counts[label] = counts[label] + value
+            elif line.startswith('Reported ') and line.find(' alignments') != -1:
+                reported = reported + int(line.split(' ')[1])
+    data = ["# reads processed: %d\n" % (processed,)]
+    for label in order:
+        p = float(counts[label]) * 100 / float(processed) if processed else 0.0
+        data.append("%s: %d (%.2f%%)\n" % (label, counts[label], p))
+    data.append("Reported %d alignments to 1 output stream(s)\n" % (reported,))
+    file(output,'w').writelines(data)
+
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options]"
+    description = """It merges deterministically the files which have been produced independently for each shard of reads into one file, such that the result is the same as the one obtained by processing all the reads at once."""
+    version = "%prog 0.10 beta"
+
+    parser = optparse.OptionParser(usage = usage,
+                                   description = description,
+                                   version = version)
+
+    parser.add_option("--input","-i",
+                      action = "store",
+                      type = "string",
+                      dest = "input_template",
+                      help = """The template of the names of the input files, where '%d' is replaced by the number of the shard (starting with 1), e.g. 'shards/shard_%d/reads.map'.""")
+
+    parser.add_option("--shards","-n",
+                      action = "store",
+                      type = "int",
+                      dest = "shards",
+                      default = 2,
+                      help = """The number of shards. Default is %default.""")
+
+    parser.add_option("--output","-o",
+                      action = "store",
+                      type = "string",
+                      dest = "output_filename",
+                      help = """The output file.""")
+
+    choices = ('cat','sum','merge','bowtie')
+    parser.add_option("--method","-m",
+                      action = "store",
+                      type = "choice",
+                      choices = choices,
+                      dest = "method",
+                      default = 'cat',
+                      help = """The method used for merging the files. The choices are ['"""+"','".join(choices)+"""']. Default is '%default'.""")
+
+    parser.add_option("--lines","-l",
+                      action = "store",
+                      type = "int",
+                      dest = "lines",
+                      default = 1,
+                      help = """The number of lines of one record (used only by method 'merge'), e.g. 8 for a pair of reads. Default is %default.""")
+
+    parser.add_option("--key","-k",
+                      action = "store",
+                      type = "string",
+                      dest = "key",
+                      default = '',
+                      help = """The columns (tab separated, starting with 1, and separated by comma) of a record which are used as key for sorting (used only by method 'merge'), e.g. '2,6' for the sequences of a pair of reads (given as 8 lines). If it is empty then the entire record is used as key. Default is '%default'.""")
+
+    parser.add_option("--unique","-u",
+                      action = "store_true",
+                      dest = "unique",
+                      default = False,
+                      help = """If it is set then only the first record (from the first shard) is kept for the records which have the same key (used only by method 'merge'). Default is %default.""")
+
+    (options, args) = parser.parse_args()
+
+    # validate options
+    if not (options.input_template and
+            options.output_filename
+            ):
+        parser.print_help()
+        parser.error("No inputs and outputs specified!")
+
+    if options.input_template.find('%d') == -1:
+        parser.error("The template of the input files should contain '%d'!")
+
+    print >>sys.stderr,"Starting..."
+    inputs = [options.input_template % (k + 1,) for k in xrange(options.shards)]
+    inputs = [f for f in inputs if os.path.isfile(f)]
+    if not inputs:
+        print >>sys.stderr,"WARNING: No input files found for '%s'!" % (options.input_template,)
+    elif options.method == 'cat':
+        cat(inputs, options.output_filename)
+    elif options.method == 'sum':
+        add(inputs, options.output_filename)
+    elif options.method == 'merge':
+        key = [int(c) - 1 for c in options.key.split(',') if c.strip()]
+        merge(inputs, options.output_filename, options.lines, key, options.unique)
+    elif options.method == 'bowtie':
+        bowtie(inputs, options.output_filename)
+    print >>sys.stderr,"Done."
+    #
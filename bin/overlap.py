@@ -49,6 +49,7 @@ import itertools
 import string
 import gzip
 import gc
+import compression
 
 ttable = string.maketrans("ACGTYRSWKMBDHV-.","TGCARYSWMKVHDB-.")
 
@@ -60,12 +61,7 @@ def dnaReverseComplement(seq):
 
 def fastq(file_name, size_read_buffer = 10**8):
     fid = None
-    if file_name == '-':
-        fid = sys.stdin
-    elif file_name.lower().endswith('.gz'):
-        fid = gzip.open(file_name,'r')#,buffering=16*1024*1024 + 8)
-    else:
-        fid = open(file_name,'r')#,buffering=16*1024*1024 + 8) # or buffering = (64*1024)+8 => 64KB ; if the 8 bytes are not added, it will cause poor performance
+    fid = compression.zopen(file_name) # compressed files are decompressed in parallel by an external program
     piece = [None,None,None,None]
     i = 0
     j = 1
@@ -364,10 +360,14 @@ def overlap(input_1_filename,
     k = 0
     i = 0
     # find fast the length of the read
-    d = file(input_1_filename,"r").readlines(50000)
+    fid = compression.zopen(input_1_filename)
+    d = fid.readlines(50000)
+    fid.close()
     nax = set([len(el.rstrip('\r\n')) for i,el in enumerate(d) if i%4 == 1])
     na = nax.pop()
-    d = file(input_2_filename,"r").readlines(50000)
+    fid = compression.zopen(input_2_filename)
+    d = fid.readlines(50000)
+    fid.close()
     nbx = set([len(el.rstrip('\r\n')) for i,el in enumerate(d) if i%4 == 1])
     nb = nbx.pop()
 
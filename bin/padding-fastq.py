@@ -46,6 +46,7 @@ import sys
 import optparse
 import gc
 import gzip
+import compression
 
 
 if __name__=='__main__':
@@ -99,13 +100,7 @@ if __name__=='__main__':
 
     buffer_size = 10**8
 
-    fin = None
-    if options.input_filename == '-':
-        fin = sys.stdin
-    elif options.input_filename.endswith('.gz'):
-        fin = gzip.open(options.input_filename,'r')
-    else:
-        fin = open(options.input_filename,'r')
+    fin = compression.zopen(options.input_filename)
 
     fou = None
     if options.output_filename == '-':
@@ -48,6 +48,7 @@ import Bio.Seq
 import Bio.SeqIO
 import Bio.SeqRecord
 import Bio.Alphabet
+import intervals
 
 
 #
@@ -157,28 +158,6 @@ def predict(aexon,acds,achrom,aposition,astrand):
     return (txt,info)
 
 
-#
-#
-#
-def add_line(aline,adict):
-    chrom = aline[0]
-    pstart = int(aline[3])
-    pend = int(aline[4])
-    strand = aline[6]
-    if pstart > pend:
-        (pstart,pend) = (pend,pstart)
-    ids = [l.replace('"','').replace("'","").strip().split(' ') for l in aline[8].split(";") if l]
-    ids = dict([l for l in ids if len(l) == 2])
-    g_id = ids["gene_id"]
-    t_id = ids["transcript_id"]
-    e_no = int(ids["exon_number"])
-    if g_id not in adict:
-        adict[g_id] = dict()
-    if t_id not in adict[g_id]:
-        adict[g_id][t_id] = []
-    adict[g_id][t_id].append((e_no,pstart,pend,strand,chrom))
-
-
 #
 #
 #
@@ -213,40 +192,21 @@ def predict_frame(gtf_file,
                     tr2fa[t] = str(record.seq).upper()
             handle.close()
 
-        # read and pre-process the GTF file
-        if verbose:
-            print >>sys.stderr,"Parsing the GTF file..."
-        g = []
-        if gtf_file == '-':
-            g = [line.rstrip('\r\n').split("\t") for line in file(sys.stdin,"r").readlines() if (not line.startswith("#")) and line.rstrip()]
-        elif gtf_file.endswith('.gz'):
-            z = gzip.open(gtf_file,"r")
-            g = [line.rstrip('\r\n').split("\t") for line in z.readlines() if (not line.startswith("#")) and line.rstrip()]
-            z.close()
-        else:
-            g = [line.rstrip('\r\n').split("\t") for line in file(gtf_file,"r").readlines() if (not line.startswith("#")) and line.rstrip()]
-
-
-
-        # get all exons per gene as a dictionary
+        # get all exons per gene as a dictionary (see 'intervals.py')
         if verbose:
-            print >>sys.stderr,"Building the database of exons and CDSes..."
+            print >>sys.stderr,"Loading the database of exons and CDSes..."
+        db = intervals.load(gtf_file,'gtf')
         exon = dict()
         cds = dict()
-        q = 0
-        for line in g:
-            if line[2] == 'gene':
-                q = q + 1
-            flag = False
-            x = line[8].partition(";")
-            if x[0] and x[0].startswith("gene_id "):
-                x = x[0][9:-1]
-            if x not in myg:
-                continue
-            if line[2] == 'exon':
-                add_line(line,exon)
-            elif line[2] == 'CDS':
-                add_line(line,cds)
+        for (kind,adict) in (('exon',exon),('CDS',cds)):
+            for g in myg:
+                for f in db.features(kind,g):
+                    if g not in adict:
+                        adict[g] = dict()
+                    t = f[intervals.TRANSCRIPT]
+                    if t not in adict[g]:
+                        adict[g][t] = []
+                    adict[g][t].append((f[intervals.NUMBER],f[intervals.START],f[intervals.END],f[intervals.STRAND],f[intervals.CHROM]))
         # sorting the database
         for g in exon:
             for t in exon[g]:
@@ -56,6 +56,7 @@ import gc
 import shutil
 import errno
 import gzip
+import compression
 
 ttable = string.maketrans("ACGTYRSWKMBDHV-.","TGCARYSWMKVHDB-.") # global
 empty_read = ['@N123\n','N\n','+\n','I\n'] # global
@@ -74,7 +75,14 @@ def remove_file(a_file):
 def linkit(file_input, file_output, kind ='soft'):
     #
     remove_file(file_output)
-    if os.path.islink(file_input):
+    if compression.kind(file_input) and not compression.is_compressed(file_output):
+        # it cannot be linked and therefore it is decompressed
+        fin = compression.zopen(file_input)
+        fou = open(file_output,'wb')
+        shutil.copyfileobj(fin, fou, 16*1024*1024)
+        fou.close()
+        fin.close()
+    elif os.path.islink(file_input):
         linkto = os.readlink(file_input)
         if kind == 'soft':
             os.symlink(linkto, file_output)
@@ -124,11 +132,7 @@ def dnaReverseComplement(seq):
 #
 #
 def read_first_fastq(file_name, first = 2000000, size_buffer = 10**8):
-    fid = None
-    if file_name.lower().endswith('.gz'):
-        fid = gzip.open(file_name,'r')
-    else:
-        fid = open(file_name,'r')
+    fid = compression.zopen(file_name)
     i = 0
     while True:
         gc.disable()
@@ -149,11 +153,7 @@ def read_first_fastq(file_name, first = 2000000, size_buffer = 10**8):
 #
 #
 def read_fastq(file_name, size_buffer = 10**8):
-    fid = None
-    if file_name.lower().endswith('.gz'):
-        fid = gzip.open(file_name,'r')
-    else:
-        fid = open(file_name,'r')
+    fid = compression.zopen(file_name)
     while True:
         gc.disable()
         lines = fid.readlines(10**8)
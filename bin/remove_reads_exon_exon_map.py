@@ -51,18 +51,14 @@ remove_reads_exon_exon.py \
 import sys
 import os
 import optparse
-import gzip
+import compression
 
 #########################
 def line_from(a_map_filename):
     # it gives chunks from a_map_filename which is assumed to be ordered by the name of transcripts (i.e. column 3)
     # col 1 => read name
     # col 3 => name sequence on which read is aligning
-    fin = None
-    if a_map_filename.lower().endswith('.gz'):
-        fin = gzip.open(a_map_filename,'r')
-    else:
-        fin = open(a_map_filename,'r')
+    fin = compression.zopen(a_map_filename) # it might be compressed
     while True:
         lines=fin.readlines(10**8)
         if not lines:
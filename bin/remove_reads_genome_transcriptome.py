@@ -48,6 +48,7 @@ import optparse
 import gc
 import shutil
 import tempfile
+import compression
 
 def give_me_temp_filename(tmp_dir):
     if tmp_dir and (not os.path.isdir(tmp_dir)) and (not os.path.islink(tmp_dir)):
@@ -61,7 +62,7 @@ def giveRC(h,col):
 
 def map2dict(a_file, column, limit_counts_reads = 7*(10**7), size_buffer = 10**8):
     # get read name and mismatches
-    fi = open(a_file,'r')
+    fi = compression.zopen(a_file) # it might be compressed
     pack = None
     last_read = None
     base = []
@@ -0,0 +1,490 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It keeps the indexes of the aligners (e.g. the Bowtie indexes of the database
+of FusionCatcher) resident in memory, such that the aligners do not load them
+again from the disk at every step. The files of the indexes are mapped in
+memory by a small background process (i.e. the manager) which touches their
+pages periodically such that they stay in the page cache, which is shared by
+all the processes which map the same files (e.g. 'bowtie --mm'), i.e. the
+steps which overlap do not multiply the memory used by the indexes. This is
+best effort, i.e. the pages are not locked in memory (no 'mlock') and the
+operating system may still evict some of them between two touches.
+
+When the available memory is below a given limit (see '--min-available') the
+manager releases the indexes (largest first), i.e. they are unmapped and
+dropped from the page cache, and it loads them again when there is enough
+available memory.
+
+There is one manager for the same set of index files, which is shared by all
+the runs (e.g. a batch of samples) which use them, i.e. a run which finds the
+manager running registers itself with it and reuses the resident indexes.
+The manager exits when all the runs which registered (see '--session') have
+exited and the idle time (see '--idle') has passed, or when it is stopped
+(see '--stop').
+
+Example:
+
+import resident
+resident.start(['/some/fusioncatcher/data/current/transcripts_index/'], session = os.getpid())
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+
+"""
+import os
+import sys
+import time
+import mmap
+import errno
+import fcntl
+import signal
+import hashlib
+import optparse
+import tempfile
+import ctypes
+import ctypes.util
+
+# the size of one page of memory
+PAGE = mmap.PAGESIZE
+
+# the advice for dropping a file from the page cache (see 'posix_fadvise')
+POSIX_FADV_DONTNEED = 4
+
+GB = float(2**30)
+
+_libc = None
+
+#
+def libc():
+    """
+    It returns the C library (or None if it cannot be loaded), which is
+    needed for measuring and dropping the pages of a file from the page cache.
+    """
+    global _libc
+    if _libc is None:
+        try:
+            _libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno = True)
+            _libc.mmap.restype = ctypes.c_void_p
+            _libc.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int64]
+            _libc.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+            _libc.mincore.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_char_p]
+            _libc.posix_fadvise.argtypes = [ctypes.c_int, ctypes.c_int64, ctypes.c_int64, ctypes.c_int]
+        except (OSError, AttributeError):
+            _libc = False
+    return _libc if _libc else None
+
+#
+def files(paths):
+    """
+    It returns the files of the given indexes, where an index is given as a
+    directory (e.g. Bowtie, STAR), as a file or as the prefix of its files
+    (e.g. Bowtie2).
+    """
+    r = []
+    for p in paths:
+        if os.path.isdir(p):
+            r.extend([os.path.join(p,f) for f in sorted(os.listdir(p))])
+        elif os.path.isfile(p):
+            r.append(p)
+        else:
+            d = os.path.dirname(p) or '.'
+            b = os.path.basename(p)
+            if b and os.path.isdir(d):
+                r.extend([os.path.join(d,f) for f in sorted(os.listdir(d)) if f.startswith(b)])
+    r = [os.path.abspath(f) for f in r if os.path.isfile(f)]
+    return sorted(set(r))
+
+#
+def state(filenames):
+    """
+    It returns the prefix of the files of the manager of the given files of
+    indexes (i.e. '.lock', '.pid' and '.sessions').
+    """
+    h = hashlib.md5('\n'.join(filenames)).hexdigest()
+    return os.path.join(tempfile.gettempdir(), 'fusioncatcher-resident-%s' % (h,))
+
+#
+def available():
+    """
+    It returns the available memory (in bytes).
+    """
+    m = dict()
+    if os.path.isfile('/proc/meminfo'):
+        for line in file('/proc/meminfo','r'):
+            line = line.split()
+            if len(line) > 1:
+                m[line[0].rstrip(':')] = int(line[1]) * 1024
+    if 'MemAvailable' in m:
+        return m['MemAvailable']
+    return m.get('MemFree',0) + m.get('Buffers',0) + m.get('Cached',0)
+
+#
+def residency(filename):
+    """
+    It returns the fraction of the pages of a file which are in the page
+    cache (or None if it cannot be measured).
+    """
+    c = libc()
+    size = os.path.getsize(filename)
+    if not c or not size:
+        return None
+    n = (size + PAGE - 1) / PAGE
+    v = ctypes.create_string_buffer(n)
+    fd = os.open(filename, os.O_RDONLY)
+    try:
+        a = c.mmap(None, size, mmap.PROT_READ, mmap.MAP_SHARED, fd, 0)
+        if a is None or a == ctypes.c_void_p(-1).value:
+            return None
+        r = c.mincore(a, size, v)
+        c.munmap(a, size)
+    finally:
+        os.close(fd)
+    if r != 0:
+        return None
+    return float(sum([ord(x) & 1 for x in v.raw])) / float(n)
+
+#
+def evict(filename):
+    """
+    It drops the pages of a file from the page cache (only the ones which are
+    not used by any process). It returns False if it cannot be done.
+    """
+    c = libc()
+    if not c:
+        return False
+    fd = os.open(filename, os.O_RDONLY)
+    try:
+        r = c.posix_fadvise(fd, 0, 0, POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return r == 0
+
+#
+def alive(pid):
+    """
+    It returns True if the process is running.
+    """
+    try:
+        os.kill(pid, 0)
+    except OSError, e:
+        return e.errno == errno.EPERM
+    return True
+
+#
+def register(prefix, session = 0, idle = 0):
+    """
+    It registers a run with the manager, i.e. the manager is kept while the
+    process SESSION is running and for IDLE seconds from now.
+    """
+    lines = []
+    if session:
+        lines.append('session\t%d\n' % (session,))
+    if idle:
+        lines.append('until\t%.1f\n' % (time.time() + idle,))
+    fd = os.open(prefix + '.sessions', os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0644)
+    os.write(fd, ''.join(lines))
+    os.close(fd)
+
+#
+def wanted(prefix):
+    """
+    It returns True if any run still needs the manager.
+    """
+    try:
+        lines = [line.rstrip('\r\n').split('\t') for line in file(prefix + '.sessions','r') if line.rstrip('\r\n')]
+    except IOError:
+        # stopped
+        return False
+    now = time.time()
+    for line in lines:
+        if len(line) < 2:
+            continue
+        if line[0] == 'session' and alive(int(line[1])):
+            return True
+        elif line[0] == 'until' and float(line[1]) > now:
+            return True
+    return False
+
+#
+def manager_pid(prefix):
+    """
+    It returns the process id of the manager (or None if it is not running).
+    """
+    try:
+        pid = int(file(prefix + '.pid','r').read().strip())
+    except (IOError, ValueError):
+        return None
+    return pid if alive(pid) else None
+
+#
+class manager:
+    """
+    It keeps the given files mapped in memory while there is enough available
+    memory (i.e. above MIN_AVAILABLE bytes).
+    """
+    def __init__(self, filenames, min_available):
+        self.filenames = filenames
+        self.min_available = min_available
+        self.maps = dict()
+
+    def touch(self, m):
+        # it reads one byte from each page
+        for i in xrange(0, len(m), PAGE):
+            m[i]
+
+    def load(self, filename):
+        fd = os.open(filename, os.O_RDONLY)
+        try:
+            m = mmap.mmap(fd, 0, mmap.MAP_SHARED, mmap.PROT_READ)
+        finally:
+            os.close(fd)
+        self.touch(m)
+        self.maps[filename] = m
+
+    def release(self, filename):
+        self.maps.pop(filename).close()
+        evict(filename)
+
+    def step(self):
+        if available() < self.min_available:
+            # the largest indexes are released first
+            for f in sorted(self.maps.keys(), key = lambda x: -len(self.maps[x])):
+                self.release(f)
+                if available() >= self.min_available:
+                    break
+        else:
+            for f in self.filenames:
+                if f in self.maps or not os.path.isfile(f):
+                    continue
+                s = os.path.getsize(f)
+                if not s:
+                    continue
+                if available() - s * (1 - (residency(f) or 0)) < self.min_available:
+                    break
+                self.load(f)
+        for m in self.maps.itervalues():
+            self.touch(m)
+
+    def close(self):
+        for f in self.maps.keys():
+            self.maps.pop(f).close()
+
+#
+def run(filenames, prefix, min_available, interval):
+    """
+    It runs the manager (until no run needs it anymore).
+    """
+    file(prefix + '.pid','w').write('%d\n' % (os.getpid(),))
+    m = manager(filenames, min_available)
+    last = 0
+    try:
+        while True:
+            if not wanted(prefix):
+                # a run which registers now finds no manager and starts one
+                os.remove(prefix + '.pid')
+                if not wanted(prefix):
+                    break
+                file(prefix + '.pid','w').write('%d\n' % (os.getpid(),))
+            if time.time() - last >= interval:
+                m.step()
+                last = time.time()
+            time.sleep(1)
+    finally:
+        m.close()
+        if os.path.isfile(prefix + '.pid') and manager_pid(prefix) == os.getpid():
+            os.remove(prefix + '.pid')
+
+#
+def start(paths, session = 0, idle = 0, min_available = 2 * GB, interval = 30):
+    """
+    It keeps the given indexes resident in memory (see 'files') for the given
+    run (see 'register'). A manager which is running already for the same
+    indexes is reused and otherwise a new one is started (in background). It
+    returns the process id of the manager and True if it has been started now
+    (or None if there are no files).
+    """
+    filenames = files(paths)
+    if not filenames:
+        return (None, False)
+    prefix = state(filenames)
+    register(prefix, session, idle)
+    for i in xrange(100):
+        lock = open(prefix + '.lock','a')
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except IOError:
+            lock.close()
+            pid = manager_pid(prefix)
+            if pid:
+                # it is running already
+                return (pid, False)
+            # it is exiting (or starting)
+            time.sleep(0.1)
+            continue
+        if os.path.isfile(prefix + '.pid'):
+            os.remove(prefix + '.pid')
+        pid = os.fork()
+        if pid == 0:
+            # the manager is detached (and it keeps the lock while it runs)
+            try:
+                os.setsid()
+                if os.fork() > 0:
+                    os._exit(0)
+                signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+                signal.signal(signal.SIGINT, signal.SIG_IGN)
+                null = os.open(os.devnull, os.O_RDWR)
+                for fd in (0,1,2):
+                    os.dup2(null, fd)
+                os.closerange(3, lock.fileno())
+                os.closerange(lock.fileno() + 1, 65536)
+                run(filenames, prefix, min_available, interval)
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+        lock.close()
+        for j in xrange(100):
+            pid = manager_pid(prefix)
+            if pid:
+                return (pid, True)
+            time.sleep(0.1)
+        break
+    print >>sys.stderr,"WARNING: The manager of the resident indexes could not be started!"
+    return (None, False)
+
+#
+def stop(paths):
+    """
+    It stops the manager of the given indexes (if it is running).
+    """
+    filenames = files(paths)
+    if not filenames:
+        return None
+    prefix = state(filenames)
+    if os.path.isfile(prefix + '.sessions'):
+        os.remove(prefix + '.sessions')
+    pid = manager_pid(prefix)
+    if pid:
+        os.kill(pid, signal.SIGTERM)
+    return pid
+
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options]"
+    description = """It keeps the indexes of the aligners (e.g. Bowtie) resident in memory (i.e. page cache, shared by all the processes which map them, e.g. 'bowtie --mm') such that they are not loaded again from the disk at every step and by every run (e.g. a batch of samples)."""
+    version = "%prog 0.10 beta"
+
+    parser = optparse.OptionParser(usage = usage,
+                                   description = description,
+                                   version = version)
+
+    parser.add_option("--index","-i",
+                      action = "append",
+                      type = "string",
+                      dest = "indexes",
+                      help = """An index which is kept resident in memory, given as a directory (e.g. Bowtie or STAR), a file or the prefix of its files (e.g. Bowtie2). It might be given several times.""")
+
+    parser.add_option("--session","-s",
+                      action = "store",
+                      type = "int",
+                      dest = "session",
+                      default = 0,
+                      help = """The id of a process (e.g. a run of FusionCatcher) while which the indexes are kept resident in memory. Default is '%default'.""")
+
+    parser.add_option("--idle","-t",
+                      action = "store",
+                      type = "int",
+                      dest = "idle",
+                      default = 3600,
+                      help = """The time (in seconds, from now) for which the indexes are kept resident in memory, e.g. for the next runs of a batch of samples. Default is '%default'.""")
+
+    parser.add_option("--min-available","-m",
+                      action = "store",
+                      type = "float",
+                      dest = "min_available",
+                      default = 2,
+                      help = """The minimum available memory (in GB). The indexes are released when the available memory is below it. Default is '%default'.""")
+
+    parser.add_option("--interval",
+                      action = "store",
+                      type = "int",
+                      dest = "interval",
+                      default = 30,
+                      help = """The time (in seconds) between two checks of the available memory (and touches of the indexes). Default is '%default'.""")
+
+    parser.add_option("--status",
+                      action = "store_true",
+                      dest = "status",
+                      default = False,
+                      help = """It prints the manager and the fraction of each file of the indexes which is resident in memory.""")
+
+    parser.add_option("--stop",
+                      action = "store_true",
+                      dest = "stop",
+                      default = False,
+                      help = """It stops the manager, i.e. the indexes are not kept resident in memory anymore.""")
+
+    (options,args) = parser.parse_args()
+
+    # validate options
+    if not options.indexes:
+        parser.print_help()
+        sys.exit(1)
+
+    if options.stop:
+        pid = stop(options.indexes)
+        if pid:
+            print "The manager (process %d) has been stopped." % (pid,)
+    elif options.status:
+        filenames = files(options.indexes)
+        pid = manager_pid(state(filenames)) if filenames else None
+        print "Manager: %s" % ('process %d' % (pid,) if pid else 'not running',)
+        for f in filenames:
+            r = residency(f)
+            print "%s\t%d bytes\t%s resident" % (f, os.path.getsize(f), '%.1f%%' % (100.0 * r,) if r is not None else 'NA')
+    else:
+        (pid, started) = start(options.indexes,
+                               session = options.session,
+                               idle = options.idle,
+                               min_available = options.min_available * GB,
+                               interval = options.interval)
+        if pid:
+            print "The indexes are kept resident in memory by the manager (process %d, %s)." % (pid, 'started now' if started else 'reused')
+        else:
+            sys.exit(1)
+    #
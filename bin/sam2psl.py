@@ -364,6 +364,7 @@ import os
 import sys
 import optparse
 import gc
+import compression
 
 
 cigar_set = (['M','I','D','N','S','H','P','=','X'])
@@ -644,7 +645,7 @@ def getlines(a_filename):
     if a_filename == '-':
         fin = sys.stdin
     else:
-        fin = open(a_filename,'r')
+        fin = compression.zopen(a_filename) # it might be compressed
     header = dict()
     first = True
     while True:
@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It builds the set of genes which are partners in the candidate fusion genes
+(e.g. found on a subsample of reads, see '--screen' of 'fusioncatcher.py').
+The set is expanded liberally with the genes which are paired with them in
+the given lists of pairs of genes (e.g. paralogs and adjacent genes).
+Optionally only the genes which are missing from a known set of genes (or
+only the pairs of genes which are missing from a known list of candidate
+fusion genes) are written, which is used for checking that a set of genes
+covers the candidate fusion genes found later.
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+
+"""
+import os
+import sys
+import optparse
+
+#
+def read_pairs(input_filename, status = 'further'):
+    """
+    It reads the pairs of genes from the list of candidate fusion genes (i.e.
+    the first two columns), where only the candidate fusion genes which have
+    the given analysis status are used ('all' for all of them).
+    """
+    pairs = set()
+    if not (os.path.isfile(input_filename) or os.path.islink(input_filename)):
+        return pairs
+    # 0  - Fusion_gene_1
+    # 1  - Fusion_gene_2
+    # 2  - Count_paired-end_reads
+    # 3  - Fusion_gene_symbol_1
+    # 4  - Fusion_gene_symbol_2
+    # 5  - Information_fusion_genes
+    # 6  - Analysis_status -> further or skipped
+    data = [line.rstrip('\r\n').split('\t') for line in file(input_filename,'r').readlines() if line.rstrip('\r\n')]
+    if data and data[0][0].startswith('Fusion_gene'):
+        data.pop(0) # remove the header
+    for line in data:
+        if len(line) < 2:
+            continue
+        if status != 'all' and len(line) > 6 and line[6] != status:
+            continue
+        pairs.add((line[0],line[1]))
+    return pairs
+
+#
+def read_candidates(input_filename, status = 'further'):
+    """
+    It reads the genes from the list of candidate fusion genes (i.e. the
+    first two columns), where only the candidate fusion genes which have the
+    given analysis status are used ('all' for all of them).
+    """
+    genes = set()
+    for (g1,g2) in read_pairs(input_filename, status):
+        genes.add(g1)
+        genes.add(g2)
+    return genes
+
+#
+def expand(genes, pairs_filenames):
+    """
+    It adds to the set of genes the genes which are paired with them in the
+    given files (i.e. first two columns are genes).
+    """
+    extra = set()
+    for f in pairs_filenames:
+        if not (os.path.isfile(f) or os.path.islink(f)):
+            print >>sys.stderr,"WARNING: '%s' is missing and it is skipped!" % (f,)
+            continue
+        for line in file(f,'r'):
+            g = line.rstrip('\r\n').split('\t')
+            if len(g) < 2:
+                continue
+            if g[0] in genes:
+                extra.add(g[1])
+            if g[1] in genes:
+                extra.add(g[0])
+    return genes.union(extra)
+
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options]"
+    description = """It builds the set of genes which are partners in the candidate fusion genes, which is expanded with the genes paired with them (e.g. paralogs and adjacent genes)."""
+    version = "%prog 0.10 beta"
+
+    parser = optparse.OptionParser(usage = usage,
+                                   description = description,
+                                   version = version)
+
+    parser.add_option("--input","-i",
+                      action = "store",
+                      type = "string",
+                      dest = "input_filename",
+                      help = """The input file with the candidate fusion genes (e.g. 'preliminary-list_candidate-fusion-genes.txt'). If it is missing then no genes are found.""")
+
+    parser.add_option("--status","-s",
+                      action = "store",
+                      type = "string",
+                      dest = "status",
+                      default = "further",
+                      help = """Only the candidate fusion genes which have this analysis status are used ('all' for all of them). Default is '%default'.""")
+
+    parser.add_option("--pairs","-p",
+                      action = "append",
+                      type = "string",
+                      dest = "pairs_filenames",
+                      default = [],
+                      help = """A file with pairs of genes (i.e. first two columns, e.g. 'paralogs.txt' or 'adjacent_genes.txt') which is used for expanding the set of genes. It can be given several times.""")
+
+    parser.add_option("--known","-k",
+                      action = "store",
+                      type = "string",
+                      dest = "known_filename",
+                      help = """If it is given then only the genes which are missing from this file (i.e. one gene per line) are written.""")
+
+    parser.add_option("--known-pairs","-n",
+                      action = "store",
+                      type = "string",
+                      dest = "known_pairs_filename",
+                      help = """If it is given then only the pairs of genes of the candidate fusion genes which are missing from this list of candidate fusion genes (i.e. all of them, whatever their analysis status) are written (i.e. two genes per line, tab separated), instead of the set of genes.""")
+
+    parser.add_option("--output","-o",
+                      action = "store",
+                      type = "string",
+                      dest = "output_filename",
+                      help = """The output file with the set of genes (one gene per line, sorted).""")
+
+    (options, args) = parser.parse_args()
+
+    # validate options
+    if not (options.input_filename and
+            options.output_filename
+            ):
+        parser.print_help()
+        parser.error("No inputs and outputs specified!")
+
+    if options.known_pairs_filename:
+        print >>sys.stderr,"Reading...",options.input_filename
+        pairs = read_pairs(options.input_filename, options.status)
+        print >>sys.stderr,"%d pairs of genes found in the candidate fusion genes" % (len(pairs),)
+        known = read_pairs(options.known_pairs_filename, 'all')
+        known = known.union([(g2,g1) for (g1,g2) in known])
+        pairs = pairs.difference(known)
+        print >>sys.stderr,"%d pairs of genes are missing from '%s'" % (len(pairs),options.known_pairs_filename)
+        print >>sys.stderr,"Writing...",options.output_filename
+        file(options.output_filename,'w').writelines(['%s\t%s\n' % el for el in sorted(pairs)])
+        print >>sys.stderr,"Done."
+        sys.exit(0)
+
+    print >>sys.stderr,"Reading...",options.input_filename
+    genes = read_candidates(options.input_filename, options.status)
+    print >>sys.stderr,"%d genes found in the candidate fusion genes" % (len(genes),)
+
+    if options.pairs_filenames and genes:
+        genes = expand(genes, options.pairs_filenames)
+        print >>sys.stderr,"%d genes after expansion" % (len(genes),)
+
+    if options.known_filename:
+        known = set()
+        if os.path.isfile(options.known_filename) or os.path.islink(options.known_filename):
+            known = set([line.rstrip('\r\n') for line in file(options.known_filename,'r') if line.rstrip('\r\n')])
+        genes = genes.difference(known)
+        print >>sys.stderr,"%d genes are missing from '%s'" % (len(genes),options.known_filename)
+
+    print >>sys.stderr,"Writing...",options.output_filename
+    file(options.output_filename,'w').writelines([el+'\n' for el in sorted(genes)])
+    print >>sys.stderr,"Done."
+    #
@@ -60,6 +60,7 @@ import optparse
 import tempfile
 import gc
 import multiprocessing
+import compression
 
 ######### Functions ############
 
@@ -81,6 +82,13 @@ def empty(a_file):
         f = False
     return f
 
+def first_line_of(a_file):
+    # it reads the first line of a file (which might be compressed)
+    fid = compression.zopen(a_file)
+    line = fid.readline()
+    fid.close()
+    return line
+
 #
 # sort
 #
@@ -144,16 +152,26 @@ def sort_columns(input_filename = '-',
     if fon == '-':
         fon = give_me_temp_filename(tmp_dir)
 
+    # the input file might be compressed (e.g. intermediate files compressed
+    # on the fly) and therefore it is decompressed in parallel for SORT
+    reader = ''
+    if compression.kind(fin):
+        cmd = compression.decompressor(fin, parallel)
+        if not cmd:
+            print >>sys.stderr, "ERROR (sort_ttdb.py): Cannot find any program for decompressing '%s'!" % (fin,)
+            sys.exit(1)
+        reader = ' '.join(cmd) + " < '" + fin + "' | "
+
     if header:
-        header_saved = file(fin,'r').readline()
+        header_saved = first_line_of(fin)
         file(output_filename,'w').write(header_saved)
     else:
         file(output_filename,'w').write('')
 
     # process the type of the column, numeric, or string
-    first_line = file(fin,'r').readline()
+    first_line = first_line_of(fin)
     if first_line:
-        nc=len(file(fin,'r').readline().rstrip('\r\n').split('\t'))#read first line in order to find out the number of columns
+        nc=len(first_line.rstrip('\r\n').split('\t'))#read first line in order to find out the number of columns
         if columns:
             columns=columns.strip().lower()
             if columns=='d':
@@ -184,8 +202,12 @@ def sort_columns(input_filename = '-',
             comd = "-u "+comd
         if tmp_dir:
             comd = "-T '"+tmp_dir+"' "+comd
-        if header:
+        if header and reader:
+            comd = reader + "LC_ALL=C sed 1d | LC_ALL=C sort " + extra + comd + " >> '" + output_filename + "'"
+        elif header:
             comd = "LC_ALL=C sed 1d '" + fin + "' | LC_ALL=C sort " + extra + comd + " >> '" + output_filename + "'"
+        elif reader:
+            comd = reader + "LC_ALL=C sort " + extra + comd + " >> '" + output_filename + "'"
         else:
             comd = "LC_ALL=C sort " + extra + comd + " '" + fin + "' >> '" + output_filename + "'"
         r = os.system(comd)
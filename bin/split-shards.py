@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It splits a FASTQ file into several shards (i.e. contiguous parts which have
+almost the same number of reads) such that the read-level stages of
+FusionCatcher can be executed independently on each shard (see '--shards' of
+'fusioncatcher.py'). A read (or a group of reads, see '--lines') is never
+split between two shards and optionally the mates of a pair of reads (i.e.
+consecutive reads whose names end with /1 and /2) are always kept together in
+the same shard.
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+
+"""
+import os
+import sys
+import gc
+import optparse
+import compression
+
+#
+def mate(name):
+    """
+    It returns the name of a read without /1 or /2 at its end.
+    """
+    name = name.rstrip('\r\n')
+    if name.endswith('/1') or name.endswith('/2'):
+        name = name[:-2]
+    return name
+
+#
+def count_lines(input_filename, size_buffer = 10**8):
+    """
+    It counts the lines of a file (which might be compressed).
+    """
+    n = 0
+    fin = compression.zopen(input_filename)
+    while True:
+        gc.disable()
+        lines = fin.readlines(size_buffer)
+        gc.enable()
+        if not lines:
+            break
+        n = n + len(lines)
+    fin.close()
+    return n
+
+#
+def split(input_filename,
+          output_template,
+          shards,
+          lines = 4,
+          mates = False,
+          size_buffer = 10**8):
+    """
+    It splits the input file into shards. It returns the list with the
+    number of records (of LINES lines) written in each shard.
+    """
+    records = count_lines(input_filename, size_buffer) / lines
+    # the number of records written when each shard is complete
+    limits = [(records * (k + 1)) / shards for k in xrange(shards)]
+
+    counts = [0] * shards
+    k = 0
+    written = 0
+    last = None
+    fou = open(output_template % (k + 1,),'w')
+    fin = compression.zopen(input_filename)
+    leftover = []
+    while True:
+        gc.disable()
+        data = fin.readlines(size_buffer)
+        gc.enable()
+        if not data:
+            # an incomplete record at the end of the file is kept as it is
+            fou.writelines(leftover)
+            break
+        if leftover:
+            data = leftover + data
+        n = len(data) - len(data) % lines
+        leftover = data[n:]
+        buf = []
+        for i in xrange(0, n, lines):
+            if written >= limits[k] and k < shards - 1:
+                # the mates of a pair are kept in the same shard
+                if not (mates and last is not None and mate(data[i]) == last):
+                    fou.writelines(buf)
+                    buf = []
+                    fou.close()
+                    k = k + 1
+                    while k < shards - 1 and written >= limits[k]:
+                        file(output_template % (k + 1,),'w').close()
+                        k = k + 1
+                    fou = open(output_template % (k + 1,),'w')
+            buf.extend(data[i:i+lines])
+            if mates:
+                last = mate(data[i])
+            written = written + 1
+            counts[k] = counts[k] + 1
+        fou.writelines(buf)
+    fin.close()
+    fou.close()
+    # make sure that all the shards exist (even if they are empty)
+    for j in xrange(k + 1, shards):
+        file(output_template % (j + 1,),'w').close()
+    return counts
+
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options]"
+    description = """It splits a FASTQ file into several shards (i.e. contiguous parts which have almost the same number of reads) such that the read-level stages can be executed independently on each shard."""
+    version = "%prog 0.10 beta"
+
+    parser = optparse.OptionParser(usage = usage,
+                                   description = description,
+                                   version = version)
+
+    parser.add_option("--input","-i",
+                      action = "store",
+                      type = "string",
+                      dest = "input_filename",
+                      help = """The input FASTQ file (it might be compressed).""")
+
+    parser.add_option("--output","-o",
+                      action = "store",
+                      type = "string",
+                      dest = "output_template",
+                      help = """The template of the names of the output files, where '%d' is replaced by the number of the shard (starting with 1), e.g. 'shards/shard_%d/reads.fq'.""")
+
+    parser.add_option("--shards","-n",
+                      action = "store",
+                      type = "int",
+                      dest = "shards",
+                      default = 2,
+                      help = """The number of shards. Default is %default.""")
+
+    parser.add_option("--lines","-l",
+                      action = "store",
+                      type = "int",
+                      dest = "lines",
+                      default = 4,
+                      help = """The number of lines of one record, which is never split between two shards (e.g. 4 for one read or 8 for a pair of reads which are processed together as one line using 'paste - - - - - - - -'). Default is %default.""")
+
+    parser.add_option("--mates","-m",
+                      action = "store_true",
+                      dest = "mates",
+                      default = False,
+                      help = """If it is set then the consecutive reads whose names differ only by /1 and /2 at their end (i.e. the mates of a pair) are kept always in the same shard. Default is %default.""")
+
+    (options, args) = parser.parse_args()
+
+    # validate options
+    if not (options.input_filename and
+            options.output_template
+            ):
+        parser.print_help()
+        parser.error("No inputs and outputs specified!")
+
+    if options.output_template.find('%d') == -1:
+        parser.error("The template of the output files should contain '%d'!")
+
+    if options.shards < 1 or options.lines < 1:
+        parser.error("The number of shards and lines should be at least 1!")
+
+    print >>sys.stderr,"Starting..."
+    for k in xrange(options.shards):
+        d = os.path.dirname(options.output_template % (k + 1,))
+        if d and not os.path.isdir(d):
+            os.makedirs(d)
+    counts = split(input_filename = options.input_filename,
+                   output_template = options.output_template,
+                   shards = options.shards,
+                   lines = options.lines,
+                   mates = options.mates)
+    for (k,c) in enumerate(counts):
+        print >>sys.stderr,"Shard %d: %d records" % (k + 1, c)
+    print >>sys.stderr,"Done."
+    #
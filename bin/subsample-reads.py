@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It subsamples a FASTQ file by keeping (in one streaming pass, after the reads
+are counted) every k-th read (or group of reads, see '--lines') such that
+approximately the given number of reads is kept (see '--screen' of
+'fusioncatcher.py'). Optionally the mates of a pair of reads (i.e. consecutive
+reads whose names end with /1 and /2) are always kept or dropped together.
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+
+"""
+import os
+import sys
+import gc
+import optparse
+import compression
+
+#
+def mate(name):
+    """
+    It returns the name of a read without /1 or /2 at its end.
+    """
+    name = name.rstrip('\r\n')
+    if name.endswith('/1') or name.endswith('/2'):
+        name = name[:-2]
+    return name
+
+#
+def count_lines(input_filename, size_buffer = 10**8):
+    """
+    It counts the lines of a file (which might be compressed).
+    """
+    n = 0
+    fin = compression.zopen(input_filename)
+    while True:
+        gc.disable()
+        lines = fin.readlines(size_buffer)
+        gc.enable()
+        if not lines:
+            break
+        n = n + len(lines)
+    fin.close()
+    return n
+
+#
+def subsample(input_filename,
+              output_filename,
+              reads,
+              lines = 4,
+              mates = False,
+              size_buffer = 10**8):
+    """
+    It keeps every k-th record (of LINES lines) from the input file such that
+    approximately READS records are kept. It returns the number of records
+    written.
+    """
+    records = count_lines(input_filename, size_buffer) / lines
+    step = 1
+    if reads > 0 and records > reads:
+        step = records / reads
+
+    counts = 0
+    unit = -1
+    last = None
+    fou = open(output_filename,'w')
+    fin = compression.zopen(input_filename)
+    leftover = []
+    while True:
+        gc.disable()
+        data = fin.readlines(size_buffer)
+        gc.enable()
+        if not data:
+            break
+        if leftover:
+            data = leftover + data
+        n = len(data) - len(data) % lines
+        leftover = data[n:]
+        buf = []
+        for i in xrange(0, n, lines):
+            if mates:
+                name = mate(data[i])
+                # the mates of a pair are kept (or dropped) together
+                if name != last:
+                    unit = unit + 1
+                last = name
+            else:
+                unit = unit + 1
+            if unit % step == 0:
+                buf.extend(data[i:i+lines])
+                counts = counts + 1
+        fou.writelines(buf)
+    fin.close()
+    fou.close()
+    return counts
+
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options]"
+    description = """It subsamples a FASTQ file by keeping every k-th read (or pair of reads) such that approximately the given number of reads is kept."""
+    version = "%prog 0.10 beta"
+
+    parser = optparse.OptionParser(usage = usage,
+                                   description = description,
+                                   version = version)
+
+    parser.add_option("--input","-i",
+                      action = "store",
+                      type = "string",
+                      dest = "input_filename",
+                      help = """The input FASTQ file (it might be compressed).""")
+
+    parser.add_option("--output","-o",
+                      action = "store",
+                      type = "string",
+                      dest = "output_filename",
+                      help = """The output FASTQ file.""")
+
+    parser.add_option("--reads","-n",
+                      action = "store",
+                      type = "int",
+                      dest = "reads",
+                      default = 10000000,
+                      help = """The approximate number of reads (or records, see '--lines') which are kept. Default is %default.""")
+
+    parser.add_option("--lines","-l",
+                      action = "store",
+                      type = "int",
+                      dest = "lines",
+                      default = 4,
+                      help = """The number of lines of one record (e.g. 4 for one read). Default is %default.""")
+
+    parser.add_option("--mates","-m",
+                      action = "store_true",
+                      dest = "mates",
+                      default = False,
+                      help = """If it is set then the consecutive reads whose names differ only by /1 and /2 at their end (i.e. the mates of a pair) are always kept or dropped together. Default is %default.""")
+
+    (options, args) = parser.parse_args()
+
+    # validate options
+    if not (options.input_filename and
+            options.output_filename
+            ):
+        parser.print_help()
+        parser.error("No inputs and outputs specified!")
+
+    if options.reads < 1 or options.lines < 1:
+        parser.error("The number of reads and lines should be at least 1!")
+
+    print >>sys.stderr,"Starting..."
+    d = os.path.dirname(options.output_filename)
+    if d and not os.path.isdir(d):
+        os.makedirs(d)
+    c = subsample(input_filename = options.input_filename,
+                  output_filename = options.output_filename,
+                  reads = options.reads,
+                  lines = options.lines,
+                  mates = options.mates)
+    print >>sys.stderr,"%d records kept" % (c,)
+    print >>sys.stderr,"Done."
+    #
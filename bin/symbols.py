@@ -40,6 +40,12 @@ This file is not running/executing/using BLAT.
 """
 import os
 import sys
+import bisect
+import marshal
+import hashlib
+
+# version of the format of the saved index (see 'read_index')
+VERSION = 1
 
 # hard coded gene synonyms
 synonym = {
@@ -717,42 +723,181 @@ def find_starts(txt,gs):
         r.extend([el for el in gs if el.upper().startswith(t.upper())])
     return list(set(r))
 
+# same as find_starts but it uses a sorted list of upper case gene symbols
+def find_starts_sorted(txt,gs):
+    r = set()
+    n = len(gs)
+    for t in txt:
+        t = t.upper()
+        i = bisect.bisect_left(gs,t)
+        while i < n and gs[i].startswith(t):
+            r.add(gs[i])
+            i = i + 1
+    return sorted(r)
+
 # read the gene symbols and generate loci
 def generate_loci(gene_symbols_filename = 'genes_symbols.txt'):
     genes = [line.rstrip('\r\n').split('\t') for line in file(gene_symbols_filename,'r').readlines()]
-    genes = list(set([v.upper() for (k,v) in genes]))
+    return loci_symbols([v for (k,v) in genes])
+
+# generate the loci from a list of gene symbols
+def loci_symbols(genes):
+    genes = sorted(set([v.upper() for v in genes]))
 
     loci = dict()
-    loci['HOXA@'] = find_starts(['HOXA'],genes)
-    loci['HOXB@'] = find_starts(['HOXB'],genes)
-    loci['HOXC@'] = find_starts(['HOXC'],genes)
-    loci['HOXD@'] = find_starts(['HOXD'],genes)
+    loci['HOXA@'] = find_starts_sorted(['HOXA'],genes)
+    loci['HOXB@'] = find_starts_sorted(['HOXB'],genes)
+    loci['HOXC@'] = find_starts_sorted(['HOXC'],genes)
+    loci['HOXD@'] = find_starts_sorted(['HOXD'],genes)
     loci['HOX@'] = loci['HOXA@'] + loci['HOXB@'] + loci['HOXC@'] + loci['HOXD@']
     
-    loci['HLA@'] = find_starts(['HLA-'],genes)
+    loci['HLA@'] = find_starts_sorted(['HLA-'],genes)
 
-    loci['IGL@'] = find_starts(['IGLV','IGLJ','IGLC','IGLL','IGL_locus','IGH_locus'],genes)
+    loci['IGL@'] = find_starts_sorted(['IGLV','IGLJ','IGLC','IGLL','IGL_locus','IGH_locus'],genes)
     loci['IGLV@'] = loci['IGL@']
-    loci['IGK@'] = find_starts(['IGKV','IGKJ','IGKC','IGK_locus'],genes)
+    loci['IGK@'] = find_starts_sorted(['IGKV','IGKJ','IGKC','IGK_locus'],genes)
     loci['IGKV@'] = loci['IGK@']
-    loci['IGH@'] = find_starts(['IGHV','IGHD','IGHJ','IGHA','IGHG','IGHE','IGHM','IGH_locus','IGL_locus'],genes)
+    loci['IGH@'] = find_starts_sorted(['IGHV','IGHD','IGHJ','IGHA','IGHG','IGHE','IGHM','IGH_locus','IGL_locus'],genes)
     loci['IGHV@'] = loci['IGH@']
     loci['IG@'] = loci['IGL@'] + loci['IGK@'] + loci['IGH@']
 
-    loci['TRA@'] = find_starts(['TRAC','TRAV','TRAJ','TRA_locus'],genes)
+    loci['TRA@'] = find_starts_sorted(['TRAC','TRAV','TRAJ','TRA_locus'],genes)
     loci['TCRA@'] = loci['TRA@']
-    loci['TRB@'] = find_starts(['TRBV','TRBD','TRBJ','TRBC','TRB_locus'],genes)
+    loci['TRB@'] = find_starts_sorted(['TRBV','TRBD','TRBJ','TRBC','TRB_locus'],genes)
     loci['TCRB@'] = loci['TRB@']
-    loci['TRBV@'] = find_starts(['TRBV'],genes)
+    loci['TRBV@'] = find_starts_sorted(['TRBV'],genes)
     loci['TCRVB@'] = loci['TRBV@']
     loci['TCRBV@'] = loci['TRBV@']
-    loci['TRD@'] = find_starts(['TRDV','TRDD','TRDJ','TRDC','TRD_locus'],genes)
+    loci['TRD@'] = find_starts_sorted(['TRDV','TRDD','TRDJ','TRDC','TRD_locus'],genes)
     loci['TCRB@'] = loci['TRD@']
-    loci['TRG@'] = find_starts(['TRGV','TRGJ','TRGC','TRG_locus'],genes)
+    loci['TRG@'] = find_starts_sorted(['TRGV','TRGJ','TRGC','TRG_locus'],genes)
     loci['TCRG@'] = loci['TRG@']
     loci['TCR@'] = loci['TRG@'] + loci['TRD@'] + loci['TRBV@'] + loci['TRB@'] + loci['TRA@']
     return loci
 
+# read (or build and save) an index: gene symbol/synonym/locus => Ensembl gene ids
+def read_index(gene_symbols_filename = 'synonyms.txt', cache = True):
+    """
+    It reads the gene symbols only once and it builds an index where every gene
+    symbol, hard coded synonym and locus (e.g. IGH@) points to the sorted tuple
+    of its Ensembl gene ids. It returns the index and the loci. The index is
+    saved next to the file of gene symbols (i.e. '<file>.idx') and it is used
+    as long as the content of the file has not changed.
+    """
+    idx = gene_symbols_filename + '.idx'
+    digest = hashlib.md5(file(gene_symbols_filename,'rb').read()).hexdigest()
+    if cache and os.path.isfile(idx):
+        try:
+            (v, d, index, loci) = marshal.load(open(idx,'rb'))
+            if v == VERSION and d == digest:
+                return (index,loci)
+        except (ValueError, EOFError, TypeError, IOError):
+            pass
+    (index,loci) = build_index(gene_symbols_filename)
+    if cache:
+        temp = '%s.%d.tmp' % (idx, os.getpid())
+        try:
+            fou = open(temp,'wb')
+            marshal.dump((VERSION, digest, index, loci), fou)
+            fou.close()
+            os.rename(temp, idx)
+        except (IOError, OSError):
+            print >>sys.stderr,"Warning: Cannot save the index of the gene symbols in '%s'!" % (idx,)
+            if os.path.isfile(temp):
+                os.remove(temp)
+    return (index,loci)
+
+# build an index: gene symbol/synonym/locus => Ensembl gene ids
+def build_index(gene_symbols_filename = 'synonyms.txt'):
+    """
+    It builds the index of the gene symbols (see 'read_index').
+    """
+    genes = read_genes_symbols(gene_symbols_filename)
+    loci = loci_symbols(genes.keys())
+    index = dict()
+    for (k,v) in genes.iteritems():
+        if not k.endswith('@'):
+            index[k] = tuple(sorted(v))
+    for (k,v) in synonym.iteritems():
+        if (k not in index) and (not k.endswith('@')) and v in genes:
+            index[k] = tuple(sorted(genes[v]))
+    for (k,v) in loci.iteritems():
+        e = set()
+        for ex in v:
+            e.update(index.get(ex,[ex] if ex.startswith('ENS') else []))
+        index[k] = tuple(sorted(e))
+    return (index,loci)
+
+# converts a gene symbol to ensembl ids using the index
+def index_ensembl(g,index):
+    g = g.upper()
+    ens = index.get(g,None)
+    if (not ens) and (not g.endswith('@')) and g.startswith('ENS'):
+        # I let it pass if it is and Ensembl id
+        ens = (g,)
+    if not ens:
+        print >>sys.stderr,"Warning: Could not find Ensembl gene id for gene '%s' [synonym: %s]." % (g,synonym.get(g,None))
+        return None
+    return list(ens)
+
+# converts in bulk pairs of gene symbols to pairs of ensembl ids
+def ensembl_pairs(pairs,index,fallback = None):
+    """
+    It converts a list of pairs of gene symbols into a sorted list of unique
+    pairs (e1,e2) of Ensembl gene ids, where e1 < e2. Every gene symbol is
+    looked up only once. If a gene symbol is not found in 'index' then it is
+    looked up in 'fallback' (which is also an index).
+    """
+    found = dict()
+    d = set()
+    for (g1,g2) in pairs:
+        if (not g1) or (not g2) or g1.upper() == g2.upper():
+            continue
+        r = []
+        for g in (g1.upper(),g2.upper()):
+            if g not in found:
+                if fallback is not None and (not index.get(g,None)):
+                    found[g] = index_ensembl(g,fallback) if fallback.get(g,None) else index_ensembl(g,index)
+                else:
+                    found[g] = index_ensembl(g,index)
+            r.append(found[g])
+        (ens1,ens2) = r
+        if ens1 and ens2:
+            for e1 in ens1:
+                for e2 in ens2:
+                    if e1 != e2:
+                        d.add((e1,e2) if e1 < e2 else (e2,e1))
+    return sorted(d)
+
+# all pairs of ensembl ids of two different genes from the same locus
+def loci_pairs(index,loci):
+    """
+    It gives a sorted list of unique pairs (e1,e2) of Ensembl gene ids, where
+    e1 < e2, for all pairs of different genes which belong to the same locus.
+    """
+    d = set()
+    done = set()
+    for v in loci.values():
+        if id(v) in done or len(v) < 2:
+            continue
+        done.add(id(v))
+        # Ensembl id => gene symbols (from this locus) pointing to it
+        owners = dict()
+        for g in set([el.upper() for el in v]):
+            for e in (index_ensembl(g,index) or []):
+                owners.setdefault(e,set()).add(g)
+        ens = sorted(owners.keys())
+        n = len(ens)
+        for i in xrange(n-1):
+            o1 = owners[ens[i]]
+            for j in xrange(i+1,n):
+                o2 = owners[ens[j]]
+                if len(o1) == 1 and o1 == o2:
+                    # both come only from the same gene symbol
+                    continue
+                d.add((ens[i],ens[j]))
+    return sorted(d)
+
 # converts only gene symbol to ensembl id
 
 def ensembl(g,genes):
@@ -306,6 +306,45 @@ Therefore the step 1, step 2, and step 3 are executed even though 'i' has value
 This is useful in cases when there are operations with files which do not exist
 at the moment when there is a re-run.
 
+Example 15:
+-----------
+
+from workflow import pipeline # use this Python pipeline library
+job = pipeline(threads = 4) # initialize the pipeline
+
+job.parallel_start()
+
+job.add('gzip',kind='program')
+job.add('-c','',kind='parameter')
+job.add('','a.txt',kind='input')
+job.add('>','a.txt.gz',kind='output')
+job.run()
+
+job.add('gzip',kind='program')
+job.add('-c','',kind='parameter')
+job.add('','b.txt',kind='input')
+job.add('>','b.txt.gz',kind='output')
+job.run(memory = 2)
+
+job.add('cat',kind='program')
+job.add('','a.txt.gz',kind='input')
+job.add('','b.txt.gz',kind='input')
+job.add('>','ab.txt.gz',kind='output')
+job.run()
+
+job.parallel_stop()
+
+The first two steps are independent and they are executed concurrently (using
+maximum 4 slots as given by 'threads'). The third step reads the outputs of the
+first two and therefore it is started only after both of them have finished.
+The dependencies between steps are found from the files and directories given
+as inputs, outputs and temporary paths (only the ones for which the checksum is
+computed or which are not passed to the command line). The steps which execute
+Python code outside of the workflow (e.g. 'if job.run():'), the steps which read
+their VALUE from a file, and the methods LINK, SINK, IFF, CLEAN and CLOSE wait
+for all the concurrent steps to finish first. The steps are still logged in
+their order such that the automatic restart and the checksums work as before.
+
 """
 
 
@@ -320,6 +359,11 @@ import math
 import errno
 import subprocess
 import tempfile
+import signal
+import json
+import shlex
+import runpy
+import traceback
 
 #import multiprocessing
 
@@ -343,6 +387,233 @@ def _islink(alink = None):
     return f
 
 
+def _memory_available():
+    """
+    It gives the available memory (in GB) as reported by '/proc/meminfo'.
+    """
+    mem = 0
+    if os.path.isfile('/proc/meminfo'):
+        meminfo = [line.split() for line in file('/proc/meminfo','r').readlines() if line.strip()]
+        meminfo = dict([(line[0].rstrip(':'),int(line[1])) for line in meminfo if len(line) > 1])
+        if 'MemAvailable' in meminfo:
+            mem = meminfo['MemAvailable']
+        else:
+            mem = meminfo.get('MemFree',0) + meminfo.get('Buffers',0) + meminfo.get('Cached',0)
+        mem = float(mem) / float(1024*1024) # kB => GB
+    return mem
+
+
+def _strip_path(a_path):
+    """
+    Normalizes a path such that it can be compared with other paths (for
+    finding the dependencies between steps).
+    """
+    a = _expand(a_path)
+    if a.endswith('*'):
+        a = a[:-1]
+    if a.endswith('\\') or a.endswith('/'):
+        a = a[:-1]
+    return a
+
+
+def _io_counters():
+    """
+    It gives the I/O counters of this process (and of its children which have
+    been waited for) as reported by '/proc/self/io'.
+    """
+    io = dict()
+    try:
+        for line in file('/proc/self/io','r').readlines():
+            line = line.split(':')
+            if len(line) == 2:
+                io[line[0].strip()] = int(line[1])
+    except (IOError, ValueError):
+        pass
+    return io
+
+
+def _wait4(pid, options = 0):
+    """
+    It waits for a child process (like os.wait4) and it gives also the
+    difference of the I/O counters (see _io_counters) due to the child.
+    """
+    before = _io_counters()
+    while True:
+        try:
+            (p, status, usage) = os.wait4(pid, options)
+            break
+        except OSError, e:
+            if e.errno != errno.EINTR:
+                raise
+    io = dict()
+    if p:
+        after = _io_counters()
+        io = dict([(k,after[k]-before.get(k,0)) for k in after])
+    return (p, status, usage, io)
+
+
+def _system(cmd, script = None):
+    """
+    It executes a command using the shell (like os.system) and it gives its
+    exit status, resources usage (of the entire process tree) and I/O counters.
+    If SCRIPT is given (see _script) then the Python script is executed
+    in-process (in a forked child) instead of using the shell.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    old_int = signal.signal(signal.SIGINT, signal.SIG_IGN)
+    old_quit = signal.signal(signal.SIGQUIT, signal.SIG_IGN)
+    try:
+        pid = os.fork()
+        if pid == 0:
+            # child
+            try:
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                signal.signal(signal.SIGQUIT, signal.SIG_DFL)
+                if script:
+                    _run_script(script)
+                os.execv('/bin/sh', ['/bin/sh', '-c', cmd])
+            finally:
+                os._exit(127)
+        (p, status, usage, io) = _wait4(pid)
+    finally:
+        signal.signal(signal.SIGINT, old_int)
+        signal.signal(signal.SIGQUIT, old_quit)
+    return (status, usage, io)
+
+
+# the redirections (of the standard output/error) which are supported when
+# a Python script is executed in-process
+_REDIRECTS = {'>': (1, os.O_WRONLY | os.O_CREAT | os.O_TRUNC),
+              '1>': (1, os.O_WRONLY | os.O_CREAT | os.O_TRUNC),
+              '>>': (1, os.O_WRONLY | os.O_CREAT | os.O_APPEND),
+              '2>': (2, os.O_WRONLY | os.O_CREAT | os.O_TRUNC),
+              '2>>': (2, os.O_WRONLY | os.O_CREAT | os.O_APPEND),
+              '<': (0, os.O_RDONLY)}
+
+
+def _preload(modules):
+    """
+    It imports the modules which are used by most of the Python scripts (see
+    PRELOAD of the pipeline). The modules which cannot be found are ignored.
+    """
+    for m in modules:
+        try:
+            __import__(m)
+        except Exception:
+            pass
+
+
+def _script(cmd):
+    """
+    It tests if a command line runs only a Python script (optionally with
+    its standard input/output/error redirected to files) such that it can be
+    executed in-process, i.e. without the shell and without starting again the
+    Python interpreter. It returns (script, arguments, redirections) or None
+    (e.g. for pipes, lists of commands, variables, wildcards, etc.).
+    """
+    try:
+        tokens = shlex.split(cmd)
+    except ValueError:
+        return None
+    if not tokens:
+        return None
+    program = tokens[0]
+    if not program.endswith('.py'):
+        return None
+    if program.find(os.sep) == -1:
+        for d in os.environ.get('PATH','').split(os.pathsep):
+            a = os.path.join(d or os.curdir,program)
+            if os.path.isfile(a):
+                program = a
+                break
+        else:
+            return None
+    if not (os.path.isfile(program) and os.access(program, os.X_OK)):
+        return None
+    try:
+        line = file(program,'r').readline()
+    except IOError:
+        return None
+    if not (line.startswith('#!') and line.find('python') != -1 and line.find('python3') == -1):
+        return None
+    args = []
+    redirects = []
+    i = 1
+    n = len(tokens)
+    while i < n:
+        t = tokens[i]
+        if t in _REDIRECTS and i + 1 < n:
+            redirects.append((t,tokens[i+1]))
+            i = i + 2
+            continue
+        elif t == '2>&1':
+            redirects.append((t,None))
+        elif [1 for c in t if c in '|&;<>()$`*?[]{}~\\\n']:
+            return None
+        else:
+            args.append(t)
+        i = i + 1
+    return (os.path.abspath(program), args, redirects)
+
+
+def _run_script(script):
+    """
+    It executes a Python script (see _script) as the main module of the
+    current process (which should be a child forked for this) and it exits.
+    """
+    code = 1
+    try:
+        try:
+            (program, args, redirects) = script
+            for (r,a) in redirects:
+                if r == '2>&1':
+                    os.dup2(1, 2)
+                else:
+                    (fd, flags) = _REDIRECTS[r]
+                    f = os.open(a, flags, 0666)
+                    if f != fd:
+                        os.dup2(f, fd)
+                        os.close(f)
+            d = os.path.dirname(program)
+            if d not in sys.path:
+                sys.path.insert(0, d)
+            sys.argv = [program] + args
+            runpy.run_path(program, run_name = '__main__')
+            code = 0
+        except SystemExit, e:
+            if e.code is None:
+                code = 0
+            elif isinstance(e.code, (int, long)):
+                code = e.code
+            else:
+                print >>sys.stderr, e.code
+                code = 1
+        except:
+            traceback.print_exc()
+            code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code & 0xFF)
+
+
+def _overlap(paths1, paths2):
+    """
+    It tests if two sets of paths overlap (a directory overlaps all the paths
+    found in it).
+    """
+    if paths1 & paths2:
+        return True
+    for a in paths1:
+        for b in paths2:
+            if a.startswith(b + os.sep) or b.startswith(a + os.sep):
+                return True
+    return False
+
+
 #############################
 class _crc32:
     """
@@ -414,8 +685,16 @@ class pipeline:
                  log_filename = 'log_pipeline.txt',
                  checksums_filename = 'checksums.txt',
                  hash_library = 'crc32',
-                 threads = 1, # not in use yet
-                 start_step = 1 # the number of the starting step (in case that one wants to execute again some specific part of the workflow
+                 threads = 1, # used only by the steps executed concurrently (see PARALLEL_START)
+                 start_step = 1, # the number of the starting step (in case that one wants to execute again some specific part of the workflow
+                 manifest_filename = None,
+                 incremental = False,
+                 telemetry_filename = None,
+                 trace_filename = None,
+                 inprocess = False,
+                 preload = None,
+                 keep = False,
+                 disk_path = None
                  ):
         """
         Initialization.
@@ -425,12 +704,60 @@ class pipeline:
         hash_library       - type of hash library used for computing the checksums, e.g. sha512,
                              sha256, md5, crc32, adler32. If it is set to '' or 'no' then no
                              checksums are used and everything is executed.
-        threads            - number of threads to be used for runnind the job.
+        threads            - number of slots (i.e. CPUs) which can be used by the
+                             steps which are executed concurrently (see the method
+                             PARALLEL_START). Default is 1.
         start_step         - the count of the step from where the execution of workflow should
                              start, default is 1 (in case that one wants to execute again some
                              specific part of the workflow). If it is set to 0 then workflow
                              is restarted automatically from the last step where it was previously
                              stopped.
+        manifest_filename  - name of the file where the fingerprints of the inputs
+                             used for building each output (i.e. artifact) are saved.
+                             A fingerprint covers the command line and the content of
+                             all input files of the step which built the output. The
+                             fingerprints of the input files are saved also (together
+                             with their sizes and modification times) such that they
+                             are not computed again in the next runs. The manifest is
+                             used only if INCREMENTAL is True.
+        incremental        - if it is True then a step is skipped when all its outputs
+                             exist and they have been built (according to the manifest)
+                             from inputs which have not changed since then. The steps
+                             which have no input files or which change their inputs
+                             in place are always executed. If it is False then no
+                             fingerprints are computed.
+        telemetry_filename - name of the file where the resources used by each executed
+                             step are saved (one JSON object per line), i.e. wall time,
+                             user/system CPU time, peak memory (of all processes of
+                             the step), bytes read/written and the sizes of the input
+                             and output files. If it is None then nothing is saved.
+        trace_filename     - name of the file where the timeline of the executed steps
+                             is saved (when the pipeline is closed) using the Chrome
+                             trace format (it can be viewed with chrome://tracing or
+                             Perfetto). If it is None then nothing is saved.
+        inprocess          - if it is True then the steps which run only a Python script
+                             (e.g. the scripts of FusionCatcher, optionally with the
+                             standard input/output/error redirected to files) are executed
+                             in-process, i.e. in a child forked from this process (which has
+                             the most used modules already imported) instead of starting
+                             the shell and a new Python interpreter. The steps which use
+                             pipes, several commands, etc. are executed using the shell.
+        preload            - list of the modules which are imported in advance when the
+                             steps are executed in-process (such that every step does
+                             not import them again), e.g. the modules used by most of
+                             the Python scripts of the workflow. The modules which
+                             cannot be found are ignored.
+        keep               - if it is True then the outputs are not deleted when all their
+                             consumers have finished (see CONSUMERS in ADD). They are not
+                             deleted also when the checksums are used.
+        disk_path          - the directory (e.g. the output directory) whose file system
+                             is checked after each executed step (i.e. its used space,
+                             as given by os.statvfs, which is cheap and counts the
+                             hard links once, but it includes also the files which do
+                             not belong to the pipeline and it misses the peaks within
+                             a step). The peak is reported when the pipeline is closed
+                             (and the used space after each step is saved in the
+                             telemetry). If it is None then nothing is measured.
         """
 
         self.task = []
@@ -439,7 +766,7 @@ class pipeline:
         self.ifs_steps = dict()
         self.ifs_ids = dict()
         self.iffs = set()
-        self.threads = 1
+        self.threads = threads if threads and threads > 0 else 1
         self.task_count = 0
         self.checksums_filename = checksums_filename
         self.start_time = datetime.datetime.now()
@@ -448,10 +775,44 @@ class pipeline:
         self.closed = False
         self.temp_paths = set()
         self.start_step = start_step
+        self.skipped = None # the starting step saved while a block of steps is skipped (see SKIP)
         self.header = dict()
         self.screen_length = 80
         self.protected_paths = set()
 
+        self.parallel_mode = False # True if the steps are executed concurrently
+        self.parallel_memory = 0 # memory (in GB) available for the concurrent steps
+        self.parallel_steps = [] # steps which are pending, running or not logged yet
+        self.buffer = None # if it is a list then the log is kept in it instead of being written
+        self.stream = None # step whose output is streamed to the next step (see STREAM in ADD)
+
+        self.manifest_filename = manifest_filename if incremental else None
+        self.incremental = incremental
+        self.manifest = dict() # output => fingerprint of the inputs used for building it
+        self.manifest_inputs = dict() # output => input files and their fingerprints
+        self.manifest_files = dict() # input file => (size, time, fingerprint)
+        self.fingerprint = None # fingerprint of the current task
+        self.fingerprint_inputs = '' # input files of the current task and their fingerprints
+
+        self.telemetry_filename = telemetry_filename
+        self.trace_filename = trace_filename
+        self.trace = [] # the events of the timeline
+        self.start_epoch = time.time()
+        if telemetry_filename:
+            file(telemetry_filename,'a').write('')
+
+        self.inprocess = inprocess
+        if inprocess and preload:
+            _preload(preload)
+
+        self.keep = keep
+        self.consumers = dict() # output => count of the steps which will still read it
+        self.disk_path = disk_path
+        self.disk_peak = 0 # peak disk usage (in bytes) of DISK_PATH
+        self.disk_peak_step = 0 # the step after which the peak disk usage was found
+        if self.manifest_filename:
+            self.__read_manifest()
+
         self.hash_type = 'smart' # it can be 'smart' or 'all'
         # - 'smart' - if a file has had its checksum computed before it will
         #             not be computed again. This will work only and only if
@@ -496,6 +857,16 @@ class pipeline:
                         continue
                     self.ifs_steps[s1] = s2
 
+                # build database of the steps which have read the output of
+                # a previous step through a named pipe (see STREAM in ADD)
+                m = "reading the output of step = "
+                t = [line.lower().strip() for line in previous_log if line.lower().find(k) != -1 or line.lower().find(m) != -1]
+                streams = dict()
+                for i in xrange(1,len(t)):
+                    if t[i].find(m) != -1 and t[i-1].find(k) != -1:
+                        s1 = int(t[i-1].partition(k)[2].partition(' ')[0])
+                        streams[s1] = int(t[i].partition(m)[2].partition(' ')[0])
+
                 # automatic restart
                 if start_step == 0:
                     self.write("Trying to restart automatically...",log = False)
@@ -505,14 +876,24 @@ class pipeline:
                     t = [line for line in previous_log if line.lower().find(k) != -1 or line.lower().find(q) != -1]
                     self.start_step = 1
                     if t and len(t) > 1:
-                        if t[-1].lower().find(q) != -1:
-                            t = t[-2].lower().rstrip('\r\n').strip() # get the line before the last one
-                            t = int(t.split(k,1)[1].split(' ')[0])
-                            t = t + 1
-                        else:
-                            t = t[-1].lower().rstrip('\r\n').strip() # get the last line
-                            t = int(t.split(k,1)[1].split(' ')[0])
-                        self.start_step = int(t)
+                        # the last step which has been started and if it has
+                        # finished (a step which streams its output finishes
+                        # after the next step has been started)
+                        last = None
+                        finished = False
+                        for line in t:
+                            line = line.lower().rstrip('\r\n').strip()
+                            if line.find(k) != -1:
+                                last = int(line.split(k,1)[1].split(' ')[0])
+                                finished = False
+                            else:
+                                finished = True
+                        if last is not None:
+                            self.start_step = last + 1 if finished else last
+                    # the output of a step which has been streamed is not on
+                    # the disk anymore and therefore that step is executed again
+                    while self.start_step in streams:
+                        self.start_step = streams[self.start_step]
 
 
             new_log_filename = log_filename
@@ -556,7 +937,9 @@ class pipeline:
             checksum = 'yes',
             dest = None,
             dest_list = None,
-            temp_path = 'no'):
+            temp_path = 'no',
+            stream = 'no',
+            consumers = 0):
         """
         IDENTIFIER   - identifier for command line argument, e.g. '--time'.
                        Always it should be specified, e.g. ''.
@@ -600,6 +983,23 @@ class pipeline:
                        as soon as possible. It can be only 'yes' or 'no'.
                        Default is 'no', i.e. it is not a temporary path or file
                        and nothing is deleted.
+        STREAM       - in case that KIND='path' and IO='output' (i.e. a file), it specifies
+                       if the file may be streamed to the next step through a named pipe
+                       (i.e. FIFO) instead of being written on the disk. It can be only
+                       'yes' or 'no'. The file is streamed only if the checksums and the
+                       manifest are not used, the steps are not executed concurrently (see
+                       PARALLEL_START, a warning is logged) and the next step reads it (sequentially,
+                       only once) and deletes it (i.e. TEMP_PATH='yes'), in which case
+                       both steps are executed at the same time. Otherwise the file is
+                       written on the disk as usual. Therefore the file should not be used
+                       by the Python code found between the two steps (e.g. for IFF).
+                       Default is 'no'.
+        CONSUMERS    - in case that KIND='path' and IO='output', it specifies the number
+                       of the next steps which read the file or directory (LINK is not
+                       counted because its output may be a link to the file or directory).
+                       The file or directory is deleted as soon as the last of them has
+                       finished (unless it is protected, see PROTECT, or KEEP is used).
+                       Default is 0, i.e. it is not deleted.
 
         """
         identifier = str(identifier)
@@ -719,6 +1119,21 @@ class pipeline:
             self.exit_flag = False
             sys.exit(1)
 
+        stream = str(stream).lower()
+        if stream == 'yes' and not (kind == 'path' and io == 'output' and from_file == 'no'):
+            print >> sys.stderr, "ERROR: kind = '",kind,"', io = '",io,"' and stream = 'yes' are not allowed!"
+            print >> sys.stderr, "The valid choice is kind = 'path', io = 'output' and stream = 'yes'!"
+            print >> sys.stderr, identifier,value,kind,space,io,from_file,command_line,checksum,temp_path
+            self.exit_flag = False
+            sys.exit(1)
+
+        if type(consumers).__name__ != 'int' or consumers < 0 or (consumers and not (kind == 'path' and io == 'output' and from_file == 'no')):
+            print >> sys.stderr, "ERROR: kind = '",kind,"', io = '",io,"' and consumers = '",consumers,"' are not allowed!"
+            print >> sys.stderr, "The valid choice is kind = 'path', io = 'output' and consumers = a positive integer!"
+            print >> sys.stderr, identifier,value,kind,space,io,from_file,command_line,checksum,temp_path
+            self.exit_flag = False
+            sys.exit(1)
+
         if dest is not None:
             setattr(self, dest, value)
 
@@ -752,7 +1167,9 @@ class pipeline:
                           'from_file': from_file,
                           'command_line': command_line,
                           'checksum': checksum,
-                          'temp_path': temp_path})
+                          'temp_path': temp_path,
+                          'stream': stream,
+                          'consumers': consumers})
 
     #
     #
@@ -844,7 +1261,9 @@ class pipeline:
             comment = 'no',
             error_message = '',
             successful_exit_status = (0,0),
-            exit_code = 0):
+            exit_code = 0,
+            processes = 1,
+            memory = 0):
         """
         It runs what has been added using method ADD.
 
@@ -855,6 +1274,14 @@ class pipeline:
         error_message - An additional error message to be displayed if the job/task
                         fails to run.
 
+        processes     - Number of slots (i.e. CPUs) used by the job/task. It is used only
+                        when the job/task is executed concurrently with other ones (see
+                        PARALLEL_START). Default is 1.
+
+        memory        - Amount of memory (in GB) needed by the job/task. It is used only
+                        when the job/task is executed concurrently with other ones (see
+                        PARALLEL_START). Default is 0.
+
         It returns:
 
         True   - if the task has been executed succesfully
@@ -919,116 +1346,123 @@ class pipeline:
                     hit_redirect = True
                 cmd_line.append(temp)
 
+            step = {'id': self.task_count,
+                    'task': self.task,
+                    'cmd_line': cmd_line,
+                    'error_message': error_message,
+                    'successful_exit_status': successful_exit_status,
+                    'captured_error_message': captured_error_message,
+                    'hit_redirect': hit_redirect,
+                    'processes': processes,
+                    'memory': memory}
+            self.__register(step)
+
+            concurrent = (self.parallel_mode and
+                          comment == 'no' and
+                          (not empty_program) and
+                          self.task_count >= self.start_step and
+                          (not [1 for element in self.task if element['from_file'] == 'yes']))
+
+            # the previous step streams its output to this step only if this
+            # step reads and deletes it (otherwise it is executed now as usual)
+            streamed = self.stream
+            self.stream = None
+            if streamed and not (comment == 'no' and
+                                 (not concurrent) and
+                                 (not empty_program) and
+                                 self.task_count >= self.start_step and
+                                 (not [1 for element in self.task if element['from_file'] == 'yes']) and
+                                 self.__consumes(step, streamed)):
+                self.__materialize(streamed)
+                streamed = None
 
-            # print the program and command line arguments
-            self.__show_step_header_start()
-
-            temp = ' \\\n'.join(cmd_line)
-            self.write(temp)
-            temp = "-" * self.screen_length
-            self.write(temp)
             executed = True
+            if concurrent:
+                # it will be executed later concurrently with other steps
+                if [1 for element in self.task if element['stream'] == 'yes']:
+                    self.write("WARNING: The outputs of the steps executed concurrently (see PARALLEL_START) are not streamed!")
+                self.__queue(step)
+            elif ((not streamed) and
+                  comment == 'no' and
+                  (not empty_program) and
+                  self.task_count >= self.start_step and
+                  (not [1 for element in self.task if element['from_file'] == 'yes']) and
+                  self.__streamable(step)):
+                # it will be executed together with the next step
+                self.__drain()
+                self.stream = step
+            else:
+                # wait for the steps which are executed concurrently
+                self.__drain()
 
-            #execute the program with the given command line arguments
-            if comment == 'no': # it is not commented out
-                if self.task_count >= self.start_step:
-                    if self.__run_again():
-
-                        # EXECUTE IT!
-                        proc = 0
-                        if not empty_program:
-                           #proc=subprocess.call(cmd_line,shell=True)
-                            self.write('+-->EXECUTING...')
-                            proc = os.system(' '.join(cmd_line))
-                        else:
-                            self.write('+-->MOCK EXECUTION (i.e. code executed outside of workflow)...')
-                        #print "---------------------->",proc,max(successful_exit_status),min(successful_exit_status)
-                        exit_code = float(proc)/float(256)
-                        if exit_code > max(successful_exit_status) or exit_code < min(successful_exit_status):
-                            temp = "\n\nERROR: Workflow execution failed at step %d while executing:\n----------------\n   %s\n----------------\n" % (self.task_count,' \\\n   '.join(cmd_line),)
-                            self.write(temp, stderr = True)
-                            if error_message:
-                                self.write(error_message, stderr = True)
-                            # print the input and output file sizes
-                            for elem in self.task:
-                                if element['command_line'] == 'yes' and ((elem['kind'] == 'path' and elem['io'] in ('input','output')) or elem['from_file'] == 'yes'):
-                                    ap = elem['value']
-                                    temp = "  * Size '%s' = %d bytes" % (ap,self.__path_size(ap))
-                                    self.write(temp, stderr = True)
-
-                            # print the captured error message from '2>&1>' or '2>'
-                            if hit_redirect:
-                                for il in captured_error_message:
-                                    if os.path.isfile(il) or _islink(il):
-                                        temp = []
-                                        try:
-                                            temp = file(il,'r').readlines()
-                                        except:
-                                            pass
-                                        self.write(temp, stderr = True)
+                # start the previous step which streams its output to this step
+                if streamed:
+                    self.__stream_start(streamed)
+
+                # print the program and command line arguments
+                self.__show_step_header_start()
+
+                temp = ' \\\n'.join(cmd_line)
+                self.write(temp)
+                temp = "-" * self.screen_length
+                self.write(temp)
+                if streamed:
+                    temp = "==> Reading the output of step = %d through a named pipe." % (streamed['id'],)
+                    self.write(temp)
+                    step['hit_redirect'] = True # it cannot be executed again for capturing the STDERR
+
+                #execute the program with the given command line arguments
+                if comment == 'no': # it is not commented out
+                    if self.task_count >= self.start_step:
+                        if self.__run_again():
+
+                            # EXECUTE IT!
+                            proc = 0
+                            if not empty_program:
+                               #proc=subprocess.call(cmd_line,shell=True)
+                                self.write('+-->EXECUTING...')
+                                record = self.__telemetry_start()
+                                step['script'] = self.__script(cmd_line)
+                                (proc, usage, io) = _system(' '.join(cmd_line), step['script'])
+                                self.__disk(step)
+                                self.__telemetry_end(record, step, proc, usage, io)
+                                if streamed:
+                                    x = float(proc)/float(256)
+                                    self.__stream_stop(streamed, x > max(successful_exit_status) or x < min(successful_exit_status))
                             else:
-                                #pass
-                                temp = "\n\nExecuting second time the same step/command in order to capture error messages (i.e. STDERR)...\n\n-------------------------------------------"
-                                self.write(temp, stderr = True)
-                                # no redirection was found so then try to execute again the command and capture the STDERR
-                                #p = subprocess.Popen(cmd_line, stdout = subprocess.PIPE, stderr = subprocess.STDOUT, shell = False)
-                                #if p.returncode != 0:
-                                #    self.write(p.communicate()[0].splitlines(), stderr = True)
-                                temp = []
-                                temp_file = self.__give_me_temp_filename()
-                                procx = os.system(' '.join(cmd_line+['2>',temp_file]))
-                                newprocx = float(procx)/float(256)
-                                if newprocx > max(successful_exit_status) or newprocx < min(successful_exit_status):
-                                    if os.path.isfile(temp_file):
-                                        # read error message
-                                        try:
-                                            temp = file(temp_file,'r').readlines()
-                                        except:
-                                            pass
-                                        if temp:
-                                            temp.append("")
-                                            temp.append("")
-                                        self.write(temp, stderr = True)
-                                        os.remove(temp_file)
-                                else:
-                                    temp = "\n\nWARNING: First execution ended with error but second execution did not! Therefore cannot capture the STDERR!\n\n"
-                                    self.write(temp, stderr = True)
-                            self.exit_flag = False
-                            sys.exit(1)
-                        elif self.hash_library and self.hash_library != 'no': # DON'T EXECUTE IT
-                            temp = "==> Saving checksum..."
+                                self.write('+-->MOCK EXECUTION (i.e. code executed outside of workflow)...')
+                            #print "---------------------->",proc,max(successful_exit_status),min(successful_exit_status)
+                            exit_code = float(proc)/float(256)
+                            if exit_code > max(successful_exit_status) or exit_code < min(successful_exit_status):
+                                self.__failure(step)
+                            elif self.hash_library and self.hash_library != 'no': # DON'T EXECUTE IT
+                                temp = "==> Saving checksum..."
+                                self.write(temp)
+                                self.__save_checksum()
+                            if self.manifest_filename:
+                                self.__save_manifest(self.fingerprint)
+                        else:
+                            temp="|==> SKIPPED because it has not changed since last run."
                             self.write(temp)
-                            self.__save_checksum()
+                            executed = False
                     else:
-                        temp="|==> SKIPPED because it has not changed since last run."
+                        temp="|==> SKIPPED because of the step count."
                         self.write(temp)
                         executed = False
-                else:
-                    temp="|==> SKIPPED because of the step count."
+                elif comment == 'yes':
+                    temp="|==> SKIPPED because it has been commented out."
                     self.write(temp)
                     executed = False
-            elif comment == 'yes':
-                temp="|==> SKIPPED because it has been commented out."
-                self.write(temp)
-                executed = False
 
-            # erase the 'temp_path'
-            if self.task_count >= self.start_step:
-                for task in self.task:
-                    if task['temp_path'] == 'yes':
-                        v = task['value']
-                        if task['from_file'] == 'yes':
-                            if task['kind'] == 'parameter':
-                                self.__delete_path(v)
-                            elif task['kind'] == 'path':
-                                x = [line.rstrip('\r\n') for line in file(v,'r')]
-                                x.append(v)
-                                self.__delete_path(x)
-                        elif task['kind'] == 'path':
-                            self.__delete_path(v)
-
-            # time difference
-            self.__show_step_header_end()
+                # erase the 'temp_path'
+                if self.task_count >= self.start_step:
+                    self.__erase_temp_paths()
+
+                # erase the paths which have no consumers left
+                self.__release(step)
+
+                # time difference
+                self.__show_step_header_end()
         else:
             # hmm ... there is a list of tasks to be run
             self.write("ERROR: Not implemented this yet!", stderr = True)
@@ -1042,6 +1476,597 @@ class pipeline:
 
         return executed # return if the task has been executed or skipped
 
+    ###
+    ### __FAILURE
+    ###
+    def __failure(self, step):
+        """
+        It reports that a job/task failed to run (i.e. the exit code is not
+        one of the successful ones) and it stops the workflow.
+        """
+        cmd_line = step['cmd_line']
+        successful_exit_status = step['successful_exit_status']
+        temp = "\n\nERROR: Workflow execution failed at step %d while executing:\n----------------\n   %s\n----------------\n" % (step['id'],' \\\n   '.join(cmd_line),)
+        self.write(temp, stderr = True)
+        if step['error_message']:
+            self.write(step['error_message'], stderr = True)
+        # print the input and output file sizes
+        for elem in self.task:
+            if elem['command_line'] == 'yes' and ((elem['kind'] == 'path' and elem['io'] in ('input','output')) or elem['from_file'] == 'yes'):
+                ap = elem['value']
+                temp = "  * Size '%s' = %d bytes" % (ap,self.__path_size(ap))
+                self.write(temp, stderr = True)
+
+        # print the captured error message from '2>&1>' or '2>'
+        if step['hit_redirect']:
+            for il in step['captured_error_message']:
+                if os.path.isfile(il) or _islink(il):
+                    temp = []
+                    try:
+                        temp = file(il,'r').readlines()
+                    except:
+                        pass
+                    self.write(temp, stderr = True)
+        else:
+            #pass
+            temp = "\n\nExecuting second time the same step/command in order to capture error messages (i.e. STDERR)...\n\n-------------------------------------------"
+            self.write(temp, stderr = True)
+            # no redirection was found so then try to execute again the command and capture the STDERR
+            #p = subprocess.Popen(cmd_line, stdout = subprocess.PIPE, stderr = subprocess.STDOUT, shell = False)
+            #if p.returncode != 0:
+            #    self.write(p.communicate()[0].splitlines(), stderr = True)
+            temp = []
+            temp_file = self.__give_me_temp_filename()
+            procx = os.system(' '.join(cmd_line+['2>',temp_file]))
+            newprocx = float(procx)/float(256)
+            if newprocx > max(successful_exit_status) or newprocx < min(successful_exit_status):
+                if os.path.isfile(temp_file):
+                    # read error message
+                    try:
+                        temp = file(temp_file,'r').readlines()
+                    except:
+                        pass
+                    if temp:
+                        temp.append("")
+                        temp.append("")
+                    self.write(temp, stderr = True)
+                    os.remove(temp_file)
+            else:
+                temp = "\n\nWARNING: First execution ended with error but second execution did not! Therefore cannot capture the STDERR!\n\n"
+                self.write(temp, stderr = True)
+        self.exit_flag = False
+        sys.exit(1)
+
+    ###
+    ### __ERASE_TEMP_PATHS
+    ###
+    def __erase_temp_paths(self):
+        """
+        It erases the paths of the current task which are marked as temporary.
+        """
+        for task in self.task:
+            if task['temp_path'] == 'yes':
+                v = task['value']
+                if task['from_file'] == 'yes':
+                    if task['kind'] == 'parameter':
+                        self.__delete_path(v)
+                    elif task['kind'] == 'path':
+                        x = [line.rstrip('\r\n') for line in file(v,'r')]
+                        x.append(v)
+                        self.__delete_path(x)
+                elif task['kind'] == 'path':
+                    self.__delete_path(v)
+
+    ###
+    ### PARALLEL
+    ###
+    def parallel_start(self, memory = None):
+        """
+        It starts a block of steps which are executed concurrently, as long
+        as they do not depend on each other. A step depends on a previous step
+        if it reads, writes or deletes a path which is written by the previous
+        step or if it writes or deletes a path which is read by the previous
+        step. The number of steps running at the same time is limited by
+        'threads' (see 'processes' in RUN) and by the available memory (see
+        'memory' in RUN).
+
+        memory   - amount of memory (in GB) which can be used by the concurrent
+                   steps. By default it is the memory which is available now.
+        """
+        self.__materialize()
+        self.__drain()
+        if memory is None:
+            memory = _memory_available()
+        self.parallel_memory = memory
+        self.parallel_mode = True
+
+    def parallel_stop(self):
+        """
+        It ends a block of steps which are executed concurrently. It returns
+        only after all the steps from the block have been executed.
+        """
+        self.__drain()
+        self.parallel_mode = False
+
+    def skip(self, flag = True):
+        """
+        It starts (flag is True) or it ends (flag is False) a block of steps
+        which are skipped from execution, exactly as the steps before the
+        starting step are skipped (see START_STEP), i.e. they are only counted
+        and logged. This is used when the block is executed elsewhere (e.g. by
+        another pipeline, for each shard of reads) but the steps should still
+        be counted such that an automatic restart finds the same steps.
+        """
+        self.__materialize()
+        self.__drain()
+        if flag:
+            if self.skipped is None:
+                self.skipped = self.start_step
+                self.start_step = sys.maxint
+        elif self.skipped is not None:
+            self.start_step = self.skipped
+            self.skipped = None
+
+    def __queue(self, step):
+        """
+        It adds a step to the queue of steps which are executed concurrently.
+        """
+        (reads, writes, deletes) = self.__paths(step['task'])
+        step['reads'] = reads
+        step['writes'] = writes
+        step['deletes'] = deletes
+        step['status'] = 'pending'
+        step['executed'] = True
+        step['log'] = []
+        step['pid'] = None
+        step['lane'] = 0
+        step['record'] = None
+        self.parallel_steps.append(step)
+        self.__schedule()
+
+    def __paths(self, task):
+        """
+        It gives the paths which are read, written and deleted by a task.
+        """
+        reads = set()
+        writes = set()
+        deletes = set()
+        for elem in task:
+            if elem['kind'] != 'path' or elem['value'] in self.__devs:
+                continue
+            if elem['checksum'] == 'no' and elem['command_line'] == 'yes':
+                # it is not a real input/output (e.g. a directory given only
+                # to the command line or a list given by ADD_LIST)
+                continue
+            a = _strip_path(elem['value'])
+            if elem['io'] == 'output':
+                writes.add(a)
+            else:
+                reads.add(a)
+            if elem['temp_path'] == 'yes':
+                deletes.add(a)
+        return (reads, writes, deletes)
+
+    def __depends(self, step, previous):
+        """
+        It tests if a step depends on a previous step.
+        """
+        return (_overlap(previous['writes'], step['reads'] | step['writes'] | step['deletes']) or
+                _overlap(previous['reads'] | previous['deletes'], step['writes'] | step['deletes']))
+
+    def __schedule(self):
+        """
+        It starts the pending steps which do not depend on unfinished steps
+        and for which there are enough resources.
+        """
+        running = [s for s in self.parallel_steps if s['status'] == 'running']
+        used_processes = sum([s['processes'] for s in running])
+        used_memory = sum([s['memory'] for s in running])
+        unfinished = []
+        for step in self.parallel_steps:
+            if step['status'] == 'pending':
+                if [1 for s in unfinished if self.__depends(step, s)]:
+                    unfinished.append(step)
+                    continue
+                if running and (used_processes + step['processes'] > self.threads or
+                                used_memory + step['memory'] > self.parallel_memory):
+                    unfinished.append(step)
+                    continue
+                self.__launch(step)
+                if step['status'] == 'running':
+                    running.append(step)
+                    used_processes = used_processes + step['processes']
+                    used_memory = used_memory + step['memory']
+            if step['status'] != 'done':
+                unfinished.append(step)
+
+    def __launch(self, step):
+        """
+        It starts the execution of a step (in background).
+        """
+        previous = self.task
+        self.task = step['task']
+        self.buffer = step['log']
+        self.__show_step_header_start(step['id'])
+        self.write(' \\\n'.join(step['cmd_line']))
+        self.write("-" * self.screen_length)
+        if self.__run_again():
+            step['fingerprint'] = self.fingerprint
+            self.write('+-->EXECUTING...')
+            step['script'] = self.__script(step['cmd_line'])
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                # child
+                try:
+                    os.setpgrp()
+                    if step['script']:
+                        _run_script(step['script'])
+                    os.execv('/bin/sh', ['/bin/sh', '-c', ' '.join(step['cmd_line'])])
+                finally:
+                    os._exit(127)
+            step['pid'] = pid
+            step['status'] = 'running'
+            step['record'] = self.__telemetry_start()
+            lanes = set([s['lane'] for s in self.parallel_steps if s['status'] == 'running'])
+            step['lane'] = min(set(range(1,len(lanes)+2)) - lanes)
+        else:
+            self.write("|==> SKIPPED because it has not changed since last run.")
+            step['executed'] = False
+            self.__erase_temp_paths()
+            self.__release(step)
+            self.__show_step_header_end(step['id'])
+            step['status'] = 'done'
+        self.buffer = None
+        self.task = previous
+
+    def __finish(self, step, status, usage = None, io = None):
+        """
+        It finishes a step which has been executed in background.
+        """
+        previous = self.task
+        self.task = step['task']
+        self.buffer = step['log']
+        step['status'] = 'done'
+        self.__disk(step)
+        self.__telemetry_end(step['record'], step, status, usage, io)
+        exit_code = float(status)/float(256)
+        successful_exit_status = step['successful_exit_status']
+        if exit_code > max(successful_exit_status) or exit_code < min(successful_exit_status):
+            step['status'] = 'failed'
+        else:
+            if self.hash_library and self.hash_library != 'no':
+                self.write("==> Saving checksum...")
+                self.__save_checksum()
+            if self.manifest_filename:
+                self.__save_manifest(step['fingerprint'])
+            self.__erase_temp_paths()
+            self.__release(step)
+            self.__show_step_header_end(step['id'])
+        self.buffer = None
+        self.task = previous
+
+    def __flush(self, step):
+        """
+        It writes the log of a step executed concurrently.
+        """
+        log = step['log']
+        step['log'] = []
+        for (text, stdout, stderr, log_flag) in log:
+            self.write(text, stdout = stdout, stderr = stderr, log = log_flag)
+
+    def __drain(self):
+        """
+        It waits for all the steps which are executed concurrently. The steps
+        are logged in their order such that an automatic restart (i.e.
+        start_step = 0) never skips a step which has not been executed.
+        """
+        try:
+            while self.parallel_steps:
+                self.__schedule()
+                while self.parallel_steps and self.parallel_steps[0]['status'] == 'done':
+                    self.__flush(self.parallel_steps.pop(0))
+                running = [s for s in self.parallel_steps if s['status'] == 'running']
+                if not running:
+                    continue
+                finished = False
+                for step in running:
+                    (pid, status, usage, io) = _wait4(step['pid'], os.WNOHANG)
+                    if pid:
+                        finished = True
+                        self.__finish(step, status, usage, io)
+                        if step['status'] == 'failed':
+                            self.__parallel_failure(step)
+                if not finished:
+                    time.sleep(0.1)
+        except KeyboardInterrupt:
+            self.__kill()
+            raise
+
+    def __kill(self):
+        """
+        It kills all the steps which are running in background.
+        """
+        for step in self.parallel_steps:
+            if step['status'] == 'running':
+                try:
+                    os.killpg(step['pid'], 15)
+                    os.waitpid(step['pid'], 0)
+                except OSError:
+                    pass
+                step['status'] = 'killed'
+
+    def __parallel_failure(self, failed):
+        """
+        A step executed concurrently has failed. It waits for the other running
+        steps, writes the log and stops the workflow.
+        """
+        for step in self.parallel_steps:
+            if step['status'] == 'running':
+                (pid, status, usage, io) = _wait4(step['pid'])
+                self.__finish(step, status, usage, io)
+        while self.parallel_steps and self.parallel_steps[0]['status'] == 'done':
+            self.__flush(self.parallel_steps.pop(0))
+        first = self.parallel_steps[0]
+        self.parallel_steps = []
+        self.parallel_mode = False
+        self.__flush(failed)
+        if first['id'] != failed['id']:
+            # the automatic restart should start from the first step which has not been executed
+            self.write("  Running: step = %d   [NOT EXECUTED because step %d failed]" % (first['id'],failed['id']))
+        self.task = failed['task']
+        self.__failure(failed)
+    ###
+    ### CONSUMERS
+    ###
+    def __register(self, step):
+        """
+        It saves the number of consumers of the outputs of a step (see
+        CONSUMERS in ADD).
+        """
+        for elem in step['task']:
+            if elem['kind'] == 'path' and elem['io'] == 'output' and elem['consumers'] and elem['value'] not in self.__devs:
+                self.consumers[_strip_path(elem['value'])] = elem['consumers']
+
+    def __release(self, step):
+        """
+        It decreases the number of consumers of the paths read by a step which
+        has finished and it erases the paths which have no consumers left.
+        """
+        if not self.consumers:
+            return
+        (reads, writes, deletes) = self.__paths(step['task'])
+        done = []
+        for a in reads:
+            if a in self.consumers:
+                self.consumers[a] = self.consumers[a] - 1
+                if self.consumers[a] < 1:
+                    del self.consumers[a]
+                    done.append(a)
+        if done and (not self.keep) and not (self.hash_library and self.hash_library != 'no'):
+            self.write("==> All the consumers have finished and therefore erasing:")
+            self.__delete_path(done)
+
+    ###
+    ### DISK
+    ###
+    def __disk(self, step):
+        """
+        It measures the used space of the file system of DISK_PATH after a step
+        has been executed and it keeps track of the peak.
+        """
+        if not self.disk_path:
+            return
+        try:
+            st = os.statvfs(self.disk_path)
+        except (AttributeError, OSError):
+            # not available (e.g. on Windows)
+            self.disk_path = None
+            return
+        size = (st.f_blocks - st.f_bfree) * st.f_frsize
+        step['disk_bytes'] = size
+        if size > self.disk_peak:
+            self.disk_peak = size
+            self.disk_peak_step = step['id']
+
+    ###
+    ### STREAM
+    ###
+    def __streamable(self, step):
+        """
+        It tests if a step has outputs which may be streamed to the next step
+        (see STREAM in ADD) and it saves them in the step.
+        """
+        if ((self.hash_library and self.hash_library != 'no') or
+            self.manifest_filename or
+            self.parallel_mode):
+            return False
+        step['streams'] = set([_strip_path(elem['value']) for elem in step['task'] if
+                               elem['kind'] == 'path' and
+                               elem['io'] == 'output' and
+                               elem['stream'] == 'yes' and
+                               elem['value'] not in self.__devs and
+                               (not elem['value'].endswith('*')) and
+                               (not elem['value'].endswith('/')) and
+                               (not os.path.isdir(elem['value']))])
+        return True if step['streams'] else False
+
+    def __consumes(self, step, streamed):
+        """
+        It tests if a step reads and deletes all the outputs which are
+        streamed by the previous step.
+        """
+        (reads, writes, deletes) = self.__paths(step['task'])
+        return (streamed['streams'].issubset(reads) and
+                streamed['streams'].issubset(deletes) and
+                not streamed['streams'].intersection(writes))
+
+    def __materialize(self, step = None):
+        """
+        It executes (as usual, i.e. its outputs are written on the disk) the
+        step whose outputs were supposed to be streamed to the next step.
+        """
+        if step is None:
+            step = self.stream
+            self.stream = None
+        if not step:
+            return
+        previous = self.task
+        self.task = step['task']
+        self.__show_step_header_start(step['id'])
+        self.write(' \\\n'.join(step['cmd_line']))
+        self.write("-" * self.screen_length)
+        if self.__run_again():
+            self.write('+-->EXECUTING...')
+            record = self.__telemetry_start()
+            step['script'] = self.__script(step['cmd_line'])
+            (proc, usage, io) = _system(' '.join(step['cmd_line']), step['script'])
+            self.__disk(step)
+            self.__telemetry_end(record, step, proc, usage, io)
+            exit_code = float(proc)/float(256)
+            if exit_code > max(step['successful_exit_status']) or exit_code < min(step['successful_exit_status']):
+                self.__failure(step)
+        self.__erase_temp_paths()
+        self.__release(step)
+        self.__show_step_header_end(step['id'])
+        self.task = previous
+
+    def __stream_start(self, step):
+        """
+        It starts (in background) the step which streams its outputs to the
+        next step through named pipes.
+        """
+        previous = self.task
+        self.task = step['task']
+        self.__show_step_header_start(step['id'])
+        self.write(' \\\n'.join(step['cmd_line']))
+        self.write("-" * self.screen_length)
+        self.__run_again() # it builds the directories of the outputs
+        for a in step['streams']:
+            if os.path.isfile(a) or _islink(a):
+                os.remove(a)
+            os.mkfifo(a)
+        self.write('+-->EXECUTING (its output is streamed through a named pipe to the next step)...')
+        step['hit_redirect'] = True # it cannot be executed again for capturing the STDERR
+        step['record'] = self.__telemetry_start()
+        step['script'] = self.__script(step['cmd_line'])
+        sys.stdout.flush()
+        sys.stderr.flush()
+        pid = os.fork()
+        if pid == 0:
+            # child
+            try:
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                signal.signal(signal.SIGQUIT, signal.SIG_DFL)
+                if step['script']:
+                    _run_script(step['script'])
+                os.execv('/bin/sh', ['/bin/sh', '-c', ' '.join(step['cmd_line'])])
+            finally:
+                os._exit(127)
+        step['pid'] = pid
+        step['lane'] = 1
+        self.task = previous
+
+    def __stream_stop(self, step, failed = False):
+        """
+        It waits for the step which has streamed its outputs to the current
+        step (which has finished already) and it removes the named pipes. If
+        the current step has failed then only the current step is reported.
+        """
+        while True:
+            (p, status, usage, io) = _wait4(step['pid'], os.WNOHANG)
+            if p:
+                break
+            # the current step has not opened (or read entirely) the named
+            # pipes and therefore the writer is unblocked (it gets SIGPIPE)
+            for a in step['streams']:
+                try:
+                    os.close(os.open(a, os.O_RDONLY | os.O_NONBLOCK))
+                except OSError:
+                    pass
+            time.sleep(0.1)
+        for a in step['streams']:
+            if os.path.exists(a) and not os.path.isfile(a):
+                os.remove(a)
+        previous = self.task
+        self.task = step['task']
+        self.__disk(step)
+        self.__telemetry_end(step['record'], step, status, usage, io)
+        if not failed:
+            exit_code = float(status)/float(256)
+            if exit_code > max(step['successful_exit_status']) or exit_code < min(step['successful_exit_status']):
+                self.__failure(step)
+            self.__erase_temp_paths()
+            self.__release(step)
+            self.write("==> Step %d, which has streamed its output, finished successfully." % (step['id'],))
+            self.__show_step_header_end(step['id'])
+        self.task = previous
+
+    ###
+    ### __SCRIPT
+    ###
+    def __script(self, cmd_line):
+        """
+        It gives the Python script which can be executed in-process for the
+        given command line (see _script) or None.
+        """
+        if not self.inprocess:
+            return None
+        return _script(' '.join(cmd_line))
+
+    ###
+    ### __TELEMETRY
+    ###
+    def __telemetry_start(self):
+        """
+        It starts recording the resources used by the current task.
+        """
+        if not (self.telemetry_filename or self.trace_filename):
+            return None
+        (reads, writes, deletes) = self.__paths(self.task)
+        return {'start': time.time(),
+                'input_bytes': sum([self.__path_size(a) for a in reads])}
+
+    def __telemetry_end(self, record, step, status, usage, io):
+        """
+        It saves the resources used by a task which has been executed.
+        """
+        if record is None:
+            return
+        wall = time.time() - record['start']
+        (reads, writes, deletes) = self.__paths(step['task'])
+        programs = [os.path.basename(el['identifier'] or el['value']) for el in step['task'] if el['kind'] == 'program' and (el['identifier'] or el['value'])]
+        record['step'] = step['id']
+        record['program'] = programs[0] if programs else ''
+        record['command'] = ' '.join(step['cmd_line'])
+        record['wall'] = round(wall,3)
+        record['exit_code'] = float(status)/float(256)
+        record['output_bytes'] = sum([self.__path_size(a) for a in writes])
+        record['lane'] = step.get('lane',0)
+        record['inprocess'] = bool(step.get('script'))
+        if 'disk_bytes' in step:
+            record['disk_bytes'] = step['disk_bytes']
+        if usage:
+            record['user'] = round(usage.ru_utime,3)
+            record['sys'] = round(usage.ru_stime,3)
+            record['max_rss_kb'] = usage.ru_maxrss
+        if io:
+            for k in ('rchar','wchar','read_bytes','write_bytes'):
+                if k in io:
+                    record[k] = io[k]
+        if self.telemetry_filename:
+            file(self.telemetry_filename,'a').write(json.dumps(record,sort_keys=True)+'\n')
+        if self.trace_filename:
+            self.trace.append({'name': "%d %s" % (step['id'],record['program']),
+                               'cat': 'step',
+                               'ph': 'X',
+                               'ts': int((record['start'] - self.start_epoch) * 1000000),
+                               'dur': int(wall * 1000000),
+                               'pid': 1,
+                               'tid': record['lane'],
+                               'args': record})
+
     ###
     ###  __RUN_AGAIN
     ###
@@ -1050,6 +2075,16 @@ class pipeline:
         It tests if the the task should be run again or not based on checking if the output and input files have changed since last run.
         """
         flag_run = True
+        self.fingerprint = None
+        if self.manifest_filename:
+            self.fingerprint = self.__compute_fingerprint()
+            if self.incremental and self.fingerprint:
+                (reads, writes, deletes) = self.__paths(self.task)
+                if not [1 for a in writes if (self.manifest.get(a,None) != self.fingerprint or
+                                              not (os.path.isfile(a) or (os.path.isdir(a) and os.listdir(a))))]:
+                    temp = "==> All outputs have been built previously from the same inputs (see '%s')." % (self.manifest_filename,)
+                    self.write(temp)
+                    return False
         if self.hash_library and self.hash_library != 'no':
             checksum_now = self.__compute_checksum()
             checksums_old = set()
@@ -1065,6 +2100,158 @@ class pipeline:
                 self.__build_paths(directories = True, files = False)
         return flag_run
 
+    ###
+    ### __COMPUTE_FINGERPRINT
+    ###
+    def __compute_fingerprint(self):
+        """
+        It computes the fingerprint of the command line and of the content of
+        the input files of the current task. It returns None if the task
+        cannot be fingerprinted, that is it has no outputs, it has no input
+        files, or it changes its inputs in place.
+        """
+        if [1 for elem in self.task if (elem['kind'] == 'program' and
+                                        (not elem['value']) and
+                                        (not elem['identifier']))]:
+            return None # code executed outside of workflow
+        (reads, writes, deletes) = self.__paths(self.task)
+        if (not reads) or (not writes) or _overlap(reads, writes):
+            return None
+        fingerprint = hashlib.md5()
+        for elem in self.task:
+            if elem['checksum'] == 'no':
+                continue
+            value = elem['value']
+            if elem['kind'] in ('path','program'):
+                value = os.path.basename(value)
+            fingerprint.update('___'.join([elem['identifier'], value, elem['kind'], elem['io']]))
+        inputs = []
+        for a in sorted(reads):
+            if os.path.isdir(a):
+                files = [os.path.join(a,el) for el in sorted(os.listdir(a))]
+                files = [el for el in files if os.path.isfile(el)]
+            elif os.path.isfile(a):
+                files = [a]
+            else:
+                return None
+            for a_file in files:
+                dig = self.__fingerprint_file(a_file)
+                fingerprint.update(dig)
+                inputs.append("%s:%s" % (os.path.basename(a_file),dig))
+        self.fingerprint_inputs = ','.join(inputs)
+        return fingerprint.hexdigest()
+
+    def __fingerprint_file(self, a_file):
+        """
+        It computes the fingerprint of the content of a file (it is computed
+        again only if the size or the modification time of the file changed).
+        """
+        st = os.stat(a_file)
+        key = (st.st_size, st.st_mtime)
+        v = self.manifest_files.get(a_file, None)
+        if v and v[0] == key:
+            return v[1]
+        temp = "===> Computing fingerprint for: '%s'" % (a_file,)
+        self.write(temp)
+        finger = hashlib.md5()
+        ff = open(a_file,'rb')
+        while True:
+            dd = ff.read(2**26)
+            if not dd:
+                break
+            finger.update(dd)
+        ff.close()
+        dig = finger.hexdigest()
+        self.manifest_files[a_file] = (key, dig)
+        self.__append_manifest([self.__manifest_line(a_file, a_file = True)])
+        return dig
+
+    ###
+    ### __SAVE_MANIFEST
+    ###
+    def __save_manifest(self, fingerprint):
+        """
+        It saves in the manifest the fingerprint of the inputs used for building
+        the outputs of the current task. The outputs which have been built by
+        a task which cannot be fingerprinted are removed from the manifest.
+        """
+        (reads, writes, deletes) = self.__paths(self.task)
+        data = []
+        for a in writes:
+            if fingerprint:
+                self.manifest[a] = fingerprint
+                self.manifest_inputs[a] = self.fingerprint_inputs
+                data.append(self.__manifest_line(a))
+            else:
+                self.__forget(a)
+        self.__append_manifest(data)
+
+    def __forget(self, a_path):
+        """
+        It removes a path (and everything found in it) from the manifest.
+        """
+        if self.manifest_filename:
+            a = _strip_path(a_path)
+            data = []
+            for k in self.manifest.keys():
+                if k == a or k.startswith(a + os.sep):
+                    self.manifest.pop(k)
+                    self.manifest_inputs.pop(k,None)
+                    data.append(self.__manifest_line(k))
+            self.__append_manifest(data)
+
+    def __manifest_line(self, a_path, a_file = False):
+        """
+        It gives the line of the manifest for an output (an output without
+        fingerprint is removed from the manifest) or for the fingerprint of
+        an input file (its line starts with '@'). The paths are relative to
+        the manifest's directory.
+        """
+        r = os.path.relpath(a_path,os.path.dirname(_expand(self.manifest_filename)))
+        if a_file:
+            ((size, mtime), dig) = self.manifest_files[a_path]
+            return "@%s\t%d\t%r\t%s\n" % (r,size,mtime,dig)
+        return "%s\t%s\t%s\n" % (r,self.manifest.get(a_path,''),self.manifest_inputs.get(a_path,''))
+
+    def __append_manifest(self, data):
+        """
+        It appends lines to the manifest (the last line of a path wins).
+        """
+        if data:
+            file(self.manifest_filename,'a').writelines(data)
+
+    def __read_manifest(self):
+        """
+        It reads the manifest. If it has many lines which have been
+        overwritten by later lines then it is compacted.
+        """
+        if not os.path.isfile(self.manifest_filename):
+            return
+        d = os.path.dirname(_expand(self.manifest_filename))
+        n = 0
+        for line in file(self.manifest_filename,'r'):
+            line = line.rstrip('\r\n').split('\t')
+            if len(line) < 2 or not line[0]:
+                continue
+            n = n + 1
+            if line[0].startswith('@'):
+                if len(line) > 3:
+                    self.manifest_files[_expand(d,line[0][1:])] = ((int(line[1]),float(line[2])),line[3])
+            elif line[1]:
+                a = _expand(d,line[0])
+                self.manifest[a] = line[1]
+                self.manifest_inputs[a] = line[2] if len(line) > 2 else ''
+            else:
+                a = _expand(d,line[0])
+                self.manifest.pop(a,None)
+                self.manifest_inputs.pop(a,None)
+        if n > 2 * (len(self.manifest) + len(self.manifest_files)) + 1000:
+            data = [self.__manifest_line(k) for k in sorted(self.manifest.keys())]
+            data.extend([self.__manifest_line(k, a_file = True) for k in sorted(self.manifest_files.keys())])
+            temp = self.manifest_filename + '.tmp'
+            file(temp,'w').writelines(data)
+            os.rename(temp, self.manifest_filename)
+
     ###
     ### __COMPUTE_CHECKSUM
     ###
@@ -1283,7 +2470,7 @@ class pipeline:
         hours, minutes = divmod(minutes, 60)
 
         temp = ["/"*self.screen_length,
-                "  Running: step = %d   Time: %s   Date: %s (elapsed time: %dd:%dh:%dm)\n" % (self.task_count,str_time_now,str_date_now,time_difference.days,hours,minutes),
+                "  Running: step = %d   Time: %s   Date: %s (elapsed time: %dd:%dh:%dm)\n" % (id,str_time_now,str_date_now,time_difference.days,hours,minutes),
                 "\\"*self.screen_length,
                 "==> Current working directory: '%s'\n" % (os.getcwd(),)]
         self.write(temp)
@@ -1357,10 +2544,20 @@ class pipeline:
         Close the pipeline.
         """
         if not self.closed:
+            # wait for the steps which are executed concurrently
+            if self.exit_flag:
+                self.__materialize()
+                self.__drain()
+                self.parallel_mode = False
+
             # delete the paths and files marked as temporary
             if self.exit_flag: # if there is no error
                 self.__delete_path(self.temp_paths)
 
+            # save the timeline of the executed steps
+            if self.trace_filename:
+                json.dump({'traceEvents': self.trace, 'displayTimeUnit': 'ms'}, file(self.trace_filename,'w'))
+
             # time counting
             end_time = datetime.datetime.now()
             time_difference = end_time - self.start_time
@@ -1372,6 +2569,8 @@ class pipeline:
                     "#"*self.screen_length,
                     "#"*self.screen_length,
                     ]
+            if self.disk_path:
+                temp.insert(3,"PEAK DISK USAGE: %.3f GB (%d bytes) used on the file system of '%s' after step %d \n" % (float(self.disk_peak)/float(1024**3),self.disk_peak,self.disk_path,self.disk_peak_step))
             self.write(temp)
             self.closed = True
 
@@ -1405,6 +2604,11 @@ class pipeline:
         log    - the text is added also to the log file.
 
         """
+        if self.buffer is not None:
+            # the log of a step executed concurrently is written later
+            self.buffer.append((text, stdout, stderr, log))
+            return
+
         if type(text).__name__ == 'str':
             text = [text]
 
@@ -1459,6 +2663,8 @@ class pipeline:
         False  - if the task has been skipped from execution
 
        """
+        self.__materialize()
+        self.__drain()
         self.task_count = self.task_count + 1
         self.__show_step_header_start()
         executed = True
@@ -1476,10 +2682,12 @@ class pipeline:
         if self.task_count >= self.start_step:
             if os.path.exists(fout) or _islink(fout):
                 self.__delete_path(fout)
+            self.__forget(fout)
             linkfrom = fin
             if _islink(fin):
                 linkfrom = _expand(os.readlink(fin))
             if (not self.__isprotected(fin)) and ((temp_path == 'yes' and kind == 'soft') or kind == 'move'):
+                self.consumers.pop(_strip_path(fin),None)
                 try:
                     shutil.move(fin, fout)
                 except OSError as er:
@@ -1584,12 +2792,15 @@ class pipeline:
         False  - if the task has been skipped from execution
 
        """
+        self.__materialize()
+        self.__drain()
         self.task_count = self.task_count + 1
         self.__show_step_header_start()
         executed = True
         if self.task_count >= self.start_step:
             if os.path.exists(fout) or _islink(fout):
                 self.__delete_path(fout)
+            self.__forget(fout)
             if variable:
                 data = []
                 if type(variable).__name__ == 'list':
@@ -1629,6 +2840,8 @@ class pipeline:
         False  - if the task has been skipped from execution
 
        """
+        self.__materialize()
+        self.__drain()
         self.task_count = self.task_count + 1
         self.__show_step_header_start()
 
@@ -1691,6 +2904,8 @@ class pipeline:
         True   - if the task has been executed succesfully
         False  - if the task has been skipped from execution
         """
+        self.__materialize()
+        self.__drain()
         self.task_count = self.task_count + 1
         self.__show_step_header_start()
 
@@ -0,0 +1,1207 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It benchmarks FusionCatcher and some of its most time/memory consuming
+scripts (i.e. remove_adapter.py, find_fusion_genes_map.py,
+label_fusion_genes.py, sam2psl.py, analyze_splits_sam.py and
+blat_parallel.py) on paired-end reads simulated (with planted fusion genes, see 'simulate_reads.py') at
+several depths and read lengths and also (optionally) on the reads of the
+installation test (i.e. 'test/reads_1.fq.gz' and 'test/reads_2.fq.gz').
+
+Also it calibrates the model which predicts the peak memory of the aligners
+(see 'memory_model.py') by measuring the peak memory of the aligners found in
+PATH on random references of several sizes, and it checks that the measured
+peak memory stays below a given cap when the reference has the largest size
+allowed by the calibrated model for that cap (benchmark 'memory_model').
+
+For each benchmark it records the wall time, the throughput (i.e. records
+processed per second), the peak memory (RSS), the recall (i.e. fraction of
+the planted fusion genes which are found, where it makes sense), the CPU time
+and the idle CPU time (i.e. the CPU time which was available, according to
+'--processes', but it was not used) in a results file (tab separated, one line for each benchmark) such that the results of
+different versions of FusionCatcher can be compared.
+
+By default, everything runs offline on a toy (i.e. random) database, which is
+generated automatically. The entire FusionCatcher pipeline is benchmarked only
+if '--pipeline' is used, in which case '--data' should point to a database
+built by 'fusioncatcher-build.py'.
+
+Examples:
+
+benchmark.py
+
+benchmark.py --pairs 1000000,10000000,200000000 --read-length 50,100,150
+
+benchmark.py --pipeline --data /some/fusioncatcher/data/current/ --pairs 10000000
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+"""
+import os
+import sys
+import gzip
+import time
+import errno
+import random
+import socket
+import shutil
+import filecmp
+import pipes
+import itertools
+import math
+import datetime
+import optparse
+import subprocess
+
+import simulate_reads
+
+# the directory of this script
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# the directory with the scripts of FusionCatcher
+BIN = os.path.abspath(os.path.join(HERE,'..','..','bin'))
+
+sys.path.insert(0,BIN)
+import memory_model
+import intervals
+import resident
+
+# the benchmarks which can be executed
+BENCHMARKS = ['remove_adapter', 'find_fusion_genes_map', 'label_fusion_genes',
+              'sam2psl', 'analyze_splits_sam', 'blat_parallel', 'kmer_filter',
+              'fragment_fastq', 'find_homolog_genes', 'intervals', 'resident',
+              'memory_model', 'pipeline']
+
+# the aligners and their steps (i.e. building the index and aligning the
+# reads) whose peak memory is modeled (see 'memory_model.py')
+ALIGNERS = [('bowtie', ('bowtie-build','bowtie')),
+            ('bowtie2', ('bowtie2-build','bowtie2')),
+            ('STAR', ('STAR-build','STAR')),
+            ('blat', ('blat',))]
+
+# the columns of the results file
+COLUMNS = ['date', 'version', 'host', 'benchmark', 'dataset', 'pairs',
+           'read_length', 'records', 'exit_code', 'wall_seconds',
+           'records_per_second', 'max_rss_kb', 'recall', 'cpu_seconds',
+           'idle_cpu_seconds']
+
+#
+def version():
+    """
+    It gives the version (i.e. the git commit) of FusionCatcher.
+    """
+    v = 'NA'
+    try:
+        p = subprocess.Popen(['git','rev-parse','--short','HEAD'], cwd = BIN, stdout = subprocess.PIPE, stderr = subprocess.PIPE)
+        o = p.communicate()[0].strip()
+        if p.returncode == 0 and o:
+            v = o
+    except OSError:
+        pass
+    return v
+
+#
+def execute(cmd, log_filename, stdout_filename = None):
+    """
+    It executes a command and it returns its exit code, wall time (seconds),
+    peak memory (RSS in kB) and CPU time (seconds, including the CPU time of
+    its child processes).
+    """
+    flog = file(log_filename,'a')
+    flog.write('\n$ %s\n' % (' '.join(cmd),))
+    flog.flush()
+    fout = file(stdout_filename,'w') if stdout_filename else flog
+    start = time.time()
+    p = subprocess.Popen(cmd, stdout = fout, stderr = flog)
+    while True:
+        try:
+            (pid, status, usage) = os.wait4(p.pid, 0)
+            break
+        except OSError, e:
+            if e.errno != errno.EINTR:
+                raise
+    wall = time.time() - start
+    if stdout_filename:
+        fout.close()
+    flog.close()
+    code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else -1
+    return (code, wall, usage.ru_maxrss, usage.ru_utime + usage.ru_stime)
+
+#
+def script(name):
+    return [sys.executable, os.path.join(BIN,name)]
+
+#
+def which(program):
+    for p in os.environ.get('PATH','').split(os.pathsep):
+        f = os.path.join(p,program)
+        if os.path.isfile(f) and os.access(f,os.X_OK):
+            return f
+    return None
+
+#
+def count_lines(filename):
+    n = 0
+    if os.path.isfile(filename):
+        for line in file(filename,'r'):
+            n = n + 1
+    return n
+
+#
+def planted(filename):
+    """
+    It reads the fusion genes which have been planted (pairs of genes, sorted).
+    """
+    data = [line.rstrip('\r\n').split('\t') for line in file(filename,'r').readlines()[1:] if line.rstrip('\r\n')]
+    return set([tuple(sorted(line[:2])) for line in data])
+
+#
+def found(filename, column_1 = 0, column_2 = 1, label = None):
+    """
+    It reads the fusion genes which have been found (pairs of genes, sorted).
+    The columns may be also given as (parts of) names of the header.
+    """
+    data = set()
+    if not os.path.isfile(filename):
+        return data
+    lines = [line.rstrip('\r\n').split('\t') for line in file(filename,'r').readlines() if line.rstrip('\r\n')]
+    if not lines:
+        return data
+    header = lines.pop(0)
+    if not isinstance(column_1,int):
+        column_1 = [i for (i,h) in enumerate(header) if h.startswith(column_1)][0]
+        column_2 = [i for (i,h) in enumerate(header) if h.startswith(column_2)][0]
+    c = header.index('Fusion_description') if label and 'Fusion_description' in header else None
+    for line in lines:
+        if c is not None and label not in line[c].split(','):
+            continue
+        data.add(tuple(sorted([line[column_1],line[column_2]])))
+    return data
+
+#
+def recall(truth, result):
+    return "%.4f" % (float(len(truth.intersection(result)))/float(len(truth)),) if truth else 'NA'
+
+#
+def record(results_filename, line):
+    """
+    It appends one line to the results file.
+    """
+    new = not os.path.isfile(results_filename)
+    fou = file(results_filename,'a')
+    if new:
+        fou.write('\t'.join(COLUMNS)+'\n')
+    fou.write('\t'.join([str(line.get(c,'NA')) for c in COLUMNS])+'\n')
+    fou.close()
+    print '  '.join(['%s=%s' % (c,line.get(c,'NA')) for c in COLUMNS[3:]])
+
+#
+def run_benchmark(name, cmd, records, dataset, options, truth = None, result = None, stdout_filename = None, measures = None):
+    """
+    It executes one benchmark and it records its results. The measurements
+    (i.e. exit code, wall time, peak memory and CPU time) are appended also to
+    MEASURES (if it is given).
+    """
+    (code, wall, rss, cpu) = execute(cmd, options.log_filename, stdout_filename)
+    if measures is not None:
+        measures.append((code, wall, rss, cpu))
+    line = {'date': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'version': options.version,
+            'host': socket.gethostname(),
+            'benchmark': name,
+            'dataset': dataset['name'],
+            'pairs': dataset['pairs'],
+            'read_length': dataset['read_length'],
+            'records': records,
+            'exit_code': code,
+            'wall_seconds': "%.3f" % (wall,),
+            'records_per_second': "%.1f" % (float(records)/wall,) if wall > 0 else 'NA',
+            'max_rss_kb': rss,
+            'recall': recall(truth, result()) if (truth is not None and result and code == 0) else 'NA',
+            'cpu_seconds': "%.3f" % (cpu,),
+            'idle_cpu_seconds': "%.3f" % (max(0.0, options.processes * wall - cpu),)}
+    record(options.results_filename, line)
+    return code == 0
+
+#
+def compare(variants, records, dataset, options, stdout = False, setup = None):
+    """
+    It benchmarks several variants (as (name, command, output)) of the same
+    step, where the first one is the reference (e.g. the old implementation),
+    and it checks that their outputs are the same as the output of the
+    reference. The output is the standard output of the command if STDOUT is
+    True and it is not checked if it is None. SETUP (if it is given) is called
+    with the name of each variant before executing it and the benchmark stops
+    if it returns False. It returns False if any check has failed and the
+    measurements of the variants (see 'run_benchmark').
+    """
+    ok = True
+    measures = []
+    for (name,cmd,output) in variants:
+        if setup and not setup(name):
+            return (False, measures)
+        m = []
+        ok = run_benchmark(name, cmd, records, dataset, options,
+                           stdout_filename = (output if output else os.devnull) if stdout else None,
+                           measures = m) and ok
+        measures.extend(m)
+    if not ok:
+        return (ok, measures)
+    (reference, cmd, output) = variants[0]
+    for ((name,cmd,o),m) in zip(variants[1:],measures[1:]):
+        if output and o and not (os.path.isfile(output) and os.path.isfile(o) and filecmp.cmp(output, o, shallow = False)):
+            print >>sys.stderr, "ERROR: The outputs of '%s' and '%s' differ (see '%s' and '%s')!" % (reference, name, output, o)
+            ok = False
+            continue
+        print "'%s' takes %.3f seconds versus %.3f seconds for '%s' (%.2fx faster)." % (name, m[1], measures[0][1], reference, measures[0][1] / max(0.001, m[1]))
+    return (ok, measures)
+
+#
+def aligner_commands(aligner, reference, fastq, fasta, directory, threads):
+    """
+    It returns the commands (as (step, command, stdout)) which build the index
+    of the reference and align the reads using the given aligner, with the
+    same main parameters as in 'fusioncatcher.py'.
+    """
+    index = os.path.join(directory,'index')
+    if not os.path.isdir(index):
+        os.makedirs(index)
+    output = os.path.join(directory,'output')
+    t = str(threads)
+    cmds = []
+    if aligner == 'bowtie':
+        cmds.append(('bowtie-build',
+                     ['bowtie-build','-f','--quiet','--offrate','1','--ftabchars','5',reference,index+'/'],
+                     None))
+        cmds.append(('bowtie',
+                     ['bowtie','-t','-k','1000','-v','2','-p',t,'--tryhard',index+'/',fastq],
+                     output))
+    elif aligner == 'bowtie2':
+        cmds.append(('bowtie2-build',
+                     ['bowtie2-build','-f','--quiet','--offrate','1','--ftabchars','7',reference,os.path.join(index,'index')],
+                     None))
+        cmds.append(('bowtie2',
+                     ['bowtie2','-p',t,'--phred33','--no-unal','--local','-N','1','-R','3','-D','20','-k','5','-L','20',
+                      '-x',os.path.join(index,'index'),'-U',fastq,'-S',output],
+                     None))
+    elif aligner == 'STAR':
+        size = os.path.getsize(reference)
+        sequences = sum([1 for line in file(reference,'r') if line.startswith('>')])
+        cmds.append(('STAR-build',
+                     ['STAR','--runMode','genomeGenerate',
+                      '--genomeDir',index,
+                      '--genomeFastaFiles',reference,
+                      '--genomeSAindexNbases',str(int(min(14, math.log(size,2)))),
+                      '--genomeChrBinNbits',str(int(min(18, math.log(float(size)/float(max(1,sequences)),2)))),
+                      '--runThreadN',t,
+                      '--outFileNamePrefix',index+'/'],
+                     None))
+        if not os.path.isdir(output):
+            os.makedirs(output)
+        cmds.append(('STAR',
+                     ['STAR','--twopass1readsN','-1','--twopassMode','Basic',
+                      '--genomeDir',index,
+                      '--readFilesIn',fastq,
+                      '--runThreadN',t,
+                      '--outFileNamePrefix',output+'/'],
+                     None))
+    elif aligner == 'blat':
+        # one BLAT process (see 'blat_parallel.py' which runs one for each CPU)
+        cmds.append(('blat',
+                     ['blat','-noHead','-stepSize=5','-tileSize=11','-minScore=30','-t=DNA','-q=RNA',
+                      '-repMatch=2253','-minIdentity=30',reference,fasta,output],
+                     None))
+    return cmds
+
+#
+def calibrate(options, work):
+    """
+    It calibrates the model of the peak memory of the aligners (see
+    'memory_model.py') and it checks that the measured peak memory stays below
+    the cap when the reference has the largest size allowed by the model. It
+    returns False if any check has failed.
+    """
+    ok = True
+    threads = options.processes
+    sizes = [int(e) for e in options.model_sizes.split(',') if e.strip()]
+    read_length = [int(e) for e in options.read_length.split(',') if e.strip()][0]
+    reads = options.model_reads * read_length
+    dataset = {'name': 'memory_model', 'pairs': options.model_reads, 'read_length': read_length}
+    aligners = [(a,steps) for (a,steps) in ALIGNERS if which(a)]
+    if not aligners:
+        print >>sys.stderr, "WARNING: No aligner (i.e. %s) is found in PATH and therefore the benchmark 'memory_model' is skipped!" % (', '.join([a for (a,steps) in ALIGNERS]),)
+        return ok
+    model = memory_model.load()
+    d = os.path.join(work,'memory_model')
+
+    def measure(name, aligner, nucleotides):
+        # it runs the steps of the aligner on a random reference of the
+        # given size and it returns the peak memory (GB) of each step
+        if os.path.isdir(d):
+            shutil.rmtree(d)
+        os.makedirs(d)
+        reference = os.path.join(d,'reference.fa')
+        fastq = os.path.join(d,'reads.fq')
+        fasta = os.path.join(d,'reads.fa')
+        simulate_reads.reference(nucleotides = nucleotides,
+                                 reads = options.model_reads,
+                                 read_length = read_length,
+                                 database_filename = reference,
+                                 fastq_filename = fastq,
+                                 fasta_filename = fasta,
+                                 seed = options.seed + 3)
+        peaks = {}
+        for (step, cmd, stdout) in aligner_commands(aligner, reference, fastq, fasta, d, threads):
+            m = []
+            if run_benchmark(name+'_'+step, cmd, nucleotides, dataset, options, stdout_filename = stdout, measures = m):
+                peaks[step] = float(m[0][2]) / float(1024*1024) # kB => GB
+        shutil.rmtree(d)
+        return peaks
+
+    for (aligner,steps) in aligners:
+        print "Calibrating the model of the peak memory of %s..." % (aligner,)
+        samples = dict([(step,[]) for step in steps])
+        for size in sizes:
+            peaks = measure('memory_model', aligner, size)
+            for step in steps:
+                if step in peaks:
+                    samples[step].append((size,peaks[step]))
+                else:
+                    ok = False
+        for step in steps:
+            model = memory_model.fit(samples[step], step, reads = reads, threads = threads, model = model)
+
+        # the cap is chosen (if it is not given) such that the largest allowed
+        # reference is in the middle of the calibrated sizes
+        cap = options.memory_cap
+        if not cap:
+            cap = max([memory_model.peak(step, sorted(sizes)[len(sizes)/2], reads = reads, threads = threads, model = model) for step in steps])
+        n = memory_model.limit(steps, cap, reads = reads, threads = threads, model = model)
+        for step in steps:
+            p = memory_model.peak(step, n, reads = reads, threads = threads, model = model)
+            if p > cap:
+                print >>sys.stderr, "ERROR: The predicted peak memory of '%s' (%.3f GB) is over the cap (%.3f GB) for a reference of %d nucleotides!" % (step, p, cap, n)
+                ok = False
+        if n > 2 * max(sizes):
+            print >>sys.stderr, "WARNING: The largest reference allowed for %s under the cap (%.3f GB) has %d nucleotides, which is too large for checking the measured peak memory!" % (aligner, cap, n)
+            continue
+        print "Checking the peak memory of %s under the cap of %.3f GB (reference of %d nucleotides)..." % (aligner, cap, n)
+        peaks = measure('memory_model_check', aligner, n)
+        for step in steps:
+            if step not in peaks:
+                ok = False
+                continue
+            # the steps which run one process per thread (e.g. BLAT)
+            p = peaks[step] * (threads if model[step].get('copies',0) else 1)
+            if p > cap:
+                print >>sys.stderr, "ERROR: The measured peak memory of '%s' (%.3f GB) is over the cap (%.3f GB) for a reference of %d nucleotides!" % (step, p, cap, n)
+                ok = False
+
+    memory_model.save(options.memory_model, model)
+    print "The calibrated model of the peak memory is in '%s' (it should be copied to 'fusioncatcher/etc/memory_model.txt' in order to be used by FusionCatcher)." % (options.memory_model,)
+    return ok
+
+#
+def analyze_splits_sam(options, psl, dataset, out, name):
+    """
+    It runs 'analyze_splits_sam.py' where all the pairs of local alignments
+    are checked (i.e. '--all-pairs') and where only the pairs which might be
+    joined are checked (i.e. sweep over the sorted alignments, the default)
+    and the outputs should be the same. It returns False if any check has
+    failed.
+    """
+    variants = []
+    for (suffix,extra) in (('_all_pairs',['--all-pairs']),('',[])):
+        output = os.path.join(out,name+suffix+'.psl')
+        variants.append((name+suffix,
+                         script('analyze_splits_sam.py') + ['--input',psl,
+                                                            '--output',output,
+                                                            '--remove-extra'] + extra,
+                         output))
+    return compare(variants, count_lines(psl), dataset, options)[0]
+
+#
+def kmer_filter(options, transcripts, reads, truth_sam, dataset, out):
+    """
+    It benchmarks the k-mer prefiltering of the reads (see 'kmer-filter.py')
+    where the reference is made of the gene-gene sequences of the planted
+    fusion genes. The recall is computed against the reads which truly align
+    on them (i.e. SAM file) and, if Bowtie2 or BLAT is found in PATH, against
+    the reads which are aligned on them by the aligner without prefiltering
+    (where also the speedup of the prefiltering is given). It returns False if
+    any benchmark has failed.
+    """
+    ok = True
+    sequences = dict(transcripts)
+    fusions = [line.rstrip('\r\n').split('\t') for line in file(os.path.join(reads,'fusions.txt'),'r').readlines()[1:] if line.rstrip('\r\n')]
+    reference = os.path.join(out,'gene-gene.fa')
+    simulate_reads.write_fasta(reference,[('%s-%s' % (f[0],f[1]), sequences[f[2]] + sequences[f[3]]) for f in fusions])
+    targets = set([f[2] for f in fusions] + [f[3] for f in fusions])
+
+    # the reads which truly align on the gene-gene sequences
+    truth = set()
+    for line in file(truth_sam,'r'):
+        if line.startswith('@'):
+            continue
+        line = line.split('\t',3)
+        if line[2] in targets:
+            truth.add('%s/%d' % (line[0], 1 if int(line[1]) & 0x40 else 2))
+
+    # both mates are prefiltered together (like 'reads_gene-gene.fq')
+    fastq = os.path.join(out,'kmer_reads.fq')
+    fou = file(fastq,'w')
+    for m in (1,2):
+        fin = gzip.open(os.path.join(reads,'reads_%d.fq.gz' % (m,)),'r')
+        fou.writelines(fin)
+        fin.close()
+    fou.close()
+    records = count_lines(fastq) / 4
+
+    def names(filename):
+        # the names of the reads from a FASTQ file
+        return set([line[1:].rstrip('\r\n') for (i,line) in enumerate(file(filename,'r')) if i % 4 == 0])
+
+    kept = os.path.join(out,'kmer_reads_kept.fq')
+    filtering = []
+    ok = run_benchmark('kmer_filter',
+                       script('kmer-filter.py') + ['--input',fastq,
+                                                   '--reference',reference,
+                                                   '--output',kept,
+                                                   '--kmer',str(options.kmer)],
+                       records, dataset, options,
+                       truth = truth, result = lambda: names(kept), measures = filtering) and ok
+    if not ok:
+        return ok
+    print "The k-mer prefiltering kept %d reads out of %d." % (count_lines(kept) / 4, records)
+
+    aligner = [a for a in ('bowtie2','blat') if which(a)]
+    if not aligner:
+        print >>sys.stderr, "WARNING: Neither Bowtie2 nor BLAT is found in PATH and therefore the speedup of the k-mer prefiltering is not measured!"
+        return ok
+    aligner = aligner[0]
+
+    def aligned(filename):
+        # the names of the reads aligned by the aligner (SAM or PSL)
+        if aligner == 'blat':
+            return set([line.split('\t')[9] for line in file(filename,'r') if line.strip()])
+        return set([line.split('\t',1)[0] for line in file(filename,'r') if not line.startswith('@')])
+
+    walls = {}
+    results = {}
+    for (name,reads_fastq) in (('all',fastq),('kept',kept)):
+        d = os.path.join(out,'kmer_'+name)
+        fasta = os.path.join(d,'reads.fa')
+        if not os.path.isdir(d):
+            os.makedirs(d)
+        # the reads as FASTA (for BLAT)
+        data = file(reads_fastq,'r').readlines()
+        file(fasta,'w').writelines(['>%s\n%s' % (data[i][1:].rstrip('\r\n'),data[i+1]) for i in xrange(0,len(data),4)])
+        data = None
+        for (step, cmd, stdout) in aligner_commands(aligner, reference, reads_fastq, fasta, d, options.processes):
+            if step.endswith('-build'):
+                # the index is not a part of the comparison
+                (code, wall, rss, cpu) = execute(cmd, options.log_filename, stdout)
+                ok = ok and code == 0
+                continue
+            # the recall of the prefiltered reads is computed against the
+            # reads aligned without prefiltering
+            m = []
+            ok = run_benchmark('kmer_filter_%s_%s' % (step,name), cmd, count_lines(reads_fastq) / 4, dataset, options,
+                               stdout_filename = stdout, measures = m,
+                               truth = results.get('all'), result = lambda: aligned(os.path.join(d,'output'))) and ok
+            if m:
+                walls[name] = m[0][1]
+            results[name] = aligned(os.path.join(d,'output')) if os.path.isfile(os.path.join(d,'output')) else set()
+    if ok and 'all' in walls and 'kept' in walls:
+        print "The speedup of %s due to the k-mer prefiltering is %.2fx (including the prefiltering) and %d reads out of %d aligned reads are kept." % (
+            aligner,
+            walls['all'] / max(0.001, walls['kept'] + filtering[0][1]),
+            len(results['all'].intersection(results['kept'])),
+            len(results['all']))
+    return ok
+
+#
+def fragment_fastq(options, r1, r2, dataset, out):
+    """
+    It benchmarks the fragmentation of the reads (see 'fragment_fastq.py')
+    where the fragments of the pairs of reads and of the merged reads (here
+    the first reads, as single-end) are written into separate files which are
+    concatenated (like before) and where they are streamed into the same file
+    (see '--input_merged'). The outputs should be the same and the peak disk
+    usage of the second one should be lower. It returns False if any check has
+    failed.
+    """
+    # the same parameters as in 'fusioncatcher.py' (for the default values)
+    parameters = ['--window-size','82',
+                  '--step-size','49',
+                  '--threshold-read','92',
+                  '--anchors',str(int(math.ceil(float(dataset['read_length'])/float(160)))) if dataset['read_length'] != 'NA' else '1',
+                  '--skip-short','60',
+                  '--trim-n']
+    t1 = os.path.join(out,'fragments-t1.fq')
+    t2 = os.path.join(out,'fragments-t2.fq')
+    files = os.path.join(out,'fragments_files.fq')
+    streamed = os.path.join(out,'fragments_streamed.fq')
+    # the fragments are written into two files which are concatenated
+    # afterwards (i.e. before '--input_merged')
+    old = ' && '.join([' '.join([pipes.quote(e) for e in cmd]) for cmd in (
+        script('fragment_fastq.py') + ['-1',r1,'-2',r2,'-f',t1] + parameters,
+        script('fragment_fastq.py') + ['-1',r1,'-2','-','-f',t2] + parameters,
+        ['cat',t1,t2])]) + ' > ' + pipes.quote(files)
+    ok = compare([('fragment_fastq_files', ['sh','-c',old], files),
+                  ('fragment_fastq', script('fragment_fastq.py') + ['-1',r1,'-2',r2,'-m',r1,'-f',streamed] + parameters, streamed)],
+                 dataset['pairs'], dataset, options)[0]
+    if ok:
+        # the fragments and their concatenation are on the disk at the same time
+        disk_files = os.path.getsize(t1) + os.path.getsize(t2) + os.path.getsize(files)
+        disk_streamed = os.path.getsize(streamed)
+        if disk_streamed >= disk_files:
+            print >>sys.stderr, "ERROR: The peak disk usage of the streamed fragments (%d bytes) is not lower than of the concatenated files (%d bytes)!" % (disk_streamed, disk_files)
+            ok = False
+        else:
+            print "The peak disk usage of the fragments is %d bytes when streamed and %d bytes when concatenated from files (%.2fx lower)." % (disk_streamed, disk_files, float(disk_files) / float(max(1,disk_streamed)))
+    for f in (t1,t2,files,streamed):
+        if os.path.isfile(f):
+            os.remove(f)
+    return ok
+
+#
+def interval_index(options, dataset, out):
+    """
+    It benchmarks the building of the interval index of the exons and genes
+    (see 'intervals.py') of a random annotation (see '--interval-genes') and
+    it checks the features found by the index for random positions and
+    intervals (see '--interval-queries') against a brute-force search (i.e.
+    scanning all the features). It gives also the time needed for loading the
+    saved index versus parsing the file and the speedup of the queries. It
+    returns False if any check has failed.
+    """
+    ok = True
+    directory = os.path.join(out,'annotation')
+    simulate_reads.annotation(directory,
+                              genes = options.interval_genes,
+                              seed = options.seed + 6)
+    rnd = random.Random(options.seed + 7)
+    for (name,kind) in (('organism.gtf','gtf'),('exons.txt','exons'),('genes.txt','genes')):
+        f = os.path.join(directory,name)
+        ok = run_benchmark('intervals_'+kind,
+                           script('intervals.py') + ['--input',f,'--format',kind],
+                           count_lines(f), dataset, options) and ok
+        if not ok:
+            return ok
+        start = time.time()
+        db = intervals.load(f, kind, cache = False)
+        loaded = time.time() - start
+        start = time.time()
+        built = intervals.build(file(f,'r'), kind)
+        parsed = time.time() - start
+        if db.items != built.items:
+            print >>sys.stderr, "ERROR: The saved interval index of '%s' differs from the one built from the file!" % (name,)
+            return False
+
+        # random queries (positions and intervals of several lengths)
+        items = db.items
+        keys = sorted(set([(e[intervals.KIND],e[intervals.CHROM]) for e in items]))
+        genes = sorted(db.genes.keys())
+        queries = []
+        for i in xrange(options.interval_queries):
+            (k,c) = rnd.choice(keys)
+            p = rnd.randint(1,10**8)
+            queries.append((k,c,p,p + rnd.choice((0,0,100,10000,1000000)) ))
+        start = time.time()
+        found = [db.overlap(k,c,a,b) for (k,c,a,b) in queries]
+        indexed = time.time() - start
+        start = time.time()
+        expected = [[e for e in items if e[intervals.KIND] == k and e[intervals.CHROM] == c and e[intervals.START] <= b and e[intervals.END] >= a] for (k,c,a,b) in queries]
+        scanned = time.time() - start
+        if found != expected:
+            print >>sys.stderr, "ERROR: The features found by the interval index of '%s' differ from the brute-force search!" % (name,)
+            ok = False
+        # the features of random genes
+        for g in rnd.sample(genes,min(len(genes),options.interval_queries / 10)):
+            spans = db.gene(g)
+            for k in set([e[0] for e in keys]):
+                expected = [e for e in items if e[intervals.KIND] == k and e[intervals.GENE] == g and [x for x in spans if x[intervals.CHROM] == e[intervals.CHROM] and e[intervals.START] <= max(x[intervals.START],x[intervals.END]) and e[intervals.END] >= min(x[intervals.START],x[intervals.END])]]
+                if db.features(k,g) != expected:
+                    print >>sys.stderr, "ERROR: The features of gene '%s' found by the interval index of '%s' differ from the brute-force search!" % (g,name)
+                    ok = False
+                    break
+        print "The interval index of '%s' (%d features) is loaded in %.3f seconds (versus %.3f seconds for parsing the file) and it answers %d queries in %.3f seconds (versus %.3f seconds for scanning all the features, i.e. %.1fx faster)." % (name, len(items), loaded, parsed, len(queries), indexed, scanned, scanned / max(indexed,0.000001))
+    return ok
+
+#
+def resident_index(options, dataset, out):
+    """
+    It benchmarks the startup of an aligner (i.e. loading its index) when the
+    index is read from the disk (i.e. dropped from the page cache) and when it
+    is kept resident in memory (see 'resident.py'), where the second run
+    should reuse the manager started for the first one. The index is a Bowtie
+    index of a random reference (see '--resident-size') which is used by
+    'bowtie --mm' if Bowtie is found in PATH, otherwise it is made of random
+    files which are read entirely. It returns False if any check has failed.
+    """
+    directory = os.path.join(out,'resident')
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    if which('bowtie-build') and which('bowtie'):
+        reference = os.path.join(directory,'reference.fa')
+        fastq = os.path.join(directory,'reads.fq')
+        simulate_reads.reference(nucleotides = options.resident_size,
+                                 reads = options.model_reads,
+                                 read_length = dataset['read_length'],
+                                 database_filename = reference,
+                                 fastq_filename = fastq,
+                                 fasta_filename = os.path.join(directory,'reads.fa'),
+                                 seed = options.seed + 8)
+        cmds = aligner_commands('bowtie', reference, fastq, None, directory, options.processes)
+        (code, wall, rss, cpu) = execute(cmds[0][1], options.log_filename)
+        if code != 0:
+            print >>sys.stderr, "ERROR: The Bowtie index could not be built (see 'log.txt' in the working directory)!"
+            return False
+        index = os.path.join(directory,'index')
+        # the same order of the alignments in both runs (for comparing them)
+        cmd = cmds[1][1][:1] + ['--mm','--reorder'] + cmds[1][1][1:]
+        outputs = (cmds[1][2]+'_cold',cmds[1][2])
+        records = options.model_reads
+    else:
+        print >>sys.stderr, "WARNING: Bowtie is not found in PATH and therefore random files are used as index in the benchmark 'resident'!"
+        index = os.path.join(directory,'index')
+        if not os.path.isdir(index):
+            os.makedirs(index)
+        n = options.resident_size
+        for i in xrange(4):
+            fou = file(os.path.join(index,'random.%d.ebwt' % (i+1,)),'wb')
+            for j in xrange(0, n / 4, 2**20):
+                fou.write(os.urandom(min(2**20, n / 4 - j)))
+            fou.close()
+        cmd = ['cat'] + resident.files([index])
+        outputs = (None,None)
+        records = n
+    filenames = resident.files([index])
+    errors = []
+
+    def setup(name):
+        # the index is dropped from the page cache before each run and then
+        # it is read from the disk or it is kept resident in memory
+        for f in filenames:
+            resident.evict(f)
+        if name == 'resident_cold':
+            if None in [resident.residency(f) for f in filenames]:
+                print >>sys.stderr, "WARNING: The page cache cannot be measured or dropped here and therefore the first run might not read the index from the disk!"
+            return True
+        (pid, started) = resident.start([index], idle = 600, min_available = 0.5 * resident.GB, interval = 1)
+        if not pid:
+            print >>sys.stderr, "ERROR: The manager of the resident indexes could not be started!"
+            return False
+        for i in xrange(600):
+            r = [resident.residency(f) for f in filenames]
+            if None in r or min(r) >= 0.99:
+                break
+            time.sleep(0.1)
+        if None not in r and min(r) < 0.99:
+            print >>sys.stderr, "ERROR: The index is not resident in memory (%.1f%%)!" % (100.0 * min(r),)
+            errors.append(name)
+        # the next run (e.g. the next sample) reuses the manager
+        (again, started) = resident.start([index], idle = 600, min_available = 0.5 * resident.GB, interval = 1)
+        if again != pid or started:
+            print >>sys.stderr, "ERROR: The manager of the resident indexes has not been reused (process %s instead of %s)!" % (again, pid)
+            errors.append(name)
+        return True
+
+    ok = compare([('resident_cold', cmd, outputs[0]),
+                  ('resident', cmd, outputs[1])],
+                 records, dataset, options, stdout = True, setup = setup)[0]
+    resident.stop([index])
+    shutil.rmtree(directory)
+    return ok and not errors
+
+#
+def homologs(map_filename):
+    """
+    It counts (straightforwardly, using the names of the genes) the reads
+    shared by each pair of genes (like 'find_homolog_genes.py' with
+    '--reads 1') and it returns the sorted lines of its output.
+    """
+    counts = dict()
+    reads = itertools.groupby((line.rstrip('\r\n').split('\t')[:2] for line in file(map_filename,'r') if line.rstrip('\r\n')), lambda x: x[0])
+    for (read,lines) in reads:
+        g = sorted(set([e[1] for e in lines]))
+        for i in xrange(len(g)-1):
+            for j in xrange(i+1,len(g)):
+                k = '%s\t%s' % (g[i],g[j])
+                counts[k] = counts.get(k,0) + 1
+    return sorted(['%s\t%d\n' % (k,v) for (k,v) in counts.iteritems()])
+
+#
+def find_homolog_genes(options, names, dataset, out):
+    """
+    It benchmarks (i.e. peak memory and throughput) the counting of the reads
+    shared by the pairs of genes (see 'find_homolog_genes.py') on reads which
+    map on many genes of the same family (see '--homolog-reads'). The output
+    should be the same as the one counted straightforwardly. It returns False
+    if any check has failed.
+    """
+    mapping = os.path.join(out,'homolog_genes.map')
+    # at most 50 genes per read such that no read is truncated (see
+    # 'find_homolog_genes.py')
+    simulate_reads.multimapping(map_filename = mapping,
+                                genes = names,
+                                reads = options.homolog_reads,
+                                max_genes = 50,
+                                seed = options.seed + 5)
+    output = os.path.join(out,'homolog_genes.txt')
+    ok = run_benchmark('find_homolog_genes',
+                       script('find_homolog_genes.py') + ['--input',mapping,
+                                                          '--output',output,
+                                                          '--reads','1',
+                                                          '--processes',str(options.processes)],
+                       options.homolog_reads, dataset, options)
+    if ok and sorted(file(output,'r').readlines()) != homologs(mapping):
+        print >>sys.stderr, "ERROR: The output of 'find_homolog_genes.py' differs from the straightforward counting of the pairs of genes (see '%s')!" % (mapping,)
+        ok = False
+    os.remove(mapping)
+    return ok
+
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options]"
+    description = """It benchmarks FusionCatcher and its most time/memory consuming scripts on simulated reads with planted fusion genes and it records the throughput, peak memory and recall in a results file."""
+    version_text = "%prog 0.99 beta"
+
+    parser = optparse.OptionParser(usage=usage,description=description,version=version_text)
+
+    parser.add_option("--data","-d",
+                      action = "store",
+                      type = "string",
+                      dest = "data_directory",
+                      help = """The database of FusionCatcher used for simulating the reads (it should contain 'transcripts.fa', 'genes.fa' and 'genes_symbols.txt') and for running FusionCatcher (see '--pipeline'). If it is not specified then a toy database is generated in the working directory.""")
+
+    parser.add_option("--work","-w",
+                      action = "store",
+                      type = "string",
+                      dest = "work_directory",
+                      default = 'benchmark_work',
+                      help = """The working directory where the simulated reads and the outputs are written. Default is '%default'.""")
+
+    parser.add_option("--results","-r",
+                      action = "store",
+                      type = "string",
+                      dest = "results_filename",
+                      default = 'benchmark_results.txt',
+                      help = """The results file (tab separated) where the results of the benchmarks are appended. Default is '%default'.""")
+
+    parser.add_option("--pairs","-n",
+                      action = "store",
+                      type = "string",
+                      dest = "pairs",
+                      default = '100000',
+                      help = """The numbers of paired-end reads (comma separated) which are simulated, e.g. 1000000,10000000,200000000. Default is '%default'.""")
+
+    parser.add_option("--read-length","-l",
+                      action = "store",
+                      type = "string",
+                      dest = "read_length",
+                      default = '100',
+                      help = """The lengths of the reads (comma separated) which are simulated, e.g. 50,100,150. Default is '%default'.""")
+
+    parser.add_option("--fusions","-f",
+                      action = "store",
+                      type = "int",
+                      dest = "fusions",
+                      default = 20,
+                      help = """The number of fusion genes which are planted. Default is '%default'.""")
+
+    parser.add_option("--fusion-fraction",
+                      action = "store",
+                      type = "float",
+                      dest = "fusion_fraction",
+                      default = 0.001,
+                      help = """The fraction of paired-end reads which support the planted fusion genes. Default is '%default'.""")
+
+    parser.add_option("--benchmarks","-b",
+                      action = "store",
+                      type = "string",
+                      dest = "benchmarks",
+                      default = ','.join(BENCHMARKS[:-1]),
+                      help = """The benchmarks (comma separated) which are executed. The choices are: %s. Default is '%%default'.""" % (', '.join(BENCHMARKS),))
+
+    parser.add_option("--pipeline",
+                      action = "store_true",
+                      dest = "pipeline",
+                      default = False,
+                      help = """If it is set then the entire FusionCatcher pipeline is benchmarked also (the database given by '--data' should be a complete database of FusionCatcher). Default is '%default'.""")
+
+    parser.add_option("--test-reads",
+                      action = "store_true",
+                      dest = "test_reads",
+                      default = False,
+                      help = """If it is set then the reads of the installation test (i.e. 'test/reads_1.fq.gz' and 'test/reads_2.fq.gz') are benchmarked also (where the fusion genes reported in 'test/final-list_candidate-fusion-genes.txt' are used for computing the recall). Default is '%default'.""")
+
+    parser.add_option("--processes","-p",
+                      action = "store",
+                      type = "int",
+                      dest = "processes",
+                      default = 1,
+                      help = """The number of parallel processes/CPUs used by the benchmarked programs. Default is '%default'.""")
+
+    parser.add_option("--blat-reads",
+                      action = "store",
+                      type = "int",
+                      dest = "blat_reads",
+                      default = 20000,
+                      help = """The maximum number of reads aligned by BLAT in the benchmark 'blat_parallel', where the first 10%% of the reads are much slower to align than the others (i.e. skewed input). Default is '%default'.""")
+
+    parser.add_option("--split-reads",
+                      action = "store",
+                      type = "int",
+                      dest = "split_reads",
+                      default = 20,
+                      help = """The number of reads with many local alignments in the benchmark 'analyze_splits_sam_many_hits' (see '--split-hits'). Default is '%default'.""")
+
+    parser.add_option("--split-hits",
+                      action = "store",
+                      type = "int",
+                      dest = "split_hits",
+                      default = 500,
+                      help = """The number of local alignments of each read in the benchmark 'analyze_splits_sam_many_hits'. Default is '%default'.""")
+
+    parser.add_option("--homolog-reads",
+                      action = "store",
+                      type = "int",
+                      dest = "homolog_reads",
+                      default = 200000,
+                      help = """The number of reads which map on several genes of the same family in the benchmark 'find_homolog_genes'. Default is '%default'.""")
+
+    parser.add_option("--interval-genes",
+                      action = "store",
+                      type = "int",
+                      dest = "interval_genes",
+                      default = 20000,
+                      help = """The number of genes of the random annotation in the benchmark 'intervals'. Default is '%default'.""")
+
+    parser.add_option("--interval-queries",
+                      action = "store",
+                      type = "int",
+                      dest = "interval_queries",
+                      default = 1000,
+                      help = """The number of random queries which are checked against the brute-force search in the benchmark 'intervals'. Default is '%default'.""")
+
+    parser.add_option("--resident-size",
+                      action = "store",
+                      type = "int",
+                      dest = "resident_size",
+                      default = 400000000,
+                      help = """The size (nucleotides, or bytes for the random files used when Bowtie is not found) of the index kept resident in memory in the benchmark 'resident'. Default is '%default'.""")
+
+    parser.add_option("--kmer",
+                      action = "store",
+                      type = "int",
+                      dest = "kmer",
+                      default = 20,
+                      help = """The length of the k-mers used in the benchmark 'kmer_filter' (see '--prefilter-kmer' of 'fusioncatcher.py'). Default is '%default'.""")
+
+    parser.add_option("--model-sizes",
+                      action = "store",
+                      type = "string",
+                      dest = "model_sizes",
+                      default = '1000000,2000000,4000000,8000000',
+                      help = """The sizes (nucleotides, comma separated) of the random references used for calibrating the model of the peak memory of the aligners in the benchmark 'memory_model'. Default is '%default'.""")
+
+    parser.add_option("--model-reads",
+                      action = "store",
+                      type = "int",
+                      dest = "model_reads",
+                      default = 10000,
+                      help = """The number of reads aligned in the benchmark 'memory_model'. Default is '%default'.""")
+
+    parser.add_option("--memory-cap",
+                      action = "store",
+                      type = "float",
+                      dest = "memory_cap",
+                      default = 0,
+                      help = """The cap (in GB) for which the calibrated model of the peak memory is checked in the benchmark 'memory_model'. If it is 0 then the cap is chosen such that the largest reference allowed by the model is in the middle of the sizes given by '--model-sizes'. Default is '%default'.""")
+
+    parser.add_option("--memory-model",
+                      action = "store",
+                      type = "string",
+                      dest = "memory_model",
+                      help = """The file where the calibrated model of the peak memory of the aligners is written by the benchmark 'memory_model'. It should be copied to 'fusioncatcher/etc/memory_model.txt' in order to be used by FusionCatcher (see '--memory-model' of 'fusioncatcher.py'). If it is not given then it is written in the working directory as 'memory_model.txt'.""")
+
+    parser.add_option("--fusioncatcher-options",
+                      action = "store",
+                      type = "string",
+                      dest = "fusioncatcher_options",
+                      default = '',
+                      help = """Extra command line options passed to FusionCatcher (see '--pipeline'), e.g. '--skip-blat'.""")
+
+    parser.add_option("--keep",
+                      action = "store_true",
+                      dest = "keep",
+                      default = False,
+                      help = """If it is set then the simulated reads and the outputs are kept in the working directory. Default is '%default'.""")
+
+    parser.add_option("--seed",
+                      action = "store",
+                      type = "int",
+                      dest = "seed",
+                      default = 1,
+                      help = """The seed of the random number generator. Default is '%default'.""")
+
+    (options,args) = parser.parse_args()
+
+    # validate options
+    if not (options.work_directory and
+            options.results_filename
+            ):
+        parser.print_help()
+        sys.exit(1)
+
+    benchmarks = [b.strip() for b in options.benchmarks.split(',') if b.strip()]
+    if options.pipeline and 'pipeline' not in benchmarks:
+        benchmarks.append('pipeline')
+    for b in benchmarks:
+        if b not in BENCHMARKS:
+            print >>sys.stderr, "ERROR: Unknown benchmark '%s'!" % (b,)
+            sys.exit(1)
+    if 'pipeline' in benchmarks and not options.data_directory:
+        print >>sys.stderr, "ERROR: The pipeline can be benchmarked only using a complete database of FusionCatcher (see '--data')!"
+        sys.exit(1)
+
+    options.version = version()
+    options.log_filename = os.path.join(os.path.abspath(options.work_directory),'log.txt')
+    options.results_filename = os.path.abspath(options.results_filename)
+    work = os.path.abspath(options.work_directory)
+    if not os.path.isdir(work):
+        os.makedirs(work)
+    options.memory_model = os.path.abspath(options.memory_model) if options.memory_model else os.path.join(work,'memory_model.txt')
+
+    data = options.data_directory
+    if not data:
+        data = os.path.join(work,'toy_data')
+        if not os.path.isfile(os.path.join(data,'transcripts.fa')):
+            print "Generating a toy database..."
+            simulate_reads.toy(data, seed = options.seed)
+    data = os.path.abspath(data)
+
+    print "Reading the transcripts..."
+    transcripts = simulate_reads.read_fasta(os.path.join(data,'transcripts.fa'))
+    genes = []
+    if os.path.isfile(os.path.join(data,'genes.fa')):
+        print "Reading the genes..."
+        genes = simulate_reads.read_fasta(os.path.join(data,'genes.fa'))
+
+    # the datasets
+    datasets = []
+    for read_length in [int(e) for e in options.read_length.split(',') if e.strip()]:
+        for pairs in [int(e) for e in options.pairs.split(',') if e.strip()]:
+            datasets.append({'name': 'simulated', 'pairs': pairs, 'read_length': read_length})
+    if options.test_reads:
+        datasets.append({'name': 'test', 'pairs': 'NA', 'read_length': 'NA'})
+
+    failed = False
+    if 'memory_model' in benchmarks:
+        failed = not calibrate(options, work) or failed
+
+    for dataset in datasets:
+        if dataset['name'] == 'test':
+            d = os.path.join(work,'test')
+            if not os.path.isdir(d):
+                os.makedirs(d)
+            reads = os.path.abspath(os.path.join(HERE,'..'))
+            dataset['pairs'] = sum([1 for line in gzip.open(os.path.join(reads,'reads_1.fq.gz'),'r')]) / 4
+            truth = found(os.path.join(reads,'final-list_candidate-fusion-genes.txt'),'Gene_1_id','Gene_2_id')
+            r1 = os.path.join(reads,'reads_1.fq.gz')
+            r2 = os.path.join(reads,'reads_2.fq.gz')
+            truth_map = None
+            truth_sam = None
+        else:
+            d = os.path.join(work,'simulated_%d_%d' % (dataset['pairs'],dataset['read_length']))
+            reads = os.path.join(d,'reads')
+            truth_map = os.path.join(d,'truth.map')
+            truth_sam = os.path.join(d,'truth.sam')
+            if not os.path.isfile(os.path.join(reads,'fusions.txt')):
+                print "Simulating %d paired-end reads of length %d..." % (dataset['pairs'],dataset['read_length'])
+                rnd = random.Random(options.seed)
+                fusions = simulate_reads.plant(transcripts, options.fusions, 300, rnd)
+                simulate_reads.simulate(transcripts = transcripts,
+                                        genes = genes,
+                                        fusions = fusions,
+                                        pairs = dataset['pairs'],
+                                        read_length = dataset['read_length'],
+                                        fragment_mean = 300,
+                                        fragment_sd = 50,
+                                        fusion_fraction = options.fusion_fraction,
+                                        gene_fraction = 0.05,
+                                        error_rate = 0.002,
+                                        output_directory = reads,
+                                        map_filename = truth_map if [b for b in benchmarks if b in ('find_fusion_genes_map','label_fusion_genes')] else None,
+                                        sam_filename = truth_sam if [b for b in benchmarks if b in ('sam2psl','analyze_splits_sam','kmer_filter')] else None,
+                                        seed = options.seed + 1)
+            truth = planted(os.path.join(reads,'fusions.txt'))
+            r1 = os.path.join(reads,'reads_1.fq.gz')
+            r2 = os.path.join(reads,'reads_2.fq.gz')
+        out = os.path.join(d,'out')
+        if os.path.isdir(out):
+            shutil.rmtree(out)
+        os.makedirs(out)
+        print "Benchmarking on the %s reads (%s pairs)..." % (dataset['name'],dataset['pairs'])
+
+        if 'remove_adapter' in benchmarks:
+            failed = not run_benchmark('remove_adapter',
+                                       script('remove_adapter.py') + ['--input_1',r1,'--input_2',r2,
+                                                                      '--output_1',os.path.join(out,'trimmed_1.fq'),
+                                                                      '--output_2',os.path.join(out,'trimmed_2.fq'),
+                                                                      '--processes',str(options.processes)],
+                                       dataset['pairs'], dataset, options) or failed
+
+        if truth_map and os.path.isfile(truth_map) and ('find_fusion_genes_map' in benchmarks or 'label_fusion_genes' in benchmarks):
+            candidates = os.path.join(out,'candidate_fusion-genes.txt')
+            failed = not run_benchmark('find_fusion_genes_map',
+                                       script('find_fusion_genes_map.py') + ['--input',truth_map,
+                                                                             '--input_hugo',os.path.join(data,'genes_symbols.txt'),
+                                                                             '--output_fusion_genes',candidates,
+                                                                             '--output_fusion_reads',os.path.join(out,'candidate_fusion-genes_supporting_paired-reads.txt'),
+                                                                             '--output_missing_mate_reads',os.path.join(out,'candidate_fusion-genes_missing_mates.txt')],
+                                       count_lines(truth_map), dataset, options,
+                                       truth = truth, result = lambda: found(candidates)) or failed
+
+            if 'label_fusion_genes' in benchmarks and os.path.isfile(candidates):
+                # the planted fusion genes are labeled as known
+                known = os.path.join(out,'known.txt')
+                file(known,'w').writelines(['%s\t%s\n' % e for e in sorted(truth)])
+                labeled = os.path.join(out,'candidate_fusion-genes_labeled.txt')
+                failed = not run_benchmark('label_fusion_genes',
+                                           script('label_fusion_genes.py') + ['--input',candidates,
+                                                                              '--label','known',
+                                                                              '--filter_gene_pairs',known,
+                                                                              '--output_fusion_genes',labeled],
+                                           count_lines(candidates), dataset, options,
+                                           truth = truth, result = lambda: found(labeled, label = 'known')) or failed
+
+        if truth_sam and os.path.isfile(truth_sam) and ('sam2psl' in benchmarks or 'analyze_splits_sam' in benchmarks):
+            psl = os.path.join(out,'truth.psl')
+            failed = not run_benchmark('sam2psl',
+                                       script('sam2psl.py') + ['--input',truth_sam,'--output',psl],
+                                       count_lines(truth_sam), dataset, options) or failed
+
+            if 'analyze_splits_sam' in benchmarks and os.path.isfile(psl):
+                # sorted like in FusionCatcher
+                sorted_psl = os.path.join(out,'truth_sorted.psl')
+                os.system("LC_ALL=C sort -k 10,10 -k 14,14 -k 12,12n -k 13,13n -t '\t' '%s' > '%s'" % (psl,sorted_psl))
+                failed = not analyze_splits_sam(options, sorted_psl, dataset, out, 'analyze_splits_sam') or failed
+
+        if 'analyze_splits_sam' in benchmarks and dataset['name'] != 'test':
+            # reads with many local alignments (e.g. repeats)
+            hits_psl = os.path.join(out,'many_hits.psl')
+            simulate_reads.many_hits(psl_filename = hits_psl,
+                                     reads = options.split_reads,
+                                     hits = options.split_hits,
+                                     read_length = dataset['read_length'],
+                                     seed = options.seed + 4)
+            failed = not analyze_splits_sam(options, hits_psl, dataset, out, 'analyze_splits_sam_many_hits') or failed
+
+        if 'blat_parallel' in benchmarks and dataset['name'] != 'test':
+            if not which('blat'):
+                print >>sys.stderr, "WARNING: BLAT is not found in PATH and therefore the benchmark 'blat_parallel' is skipped!"
+            else:
+                # the input is divided into one part per CPU (static) and into
+                # many small chunks (dynamic) and the outputs should be the same
+                database = os.path.join(out,'skewed_database.fa')
+                fasta = os.path.join(out,'skewed_reads.fa')
+                n = min(dataset['pairs'],options.blat_reads)
+                simulate_reads.skewed(transcripts = transcripts,
+                                      reads = n,
+                                      read_length = dataset['read_length'],
+                                      database_filename = database,
+                                      reads_filename = fasta,
+                                      seed = options.seed + 2)
+                variants = []
+                for (name,chunks) in (('blat_parallel_static',options.processes),('blat_parallel',0)):
+                    psl = os.path.join(out,name+'.psl')
+                    variants.append((name,
+                                     script('blat_parallel.py') + ['-noHead',
+                                                                   '-stepSize=5',
+                                                                   '-tileSize=11',
+                                                                   '-minScore=30',
+                                                                   '-t=DNA',
+                                                                   '-q=RNA',
+                                                                   '-repMatch=2253',
+                                                                   '-minIdentity=30',
+                                                                   '--tmp_dir=%s' % (out,),
+                                                                   '--cpus=%d' % (options.processes,)] +
+                                                                  (['--chunks=%d' % (chunks,)] if chunks else []) +
+                                                                  [database,fasta,psl],
+                                     psl))
+                failed = not compare(variants, n, dataset, options)[0] or failed
+
+        if 'kmer_filter' in benchmarks and truth_sam and os.path.isfile(truth_sam):
+            failed = not kmer_filter(options, transcripts, reads, truth_sam, dataset, out) or failed
+
+        if 'fragment_fastq' in benchmarks:
+            failed = not fragment_fastq(options, r1, r2, dataset, out) or failed
+
+        if 'find_homolog_genes' in benchmarks and dataset['name'] != 'test':
+            failed = not find_homolog_genes(options, [e[0] for e in (genes if genes else transcripts)], dataset, out) or failed
+
+        if 'intervals' in benchmarks and dataset['name'] != 'test':
+            failed = not interval_index(options, dataset, out) or failed
+
+        if 'resident' in benchmarks and dataset['name'] != 'test':
+            failed = not resident_index(options, dataset, out) or failed
+
+        if 'pipeline' in benchmarks:
+            reads_directory = os.path.dirname(r1)
+            final = os.path.join(out,'fusioncatcher','final-list_candidate-fusion-genes.txt')
+            failed = not run_benchmark('pipeline',
+                                       script('fusioncatcher.py') + ['--input',reads_directory,
+                                                                     '--output',os.path.join(out,'fusioncatcher'),
+                                                                     '--data',data,
+                                                                     '-p',str(options.processes)] + options.fusioncatcher_options.split(),
+                                       dataset['pairs'], dataset, options,
+                                       truth = truth, result = lambda: found(final,'Gene_1_id','Gene_2_id')) or failed
+
+        if not options.keep:
+            shutil.rmtree(out)
+            if dataset['name'] != 'test':
+                shutil.rmtree(d)
+
+    print "The results are in '%s'." % (options.results_filename,)
+    if failed:
+        print >>sys.stderr, "WARNING: Some of the benchmarks have failed (see 'log.txt' in the working directory)!"
+        sys.exit(1)
+    #
@@ -0,0 +1,662 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It simulates paired-end short reads (FASTQ) from the transcripts of a
+FusionCatcher database (i.e. 'transcripts.fa', where the names of the
+sequences are 'transcript_id;gene_id') where a given number of fusion genes
+are planted. Optionally, a part of the reads are simulated from the unspliced
+genes (i.e. 'genes.fa'). The fusion genes which have been planted are saved in
+'fusions.txt' such that the recall of FusionCatcher (or of one of its scripts)
+can be computed.
+
+Optionally, the true alignments of the reads on the transcripts are saved
+also in Bowtie MAP format (sorted by read names, like in FusionCatcher) and/or
+in SAM format (where the reads which cross the fusion point are split between
+the two transcripts) such that the scripts of FusionCatcher can be benchmarked
+without running the aligners.
+
+Also it can generate a toy (i.e. random) set of genes and transcripts which
+can be used for running the benchmarks offline, and a skewed input for BLAT
+(where a few reads are much slower to align than the others) which is used
+for benchmarking 'blat_parallel.py', and random references (with reads from
+them) of given sizes which are used for calibrating the model of the peak
+memory of the aligners (see 'memory_model.py'), and local alignments (PSL)
+of reads which have many hits, which are used for benchmarking
+'analyze_splits_sam.py', and reads which map on many genes (e.g. paralogs),
+which are used for benchmarking 'find_homolog_genes.py', and a random
+annotation of genes, transcripts, exons and CDSes on chromosomes (i.e.
+'organism.gtf', 'exons.txt' and 'genes.txt'), which is used for benchmarking
+the interval index of the exons and genes (see 'intervals.py').
+
+
+
+Author: Daniel Nicorici, Daniel.Nicorici@gmail.com
+
+Copyright (c) 2009-2017 Daniel Nicorici
+
+This file is part of FusionCatcher.
+
+FusionCatcher is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+FusionCatcher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with FusionCatcher (see file 'COPYING.txt').  If not, see
+<http://www.gnu.org/licenses/>.
+
+By default, FusionCatcher is running BLAT aligner
+<http://users.soe.ucsc.edu/~kent/src/> but it offers also the option to disable
+all its scripts which make use of BLAT aligner if you choose explicitly to do so.
+BLAT's license does not allow to be used for commercial activities. If BLAT
+license does not allow to be used in your case then you may still use
+FusionCatcher by forcing not use the BLAT aligner by specifying the option
+'--skip-blat'. Fore more information regarding BLAT please see its license.
+
+Please, note that FusionCatcher does not require BLAT in order to find
+candidate fusion genes!
+
+This file is not running/executing/using BLAT.
+"""
+import os
+import sys
+import gzip
+import math
+import random
+import string
+import optparse
+
+# Illumina TruSeq adapters (added to the reads when the fragment is shorter than the read)
+ADAPTER_1 = 'AGATCGGAAGAGCACACGTCTGAACTCCAGTCACATCTCGTATGCCGTCTTCTGCTTG'
+ADAPTER_2 = 'AGATCGGAAGAGCGTCGTGTAGGGAAAGAGTGTAGATCTCGGTGGTCGCCGTATCATT'
+
+_complement = string.maketrans('ACGTNacgtn','TGCANtgcan')
+_errors = {'A':'CGT','C':'AGT','G':'ACT','T':'ACG','N':'ACG'}
+
+#
+def reverse_complement(seq):
+    return seq.translate(_complement)[::-1]
+
+#
+def read_fasta(filename):
+    """
+    It reads a FASTA file and it returns a list of (name, sequence), where the
+    name is the first word of the header.
+    """
+    fin = gzip.open(filename,'r') if filename.lower().endswith('.gz') else file(filename,'r')
+    data = []
+    name = None
+    seq = []
+    for line in fin:
+        if line.startswith('>'):
+            if name is not None:
+                data.append((name,''.join(seq).upper()))
+            name = line[1:].strip().split(' ',1)[0].split('\t',1)[0]
+            seq = []
+        else:
+            seq.append(line.strip())
+    if name is not None:
+        data.append((name,''.join(seq).upper()))
+    fin.close()
+    return data
+
+#
+def write_fasta(filename, data, width = 60):
+    fou = file(filename,'w')
+    for (name,seq) in data:
+        fou.write('>%s\n' % (name,))
+        fou.writelines([seq[i:i+width]+'\n' for i in xrange(0,len(seq),width)])
+    fou.close()
+
+#
+def gene_of(name):
+    """
+    It gives the gene of a transcript (i.e. 'transcript_id;gene_id').
+    """
+    g = name.partition(';')[2]
+    return g if g else name
+
+#
+def toy(directory, genes = 300, seed = 1):
+    """
+    It generates a toy (i.e. random) database: 'genes.fa', 'transcripts.fa'
+    and 'genes_symbols.txt'.
+    """
+    rnd = random.Random(seed)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    g_fa = []
+    t_fa = []
+    symbols = []
+    k = 0
+    for i in xrange(1,genes+1):
+        g = 'ENSG%011d' % (i,)
+        n = rnd.randint(2,8)
+        exons = [''.join([rnd.choice('ACGT') for j in xrange(rnd.randint(80,600))]) for e in xrange(n)]
+        introns = [''.join([rnd.choice('ACGT') for j in xrange(rnd.randint(100,1500))]) for e in xrange(n-1)]
+        g_fa.append((g,''.join([e+f for (e,f) in zip(exons,introns+[''])])))
+        symbols.append('%s\tTOY%d\n' % (g,i))
+        for j in xrange(rnd.randint(1,3)):
+            k = k + 1
+            x = sorted(rnd.sample(xrange(n),rnd.randint(max(1,n-2),n)))
+            t_fa.append(('ENST%011d;%s' % (k,g),''.join([exons[e] for e in x])))
+    write_fasta(os.path.join(directory,'genes.fa'),g_fa)
+    write_fasta(os.path.join(directory,'transcripts.fa'),t_fa)
+    file(os.path.join(directory,'genes_symbols.txt'),'w').writelines(symbols)
+
+#
+def annotation(directory, genes = 2000, chromosomes = 5, seed = 1):
+    """
+    It generates a random annotation (i.e. 'organism.gtf', 'exons.txt' and
+    'genes.txt' like in the database of FusionCatcher) of genes with short
+    and long introns, on both strands, where the genes might overlap.
+    """
+    rnd = random.Random(seed)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    gtf = []
+    exons_txt = []
+    genes_txt = []
+    k = 0
+    for i in xrange(1,genes+1):
+        g = 'ENSG%011d' % (i,)
+        chrom = str(rnd.randint(1,chromosomes))
+        strand = rnd.choice(('+','-'))
+        start = rnd.randint(1,10**8)
+        n = rnd.randint(1,12)
+        # a few genes are very long (i.e. long introns)
+        intron = 200000 if rnd.random() < 0.05 else 5000
+        x = start
+        exons = []
+        for e in xrange(n):
+            y = x + rnd.randint(50,400)
+            exons.append((x,y))
+            x = y + rnd.randint(50,intron)
+        end = exons[-1][1]
+        genes_txt.append('%s\t%d\t%d\t%d\t%s\n' % (g,end,start,1 if strand == '+' else -1,chrom))
+        for j in xrange(rnd.randint(1,3)):
+            k = k + 1
+            t = 'ENST%011d' % (k,)
+            x = sorted(rnd.sample(exons,rnd.randint(1,n)))
+            if strand == '-':
+                x.reverse()
+            coding = rnd.random() < 0.7
+            for (r,(a,b)) in enumerate(x):
+                attributes = 'gene_id "%s"; transcript_id "%s"; exon_number "%d"; gene_name "TOY%d";' % (g,t,r+1,i)
+                gtf.append('%s\ttoy\texon\t%d\t%d\t.\t%s\t.\t%s\n' % (chrom,a,b,strand,attributes))
+                if coding and 0 < r < len(x) - 1:
+                    gtf.append('%s\ttoy\tCDS\t%d\t%d\t.\t%s\t0\t%s\n' % (chrom,a,b,strand,attributes))
+                exons_txt.append('\t'.join(['', g, t, 'ENSE%011d' % (len(exons_txt)+1,), str(a), str(b), str(r+1),
+                                             str(start), str(end), str(x[0][0] if strand == '+' else x[-1][0]), str(x[-1][1] if strand == '+' else x[0][1]),
+                                             '1' if strand == '+' else '-1', chrom, '', '', '', '', '', ''])+'\n')
+    file(os.path.join(directory,'organism.gtf'),'w').writelines(gtf)
+    file(os.path.join(directory,'exons.txt'),'w').writelines(exons_txt)
+    file(os.path.join(directory,'genes.txt'),'w').writelines(genes_txt)
+
+#
+def plant(transcripts, count, length, rnd):
+    """
+    It builds COUNT fusion transcripts, each from two transcripts of two
+    different genes, which are longer than LENGTH.
+    """
+    candidates = [t for t in transcripts if len(t[1]) > 2 * length]
+    fusions = []
+    used = set()
+    tries = 0
+    while len(fusions) < count and tries < 100 * count:
+        tries = tries + 1
+        (t1,s1) = rnd.choice(candidates)
+        (t2,s2) = rnd.choice(candidates)
+        (g1,g2) = (gene_of(t1),gene_of(t2))
+        if g1 == g2 or g1 in used or g2 in used:
+            continue
+        b1 = rnd.randint(length,len(s1)-length)
+        b2 = rnd.randint(length,len(s2)-length)
+        used.update([g1,g2])
+        fusions.append({'transcript_1': t1,
+                        'transcript_2': t2,
+                        'gene_1': g1,
+                        'gene_2': g2,
+                        'point_1': b1,
+                        'point_2': b2,
+                        'seq': s1[:b1] + s2[b2:]})
+    return fusions
+
+#
+def mutate(seq, rate, rnd):
+    """
+    It adds random substitutions to a read.
+    """
+    if rate <= 0:
+        return seq
+    seq = list(seq)
+    n = len(seq)
+    lg = math.log(1 - rate)
+    i = -1
+    while True:
+        i = i + int(math.log(1 - rnd.random()) / lg) + 1
+        if i >= n:
+            break
+        seq[i] = rnd.choice(_errors.get(seq[i],'ACG'))
+    return ''.join(seq)
+
+#
+def sample(sources, read_length, rnd, error_rate = 0.002):
+    """
+    It samples one read (with sequencing errors) from a random position of a
+    random sequence among SOURCES (as (name, sequence)).
+    """
+    (name,seq) = rnd.choice(sources)
+    p = rnd.randint(0,len(seq)-read_length)
+    return mutate(seq[p:p+read_length],error_rate,rnd)
+
+#
+def simulate(transcripts,
+             genes,
+             fusions,
+             pairs,
+             read_length,
+             fragment_mean,
+             fragment_sd,
+             fusion_fraction,
+             gene_fraction,
+             error_rate,
+             output_directory,
+             map_filename = None,
+             sam_filename = None,
+             seed = 1,
+             compress = True):
+    """
+    It simulates the paired-end reads.
+    """
+    rnd = random.Random(seed)
+    if not os.path.isdir(output_directory):
+        os.makedirs(output_directory)
+    ext = '.fq.gz' if compress else '.fq'
+    opener = (lambda f: gzip.GzipFile(f,'wb',1)) if compress else (lambda f: file(f,'w'))
+    fq1 = opener(os.path.join(output_directory,'reads_1'+ext))
+    fq2 = opener(os.path.join(output_directory,'reads_2'+ext))
+    fmap = file(map_filename,'w') if map_filename else None
+    fsam = file(sam_filename,'w') if sam_filename else None
+    if fsam:
+        fsam.writelines(['@SQ\tSN:%s\tLN:%d\n' % (t,len(s)) for (t,s) in transcripts])
+    qual = 'I' * read_length
+    supporting = [0] * len(fusions)
+    b1 = []
+    b2 = []
+    bm = []
+    bs = []
+    for i in xrange(pairs):
+        name = 'r%010d' % (i,)
+        u = rnd.random()
+        f = max(read_length/2, int(rnd.gauss(fragment_mean,fragment_sd)))
+        fusion = None
+        source = None
+        if fusions and u < fusion_fraction:
+            # the fragment spans the fusion point
+            k = rnd.randrange(len(fusions))
+            fusion = fusions[k]
+            seq = fusion['seq']
+            p = fusion['point_1']
+            f = min(f,len(seq))
+            start = rnd.randint(max(0,p-f+1),min(p-1,len(seq)-f))
+            supporting[k] = supporting[k] + 1
+        elif genes and u < fusion_fraction + gene_fraction:
+            (source,seq) = rnd.choice(genes)
+            f = min(f,len(seq))
+            start = rnd.randint(0,len(seq)-f)
+            source = None # not aligned on transcripts
+        else:
+            (source,seq) = rnd.choice(transcripts)
+            f = min(f,len(seq))
+            start = rnd.randint(0,len(seq)-f)
+        frag = seq[start:start+f]
+        forward = rnd.random() < 0.5
+        if not forward:
+            frag = reverse_complement(frag)
+        r1 = frag[:read_length]
+        r2 = reverse_complement(frag)[:read_length]
+        if len(r1) < read_length:
+            r1 = (r1 + ADAPTER_1)[:read_length]
+            r2 = (r2 + ADAPTER_2)[:read_length]
+        b1.append('@%s/1\n%s\n+\n%s\n' % (name,mutate(r1,error_rate,rnd),qual[:len(r1)]))
+        b2.append('@%s/2\n%s\n+\n%s\n' % (name,mutate(r2,error_rate,rnd),qual[:len(r2)]))
+        if (fmap or fsam) and (fusion or source):
+            # true alignments of the mates (on the forward strand of the reference)
+            n = min(read_length,f)
+            mates = [(1,start,'+' if forward else '-'),(2,start+f-n,'-' if forward else '+')]
+            if not forward:
+                mates = [(1,start+f-n,'-'),(2,start,'+')]
+            for (m,a,strand) in mates:
+                b = a + n
+                if fusion is None:
+                    parts = [(source,a,0,n)]
+                elif b <= fusion['point_1']:
+                    parts = [(fusion['transcript_1'],a,0,n)]
+                elif a >= fusion['point_1']:
+                    parts = [(fusion['transcript_2'],a-fusion['point_1']+fusion['point_2'],0,n)]
+                else:
+                    x = fusion['point_1'] - a
+                    parts = [(fusion['transcript_1'],a,0,x),(fusion['transcript_2'],fusion['point_2'],x,n)]
+                if fmap and len(parts) == 1:
+                    bm.append('%s/%d\t%s\t%s\t%d\n' % (name,m,strand,parts[0][0],parts[0][1]))
+                if fsam:
+                    s = seq[a:b]
+                    for (j,(ref,pos,q1,q2)) in enumerate(parts):
+                        flag = (0x10 if strand == '-' else 0) | (0x800 if j else 0) | (0x40 if m == 1 else 0x80) | 0x1
+                        cigar = ('%dS' % (q1,) if q1 else '') + '%dM' % (q2-q1,) + ('%dS' % (n-q2,) if n > q2 else '')
+                        bs.append('%s\t%d\t%s\t%d\t255\t%s\t*\t0\t0\t%s\t%s\tNM:i:0\n' % (name,flag,ref,pos+1,cigar,s,qual[:n]))
+        if len(b1) > 100000:
+            fq1.writelines(b1)
+            fq2.writelines(b2)
+            b1 = []
+            b2 = []
+            if fmap:
+                fmap.writelines(bm)
+                bm = []
+            if fsam:
+                fsam.writelines(bs)
+                bs = []
+    fq1.writelines(b1)
+    fq2.writelines(b2)
+    fq1.close()
+    fq2.close()
+    if fmap:
+        fmap.writelines(bm)
+        fmap.close()
+    if fsam:
+        fsam.writelines(bs)
+        fsam.close()
+    # the planted fusion genes
+    data = ['Gene_1_id(5end_fusion_partner)\tGene_2_id(3end_fusion_partner)\tTranscript_1\tTranscript_2\tFusion_point_1\tFusion_point_2\tSupporting_pairs\n']
+    data.extend(['%s\t%s\t%s\t%s\t%d\t%d\t%d\n' % (e['gene_1'],e['gene_2'],e['transcript_1'],e['transcript_2'],e['point_1'],e['point_2'],c) for (e,c) in zip(fusions,supporting)])
+    file(os.path.join(output_directory,'fusions.txt'),'w').writelines(data)
+
+#
+def skewed(transcripts,
+           reads,
+           read_length,
+           database_filename,
+           reads_filename,
+           hard_fraction = 0.1,
+           copies = 200,
+           seed = 1):
+    """
+    It generates a skewed input for an aligner (e.g. BLAT), i.e. a database
+    made of the transcripts and of many mutated copies of a repeat, and reads
+    (FASTA) where the first HARD_FRACTION of them are from the repeat (and
+    therefore they are much slower to align than the others).
+    """
+    rnd = random.Random(seed)
+    repeat = ''.join([rnd.choice('ACGT') for i in xrange(max(2000,2*read_length))])
+    copies = [('REPEAT%05d' % (i+1,),mutate(repeat,0.02,rnd)) for i in xrange(copies)]
+    sources = [t for t in transcripts if len(t[1]) >= read_length]
+    hard = int(reads * hard_fraction)
+    data = []
+    for i in xrange(reads):
+        data.append(('read%d' % (i+1,),sample(copies if i < hard else sources,read_length,rnd)))
+    write_fasta(database_filename,list(transcripts)+copies)
+    write_fasta(reads_filename,data)
+
+#
+def reference(nucleotides,
+              reads,
+              read_length,
+              database_filename,
+              fastq_filename,
+              fasta_filename,
+              length = 100000,
+              seed = 1):
+    """
+    It generates random reference sequences (of the given total size, in
+    sequences of the given length) and reads (FASTQ and FASTA) from them, e.g.
+    for measuring the peak memory of an aligner for a given size of the
+    reference.
+    """
+    rnd = random.Random(seed)
+    # two nucleotides for each hexadecimal digit
+    table = dict([('%x' % (i,),'ACGT'[i/4]+'ACGT'[i%4]) for i in xrange(16)])
+    data = []
+    n = 0
+    while n < nucleotides:
+        m = min(length, nucleotides - n)
+        h = '%0*x' % ((m+1)/2, rnd.getrandbits(4*((m+1)/2)))
+        data.append(('seq%05d' % (len(data)+1,),''.join([table[e] for e in h])[:m]))
+        n = n + m
+    sources = [e for e in data if len(e[1]) >= read_length]
+    fq = file(fastq_filename,'w')
+    fa = file(fasta_filename,'w')
+    for i in xrange(reads):
+        r = sample(sources,read_length,rnd)
+        fq.write('@read%d\n%s\n+\n%s\n' % (i+1,r,'I'*len(r)))
+        fa.write('>read%d\n%s\n' % (i+1,r))
+    fq.close()
+    fa.close()
+    write_fasta(database_filename,data)
+
+#
+def many_hits(psl_filename,
+              reads,
+              hits,
+              read_length,
+              unique = 0.01,
+              target_length = 1000000,
+              seed = 1):
+    """
+    It generates local alignments (PSL, sorted like the output of 'sam2psl.py'
+    in FusionCatcher) of reads which have many hits, where each read is split
+    in two parts whose alignments might have a small gap or overlap on the
+    read. One part of the read is from a repeat (i.e. it has many hits) and
+    the other part has only a few hits (i.e. UNIQUE fraction of the hits).
+    All the hits of a read are on the same target.
+    """
+    rnd = random.Random(seed)
+    data = []
+    for i in xrange(reads):
+        name = 'read%d' % (i+1,)
+        target = 'gene%05d-gene%05d' % (2*i+1,2*i+2)
+        p = rnd.randint(read_length/4,3*read_length/4)
+        repeat = rnd.random() < 0.5
+        for j in xrange(hits):
+            # small gaps and overlaps between the two parts
+            if (rnd.random() < unique) != repeat:
+                (q1,q2) = (0,p+rnd.randint(-4,4))
+            else:
+                (q1,q2) = (p+rnd.randint(-4,4),read_length)
+            n = q2 - q1
+            t = rnd.randint(0,target_length-n)
+            data.append((name,target,q1,q2,'%d\t%d\t0\t0\t0\t0\t0\t0\t+\t%s\t%d\t%d\t%d\t%s\t%d\t%d\t%d\t1\t%d,\t%d,\t%d,\n' % (n,read_length-n,name,read_length,q1,q2,target,target_length,t,t+n,n,q1,t)))
+    data.sort()
+    file(psl_filename,'w').writelines([e[4] for e in data])
+
+#
+def multimapping(map_filename,
+                 genes,
+                 reads,
+                 max_genes = 60,
+                 families = 1000,
+                 seed = 1):
+    """
+    It generates the mappings of reads on genes (tab separated, i.e. read
+    name, gene id and number of mismatches, sorted by read name, like the
+    input of 'find_homolog_genes.py') where each read maps on several genes
+    (up to MAX_GENES) from the same family of genes (i.e. homologous genes).
+    """
+    rnd = random.Random(seed)
+    genes = sorted(set(genes))
+    size = max(max_genes, len(genes) / max(1,families))
+    fou = file(map_filename,'w')
+    data = []
+    for i in xrange(reads):
+        name = '%010d/%d' % (i/2, i%2+1)
+        f = rnd.randrange(max(1,len(genes)-size+1))
+        family = genes[f:f+size]
+        n = min(len(family), int(rnd.paretovariate(1.0)) + 1, max_genes)
+        for g in sorted(rnd.sample(family,n)):
+            data.append('%s\t%s\t%d\n' % (name,g,rnd.randint(0,2)))
+        if len(data) > 100000:
+            fou.writelines(data)
+            data = []
+    fou.writelines(data)
+    fou.close()
+
+
+if __name__ == '__main__':
+
+    #command line parsing
+
+    usage = "%prog [options]"
+    description = """It simulates paired-end reads (with planted fusion genes) from the transcripts of a FusionCatcher database."""
+    version = "%prog 0.99 beta"
+
+    parser = optparse.OptionParser(usage=usage,description=description,version=version)
+
+    parser.add_option("--data","-d",
+                      action = "store",
+                      type = "string",
+                      dest = "data_directory",
+                      help = """The directory containing the files 'transcripts.fa' and (optionally) 'genes.fa', e.g. the database of FusionCatcher.""")
+
+    parser.add_option("--output","-o",
+                      action = "store",
+                      type = "string",
+                      dest = "output_directory",
+                      default = '.',
+                      help = """The output directory where the reads ('reads_1.fq.gz' and 'reads_2.fq.gz') and the planted fusion genes ('fusions.txt') are written. Default is '%default'.""")
+
+    parser.add_option("--pairs","-n",
+                      action = "store",
+                      type = "int",
+                      dest = "pairs",
+                      default = 1000000,
+                      help = """The number of paired-end reads. Default is '%default'.""")
+
+    parser.add_option("--read-length","-l",
+                      action = "store",
+                      type = "int",
+                      dest = "read_length",
+                      default = 100,
+                      help = """The length of the reads. Default is '%default'.""")
+
+    parser.add_option("--fragment-mean",
+                      action = "store",
+                      type = "int",
+                      dest = "fragment_mean",
+                      default = 300,
+                      help = """The mean length of the fragments. Default is '%default'.""")
+
+    parser.add_option("--fragment-sd",
+                      action = "store",
+                      type = "int",
+                      dest = "fragment_sd",
+                      default = 50,
+                      help = """The standard deviation of the length of the fragments. Default is '%default'.""")
+
+    parser.add_option("--fusions","-f",
+                      action = "store",
+                      type = "int",
+                      dest = "fusions",
+                      default = 20,
+                      help = """The number of fusion genes which are planted. Default is '%default'.""")
+
+    parser.add_option("--fusion-fraction",
+                      action = "store",
+                      type = "float",
+                      dest = "fusion_fraction",
+                      default = 0.001,
+                      help = """The fraction of paired-end reads which are simulated from the fusion transcripts (and which span the fusion point). Default is '%default'.""")
+
+    parser.add_option("--gene-fraction",
+                      action = "store",
+                      type = "float",
+                      dest = "gene_fraction",
+                      default = 0.05,
+                      help = """The fraction of paired-end reads which are simulated from the unspliced genes (i.e. 'genes.fa'), if it exists. Default is '%default'.""")
+
+    parser.add_option("--error-rate",
+                      action = "store",
+                      type = "float",
+                      dest = "error_rate",
+                      default = 0.002,
+                      help = """The rate of the sequencing errors (i.e. substitutions). Default is '%default'.""")
+
+    parser.add_option("--map",
+                      action = "store",
+                      type = "string",
+                      dest = "map_filename",
+                      help = """If it is specified then the true alignments of the reads on the transcripts are written in this file (Bowtie MAP format, sorted by reads names, the mates which cross the fusion point are not aligned).""")
+
+    parser.add_option("--sam",
+                      action = "store",
+                      type = "string",
+                      dest = "sam_filename",
+                      help = """If it is specified then the true alignments of the reads on the transcripts are written in this file (SAM format, the reads which cross the fusion point are split between the two transcripts).""")
+
+    parser.add_option("--uncompressed",
+                      action = "store_true",
+                      dest = "uncompressed",
+                      default = False,
+                      help = """If it is set then the reads are written uncompressed (i.e. 'reads_1.fq' and 'reads_2.fq'). Default is '%default'.""")
+
+    parser.add_option("--toy",
+                      action = "store",
+                      type = "int",
+                      dest = "toy",
+                      default = 0,
+                      help = """If it is set to a positive number then a toy database with this number of random genes (i.e. 'genes.fa', 'transcripts.fa' and 'genes_symbols.txt') is generated in the directory given by '--data' and no reads are simulated.""")
+
+    parser.add_option("--seed",
+                      action = "store",
+                      type = "int",
+                      dest = "seed",
+                      default = 1,
+                      help = """The seed of the random number generator. Default is '%default'.""")
+
+    (options,args) = parser.parse_args()
+
+    # validate options
+    if not (options.data_directory and
+            options.output_directory
+            ):
+        parser.print_help()
+        sys.exit(1)
+
+    if options.toy > 0:
+        print "Generating a toy database with %d genes in '%s'..." % (options.toy,options.data_directory)
+        toy(options.data_directory, options.toy, options.seed)
+        sys.exit(0)
+
+    print "Reading the transcripts..."
+    transcripts = read_fasta(os.path.join(options.data_directory,'transcripts.fa'))
+    genes = []
+    if options.gene_fraction > 0 and os.path.isfile(os.path.join(options.data_directory,'genes.fa')):
+        print "Reading the genes..."
+        genes = read_fasta(os.path.join(options.data_directory,'genes.fa'))
+
+    rnd = random.Random(options.seed)
+    print "Planting %d fusion genes..." % (options.fusions,)
+    fusions = plant(transcripts, options.fusions, options.fragment_mean, rnd)
+
+    print "Simulating %d paired-end reads..." % (options.pairs,)
+    simulate(transcripts = transcripts,
+             genes = genes,
+             fusions = fusions,
+             pairs = options.pairs,
+             read_length = options.read_length,
+             fragment_mean = options.fragment_mean,
+             fragment_sd = options.fragment_sd,
+             fusion_fraction = options.fusion_fraction,
+             gene_fraction = options.gene_fraction,
+             error_rate = options.error_rate,
+             output_directory = options.output_directory,
+             map_filename = options.map_filename,
+             sam_filename = options.sam_filename,
+             seed = options.seed + 1,
+             compress = not options.uncompressed)
+    print "The end."
+    #
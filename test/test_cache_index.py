@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It tests the cache of indexes of 'bin/cache-index.py', i.e. the reuse of an
+index and the building of the index without the cache when the cache cannot
+be used. The index is "built" by a small Python command (i.e. no aligner is
+needed).
+
+Example:
+
+python test_cache_index.py
+
+"""
+import os
+import sys
+import imp
+import errno
+import shutil
+import tempfile
+import unittest
+
+cache_index = imp.load_source('cache_index',os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','bin','cache-index.py'))
+
+class TestCacheIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.work = tempfile.mkdtemp()
+        self.reference = os.path.join(self.work,'genes.fa')
+        file(self.reference,'w').write('>a\nACGTACGT\n')
+        self.count = os.path.join(self.work,'builds.txt')
+
+    def tearDown(self):
+        shutil.rmtree(self.work, ignore_errors = True)
+
+    def command(self, index):
+        # it "builds" the index and it counts the builds
+        return [sys.executable, '-c',
+                ("import os,shutil,sys\n"+
+                 "os.makedirs(sys.argv[2])\n"+
+                 "shutil.copy(sys.argv[1],os.path.join(sys.argv[2],'index.txt'))\n"+
+                 "open(sys.argv[3],'a').write('x')\n"),
+                self.reference, index, self.count]
+
+    def builds(self):
+        return len(open(self.count).read()) if os.path.isfile(self.count) else 0
+
+    def build(self, cache, name):
+        index = os.path.join(self.work, name)
+        r = cache_index.cached_build(self.command(index), [self.reference], index, cache, 2**30)
+        self.assertEqual(r, 0)
+        self.assertEqual(open(os.path.join(index,'index.txt')).read(), '>a\nACGTACGT\n')
+
+    def test_reuse(self):
+        cache = os.path.join(self.work,'cache')
+        self.build(cache, 'index_1')
+        self.build(cache, 'index_2')
+        self.assertEqual(self.builds(), 1)
+
+    def test_unusable_cache(self):
+        # the cache cannot be created (i.e. its parent is a file)
+        self.build(os.path.join(self.reference,'cache'), 'index_1')
+        self.assertEqual(self.builds(), 1)
+
+    def test_lock_failure(self):
+        # the cache cannot be locked (e.g. ENOLCK on NFS)
+        def flock(fd, operation):
+            raise IOError(errno.ENOLCK, 'No locks available')
+        original = cache_index.fcntl.flock
+        cache_index.fcntl.flock = flock
+        try:
+            self.build(os.path.join(self.work,'cache'), 'index_1')
+        finally:
+            cache_index.fcntl.flock = original
+        self.assertEqual(self.builds(), 1)
+
+    def test_failed_build(self):
+        index = os.path.join(self.work,'index_1')
+        r = cache_index.cached_build([sys.executable,'-c','import sys; sys.exit(3)'], [self.reference], index, os.path.join(self.work,'cache'), 2**30)
+        self.assertEqual(r, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It tests the counting of the pairs of genes of 'bin/find_homolog_genes.py',
+i.e. the packing of the counts which are sent between processes. No aligner
+is needed.
+
+Example:
+
+python test_find_homolog_genes.py
+
+"""
+import os
+import sys
+import array
+import unittest
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','bin'))
+
+import find_homolog_genes as fhg
+
+class TestFindHomologGenes(unittest.TestCase):
+
+    def test_uint32(self):
+        self.assertTrue(array.array(fhg.UINT32).itemsize >= 4)
+
+    def test_pack_merge(self):
+        # large gene ids (i.e. keys larger than 2**32 and 2**63)
+        pairs = [(0,1),(1,0),(2,3),(70000,5),(2**31,2**32-1),(2**32-1,2**32-1)]
+        counts = dict([(a * fhg.SHIFT + b, i + 1) for (i,(a,b)) in enumerate(pairs)])
+        counts[5 * fhg.SHIFT + 7] = 2**32 - 1
+        packed = fhg.pack(counts)
+        merged = dict()
+        fhg.merge(merged, packed)
+        self.assertEqual(merged, counts)
+        # the counts are added
+        fhg.merge(merged, fhg.pack({0 * fhg.SHIFT + 1: 10, 9 * fhg.SHIFT + 9: 1}))
+        self.assertEqual(merged[1], counts[1] + 10)
+        self.assertEqual(merged[9 * fhg.SHIFT + 9], 1)
+
+    def test_homology_batch(self):
+        reads = [('r1',['g1','g2','g3'],[]),
+                 ('r2',['g2','g1'],[]),
+                 ('r3',['g3'],[])]
+        ids = dict()
+        names = []
+        counts = dict()
+        (offenders, max_pairs, max_pairs_id) = fhg.homology_batch(list(fhg.encode(reads, ids, names)), counts)
+        found = dict([((names[k // fhg.SHIFT],names[k & fhg.MASK]),v) for (k,v) in counts.iteritems()])
+        self.assertEqual(found, {('g1','g2'): 1, ('g1','g3'): 1, ('g2','g3'): 1, ('g2','g1'): 1})
+        self.assertEqual(max_pairs, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
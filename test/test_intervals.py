@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It tests the interval index of the exons, CDSes and genes (see
+'bin/intervals.py') against a brute-force search, and the saving and loading
+of the index. No aligner or database is needed.
+
+Example:
+
+python test_intervals.py
+
+"""
+import os
+import sys
+import random
+import marshal
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','bin'))
+
+import intervals
+
+#
+def random_gtf(filename, genes = 200, seed = 1):
+    # it writes a random GTF file (exons and CDSes of a few chromosomes)
+    r = random.Random(seed)
+    lines = []
+    for g in xrange(genes):
+        chrom = r.choice(['1','2','X'])
+        strand = r.choice(['+','-'])
+        start = r.randint(1, 10**6)
+        for e in xrange(r.randint(1,5)):
+            s = start + r.randint(0, 5000)
+            t = s + r.randint(0, 300)
+            for kind in (['exon','CDS'] if r.random() < 0.5 else ['exon']):
+                lines.append('%s\ttest\t%s\t%d\t%d\t.\t%s\t.\tgene_id "G%d"; transcript_id "T%d"; exon_number "%d";\n' % (chrom, kind, s, t, strand, g, g, e + 1))
+    file(filename,'w').writelines(lines)
+
+#
+def brute(features, kind, chrom, start, end):
+    # it finds the features overlapping an interval by scanning all of them
+    return [f for f in features if f[intervals.KIND] == kind and f[intervals.CHROM] == chrom and
+            min(f[intervals.START],f[intervals.END]) <= end and start <= max(f[intervals.START],f[intervals.END])]
+
+class TestIntervals(unittest.TestCase):
+
+    def setUp(self):
+        self.work = tempfile.mkdtemp()
+        self.gtf = os.path.join(self.work,'organism.gtf')
+        random_gtf(self.gtf)
+
+    def tearDown(self):
+        shutil.rmtree(self.work, ignore_errors = True)
+
+    def test_overlap(self):
+        db = intervals.load(self.gtf, 'gtf', cache = False)
+        features = list(intervals.parse_gtf(open(self.gtf,'r')))
+        self.assertEqual(db.items, features)
+        r = random.Random(2)
+        for i in xrange(500):
+            kind = r.choice(['exon','CDS','gene'])
+            chrom = r.choice(['1','2','X','Y'])
+            start = r.randint(1, 10**6 + 6000)
+            end = start if r.random() < 0.5 else start + r.randint(0, 20000)
+            self.assertEqual(db.overlap(kind, chrom, start, end), brute(features, kind, chrom, start, end))
+
+    def test_features(self):
+        db = intervals.load(self.gtf, 'gtf', cache = False)
+        features = list(intervals.parse_gtf(open(self.gtf,'r')))
+        for g in ('G0','G7','G199'):
+            self.assertEqual(db.features('exon', g), [f for f in features if f[intervals.KIND] == 'exon' and f[intervals.GENE] == g])
+
+    def test_saved_index(self):
+        db = intervals.load(self.gtf, 'gtf')
+        idx = self.gtf + '.idx'
+        self.assertTrue(os.path.isfile(idx))
+        self.assertEqual(intervals.load(self.gtf, 'gtf').items, db.items)
+        # the file changes but its size does not
+        s = os.stat(self.gtf)
+        data = open(self.gtf,'r').read().replace('G1"','G9"',1)
+        self.assertEqual(len(data), s.st_size)
+        file(self.gtf,'w').write(data)
+        os.utime(self.gtf, (s.st_atime, s.st_mtime + 10))
+        changed = intervals.load(self.gtf, 'gtf')
+        self.assertNotEqual(changed.items, db.items)
+        self.assertEqual(changed.items, list(intervals.parse_gtf(open(self.gtf,'r'))))
+
+    def test_copied_index(self):
+        # the time of modification changes but the content does not (e.g. a
+        # copy of the database) and therefore the saved index is used
+        db = intervals.load(self.gtf, 'gtf')
+        idx = self.gtf + '.idx'
+        s = os.stat(self.gtf)
+        os.utime(self.gtf, (s.st_atime, s.st_mtime + 10))
+        built = []
+        original = intervals.build
+        def build(lines, kind):
+            built.append(kind)
+            return original(lines, kind)
+        intervals.build = build
+        try:
+            self.assertEqual(intervals.load(self.gtf, 'gtf').items, db.items)
+        finally:
+            intervals.build = original
+        self.assertEqual(built, [])
+        # the new time of modification is saved
+        self.assertEqual(marshal.load(open(idx,'rb'))[2], intervals.stamp(self.gtf))
+
+    def test_save_failure(self):
+        # the index cannot be saved (i.e. its path is a directory) and
+        # therefore it is only built
+        os.mkdir(self.gtf + '.idx')
+        db = intervals.load(self.gtf, 'gtf')
+        self.assertEqual(db.items, list(intervals.parse_gtf(open(self.gtf,'r'))))
+        self.assertEqual([f for f in os.listdir(self.work) if f.endswith('.tmp')], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
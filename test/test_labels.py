@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It tests the reading of the overlapping genes of 'bin/labels.py' (i.e. the
+pairs of genes which are removed from a list of fusion genes), like in the
+original generate_*.py scripts. No database is needed.
+
+Example:
+
+python test_labels.py
+
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','bin'))
+
+import labels
+
+class TestLabels(unittest.TestCase):
+
+    def setUp(self):
+        self.work = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.work, ignore_errors = True)
+
+    def test_read_pairs(self):
+        file(os.path.join(self.work,'a.txt'),'w').write('ENSG2\tENSG1\n\nENSG3\tENSG4\r\n')
+        # a third column (e.g. a distance) is ignored unless it sorts before
+        # the genes (the columns are sorted first)
+        file(os.path.join(self.work,'b.txt'),'w').write('ENSG6\tENSG5\tZ\nENSG8\tENSG7\t10\n')
+        d = labels.read_pairs(self.work, ['a.txt','b.txt','missing.txt'])
+        self.assertEqual(d, set(['ENSG1\tENSG2\n','ENSG3\tENSG4\n','ENSG5\tENSG6\n','10\tENSG7\n']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+It tests the model of the peak memory of the aligners (see 'bin/memory_model.py').
+No aligner is needed.
+
+Example:
+
+python test_memory_model.py
+
+"""
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+
+sys.path.insert(0,os.path.join(os.path.dirname(os.path.abspath(__file__)),'..','bin'))
+
+import memory_model
+
+GB = memory_model.GB
+
+class TestMemoryModel(unittest.TestCase):
+
+    def setUp(self):
+        self.work = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.work, ignore_errors = True)
+
+    def test_peak(self):
+        model = {'a': {'base': 1.0, 'reference': 2.0, 'reads': 4.0, 'thread': 0.5, 'copies': 0},
+                 'b': {'base': 1.0, 'reference': 2.0, 'reads': 0.0, 'thread': 0.0, 'copies': 1}}
+        self.assertAlmostEqual(memory_model.peak('a', GB, reads = GB, threads = 2, model = model), 1.0 + 2.0 + 4.0 + 1.0)
+        # one process per thread
+        self.assertAlmostEqual(memory_model.peak('b', GB, threads = 4, model = model), 4 * 3.0)
+
+    def test_limit(self):
+        model = memory_model.load()
+        for steps in (['bowtie-build','bowtie'],['STAR-build','STAR'],['blat']):
+            for cap in (4, 16, 64):
+                n = memory_model.limit(steps, cap, reads = 10**9, threads = 8, model = model)
+                for step in steps:
+                    self.assertTrue(memory_model.peak(step, n, reads = 10**9, threads = 8, model = model) <= cap + 1e-6)
+                # the limit is the largest one
+                self.assertTrue(max([memory_model.peak(step, n + 10**6, reads = 10**9, threads = 8, model = model) for step in steps]) > cap)
+        # even the smallest reference does not fit
+        self.assertEqual(memory_model.limit(['STAR'], 0.1, model = model), 1)
+
+    def test_concurrency(self):
+        model = memory_model.load()
+        steps = ['bowtie2-build','bowtie2']
+        # no memory constraint
+        self.assertEqual(memory_model.concurrency(steps, 0, 10, 16, 0, model = model)[:2], (10, 1))
+        for available in (1, 8, 32, 512):
+            (n, threads, gb) = memory_model.concurrency(steps, 500 * 10**6, 10, 16, available, model = model)
+            self.assertTrue(1 <= n <= 10)
+            self.assertEqual(threads, 16 // n)
+            # the peak is predicted for the threads of one part
+            self.assertAlmostEqual(gb, max([memory_model.peak(step, 500 * 10**6, threads = threads, model = model) for step in steps]))
+            if n > 1:
+                self.assertTrue(n * gb <= available)
+
+    def test_nucleotides(self):
+        f = os.path.join(self.work,'a.fa')
+        file(f,'w').write('>seq1 some description\nACGTACGTAC\nACG\n>seq2\r\nNNNN\r\n')
+        self.assertEqual(memory_model.nucleotides(f), 17)
+
+    def test_fit(self):
+        samples = [(10**6, 0.3), (10**7, 0.5), (10**8, 2.1), (10**9, 16.0)]
+        model = memory_model.fit(samples, 'STAR', reads = 10**8, threads = 4)
+        # no measured peak is above the prediction
+        for (x,y) in samples:
+            self.assertTrue(memory_model.peak('STAR', x, reads = 10**8, threads = 4, model = model) >= y - 1e-6)
+        # the calibrated model is saved and loaded back
+        f = os.path.join(self.work,'memory_model.txt')
+        memory_model.save(f, model)
+        loaded = memory_model.load(f)
+        for step in model:
+            for c in model[step]:
+                self.assertAlmostEqual(loaded[step][c], model[step][c])
+
+
+if __name__ == '__main__':
+    unittest.main()